@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Fixtures shared by the benchmarks.
+
+Audio files are generated with the corpus generator once per session, in
+three sizes: "small" (128KB), "medium" (16MB) and "large" (1.1GB). Large
+files are only generated and benchmarked with `--benchmark-large-files`.
+"""
+
+import shutil
+from datetime import datetime, timezone
+
+import pytest
+from corpus_generator import create_mp3, create_wav
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from transparentmeta.entity.metadata import AIUsageLevel, Metadata
+from transparentmeta.sdk.factory import (
+    build_transparent_metadata_reader,
+    build_transparent_metadata_writer,
+)
+
+FILE_SIZES = {
+    "small": 128 * 1024,
+    "medium": 16 * 1024**2,
+    "large": 1100 * 1024**2,
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmark-large-files",
+        action="store_true",
+        default=False,
+        help="Also benchmark 1GB+ audio files.",
+    )
+
+
+@pytest.fixture(scope="session")
+def private_key():
+    return Ed25519PrivateKey.generate()
+
+
+@pytest.fixture(scope="session")
+def metadata():
+    return Metadata(
+        company="Transparent Audio",
+        model="v2.1",
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        ai_usage_level=AIUsageLevel.AI_GENERATED,
+        content_id="benchmark_content",
+        user_id="benchmark_user",
+        private_key_id="benchmark_key",
+        additional_info={"attribution": {"composer": "Jane Smith"}},
+    )
+
+
+@pytest.fixture(scope="session")
+def transparent_metadata_writer(private_key):
+    return build_transparent_metadata_writer(private_key)
+
+
+@pytest.fixture(scope="session")
+def transparent_metadata_reader(private_key):
+    return build_transparent_metadata_reader(private_key.public_key())
+
+
+@pytest.fixture(scope="session")
+def untagged_audio_files(tmp_path_factory):
+    """Generates untagged audio files lazily, keyed by (format, size)."""
+    directory = tmp_path_factory.mktemp("untagged_audio")
+    audio_files = {}
+
+    def get(audio_format, size_name):
+        key = (audio_format, size_name)
+        if key not in audio_files:
+            filepath = directory / f"{size_name}.{audio_format}"
+            create = create_mp3 if audio_format == "mp3" else create_wav
+            audio_files[key] = create(filepath, FILE_SIZES[size_name])
+        return audio_files[key]
+
+    return get
+
+
+@pytest.fixture(scope="session")
+def tagged_audio_files(
+    untagged_audio_files,
+    tmp_path_factory,
+    transparent_metadata_writer,
+    metadata,
+):
+    """Generates audio files with signed metadata lazily, keyed by
+    (format, size)."""
+    directory = tmp_path_factory.mktemp("tagged_audio")
+    audio_files = {}
+
+    def get(audio_format, size_name):
+        key = (audio_format, size_name)
+        if key not in audio_files:
+            filepath = directory / f"{size_name}.{audio_format}"
+            shutil.copy(untagged_audio_files(*key), filepath)
+            transparent_metadata_writer.write(filepath, metadata.model_dump())
+            audio_files[key] = filepath
+        return audio_files[key]
+
+    return get
+
+
+@pytest.fixture(params=["small", "medium", "large"])
+def size_name(request):
+    if request.param == "large" and not request.config.getoption(
+        "--benchmark-large-files"
+    ):
+        pytest.skip("1GB+ files need --benchmark-large-files")
+    return request.param
+
+
+@pytest.fixture(params=["mp3", "wav"])
+def audio_format(request):
+    return request.param
+
+
+@pytest.fixture
+def tagged_audio_file(tagged_audio_files, audio_format, size_name):
+    return tagged_audio_files(audio_format, size_name)
+
+
+@pytest.fixture
+def writable_audio_file(tagged_audio_files, audio_format, size_name, tmp_path):
+    """A copy of a tagged audio file, which benchmarks can overwrite."""
+    filepath = tmp_path / f"{size_name}.{audio_format}"
+    shutil.copy(tagged_audio_files(audio_format, size_name), filepath)
+    return filepath
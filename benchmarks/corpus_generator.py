@@ -0,0 +1,257 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+A utility script to generate reproducible corpora of synthetic MP3 and WAV
+files for benchmarks and load tests.
+
+Files are valid audio files that mutagen and transparentmeta can parse. MP3
+files repeat the frames of the test MP3 in `tests/test_data`, and WAV files
+hold silent 16-bit stereo audio, written sparsely so that files up to the 4GB
+WAV limit are created instantly. Files can come with an existing ID3 tag,
+optionally holding a large picture frame, to exercise tag rewrites.
+
+The same options and seed always generate the same corpus. A
+`manifest.jsonl` file in the output directory describes each file.
+
+Usage:
+    python benchmarks/corpus_generator.py corpus --count 1000
+    python benchmarks/corpus_generator.py corpus --count 50 --formats wav \
+        --min-size 1GB --max-size 4GB --distribution uniform
+
+Options:
+    --count <n>                  Number of files (default: 100)
+    --formats <formats>          Comma-separated formats (default: mp3,wav)
+    --min-size <size>            Minimum file size (default: 128KB)
+    --max-size <size>            Maximum file size (default: 16MB)
+    --distribution <name>        "log-uniform" or "uniform" (default:
+        log-uniform, i.e., many small files and few large ones)
+    --tagged-fraction <f>        Fraction of files with an ID3 tag
+        (default: 0.5)
+    --large-tag-fraction <f>     Fraction of tagged files whose tag holds a
+        large picture frame (default: 0.1)
+    --large-tag-size <size>      Size of the picture frame (default: 1MB)
+    --oversized-wav-fraction <f> Fraction of WAV files just above the 4GB
+        limit, which transparentmeta rejects (default: 0)
+    --seed <n>                   Random seed (default: 0)
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import struct
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+from mutagen.id3 import APIC, ID3, TIT2, TPE1
+from mutagen.mp3 import MP3
+from mutagen.wave import WAVE
+
+from transparentmeta.request.file_validators import MAX_WAV_FILE_SIZE
+
+TEST_MP3 = Path(__file__).parent.parent / "tests" / "test_data" / "test.mp3"
+WAV_HEADER_SIZE = 44
+WAV_BLOCK_ALIGN = 4  # 16-bit stereo
+FILES_PER_DIRECTORY = 1000
+# Room left below the WAV size limit for the ID3 chunk and its padding.
+WAV_TAG_ALLOWANCE = 64 * 1024
+
+_SIZE_UNITS = {"": 1, "B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3}
+
+
+@dataclass(frozen=True)
+class CorpusFile:
+    """Description of a generated audio file, as written to the manifest."""
+
+    filepath: str
+    audio_format: str
+    size: int
+    tag: str
+
+
+def parse_size(size: str) -> int:
+    """Parses a size such as "128KB", "16MB" or "4GB" into bytes."""
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)\s*([KMG]?B?)", size.upper())
+    if match is None:
+        raise argparse.ArgumentTypeError(f"Invalid size: {size}")
+    number, unit = match.groups()
+    return int(float(number) * _SIZE_UNITS[unit])
+
+
+def create_mp3(filepath: Path, size: int) -> Path:
+    """Creates an MP3 file of at least `size` bytes by repeating the frames
+    of the test MP3, which has no ID3 tag."""
+    frames = TEST_MP3.read_bytes()
+    with open(filepath, "wb") as f:
+        for _ in range(max(1, math.ceil(size / len(frames)))):
+            f.write(frames)
+    return filepath
+
+
+def create_wav(filepath: Path, size: int) -> Path:
+    """Creates a silent 16-bit stereo WAV file of about `size` bytes. The
+    audio samples are written sparsely, so large files are created
+    instantly."""
+    data_size = max(0, size - WAV_HEADER_SIZE)
+    data_size -= data_size % WAV_BLOCK_ALIGN
+    # Files above the limit can't record their true size in the RIFF header.
+    riff_size = min(WAV_HEADER_SIZE - 8 + data_size, 2**32 - 1)
+    header = (
+        b"RIFF"
+        + struct.pack("<I", riff_size)
+        + b"WAVEfmt "
+        + struct.pack(
+            "<IHHIIHH", 16, 1, 2, 44100, 44100 * WAV_BLOCK_ALIGN, 4, 16
+        )
+        + b"data"
+        + struct.pack("<I", min(data_size, 2**32 - 1))
+    )
+    with open(filepath, "wb") as f:
+        f.write(header)
+        f.truncate(WAV_HEADER_SIZE + data_size)
+    return filepath
+
+
+def add_id3_tag(
+    filepath: Path, rng: random.Random, picture_size: Optional[int] = None
+) -> None:
+    """Adds an ID3 tag with a title and an artist to an audio file, and a
+    picture frame of `picture_size` random bytes if given."""
+    audio = MP3(filepath) if filepath.suffix == ".mp3" else WAVE(filepath)
+    audio.add_tags()
+    tags: ID3 = audio.tags
+    tags.add(TIT2(encoding=3, text=f"Track {rng.randrange(10**6)}"))
+    tags.add(TPE1(encoding=3, text=f"Artist {rng.randrange(10**3)}"))
+    if picture_size is not None:
+        tags.add(
+            APIC(
+                encoding=3,
+                mime="image/jpeg",
+                type=3,
+                desc="Cover",
+                data=rng.randbytes(picture_size),
+            )
+        )
+    audio.save()
+
+
+def generate_corpus(
+    output_directory: Path,
+    count: int = 100,
+    formats: Sequence[str] = ("mp3", "wav"),
+    min_size: int = 128 * 1024,
+    max_size: int = 16 * 1024**2,
+    distribution: str = "log-uniform",
+    tagged_fraction: float = 0.5,
+    large_tag_fraction: float = 0.1,
+    large_tag_size: int = 1024**2,
+    oversized_wav_fraction: float = 0.0,
+    seed: int = 0,
+) -> Iterator[CorpusFile]:
+    """Generates a corpus of audio files, yielding each file once created.
+
+    See the module docstring for the meaning of the arguments.
+    """
+    rng = random.Random(seed)
+    for index in range(count):
+        audio_format = rng.choice(formats)
+        size = _draw_size(rng, min_size, max_size, distribution)
+        tag = "none"
+        if rng.random() < tagged_fraction:
+            tag = "large-id3" if rng.random() < large_tag_fraction else "id3"
+
+        if audio_format == "wav":
+            if rng.random() < oversized_wav_fraction:
+                # mutagen can't tag WAV files above the limit.
+                size, tag = MAX_WAV_FILE_SIZE + 1, "none"
+            else:
+                allowance = WAV_TAG_ALLOWANCE + (
+                    large_tag_size if tag == "large-id3" else 0
+                )
+                size = min(size, MAX_WAV_FILE_SIZE - allowance)
+
+        relative_path = Path(
+            f"batch_{index // FILES_PER_DIRECTORY:04d}",
+            f"file_{index:06d}.{audio_format}",
+        )
+        filepath = output_directory / relative_path
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        create = create_mp3 if audio_format == "mp3" else create_wav
+        create(filepath, size)
+        if tag != "none":
+            add_id3_tag(
+                filepath,
+                rng,
+                large_tag_size if tag == "large-id3" else None,
+            )
+
+        yield CorpusFile(
+            str(relative_path), audio_format, filepath.stat().st_size, tag
+        )
+
+
+def _draw_size(
+    rng: random.Random, min_size: int, max_size: int, distribution: str
+) -> int:
+    if distribution == "uniform":
+        return rng.randint(min_size, max_size)
+    return int(math.exp(rng.uniform(math.log(min_size), math.log(max_size))))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate a corpus of synthetic MP3 and WAV files."
+    )
+    parser.add_argument("output_directory", type=Path)
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--formats", default="mp3,wav")
+    parser.add_argument("--min-size", type=parse_size, default="128KB")
+    parser.add_argument("--max-size", type=parse_size, default="16MB")
+    parser.add_argument(
+        "--distribution",
+        choices=["log-uniform", "uniform"],
+        default="log-uniform",
+    )
+    parser.add_argument("--tagged-fraction", type=float, default=0.5)
+    parser.add_argument("--large-tag-fraction", type=float, default=0.1)
+    parser.add_argument("--large-tag-size", type=parse_size, default="1MB")
+    parser.add_argument("--oversized-wav-fraction", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if not 0 < args.min_size <= args.max_size:
+        parser.error("--min-size must be positive and at most --max-size")
+
+    args.output_directory.mkdir(parents=True, exist_ok=True)
+    corpus_files = generate_corpus(
+        args.output_directory,
+        count=args.count,
+        formats=args.formats.split(","),
+        min_size=args.min_size,
+        max_size=args.max_size,
+        distribution=args.distribution,
+        tagged_fraction=args.tagged_fraction,
+        large_tag_fraction=args.large_tag_fraction,
+        large_tag_size=args.large_tag_size,
+        oversized_wav_fraction=args.oversized_wav_fraction,
+        seed=args.seed,
+    )
+    with open(
+        args.output_directory / "manifest.jsonl", "w", encoding="utf-8"
+    ) as manifest:
+        total_size = 0
+        for corpus_file in corpus_files:
+            manifest.write(json.dumps(asdict(corpus_file)) + "\n")
+            total_size += corpus_file.size
+    print(
+        f"Generated {args.count} files ({total_size / 1024**2:.1f}MB) "
+        f"in {args.output_directory}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import tracemalloc
+
+import pytest
+
+from transparentmeta.crypto.content_hasher import ContentHasher
+from transparentmeta.crypto.hasher import DEFAULT_BUFFER_SIZE
+from transparentmeta.crypto.signature_verifier import SignatureVerifier
+from transparentmeta.crypto.signer import Signer
+from transparentmeta.serialization.metadata_serializer import (
+    MetadataSerializer,
+)
+
+
+@pytest.fixture
+def serialized_metadata(metadata):
+    return MetadataSerializer().serialize(metadata)
+
+
+@pytest.fixture
+def signer(private_key):
+    return Signer(private_key)
+
+
+@pytest.fixture
+def signature_verifier(private_key):
+    return SignatureVerifier(private_key.public_key())
+
+
+def test_sign(benchmark, signer, serialized_metadata):
+    benchmark(signer.sign, serialized_metadata)
+
+
+def test_is_signature_valid(
+    benchmark, signer, signature_verifier, serialized_metadata
+):
+    signature = signer.sign(serialized_metadata)
+
+    is_valid = benchmark(
+        signature_verifier.is_signature_valid, serialized_metadata, signature
+    )
+
+    assert is_valid
+
+
+def test_verify_many(
+    benchmark, signer, signature_verifier, serialized_metadata
+):
+    signed_messages = [
+        (serialized_metadata, signer.sign(serialized_metadata))
+    ] * 100
+
+    verifications = benchmark(signature_verifier.verify_many, signed_messages)
+
+    assert all(verifications)
+
+
+def test_compute_content_hash(benchmark, tagged_audio_file):
+    content_hasher = ContentHasher()
+
+    content_hash = benchmark(
+        content_hasher.compute_content_hash, tagged_audio_file
+    )
+
+    assert content_hash.startswith("sha256:")
+
+
+def test_compute_content_hash_runs_in_constant_memory(tagged_audio_file):
+    content_hasher = ContentHasher()
+
+    tracemalloc.start()
+    try:
+        content_hasher.compute_content_hash(tagged_audio_file)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak_memory < 2 * DEFAULT_BUFFER_SIZE
@@ -0,0 +1,35 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Import-time benchmarks, run in fresh interpreters, since the benchmark
+session has already imported everything. They include the startup time of
+the interpreter, measured on its own as a baseline.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        pytest.param("pass", id="interpreter"),
+        pytest.param("import transparentmeta.sdk", id="sdk"),
+        pytest.param(
+            "from transparentmeta.sdk import build_transparent_metadata_reader",
+            id="sdk_factory",
+        ),
+        pytest.param("import transparentmeta.cli.main", id="cli"),
+    ],
+)
+def test_import_time(benchmark, code):
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-c", code],),
+        kwargs={"check": True},
+        rounds=10,
+    )
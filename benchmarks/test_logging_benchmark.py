@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Benchmarks of the logging overhead on the hot paths.
+
+With debug records disabled, the serializer, signer and verifier should run
+as fast as the operations they wrap, since log arguments are only built
+when records are emitted. Quiet mode should make per-file reads as fast as
+with the library logger left at the WARNING level.
+"""
+
+import logging
+import os
+
+import pytest
+
+from transparentmeta.crypto.signature_verifier import SignatureVerifier
+from transparentmeta.crypto.signer import Signer
+from transparentmeta.entity.metadata import Metadata
+from transparentmeta.logger_config import set_quiet_mode
+from transparentmeta.serialization.metadata_serializer import (
+    MetadataSerializer,
+)
+
+
+@pytest.fixture
+def library_logger_level():
+    """Logs the library's info records to /dev/null, so that their full
+    cost, formatting included, is measured."""
+    logger = logging.getLogger("transparentmeta")
+    level = logger.level
+    handler = logging.StreamHandler(open(os.devnull, "w", encoding="utf-8"))
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    )
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    yield logger
+    set_quiet_mode(False)
+    logger.removeHandler(handler)
+    handler.stream.close()
+    logger.setLevel(level)
+
+
+@pytest.mark.benchmark(group="deserialize-logging-overhead")
+def test_deserialize_without_serializer(benchmark, metadata):
+    serialized_metadata = metadata.model_dump_json()
+
+    benchmark(Metadata.model_validate_json, serialized_metadata)
+
+
+@pytest.mark.benchmark(group="deserialize-logging-overhead")
+def test_deserialize_with_debug_disabled(
+    benchmark, metadata, library_logger_level
+):
+    serialized_metadata = metadata.model_dump_json()
+
+    benchmark(MetadataSerializer().deserialize, serialized_metadata)
+
+
+@pytest.mark.benchmark(group="sign-logging-overhead")
+def test_sign_without_signer(benchmark, private_key, metadata):
+    message = metadata.model_dump_json()
+
+    benchmark(lambda: private_key.sign(message.encode("utf-8")).hex())
+
+
+@pytest.mark.benchmark(group="sign-logging-overhead")
+def test_sign_with_debug_disabled(
+    benchmark, private_key, metadata, library_logger_level
+):
+    benchmark(Signer(private_key).sign, metadata.model_dump_json())
+
+
+@pytest.mark.benchmark(group="verify-logging-overhead")
+def test_verify_without_verifier(benchmark, private_key, metadata):
+    message = metadata.model_dump_json().encode("utf-8")
+    signature = private_key.sign(message).hex()
+    public_key = private_key.public_key()
+
+    benchmark(lambda: public_key.verify(bytes.fromhex(signature), message))
+
+
+@pytest.mark.benchmark(group="verify-logging-overhead")
+def test_verify_with_debug_disabled(
+    benchmark, private_key, metadata, library_logger_level
+):
+    message = metadata.model_dump_json()
+    signature = Signer(private_key).sign(message)
+    signature_verifier = SignatureVerifier(private_key.public_key())
+
+    assert benchmark(signature_verifier.is_signature_valid, message, signature)
+
+
+@pytest.mark.benchmark(group="read-logging-overhead")
+@pytest.mark.parametrize("quiet_mode", [False, True], ids=["info", "quiet"])
+def test_read_small_mp3(
+    benchmark,
+    transparent_metadata_reader,
+    tagged_audio_files,
+    library_logger_level,
+    quiet_mode,
+):
+    set_quiet_mode(quiet_mode)
+    filepath = tagged_audio_files("mp3", "small")
+
+    read_result = benchmark(transparent_metadata_reader.read, filepath)
+
+    assert read_result.is_success
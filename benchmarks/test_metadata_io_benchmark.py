@@ -0,0 +1,115 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import random
+import struct
+
+import pytest
+from corpus_generator import add_id3_tag, create_mp3
+
+from transparentmeta.serialization.metadata_serializer import (
+    MetadataSerializer,
+)
+from transparentmeta.use_case.read.factory import build_metadata_reader
+from transparentmeta.use_case.write.factory import build_metadata_writer
+
+
+@pytest.fixture
+def serialized_metadata(metadata):
+    return MetadataSerializer().serialize(metadata)
+
+
+def test_metadata_reader_read(benchmark, audio_format, tagged_audio_file):
+    metadata_reader = build_metadata_reader(audio_format)
+
+    audio_file_data_reading = benchmark(
+        metadata_reader.read, tagged_audio_file
+    )
+
+    assert audio_file_data_reading.is_success
+
+
+def test_metadata_reader_read_tag_only(
+    benchmark, audio_format, tagged_audio_file
+):
+    # WAV files are memory-mapped, so the time shouldn't grow with size.
+    metadata_reader = build_metadata_reader(audio_format, tag_only=True)
+
+    audio_file_data_reading = benchmark(
+        metadata_reader.read, tagged_audio_file
+    )
+
+    assert audio_file_data_reading.is_success
+
+
+def test_metadata_writer_write(
+    benchmark, audio_format, writable_audio_file, serialized_metadata
+):
+    metadata_writer = build_metadata_writer(audio_format)
+
+    # The file is already tagged, so each round rewrites the tag in place.
+    benchmark(
+        metadata_writer.write,
+        writable_audio_file,
+        serialized_metadata,
+        "a" * 128,
+    )
+
+
+def test_metadata_writer_write_atomic(
+    benchmark, audio_format, writable_audio_file, serialized_metadata
+):
+    metadata_writer = build_metadata_writer(audio_format, atomic=True)
+
+    # Each round copies the file, so this measures the cost of the copy,
+    # which is close to zero on file systems with reflinks.
+    benchmark(
+        metadata_writer.write,
+        writable_audio_file,
+        serialized_metadata,
+        "a" * 128,
+    )
+
+
+def test_metadata_writer_write_with_large_existing_tag(
+    benchmark, tmp_path, serialized_metadata
+):
+    filepath = create_mp3(tmp_path / "tagged.mp3", 16 * 1024**2)
+    add_id3_tag(filepath, random.Random(0), picture_size=1024**2)
+    metadata_writer = build_metadata_writer("mp3")
+
+    benchmark(metadata_writer.write, filepath, serialized_metadata, "a" * 128)
+
+
+def create_wav_with_id3_chunk_before_data(filepath, data_size):
+    id3_chunk = b"id3 " + struct.pack("<I", 10) + b"ID3\x04" + b"\x00" * 6
+    header = (
+        b"RIFF"
+        + struct.pack("<I", 4 + 24 + len(id3_chunk) + 8 + data_size)
+        + b"WAVEfmt "
+        + struct.pack("<IHHIIHH", 16, 1, 2, 44100, 44100 * 4, 4, 16)
+        + id3_chunk
+        + b"data"
+        + struct.pack("<I", data_size)
+    )
+    with open(filepath, "wb") as f:
+        f.write(header)
+        f.truncate(len(header) + data_size)
+
+
+def test_wav_metadata_writer_write_with_id3_chunk_before_data(
+    benchmark, tmp_path, serialized_metadata
+):
+    # The tag grows, so the ID3 chunk can't be rewritten where it is. The
+    # audio data must not move, so this takes about as long as tagging a
+    # tiny file.
+    filepath = tmp_path / "id3_first.wav"
+    metadata_writer = build_metadata_writer("wav")
+
+    benchmark.pedantic(
+        metadata_writer.write,
+        args=(filepath, serialized_metadata, "a" * 128),
+        setup=lambda: create_wav_with_id3_chunk_before_data(filepath, 1024**3),
+        rounds=5,
+    )
@@ -0,0 +1,22 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+
+def test_sdk_write_and_read_round_trip(
+    benchmark,
+    transparent_metadata_writer,
+    transparent_metadata_reader,
+    writable_audio_file,
+    metadata,
+):
+    metadata_dict = metadata.model_dump()
+
+    def write_and_read():
+        transparent_metadata_writer.write(writable_audio_file, metadata_dict)
+        return transparent_metadata_reader.read(writable_audio_file)
+
+    read_result = benchmark(write_and_read)
+
+    assert read_result.is_success
+    assert read_result.metadata == metadata
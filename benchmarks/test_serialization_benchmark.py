@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import pytest
+
+from transparentmeta.serialization.metadata_serializer import (
+    MetadataFormat,
+    MetadataSerializer,
+)
+
+
+@pytest.fixture
+def metadata_serializer():
+    return MetadataSerializer()
+
+
+def test_serialize(benchmark, metadata_serializer, metadata):
+    benchmark(metadata_serializer.serialize, metadata)
+
+
+def test_deserialize(benchmark, metadata_serializer, metadata):
+    serialized_metadata = metadata_serializer.serialize(metadata)
+
+    deserialized_metadata = benchmark(
+        metadata_serializer.deserialize, serialized_metadata
+    )
+
+    assert deserialized_metadata == metadata
+
+
+@pytest.fixture
+def binary_metadata_serializer():
+    return MetadataSerializer(metadata_format=MetadataFormat.BINARY)
+
+
+def test_serialize_binary(benchmark, binary_metadata_serializer, metadata):
+    benchmark(binary_metadata_serializer.serialize, metadata)
+
+
+def test_deserialize_binary(benchmark, binary_metadata_serializer, metadata):
+    serialized_metadata = binary_metadata_serializer.serialize(metadata)
+
+    deserialized_metadata = benchmark(
+        binary_metadata_serializer.deserialize, serialized_metadata
+    )
+
+    assert deserialized_metadata == metadata
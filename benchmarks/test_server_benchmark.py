@@ -0,0 +1,135 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Verification server benchmarks, comparing a verification over a kept-alive
+connection, over a new connection, and in a fresh interpreter that loads the
+key, as services that shell out to a Python script per file do.
+"""
+
+import http.client
+import json
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from transparentmeta.crypto.key_management import save_public_key_to_pem_file
+from transparentmeta.server.verification_server import (
+    ServerConfig,
+    VerificationServer,
+)
+
+VERIFY_SCRIPT = """
+import sys
+from pathlib import Path
+from transparentmeta.crypto.key_management import (
+    load_public_key_from_pem_file,
+)
+from transparentmeta.sdk import build_transparent_metadata_reader
+
+reader = build_transparent_metadata_reader(
+    load_public_key_from_pem_file(Path(sys.argv[1]))
+)
+assert reader.read(Path(sys.argv[2])).is_success
+"""
+
+
+@pytest.fixture(scope="module")
+def verification_server(transparent_metadata_reader, tagged_audio_files):
+    server = VerificationServer(
+        ("127.0.0.1", 0),
+        transparent_metadata_reader=transparent_metadata_reader,
+        config=ServerConfig(
+            allowed_directories=(tagged_audio_files("mp3", "small").parent,)
+        ),
+    )
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,))
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def verify(connection, filepath):
+    connection.request(
+        "POST",
+        "/verify",
+        json.dumps({"path": str(filepath)}),
+        {"Content-Type": "application/json"},
+    )
+    record = json.loads(connection.getresponse().read())
+    assert record["is_success"]
+
+
+def test_server_verify_with_keep_alive(
+    benchmark, verification_server, tagged_audio_files
+):
+    filepath = tagged_audio_files("mp3", "small")
+    connection = http.client.HTTPConnection(
+        "127.0.0.1", verification_server.server_port
+    )
+
+    benchmark(verify, connection, filepath)
+
+    connection.close()
+
+
+def test_server_verify_with_new_connection(
+    benchmark, verification_server, tagged_audio_files
+):
+    filepath = tagged_audio_files("mp3", "small")
+
+    def verify_with_new_connection():
+        connection = http.client.HTTPConnection(
+            "127.0.0.1", verification_server.server_port
+        )
+        verify(connection, filepath)
+        connection.close()
+
+    benchmark(verify_with_new_connection)
+
+
+def test_server_verify_upload_with_keep_alive(
+    benchmark, verification_server, tagged_audio_files
+):
+    audio_data = tagged_audio_files("mp3", "small").read_bytes()
+    connection = http.client.HTTPConnection(
+        "127.0.0.1", verification_server.server_port
+    )
+
+    def verify_upload():
+        connection.request(
+            "POST", "/verify", audio_data, {"Content-Type": "audio/mpeg"}
+        )
+        assert json.loads(connection.getresponse().read())["is_success"]
+
+    benchmark(verify_upload)
+
+    connection.close()
+
+
+def test_verify_in_fresh_interpreter(
+    benchmark, private_key, tagged_audio_files, tmp_path
+):
+    public_key_file = tmp_path / "public.pem"
+    save_public_key_to_pem_file(private_key.public_key(), public_key_file)
+    filepath = tagged_audio_files("mp3", "small")
+
+    benchmark.pedantic(
+        subprocess.run,
+        args=(
+            [
+                sys.executable,
+                "-c",
+                VERIFY_SCRIPT,
+                str(public_key_file),
+                str(filepath),
+            ],
+        ),
+        kwargs={"check": True},
+        rounds=10,
+    )
@@ -0,0 +1,72 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Drop folder benchmarks, measuring the time from dropping a batch of files
+into a watched folder to all of them being tagged. The settle time is short,
+so that the time is dominated by event delivery and tagging.
+"""
+
+import shutil
+import threading
+import time
+
+import pytest
+
+from transparentmeta.watch.drop_folder_watcher import (
+    DropFolderWatcher,
+    WatchConfig,
+)
+from transparentmeta.watch.file_debouncer import FileDebouncer
+from transparentmeta.watch.file_event_source import build_file_event_source
+from transparentmeta.watch.metadata_resolver import TemplateMetadataResolver
+
+BATCH_SIZE = 20
+SETTLE_TIME = 0.05
+
+
+@pytest.mark.parametrize("force_polling", [False, True])
+@pytest.mark.parametrize("audio_format", ["mp3", "wav"])
+def test_drop_folder_watcher_tags_dropped_batch(
+    benchmark,
+    tmp_path,
+    untagged_audio_files,
+    transparent_metadata_writer,
+    metadata,
+    audio_format,
+    force_polling,
+):
+    source = untagged_audio_files(audio_format, "small")
+    watcher = DropFolderWatcher(
+        transparent_metadata_writer,
+        TemplateMetadataResolver(metadata.model_dump(mode="json")),
+        build_file_event_source(
+            [tmp_path], SETTLE_TIME, force_polling=force_polling
+        ),
+        FileDebouncer(SETTLE_TIME),
+        WatchConfig(tick=SETTLE_TIME),
+    )
+    thread = threading.Thread(target=watcher.run)
+    thread.start()
+    rounds = iter(range(1000))
+
+    def drop_batch():
+        batch = next(rounds)
+        expected_tagged = watcher.get_statistics().tagged + BATCH_SIZE
+        for index in range(BATCH_SIZE):
+            shutil.copyfile(
+                source, tmp_path / f"{batch}_{index}.{audio_format}"
+            )
+        while watcher.get_statistics().tagged < expected_tagged:
+            time.sleep(0.001)
+
+    try:
+        benchmark.pedantic(drop_batch, rounds=5, warmup_rounds=1)
+    finally:
+        watcher.stop()
+        thread.join()
+
+    statistics = watcher.get_statistics()
+    assert statistics.failed == 0
+    assert statistics.tagged % BATCH_SIZE == 0
@@ -0,0 +1,464 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import http.client
+import json
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from transparentmeta.cli.main import build_parser, main
+from transparentmeta.crypto.key_management import (
+    save_private_key_to_pem_file,
+    save_public_key_to_pem_file,
+)
+from transparentmeta.index.catalogue_index import CatalogueIndex
+from transparentmeta.sdk.factory import build_transparent_metadata_reader
+
+
+@pytest.fixture
+def key_files(tmp_path, keys):
+    private_key_file = tmp_path / "private.pem"
+    public_key_file = tmp_path / "public.pem"
+    save_private_key_to_pem_file(keys["private_key"], private_key_file)
+    save_public_key_to_pem_file(keys["public_key"], public_key_file)
+    return private_key_file, public_key_file
+
+
+@pytest.fixture
+def metadata_file(tmp_path):
+    metadata_file = tmp_path / "metadata.json"
+    metadata_file.write_text(
+        json.dumps(
+            {
+                "company": "Transparent Audio",
+                "model": "v2.1",
+                "ai_usage_level": "ai_generated",
+                "user_id": "user_67890",
+                "private_key_id": "dummy_private_key_id",
+            }
+        )
+    )
+    return metadata_file
+
+
+@pytest.fixture
+def catalogue(tmp_path, temp_mp3):
+    catalogue = tmp_path / "catalogue"
+    (catalogue / "album").mkdir(parents=True)
+    shutil.copy(temp_mp3, catalogue / "first.mp3")
+    shutil.copy(temp_mp3, catalogue / "album" / "second.mp3")
+    return catalogue
+
+
+def read_records(results_file):
+    return [json.loads(line) for line in results_file.read_text().splitlines()]
+
+
+def tag(catalogue, key_files, metadata_file, results_file, *extra_args):
+    return main(
+        [
+            "tag",
+            str(catalogue),
+            "--private-key",
+            str(key_files[0]),
+            "--metadata",
+            str(metadata_file),
+            "--jobs",
+            "1",
+            "--output",
+            str(results_file),
+            *extra_args,
+        ]
+    )
+
+
+def verify(catalogue, key_files, results_file, *extra_args):
+    return main(
+        [
+            "verify",
+            str(catalogue),
+            "--public-key",
+            str(key_files[1]),
+            "--output",
+            str(results_file),
+            *extra_args,
+        ]
+    )
+
+
+def test_importing_cli_does_not_import_server_or_watcher():
+    # The server and the watcher are only imported by their commands. A
+    # fresh interpreter is needed, since the test session has already
+    # imported them.
+    code = (
+        "import sys, transparentmeta.cli.main; "
+        "print(sorted(name for name in "
+        "('http.server', 'sqlite3', 'mutagen.mp3', 'mutagen.wave', "
+        "'transparentmeta.server.verification_server', "
+        "'transparentmeta.watch.drop_folder_watcher', "
+        "'transparentmeta.watch.file_event_source') "
+        "if name in sys.modules))"
+    )
+
+    completed_process = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed_process.stdout.strip() == "[]"
+
+
+def test_parser_requires_a_command():
+    with pytest.raises(SystemExit):
+        build_parser().parse_args([])
+
+
+def test_tag_writes_metadata_and_records_results(
+    catalogue, key_files, metadata_file, tmp_path, capsys
+):
+    results_file = tmp_path / "tag.jsonl"
+
+    exit_status = tag(catalogue, key_files, metadata_file, results_file)
+
+    assert exit_status == 0
+    records = read_records(results_file)
+    assert [record["filepath"] for record in records] == [
+        str(catalogue.resolve() / "first.mp3"),
+        str(catalogue.resolve() / "album" / "second.mp3"),
+    ]
+    assert all(record["is_success"] for record in records)
+    assert "Completed 2/2 files (0 failed)" in capsys.readouterr().err
+
+
+def test_tag_writes_metadata_in_binary_format(
+    catalogue, key_files, metadata_file, tmp_path
+):
+    results_file = tmp_path / "tag.jsonl"
+
+    exit_status = tag(
+        catalogue,
+        key_files,
+        metadata_file,
+        results_file,
+        "--metadata-format",
+        "binary",
+    )
+
+    assert exit_status == 0
+    assert verify(catalogue, key_files, tmp_path / "verify.jsonl") == 0
+    records = read_records(tmp_path / "verify.jsonl")
+    assert records[0]["metadata"]["company"] == "Transparent Audio"
+
+
+def test_tag_binds_content_hash(catalogue, key_files, metadata_file, tmp_path):
+    results_file = tmp_path / "tag.jsonl"
+
+    exit_status = tag(
+        catalogue,
+        key_files,
+        metadata_file,
+        results_file,
+        "--bind-content-hash",
+    )
+
+    assert exit_status == 0
+    audio_file = catalogue / "first.mp3"
+    audio_data = bytearray(audio_file.read_bytes())
+    audio_data[-1000] ^= 0xFF
+    audio_file.write_bytes(audio_data)
+    assert verify(catalogue, key_files, tmp_path / "verify.jsonl") == 1
+    records = {
+        record["filepath"]: record
+        for record in read_records(tmp_path / "verify.jsonl")
+    }
+    assert not records[str(audio_file.resolve())]["is_success"]
+    second_record = records[
+        str((catalogue / "album" / "second.mp3").resolve())
+    ]
+    assert second_record["metadata"]["content_hash"].startswith("sha256:")
+
+
+def test_tag_replaces_files_atomically(
+    catalogue, key_files, metadata_file, tmp_path
+):
+    audio_file = catalogue / "first.mp3"
+    original_inode = audio_file.stat().st_ino
+
+    exit_status = tag(
+        catalogue, key_files, metadata_file, tmp_path / "tag.jsonl", "--atomic"
+    )
+
+    assert exit_status == 0
+    assert audio_file.stat().st_ino != original_inode
+    assert verify(catalogue, key_files, tmp_path / "verify.jsonl") == 0
+
+
+def test_tag_fills_content_id_from_file_name(
+    catalogue, key_files, metadata_file, tmp_path
+):
+    tag(catalogue, key_files, metadata_file, tmp_path / "tag.jsonl")
+    results_file = tmp_path / "verify.jsonl"
+
+    exit_status = verify(catalogue, key_files, results_file)
+
+    assert exit_status == 0
+    content_ids = [
+        record["metadata"]["content_id"]
+        for record in read_records(results_file)
+    ]
+    assert content_ids == ["first", "second"]
+
+
+def test_tag_fills_valid_content_id_from_single_character_file_name(
+    catalogue, key_files, metadata_file, tmp_path
+):
+    (catalogue / "album" / "second.mp3").unlink()
+    (catalogue / "first.mp3").rename(catalogue / "a.mp3")
+
+    exit_status = tag(catalogue, key_files, metadata_file, tmp_path / "t")
+    results_file = tmp_path / "verify.jsonl"
+    verify(catalogue, key_files, results_file)
+
+    assert exit_status == 0
+    assert read_records(results_file)[0]["metadata"]["content_id"] == "a.mp3"
+
+
+def test_tag_resume_skips_files_already_recorded(
+    catalogue, key_files, metadata_file, tmp_path
+):
+    results_file = tmp_path / "tag.jsonl"
+    first_record = {
+        "filepath": str(catalogue.resolve() / "first.mp3"),
+        "is_success": True,
+        "error": None,
+    }
+    # The truncated last line of an interrupted run is ignored.
+    results_file.write_text(json.dumps(first_record) + '\n{"filepath')
+
+    tag(catalogue, key_files, metadata_file, results_file, "--resume")
+
+    # The truncated line is removed before new records are appended.
+    assert [record["filepath"] for record in read_records(results_file)] == [
+        str(catalogue.resolve() / "first.mp3"),
+        str(catalogue.resolve() / "album" / "second.mp3"),
+    ]
+    verify_results_file = tmp_path / "verify.jsonl"
+    verify(catalogue, key_files, verify_results_file)
+    records = read_records(verify_results_file)
+    assert not records[0]["is_success"]
+    assert records[1]["is_success"]
+
+
+def test_verify_resume_retries_failed_files(catalogue, key_files, tmp_path):
+    results_file = tmp_path / "verify.jsonl"
+    verify(catalogue, key_files, results_file)
+
+    exit_status = verify(catalogue, key_files, results_file, "--resume")
+
+    assert exit_status == 1
+    assert len(read_records(results_file)) == 4
+
+
+def test_verify_reports_failures_with_exit_status(
+    catalogue, key_files, tmp_path
+):
+    results_file = tmp_path / "verify.jsonl"
+
+    exit_status = verify(
+        catalogue, key_files, results_file, "--tag-only", "--jobs", "2"
+    )
+
+    assert exit_status == 1
+    records = read_records(results_file)
+    assert len(records) == 2
+    assert not any(record["is_success"] for record in records)
+    assert all(record["metadata"] is None for record in records)
+
+
+def test_verify_writes_to_standard_output_without_output_file(
+    catalogue, key_files, capsys
+):
+    exit_status = main(
+        ["verify", str(catalogue), "--public-key", str(key_files[1])]
+    )
+
+    lines = capsys.readouterr().out.splitlines()
+    assert exit_status == 1
+    assert len(lines) == 2
+    assert json.loads(lines[0])["filepath"].endswith("first.mp3")
+
+
+def test_resume_without_output_file_processes_all_files(
+    catalogue, key_files, capsys
+):
+    main(
+        [
+            "verify",
+            str(catalogue),
+            "--public-key",
+            str(key_files[1]),
+            "--resume",
+        ]
+    )
+
+    assert len(capsys.readouterr().out.splitlines()) == 2
+
+
+def test_scan_updates_catalogue_index(catalogue, key_files, tmp_path, capsys):
+    index_file = tmp_path / "index.db"
+
+    exit_status = main(
+        [
+            "scan",
+            str(catalogue),
+            "--public-key",
+            str(key_files[1]),
+            "--index",
+            str(index_file),
+        ]
+    )
+
+    assert exit_status == 0
+    assert json.loads(capsys.readouterr().out) == {
+        "indexed": 2,
+        "skipped": 0,
+        "removed": 0,
+    }
+    catalogue_index = CatalogueIndex(index_file)
+    assert len(catalogue_index.find()) == 2
+    catalogue_index.close()
+
+
+def test_watch_tags_dropped_files_until_stopped(
+    tmp_path, temp_mp3, key_files, metadata_file, keys, capsys
+):
+    drop_folder = tmp_path / "drop"
+    drop_folder.mkdir()
+    reader = build_transparent_metadata_reader(keys["public_key"])
+
+    def drop_file_and_stop():
+        shutil.copy(temp_mp3, drop_folder / "dropped.mp3")
+        deadline = time.monotonic() + 5
+        while not reader.read(drop_folder / "dropped.mp3").is_success:
+            if time.monotonic() > deadline:
+                break
+            time.sleep(0.05)
+        os.kill(os.getpid(), signal.SIGTERM)
+
+    dropper = threading.Timer(0.2, drop_file_and_stop)
+    dropper.start()
+    exit_status = main(
+        [
+            "watch",
+            str(drop_folder),
+            "--private-key",
+            str(key_files[0]),
+            "--metadata",
+            str(metadata_file),
+            "--poll",
+            "--polling-interval",
+            "0.05",
+            "--settle-time",
+            "0.05",
+        ]
+    )
+    dropper.join()
+
+    assert exit_status == 0
+    statistics = json.loads(capsys.readouterr().out)
+    assert statistics["tagged"] == 1
+    assert statistics["failed"] == 0
+    assert statistics["files_per_second"] > 0
+    assert signal.getsignal(signal.SIGTERM) is signal.SIG_DFL
+
+
+def test_serve_requires_a_key():
+    with pytest.raises(SystemExit):
+        main(["serve"])
+
+
+def test_serve_verifies_files_until_stopped(
+    tmp_path, temp_mp3, key_files, metadata_dict, capsys
+):
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    responses = []
+
+    def sign_verify_and_stop():
+        deadline = time.monotonic() + 5
+        try:
+            while time.monotonic() < deadline:
+                connection = http.client.HTTPConnection(
+                    "127.0.0.1", port, timeout=5
+                )
+                try:
+                    connection.request("GET", "/health")
+                    break
+                except ConnectionRefusedError:
+                    time.sleep(0.05)
+            connection.getresponse().read()
+            for path, request in (
+                (
+                    "/sign",
+                    {
+                        "path": str(temp_mp3),
+                        "metadata": {
+                            **metadata_dict,
+                            "created_at": metadata_dict[
+                                "created_at"
+                            ].isoformat(),
+                        },
+                    },
+                ),
+                ("/verify", {"path": str(temp_mp3)}),
+            ):
+                connection.request(
+                    "POST",
+                    path,
+                    json.dumps(request),
+                    {"Content-Type": "application/json"},
+                )
+                responses.append(json.loads(connection.getresponse().read()))
+            connection.close()
+        finally:
+            os.kill(os.getpid(), signal.SIGTERM)
+
+    client = threading.Thread(target=sign_verify_and_stop)
+    client.start()
+    exit_status = main(
+        [
+            "serve",
+            "--port",
+            str(port),
+            "--private-key",
+            str(key_files[0]),
+            "--public-key",
+            str(key_files[1]),
+            "--allow-dir",
+            str(tmp_path),
+            "--keep-alive-timeout",
+            "0.5",
+        ]
+    )
+    client.join()
+
+    assert exit_status == 0
+    assert f"Listening on http://127.0.0.1:{port}" in capsys.readouterr().err
+    assert responses[0] == {"is_success": True, "error": None}
+    assert responses[1]["is_success"] is True
+    assert (
+        responses[1]["metadata"]["content_id"] == metadata_dict["content_id"]
+    )
+    assert signal.getsignal(signal.SIGTERM) is signal.SIG_DFL
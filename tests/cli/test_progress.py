@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import io
+
+from transparentmeta.cli.progress import ProgressReporter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_progress_reporter_reports_at_most_once_per_interval():
+    stream = io.StringIO()
+    clock = FakeClock()
+    progress_reporter = ProgressReporter(
+        4, stream=stream, interval_seconds=1.0, clock=clock
+    )
+
+    clock.now = 0.5
+    progress_reporter.update(True)
+    clock.now = 1.0
+    progress_reporter.update(False)
+    clock.now = 1.5
+    progress_reporter.update(True)
+
+    assert stream.getvalue() == (
+        "Processed 2/4 files (1 failed) in 1.0s, 2.0 files/s\n"
+    )
+
+
+def test_progress_reporter_reports_throughput_when_finished():
+    stream = io.StringIO()
+    clock = FakeClock()
+    progress_reporter = ProgressReporter(2, stream=stream, clock=clock)
+
+    progress_reporter.update(True)
+    progress_reporter.update(True)
+    clock.now = 4.0
+    progress_reporter.finish()
+
+    assert stream.getvalue() == (
+        "Completed 2/2 files (0 failed) in 4.0s, 0.5 files/s\n"
+    )
+
+
+def test_progress_reporter_handles_zero_elapsed_time():
+    stream = io.StringIO()
+    progress_reporter = ProgressReporter(0, stream=stream, clock=FakeClock())
+
+    progress_reporter.finish()
+
+    assert stream.getvalue() == (
+        "Completed 0/0 files (0 failed) in 0.0s, 0.0 files/s\n"
+    )
@@ -0,0 +1,62 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+from pathlib import Path
+
+import pytest
+
+import transparentmeta.cli.results_file as results_file_module
+from transparentmeta.cli.results_file import ResultsFile
+
+RECORD = {"filepath": "/music/track.mp3", "is_success": True}
+
+
+@pytest.mark.parametrize(
+    "content, expected_content",
+    [
+        ('{"a": 1}\n{"b": 2}\n', '{"a": 1}\n{"b": 2}\n'),
+        ('{"a": 1}\n{"b"', '{"a": 1}\n'),
+        ('{"a": 1}\n' + "x" * 10, '{"a": 1}\n'),
+        ('{"b"', ""),
+        ("", ""),
+    ],
+)
+def test_results_file_truncates_partial_last_line_when_opened(
+    monkeypatch, tmp_path, content, expected_content
+):
+    # A small chunk size makes the backward scan cross chunk boundaries.
+    monkeypatch.setattr(results_file_module, "TAIL_CHUNK_SIZE", 4)
+    filepath = tmp_path / "results.jsonl"
+    filepath.write_text(content)
+
+    with ResultsFile(filepath) as results_file:
+        results_file.write(RECORD)
+
+    assert filepath.read_text() == expected_content + (
+        '{"filepath": "/music/track.mp3", "is_success": true}\n'
+    )
+
+
+def test_results_file_loads_only_successful_records(tmp_path):
+    filepath = tmp_path / "results.jsonl"
+    filepath.write_text(
+        '{"filepath": "/music/first.mp3", "is_success": true}\n'
+        '{"filepath": "/music/second.mp3", "is_success": false}\n'
+        '{"is_success": true}\n'
+        '["/music/third.mp3"]\n'
+        '{"filepath": 3, "is_success": true}\n'
+        '{"filepath": "/music/fourth.mp3", "is_suc'
+    )
+
+    completed_filepaths = ResultsFile(filepath).load_completed_filepaths()
+
+    assert completed_filepaths == {Path("/music/first.mp3")}
+
+
+def test_results_file_loads_nothing_without_file(tmp_path):
+    assert (
+        ResultsFile(tmp_path / "missing.jsonl").load_completed_filepaths()
+        == set()
+    )
+    assert ResultsFile(None).load_completed_filepaths() == set()
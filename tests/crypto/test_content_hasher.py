@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import hashlib
+import io
+
+import pytest
+from mutagen.id3 import TXXX
+from mutagen.mp3 import MP3
+from mutagen.wave import WAVE
+
+from transparentmeta.crypto.content_hasher import ContentHasher
+
+
+def add_txxx_tag(audio, text):
+    if audio.tags is None:
+        audio.add_tags()
+    audio.tags.add(TXXX(encoding=3, desc="test", text=text))
+    audio.save()
+
+
+def test_content_hash_names_its_algorithm():
+    content_hasher = ContentHasher("sha512")
+    audio_data = b"\xff\xfb" + b"a" * 100
+
+    content_hash = content_hasher.compute_content_hash(io.BytesIO(audio_data))
+
+    assert content_hash == "sha512:" + hashlib.sha512(audio_data).hexdigest()
+
+
+@pytest.mark.parametrize("audio_file", ["temp_mp3", "temp_wav"])
+def test_content_hash_does_not_change_when_tags_change(audio_file, request):
+    filepath = request.getfixturevalue(audio_file)
+    content_hasher = ContentHasher()
+    audio_class = MP3 if audio_file == "temp_mp3" else WAVE
+
+    content_hash = content_hasher.compute_content_hash(filepath)
+    add_txxx_tag(audio_class(filepath), "x" * 5000)
+
+    assert content_hasher.compute_content_hash(filepath) == content_hash
+    assert content_hasher.is_content_hash_valid(filepath, content_hash)
+
+
+def test_content_hash_is_invalid_when_audio_changes(temp_mp3):
+    content_hasher = ContentHasher()
+    content_hash = content_hasher.compute_content_hash(temp_mp3)
+
+    audio_data = bytearray(temp_mp3.read_bytes())
+    audio_data[-1000] ^= 0xFF
+    temp_mp3.write_bytes(audio_data)
+
+    assert not content_hasher.is_content_hash_valid(temp_mp3, content_hash)
+
+
+def test_content_hash_is_verified_with_its_own_algorithm(temp_mp3):
+    content_hash = ContentHasher("blake2b").compute_content_hash(temp_mp3)
+
+    assert ContentHasher("sha256").is_content_hash_valid(
+        temp_mp3, content_hash
+    )
+
+
+def test_content_hash_with_unsupported_algorithm_is_invalid(temp_mp3, caplog):
+    assert not ContentHasher().is_content_hash_valid(temp_mp3, "fakehash:00")
+    assert "Unsupported content hash algorithm: fakehash" in caplog.text
+
+
+def test_content_hash_is_the_same_with_small_buffer(temp_mp3):
+    assert ContentHasher(buffer_size=7).compute_content_hash(
+        temp_mp3
+    ) == ContentHasher().compute_content_hash(temp_mp3)
+
+
+def test_position_of_file_object_is_restored(temp_mp3):
+    audio_buffer = io.BytesIO(temp_mp3.read_bytes())
+    audio_buffer.seek(42)
+
+    ContentHasher().compute_content_hash(audio_buffer)
+
+    assert audio_buffer.tell() == 42
+
+
+def test_invalid_hash_algorithm_raises_error():
+    with pytest.raises(ValueError, match="Invalid hash algorithm: fakehash"):
+        ContentHasher("fakehash")
@@ -3,6 +3,7 @@
 # Author: Valerio Velardo - valerio@transparentaudio.ai
 
 import hashlib
+import io
 
 import pytest
 
@@ -63,3 +64,27 @@ def test_two_hasher_instances_do_not_interfere_with_each_other():
     hash2 = hasher2.hash(b"instance2")
 
     assert hash1 != hash2
+
+
+@pytest.mark.parametrize("buffer_size", [1, 3, 1024])
+def test_hash_stream_matches_hash_of_concatenated_ranges(buffer_size):
+    hasher = Hasher("sha256")
+    stream = io.BytesIO(b"0123456789abcdef")
+
+    digest = hasher.hash_stream(
+        stream, [(2, 6), (8, 8), (10, 16)], buffer_size
+    )
+
+    assert digest == hasher.hash(b"2345abcdef")
+
+
+def test_hash_stream_without_ranges_matches_hash_of_empty_data():
+    hasher = Hasher("sha256")
+    assert hasher.hash_stream(io.BytesIO(b"data"), []) == hasher.hash(b"")
+
+
+def test_hash_stream_raises_when_range_exceeds_stream():
+    hasher = Hasher("sha256")
+
+    with pytest.raises(EOFError, match="range 2-10"):
+        hasher.hash_stream(io.BytesIO(b"data"), [(2, 10)])
@@ -211,6 +211,19 @@ def test_load_public_key_from_pem_raises_error_if_invalid_pem_file(
         keys_manager.load_public_key_from_pem_file(invalid_pem_file)
 
 
+def test_get_public_key_fingerprint_is_stable_per_key():
+    _, public_key = keys_manager.generate_key_pair()
+    _, other_public_key = keys_manager.generate_key_pair()
+
+    fingerprint = keys_manager.get_public_key_fingerprint(public_key)
+
+    assert len(fingerprint) == 64
+    assert fingerprint == keys_manager.get_public_key_fingerprint(public_key)
+    assert fingerprint != keys_manager.get_public_key_fingerprint(
+        other_public_key
+    )
+
+
 def test_generate_key_pair_logs_info(caplog):
     with caplog.at_level(logging.INFO):
         _, _ = keys_manager.generate_key_pair()
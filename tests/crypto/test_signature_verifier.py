@@ -79,3 +79,54 @@ def test_signature_verification_with_empty_message_works(signing):
     assert verifier.is_signature_valid(
         message, signature
     ), "Empty message should verify correctly"
+
+
+def test_verify_many_reports_which_signatures_are_invalid(signing):
+    signer, verifier = signing
+
+    signature = signer.sign("Test Message")
+    signed_messages = [
+        ("Test Message", signature),
+        ("Tampered Message", signature),
+        ("Test Message", "not_a_hex_string"),
+        ("Test Message", "é"),
+        ("", signer.sign("")),
+    ]
+
+    assert verifier.verify_many(signed_messages) == [
+        True,
+        False,
+        False,
+        False,
+        True,
+    ]
+
+
+def test_verify_many_matches_is_signature_valid(signing):
+    signer, verifier = signing
+
+    signed_messages = [
+        (f"Message {index}", signer.sign(f"Message {index % 3}"))
+        for index in range(9)
+    ]
+
+    assert verifier.verify_many(iter(signed_messages)) == [
+        verifier.is_signature_valid(message, signature)
+        for message, signature in signed_messages
+    ]
+
+
+def test_verify_many_with_no_signatures(signing):
+    _, verifier = signing
+    assert verifier.verify_many([]) == []
+
+
+def test_signature_of_bytes_is_verified(signing):
+    signer, verifier = signing
+
+    message = b"\x00\xffTest Message"
+    signature = signer.sign(message)
+
+    assert verifier.is_signature_valid(message, signature)
+    assert not verifier.is_signature_valid(b"\x00\xfeTest Message", signature)
+    assert verifier.verify_many([(message, signature)]) == [True]
@@ -86,3 +86,14 @@ def test_signature_length(ed25519_key):
     assert (
         len(signature) == ed25519_key.sign(b"test").hex().__len__()
     ), "Signature length should be consistent"
+
+
+def test_sign_bytes_signs_them_as_they_are(ed25519_key):
+    signer = Signer(ed25519_key, CharacterEncoding.UTF8)
+
+    signature = signer.sign(b"\x00\xffTest")
+
+    ed25519_key.public_key().verify(
+        binascii.unhexlify(signature), b"\x00\xffTest"
+    )
+    assert signer.sign("Test") == signer.sign(b"Test")
@@ -83,6 +83,7 @@ def test_metadata_optional_fields_omitted_without_error():
         private_key_id="dummy_private_key_id",
     )
     assert metadata.additional_info is None
+    assert metadata.content_hash is None
 
 
 @pytest.mark.parametrize(
@@ -117,3 +118,22 @@ def test_metadata_invalid_ai_usage_level_enum_raises_validation_error():
             user_id="user_67890",
             private_key_id="dummy_private_key_id",
         )
+
+
+def test_metadata_accepts_valid_content_hash(metadata_dict):
+    metadata_dict["content_hash"] = "sha3_256:" + "0a" * 32
+    metadata = Metadata(**metadata_dict)
+    assert metadata.content_hash == "sha3_256:" + "0a" * 32
+
+
+@pytest.mark.parametrize(
+    "invalid_content_hash",
+    ["0a0a0a", "sha256:", "SHA256:0a", "sha256:0A", "sha256:" + "0" * 200],
+)
+def test_metadata_invalid_content_hash_raises_validation_error(
+    invalid_content_hash, metadata_dict
+):
+    metadata_dict["content_hash"] = invalid_content_hash
+
+    with pytest.raises(ValidationError):
+        Metadata(**metadata_dict)
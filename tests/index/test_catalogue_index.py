@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+from pathlib import Path
+
+import pytest
+
+from transparentmeta.entity.metadata import AIUsageLevel
+from transparentmeta.index.catalogue_index import (
+    CatalogueIndex,
+    IndexedFile,
+    IndexedMetadata,
+)
+from transparentmeta.result.result import ReadResult
+
+
+@pytest.fixture
+def catalogue_index(tmp_path):
+    catalogue_index = CatalogueIndex(tmp_path / "catalogue.sqlite")
+    yield catalogue_index
+    catalogue_index.close()
+
+
+@pytest.fixture
+def verified_file(metadata):
+    return IndexedFile.from_read_result(
+        Path("/music/album/track.mp3"),
+        (1, 2, 3, 4),
+        ReadResult(is_success=True, metadata=metadata),
+        "key-fingerprint",
+    )
+
+
+@pytest.fixture
+def unverified_file():
+    return IndexedFile.from_read_result(
+        Path("/music/album/untagged.wav"),
+        (1, 5, 3, 4),
+        ReadResult(is_success=False, error="Signature verification failed."),
+        "key-fingerprint",
+    )
+
+
+def test_indexed_file_from_successful_read_result(verified_file, metadata):
+    assert verified_file.is_verified
+    assert verified_file.error is None
+    assert verified_file.key_fingerprint == "key-fingerprint"
+    assert verified_file.metadata == IndexedMetadata(
+        content_id=metadata.content_id,
+        private_key_id=metadata.private_key_id,
+        ai_usage_level=metadata.ai_usage_level,
+        created_at=metadata.created_at,
+    )
+
+
+def test_indexed_file_from_failed_read_result(unverified_file):
+    assert not unverified_file.is_verified
+    assert unverified_file.error == "Signature verification failed."
+    assert unverified_file.metadata is None
+    assert unverified_file.key_fingerprint == "key-fingerprint"
+
+
+def test_catalogue_index_round_trips_indexed_files(
+    catalogue_index, verified_file, unverified_file
+):
+    assert catalogue_index.upsert([verified_file, unverified_file]) == 2
+
+    assert catalogue_index.find() == [verified_file, unverified_file]
+
+
+def test_catalogue_index_persists_across_connections(tmp_path, verified_file):
+    database_path = tmp_path / "catalogue.sqlite"
+    first_catalogue_index = CatalogueIndex(database_path)
+    first_catalogue_index.upsert([verified_file])
+    first_catalogue_index.close()
+
+    second_catalogue_index = CatalogueIndex(database_path)
+    assert second_catalogue_index.find() == [verified_file]
+    second_catalogue_index.close()
+
+
+def test_catalogue_index_finds_files_matching_all_criteria(
+    catalogue_index, verified_file, unverified_file, metadata
+):
+    catalogue_index.upsert([verified_file, unverified_file])
+
+    assert catalogue_index.find(
+        ai_usage_level=AIUsageLevel.AI_ASSISTED,
+        private_key_id=metadata.private_key_id,
+    ) == [verified_file]
+    assert catalogue_index.find(content_id=metadata.content_id) == [
+        verified_file
+    ]
+    assert catalogue_index.find(is_verified=False) == [unverified_file]
+    assert catalogue_index.find(ai_usage_level=AIUsageLevel.AI_GENERATED) == []
+
+
+def test_catalogue_index_replaces_record_of_same_path(
+    catalogue_index, verified_file
+):
+    catalogue_index.upsert([verified_file])
+    modified_file = IndexedFile(verified_file.filepath, (1, 2, 9, 9), False)
+    catalogue_index.upsert([modified_file])
+
+    assert catalogue_index.find() == [modified_file]
+
+
+def test_catalogue_index_gets_file_identities_in_directory_tree(
+    catalogue_index, verified_file
+):
+    sibling_file = IndexedFile(
+        Path("/music/album2/track.mp3"), (0,) * 4, False
+    )
+    catalogue_index.upsert([verified_file, sibling_file])
+
+    assert catalogue_index.get_file_identities(
+        Path("/music/album"), "key-fingerprint"
+    ) == {verified_file.filepath: verified_file.file_identity}
+    assert (
+        len(catalogue_index.get_file_identities(Path("/music"), "other")) == 2
+    )
+
+
+def test_catalogue_index_gets_no_identity_for_files_verified_with_other_key(
+    catalogue_index, verified_file
+):
+    catalogue_index.upsert([verified_file])
+
+    assert catalogue_index.get_file_identities(
+        Path("/music/album"), "other-key-fingerprint"
+    ) == {verified_file.filepath: None}
+
+
+def test_catalogue_index_removes_files(
+    catalogue_index, verified_file, unverified_file
+):
+    catalogue_index.upsert([verified_file, unverified_file])
+
+    assert catalogue_index.remove([verified_file.filepath]) == 1
+    assert catalogue_index.find() == [unverified_file]
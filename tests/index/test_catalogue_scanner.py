@@ -0,0 +1,129 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import shutil
+
+import pytest
+
+from transparentmeta.crypto.key_management import generate_key_pair
+from transparentmeta.index.catalogue_index import CatalogueIndex
+from transparentmeta.index.catalogue_scanner import (
+    CatalogueScanner,
+    ScanSummary,
+)
+from transparentmeta.request.write_request import WriteRequest
+from transparentmeta.sdk.factory import build_transparent_metadata_reader
+from transparentmeta.use_case.write.factory import build_write_use_case
+from transparentmeta.utils.file_utils import get_file_identity
+
+private_key, public_key = generate_key_pair()
+
+
+@pytest.fixture
+def catalogue_directory(tmp_path, temp_mp3, temp_wav, metadata):
+    catalogue_directory = tmp_path / "catalogue"
+    (catalogue_directory / "album").mkdir(parents=True)
+    signed_mp3 = catalogue_directory / "album" / "signed.mp3"
+    shutil.copy(temp_mp3, signed_mp3)
+    build_write_use_case(private_key, "mp3").write(
+        WriteRequest(filepath=signed_mp3, metadata=metadata)
+    )
+    shutil.copy(temp_wav, catalogue_directory / "untagged.wav")
+    (catalogue_directory / "notes.txt").write_text("not audio")
+    return catalogue_directory
+
+
+@pytest.fixture
+def catalogue_scanner(tmp_path):
+    catalogue_index = CatalogueIndex(tmp_path / "catalogue.sqlite")
+    yield CatalogueScanner(
+        build_transparent_metadata_reader(public_key),
+        catalogue_index,
+        workers=2,
+    )
+    catalogue_index.close()
+
+
+def test_catalogue_scanner_indexes_audio_files(
+    catalogue_directory, catalogue_scanner, metadata
+):
+    scan_summary = catalogue_scanner.scan(catalogue_directory)
+
+    assert scan_summary == ScanSummary(indexed=2, skipped=0, removed=0)
+    verified_files = catalogue_scanner.catalogue_index.find(is_verified=True)
+    assert [indexed_file.filepath for indexed_file in verified_files] == [
+        catalogue_directory.resolve() / "album" / "signed.mp3"
+    ]
+    assert verified_files[0].metadata.content_id == metadata.content_id
+    assert len(catalogue_scanner.catalogue_index.find(is_verified=False)) == 1
+
+
+def test_catalogue_scanner_rescans_only_changed_files(
+    mocker, catalogue_directory, catalogue_scanner, temp_mp3
+):
+    catalogue_scanner.scan(catalogue_directory)
+    shutil.copy(temp_mp3, catalogue_directory / "album" / "signed.mp3")
+    read_many_spy = mocker.spy(
+        catalogue_scanner.transparent_metadata_reader, "read_many"
+    )
+
+    scan_summary = catalogue_scanner.scan(catalogue_directory)
+
+    assert scan_summary == ScanSummary(indexed=1, skipped=1, removed=0)
+    assert read_many_spy.call_args.args[0] == [
+        catalogue_directory.resolve() / "album" / "signed.mp3"
+    ]
+    assert catalogue_scanner.catalogue_index.find(is_verified=True) == []
+
+
+def test_catalogue_scanner_removes_deleted_files(
+    catalogue_directory, catalogue_scanner
+):
+    catalogue_scanner.scan(catalogue_directory)
+    (catalogue_directory / "untagged.wav").unlink()
+
+    scan_summary = catalogue_scanner.scan(catalogue_directory)
+
+    assert scan_summary == ScanSummary(indexed=0, skipped=1, removed=1)
+    assert len(catalogue_scanner.catalogue_index.find()) == 1
+
+
+def test_catalogue_scanner_rereads_files_when_key_changes(
+    catalogue_directory, catalogue_scanner
+):
+    catalogue_scanner.scan(catalogue_directory)
+    _, other_public_key = generate_key_pair()
+    catalogue_scanner.transparent_metadata_reader = (
+        build_transparent_metadata_reader(other_public_key)
+    )
+
+    scan_summary = catalogue_scanner.scan(catalogue_directory)
+
+    assert scan_summary == ScanSummary(indexed=2, skipped=0, removed=0)
+    assert catalogue_scanner.catalogue_index.find(is_verified=True) == []
+
+
+def test_catalogue_scanner_removes_files_deleted_during_scan(
+    mocker, catalogue_directory, catalogue_scanner
+):
+    catalogue_scanner.scan(catalogue_directory)
+    deleted_filepath = catalogue_directory.resolve() / "untagged.wav"
+
+    def get_file_identity_of_deleted_file(filepath):
+        if filepath == deleted_filepath:
+            raise FileNotFoundError(filepath)
+        return get_file_identity(filepath)
+
+    mocker.patch(
+        "transparentmeta.index.catalogue_scanner.get_file_identity",
+        side_effect=get_file_identity_of_deleted_file,
+    )
+
+    scan_summary = catalogue_scanner.scan(catalogue_directory)
+
+    assert scan_summary == ScanSummary(indexed=0, skipped=1, removed=1)
+    assert [
+        indexed_file.filepath
+        for indexed_file in catalogue_scanner.catalogue_index.find()
+    ] == [catalogue_directory.resolve() / "album" / "signed.mp3"]
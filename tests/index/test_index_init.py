@@ -0,0 +1,18 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import transparentmeta.index as index
+
+
+def test_index_public_api():
+    expected_exports = {
+        "CatalogueIndex",
+        "IndexedFile",
+        "IndexedMetadata",
+        "CatalogueScanner",
+        "ScanSummary",
+    }
+    actual_exports = set(index.__all__)
+
+    assert actual_exports == expected_exports
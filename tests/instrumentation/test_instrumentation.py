@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import threading
+
+import pytest
+
+from transparentmeta.instrumentation.instrumentation import (
+    Instrumentation,
+    Stage,
+    run_stage,
+)
+from transparentmeta.sdk.factory import (
+    build_transparent_metadata_reader,
+    build_transparent_metadata_writer,
+)
+
+
+class RecordingInstrumentation(Instrumentation):
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def on_stage(self, stage, filepath, duration_ns, num_bytes):
+        with self._lock:
+            self.calls.append((stage, filepath, duration_ns, num_bytes))
+
+    @property
+    def stages(self):
+        return [call[0] for call in self.calls]
+
+
+@pytest.fixture
+def instrumentation():
+    return RecordingInstrumentation()
+
+
+def test_run_stage_without_instrumentation_runs_stage_only():
+    def num_bytes(_):
+        raise AssertionError("num_bytes must not be computed")
+
+    assert run_stage(None, Stage.SIGN, "file", num_bytes, lambda: 42) == 42
+
+
+def test_run_stage_reports_timing(instrumentation):
+    result = run_stage(
+        instrumentation, Stage.SIGN, "file", lambda _: 10, lambda: 42
+    )
+
+    assert result == 42
+    [(stage, filepath, duration_ns, num_bytes)] = instrumentation.calls
+    assert (stage, filepath, num_bytes) == (Stage.SIGN, "file", 10)
+    assert duration_ns >= 0
+
+
+def test_run_stage_passes_result_to_num_bytes(instrumentation):
+    run_stage(instrumentation, Stage.SERIALIZE, "file", len, lambda: "abc")
+
+    assert instrumentation.calls[0][3] == 3
+
+
+def test_run_stage_reports_timing_of_failed_stage(instrumentation):
+    def fail():
+        raise ValueError("stage failed")
+
+    with pytest.raises(ValueError, match="stage failed"):
+        run_stage(
+            instrumentation,
+            Stage.SERIALIZE,
+            "file",
+            lambda serialized: len(serialized or ""),
+            fail,
+        )
+
+    assert instrumentation.calls[0][0] == Stage.SERIALIZE
+    assert instrumentation.calls[0][3] == 0
+
+
+def test_write_and_read_report_all_stages(
+    temp_mp3, metadata_dict, keys, instrumentation
+):
+    writer = build_transparent_metadata_writer(
+        keys["private_key"], instrumentation=instrumentation
+    )
+    reader = build_transparent_metadata_reader(
+        keys["public_key"], instrumentation=instrumentation
+    )
+
+    writer.write(temp_mp3, metadata_dict)
+    write_calls = instrumentation.calls
+    instrumentation.calls = []
+    read_result = reader.read(temp_mp3)
+
+    assert read_result.is_success
+    assert [call[0] for call in write_calls] == [
+        Stage.VALIDATE,
+        Stage.SERIALIZE,
+        Stage.SIGN,
+        Stage.LOAD,
+        Stage.SAVE,
+    ]
+    assert instrumentation.stages == [
+        Stage.VALIDATE,
+        Stage.LOAD,
+        Stage.VERIFY,
+        Stage.DESERIALIZE,
+    ]
+    for _, filepath, _, num_bytes in write_calls + instrumentation.calls:
+        assert filepath == temp_mp3
+        assert num_bytes > 0
+
+
+def test_write_and_read_bytes_report_sizes_of_audio_data(
+    temp_wav, metadata_dict, keys, instrumentation
+):
+    writer = build_transparent_metadata_writer(
+        keys["private_key"], instrumentation=instrumentation
+    )
+    reader = build_transparent_metadata_reader(
+        keys["public_key"], instrumentation=instrumentation
+    )
+    audio_data = temp_wav.read_bytes()
+
+    tagged_audio_data = writer.write_bytes(audio_data, "wav", metadata_dict)
+    reader.read_bytes(tagged_audio_data, "wav")
+
+    sizes = {
+        (stage, num_bytes) for stage, _, _, num_bytes in instrumentation.calls
+    }
+    assert (Stage.VALIDATE, len(audio_data)) in sizes
+    assert (Stage.LOAD, len(audio_data)) in sizes
+    assert (Stage.SAVE, len(tagged_audio_data)) in sizes
+    assert (Stage.VALIDATE, len(tagged_audio_data)) in sizes
+
+
+def test_failed_validation_is_reported(tmp_path, keys, instrumentation):
+    reader = build_transparent_metadata_reader(
+        keys["public_key"], instrumentation=instrumentation
+    )
+
+    with pytest.raises(FileNotFoundError):
+        reader.read(tmp_path / "missing.mp3")
+
+    assert instrumentation.calls[0][0] == Stage.VALIDATE
+    assert instrumentation.calls[0][3] == 0
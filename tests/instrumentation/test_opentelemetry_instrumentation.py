@@ -0,0 +1,59 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+from pathlib import Path
+
+from transparentmeta.instrumentation.instrumentation import Stage
+from transparentmeta.instrumentation.opentelemetry_instrumentation import (
+    OpenTelemetrySpanInstrumentation,
+)
+
+
+class FakeTracer:
+    """Tracer with the start_span interface of the OpenTelemetry API."""
+
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, start_time, attributes):
+        span = FakeSpan(name, start_time, attributes)
+        self.spans.append(span)
+        return span
+
+
+class FakeSpan:
+    def __init__(self, name, start_time, attributes):
+        self.name = name
+        self.start_time = start_time
+        self.attributes = attributes
+        self.end_time = None
+
+    def end(self, end_time):
+        self.end_time = end_time
+
+
+def test_records_a_span_per_stage():
+    tracer = FakeTracer()
+    instrumentation = OpenTelemetrySpanInstrumentation(tracer)
+
+    instrumentation.on_stage(Stage.VERIFY, Path("a.mp3"), 5_000, 120)
+
+    [span] = tracer.spans
+    assert span.name == "transparentmeta.verify"
+    assert span.end_time - span.start_time == 5_000
+    assert span.attributes == {
+        "file.path": "a.mp3",
+        "transparentmeta.bytes": 120,
+    }
+
+
+def test_uses_span_name_prefix():
+    tracer = FakeTracer()
+    instrumentation = OpenTelemetrySpanInstrumentation(
+        tracer, span_name_prefix="tagging."
+    )
+
+    instrumentation.on_stage(Stage.SAVE, "a.wav", 1, 1)
+
+    assert tracer.spans[0].name == "tagging.save"
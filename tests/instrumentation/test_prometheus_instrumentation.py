@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+from collections import defaultdict
+
+from transparentmeta.instrumentation.instrumentation import Stage
+from transparentmeta.instrumentation.prometheus_instrumentation import (
+    PrometheusHistogramInstrumentation,
+)
+
+
+class FakeHistogram:
+    """Histogram with the labels/observe interface of prometheus_client."""
+
+    def __init__(self):
+        self.observations = defaultdict(list)
+        self.labels_calls = 0
+
+    def labels(self, stage):
+        self.labels_calls += 1
+        return FakeHistogramChild(self.observations[stage])
+
+
+class FakeHistogramChild:
+    def __init__(self, observations):
+        self.observations = observations
+
+    def observe(self, value):
+        self.observations.append(value)
+
+
+def test_observes_durations_in_seconds_by_stage():
+    duration_histogram = FakeHistogram()
+    instrumentation = PrometheusHistogramInstrumentation(duration_histogram)
+
+    instrumentation.on_stage(Stage.SIGN, "a.mp3", 2_000_000, 10)
+    instrumentation.on_stage(Stage.SIGN, "b.mp3", 500_000_000, 10)
+    instrumentation.on_stage(Stage.LOAD, "a.mp3", 1_000_000_000, 1024)
+
+    assert duration_histogram.observations == {
+        "sign": [0.002, 0.5],
+        "load": [1.0],
+    }
+
+
+def test_looks_up_labelled_histograms_once_per_stage():
+    duration_histogram = FakeHistogram()
+    instrumentation = PrometheusHistogramInstrumentation(duration_histogram)
+
+    for _ in range(3):
+        instrumentation.on_stage(Stage.SAVE, "a.mp3", 1, 1)
+
+    assert duration_histogram.labels_calls == 1
+
+
+def test_observes_sizes_when_bytes_histogram_is_given():
+    duration_histogram = FakeHistogram()
+    bytes_histogram = FakeHistogram()
+    instrumentation = PrometheusHistogramInstrumentation(
+        duration_histogram, bytes_histogram
+    )
+
+    instrumentation.on_stage(Stage.LOAD, "a.mp3", 1, 1024)
+    instrumentation.on_stage(Stage.LOAD, "b.mp3", 1, 2048)
+
+    assert bytes_histogram.observations == {"load": [1024, 2048]}
+    assert bytes_histogram.labels_calls == 1
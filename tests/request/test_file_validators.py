@@ -12,6 +12,7 @@ from transparentmeta.request.exceptions import (
 from transparentmeta.request.file_validators import (
     validate_audio_file_is_functioning,
     validate_audio_format_is_supported,
+    validate_audio_format_name_is_supported,
     validate_file_exists,
     validate_file_has_write_permissions,
     validate_wav_file_is_not_too_large,
@@ -122,3 +123,12 @@ def test_validate_wav_file_is_not_too_large_with_non_wav_file(temp_mp3):
     assert (
         validated_path == temp_mp3
     )  # Non-WAV files should pass without size check
+
+
+def test_validate_audio_format_name_is_supported_returns_lowercase_name():
+    assert validate_audio_format_name_is_supported("WAV") == "wav"
+
+
+def test_validate_audio_format_name_is_supported_raises_if_not_supported():
+    with pytest.raises(UnsupportedAudioFormatError):
+        validate_audio_format_name_is_supported("ogg")
@@ -0,0 +1,21 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import pytest
+
+from transparentmeta.request.read_bytes_request import ReadBytesRequest
+from transparentmeta.use_case.exceptions import UnsupportedAudioFormatError
+
+
+def test_read_bytes_request_normalizes_audio_format_to_lowercase():
+    request = ReadBytesRequest(audio_data=b"audio", audio_format="MP3")
+    assert request.audio_data == b"audio"
+    assert request.audio_format == "mp3"
+
+
+def test_read_bytes_request_raises_if_format_is_not_supported():
+    with pytest.raises(
+        UnsupportedAudioFormatError, match="Unsupported audio format"
+    ):
+        ReadBytesRequest(audio_data=b"audio", audio_format="txt")
@@ -0,0 +1,34 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import pytest
+from pydantic import ValidationError
+
+from transparentmeta.request.write_bytes_request import WriteBytesRequest
+from transparentmeta.use_case.exceptions import UnsupportedAudioFormatError
+
+
+def test_write_bytes_request_is_valid(metadata):
+    request = WriteBytesRequest(
+        audio_data=b"audio", audio_format="wav", metadata=metadata
+    )
+    assert request.audio_data == b"audio"
+    assert request.audio_format == "wav"
+    assert request.metadata == metadata
+
+
+def test_write_bytes_request_raises_if_format_is_not_supported(metadata):
+    with pytest.raises(
+        UnsupportedAudioFormatError, match="Unsupported audio format"
+    ):
+        WriteBytesRequest(
+            audio_data=b"audio", audio_format="flac", metadata=metadata
+        )
+
+
+def test_write_bytes_request_raises_with_invalid_metadata():
+    with pytest.raises(ValidationError):
+        WriteBytesRequest(
+            audio_data=b"audio", audio_format="mp3", metadata={"bad": 1}
+        )
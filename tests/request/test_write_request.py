@@ -24,10 +24,6 @@ def mock_valid_file_validators(mocker):
         "transparentmeta.request.write_request.validate_audio_format_is_supported",
         return_value=path,
     )
-    mocker.patch(
-        "transparentmeta.request.write_request.validate_audio_file_is_functioning",
-        return_value=path,
-    )
     mocker.patch(
         "transparentmeta.request.write_request.validate_file_has_write_permissions",
         return_value=path,
@@ -136,3 +132,12 @@ def test_write_request_can_be_converted_to_and_from_dictionary(
     new_request = WriteRequest(**request_dict)
     assert new_request.metadata.company == "Transparent Audio"
     assert new_request.metadata.ai_usage_level == AIUsageLevel.AI_ASSISTED
+
+
+def test_write_request_leaves_audio_parsing_to_the_writer(
+    tmp_path, metadata_dict
+):
+    fake_mp3 = tmp_path / "fake.mp3"
+    fake_mp3.write_text("not real mp3 data")
+    write_request = WriteRequest(filepath=fake_mp3, metadata=metadata_dict)
+    assert write_request.filepath == fake_mp3
@@ -7,7 +7,7 @@ import dataclasses
 import pytest
 
 from transparentmeta.entity.metadata import Metadata
-from transparentmeta.result.result import ReadResult, Result
+from transparentmeta.result.result import ReadResult, Result, WriteResult
 
 
 def test_result_success():
@@ -41,3 +41,10 @@ def test_result_immutable():
     result = Result(is_success=True)
     with pytest.raises(dataclasses.FrozenInstanceError):
         result.is_success = False
+
+
+def test_write_result_failure():
+    result = WriteResult(is_success=False, error="Write error")
+    assert isinstance(result, Result)
+    assert result.is_success is False
+    assert result.error == "Write error"
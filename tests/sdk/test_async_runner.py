@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from transparentmeta.sdk.async_runner import AsyncRunner
+
+
+def test_async_runner_runs_call_on_executor():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        async_runner = AsyncRunner(executor)
+        thread_name = asyncio.run(
+            async_runner.run(lambda: threading.current_thread().name)
+        )
+
+    assert thread_name != threading.main_thread().name
+
+
+def test_async_runner_passes_arguments_and_returns_result():
+    async_runner = AsyncRunner()
+    result = asyncio.run(async_runner.run(int.to_bytes, 1, length=2))
+
+    assert result == b"\x00\x01"
+
+
+def test_async_runner_propagates_exceptions():
+    async_runner = AsyncRunner()
+    with pytest.raises(ZeroDivisionError):
+        asyncio.run(async_runner.run(divmod, 1, 0))
+
+
+def test_async_runner_limits_concurrency():
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def blocking_call():
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+
+    async def run_many(async_runner):
+        await asyncio.gather(
+            *(async_runner.run(blocking_call) for _ in range(12))
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        asyncio.run(run_many(AsyncRunner(executor, max_concurrency=2)))
+
+    assert max_running == 2
+
+
+def test_async_runner_raises_with_invalid_max_concurrency():
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        AsyncRunner(max_concurrency=0)
@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import asyncio
+
+import pytest
+
+from transparentmeta.request.exceptions import InvalidAudioFileError
+from transparentmeta.request.write_request import WriteRequest
+from transparentmeta.sdk.factory import build_async_transparent_metadata_reader
+from transparentmeta.use_case.write.factory import build_write_use_case
+
+
+@pytest.fixture
+def tmp_mp3_file_with_signed_metadata(temp_mp3, metadata, keys):
+    write_use_case = build_write_use_case(keys["private_key"], "mp3")
+    write_use_case.write(WriteRequest(filepath=temp_mp3, metadata=metadata))
+    return temp_mp3
+
+
+@pytest.fixture
+def async_transparent_metadata_reader(keys):
+    return build_async_transparent_metadata_reader(keys["public_key"])
+
+
+def test_async_transparent_metadata_reader_reads_many_files_concurrently(
+    tmp_mp3_file_with_signed_metadata,
+    metadata,
+    async_transparent_metadata_reader,
+):
+    async def read_many():
+        return await asyncio.gather(
+            *(
+                async_transparent_metadata_reader.read(
+                    tmp_mp3_file_with_signed_metadata
+                )
+                for _ in range(8)
+            )
+        )
+
+    read_results = asyncio.run(read_many())
+
+    assert all(
+        read_result.metadata == metadata for read_result in read_results
+    )
+
+
+def test_async_transparent_metadata_reader_reads_bytes(
+    tmp_mp3_file_with_signed_metadata,
+    metadata,
+    async_transparent_metadata_reader,
+):
+    read_result = asyncio.run(
+        async_transparent_metadata_reader.read_bytes(
+            tmp_mp3_file_with_signed_metadata.read_bytes(), "mp3"
+        )
+    )
+
+    assert read_result.is_success
+    assert read_result.metadata == metadata
+
+
+def test_async_transparent_metadata_reader_raises_with_corrupt_file(
+    temp_corrupt_mp3, async_transparent_metadata_reader
+):
+    with pytest.raises(InvalidAudioFileError):
+        asyncio.run(async_transparent_metadata_reader.read(temp_corrupt_mp3))
@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import asyncio
+import io
+import shutil
+
+import pytest
+from mutagen.mp3 import MP3
+
+from transparentmeta.sdk.factory import build_async_transparent_metadata_writer
+
+
+@pytest.fixture
+def async_transparent_metadata_writer(keys):
+    return build_async_transparent_metadata_writer(keys["private_key"])
+
+
+def test_async_transparent_metadata_writer_writes_many_files_concurrently(
+    tmp_path, temp_mp3, metadata_dict, async_transparent_metadata_writer
+):
+    filepaths = []
+    for index in range(8):
+        filepath = tmp_path / f"track_{index}.mp3"
+        shutil.copy(temp_mp3, filepath)
+        filepaths.append(filepath)
+
+    async def write_many():
+        await asyncio.gather(
+            *(
+                async_transparent_metadata_writer.write(
+                    filepath, metadata_dict
+                )
+                for filepath in filepaths
+            )
+        )
+
+    asyncio.run(write_many())
+
+    assert all("TXXX:signature" in MP3(path).tags for path in filepaths)
+
+
+def test_async_transparent_metadata_writer_writes_bytes(
+    temp_mp3, metadata_dict, async_transparent_metadata_writer
+):
+    tagged_audio_data = asyncio.run(
+        async_transparent_metadata_writer.write_bytes(
+            temp_mp3.read_bytes(), "mp3", metadata_dict
+        )
+    )
+
+    audio = MP3(io.BytesIO(tagged_audio_data))
+    assert (
+        '{"company":"Transparent Audio"'
+        in audio.tags["TXXX:transparency"].text[0]
+    )
+
+
+def test_async_transparent_metadata_writer_raises_with_missing_file(
+    tmp_path, metadata_dict, async_transparent_metadata_writer
+):
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(
+            async_transparent_metadata_writer.write(
+                tmp_path / "missing.mp3", metadata_dict
+            )
+        )
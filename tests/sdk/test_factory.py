@@ -2,7 +2,21 @@
 # Copyright (c) 2025 Transparent Audio
 # Author: Valerio Velardo - valerio@transparentaudio.ai
 
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from transparentmeta.crypto.content_hasher import ContentHasher
+from transparentmeta.sdk.async_runner import DEFAULT_MAX_CONCURRENCY
+from transparentmeta.sdk.async_transparent_metadata_reader import (
+    AsyncTransparentMetadataReader,
+)
+from transparentmeta.sdk.async_transparent_metadata_writer import (
+    AsyncTransparentMetadataWriter,
+)
 from transparentmeta.sdk.factory import (
+    build_async_transparent_metadata_reader,
+    build_async_transparent_metadata_writer,
     build_transparent_metadata_reader,
     build_transparent_metadata_writer,
 )
@@ -12,12 +26,39 @@ from transparentmeta.sdk.transparent_metadata_reader import (
 from transparentmeta.sdk.transparent_metadata_writer import (
     TransparentMetadataWriter,
 )
+from transparentmeta.serialization.metadata_serializer import MetadataFormat
+from transparentmeta.use_case.read.mp3_tag_only_metadata_reader import (
+    MP3TagOnlyMetadataReader,
+)
+from transparentmeta.use_case.read.read_result_cache import ReadResultCache
 from transparentmeta.use_case.read.read_use_case import ReadUseCase
 from transparentmeta.use_case.read.reader_selector import ReaderSelector
+from transparentmeta.use_case.write.padding_policy import PaddingPolicy
 from transparentmeta.use_case.write.write_use_case import WriteUseCase
 from transparentmeta.use_case.write.writer_selector import WriterSelector
 
 
+def test_importing_factory_does_not_import_formats_or_sqlite():
+    # Audio format modules are imported on first use of their format, and
+    # sqlite3 only by disk-backed caches. A fresh interpreter is needed,
+    # since the test session has already imported everything.
+    code = (
+        "import sys, transparentmeta.sdk.factory; "
+        "print(sorted(name for name in "
+        "('mutagen.mp3', 'mutagen.wave', 'sqlite3') "
+        "if name in sys.modules))"
+    )
+
+    completed_process = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed_process.stdout.strip() == "[]"
+
+
 def test_build_transparent_metadata_writer(keys):
     private_key = keys["private_key"]
     writer = build_transparent_metadata_writer(private_key)
@@ -27,6 +68,50 @@ def test_build_transparent_metadata_writer(keys):
     assert isinstance(writer.writer_selector, WriterSelector)
 
 
+def test_build_transparent_metadata_writer_with_padding_policy(keys):
+    padding_policy = PaddingPolicy(reserved_padding=1024)
+    writer = build_transparent_metadata_writer(
+        keys["private_key"], padding_policy=padding_policy
+    )
+
+    metadata_writers = writer.writer_selector.metadata_writers
+    assert metadata_writers["mp3"].padding_policy == padding_policy
+    assert metadata_writers["wav"].padding_policy == padding_policy
+
+
+def test_build_transparent_metadata_writer_with_binary_format(
+    keys, temp_mp3, metadata_dict
+):
+    writer = build_transparent_metadata_writer(
+        keys["private_key"], metadata_format=MetadataFormat.BINARY
+    )
+    reader = build_transparent_metadata_reader(keys["public_key"])
+
+    writer.write(temp_mp3, metadata_dict)
+    read_result = reader.read(temp_mp3)
+    assert read_result.is_success
+    assert read_result.metadata.company == metadata_dict["company"]
+
+
+def test_build_transparent_metadata_writer_with_atomic_mode(keys):
+    writer = build_transparent_metadata_writer(
+        keys["private_key"], atomic=True
+    )
+
+    metadata_writers = writer.writer_selector.metadata_writers
+    assert metadata_writers["mp3"].atomic
+    assert metadata_writers["wav"].atomic
+
+
+def test_build_transparent_metadata_writer_with_content_hasher(keys):
+    content_hasher = ContentHasher()
+    writer = build_transparent_metadata_writer(
+        keys["private_key"], content_hasher=content_hasher
+    )
+
+    assert writer.write_use_case.content_hasher is content_hasher
+
+
 def test_build_transparent_metadata_writer_logs_correctly(keys, caplog):
     private_key = keys["private_key"]
     writer = build_transparent_metadata_writer(private_key)
@@ -50,6 +135,18 @@ def test_build_transparent_metadata_reader(keys):
     assert isinstance(reader.reader_selector, ReaderSelector)
 
 
+def test_build_transparent_metadata_reader_with_tag_only_readers(keys):
+    public_key = keys["public_key"]
+    reader = build_transparent_metadata_reader(public_key, tag_only=True)
+
+    assert isinstance(
+        reader.reader_selector.get_reader("mp3"), MP3TagOnlyMetadataReader
+    )
+    assert isinstance(
+        reader.read_use_case.metadata_reader, MP3TagOnlyMetadataReader
+    )
+
+
 def test_build_transparent_metadata_reader_logs_correctly(keys, caplog):
     public_key = keys["public_key"]
     reader = build_transparent_metadata_reader(public_key)
@@ -62,3 +159,71 @@ def test_build_transparent_metadata_reader_logs_correctly(keys, caplog):
         in caplog.text
     )
     assert "TransparentMetadataReader instance created" in caplog.text
+
+
+def test_build_async_transparent_metadata_writer(keys):
+    padding_policy = PaddingPolicy(reserved_padding=1024)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        async_writer = build_async_transparent_metadata_writer(
+            keys["private_key"],
+            padding_policy=padding_policy,
+            executor=executor,
+            max_concurrency=4,
+        )
+
+    assert isinstance(async_writer, AsyncTransparentMetadataWriter)
+    assert isinstance(
+        async_writer.transparent_metadata_writer, TransparentMetadataWriter
+    )
+    metadata_writers = (
+        async_writer.transparent_metadata_writer.writer_selector.metadata_writers
+    )
+    assert metadata_writers["mp3"].padding_policy == padding_policy
+    assert async_writer.async_runner.executor is executor
+    assert async_writer.async_runner.max_concurrency == 4
+
+
+def test_build_async_transparent_metadata_writer_with_binary_format(keys):
+    content_hasher = ContentHasher()
+    async_writer = build_async_transparent_metadata_writer(
+        keys["private_key"],
+        metadata_format=MetadataFormat.BINARY,
+        content_hasher=content_hasher,
+        atomic=True,
+    )
+
+    write_use_case = async_writer.transparent_metadata_writer.write_use_case
+    assert (
+        write_use_case.metadata_serializer.metadata_format
+        == MetadataFormat.BINARY
+    )
+    assert write_use_case.content_hasher is content_hasher
+    metadata_writers = (
+        async_writer.transparent_metadata_writer.writer_selector.metadata_writers
+    )
+    assert metadata_writers["mp3"].atomic
+
+
+def test_build_async_transparent_metadata_reader(keys):
+    async_reader = build_async_transparent_metadata_reader(
+        keys["public_key"], tag_only=True
+    )
+
+    assert isinstance(async_reader, AsyncTransparentMetadataReader)
+    assert isinstance(
+        async_reader.transparent_metadata_reader.reader_selector.get_reader(
+            "mp3"
+        ),
+        MP3TagOnlyMetadataReader,
+    )
+    assert async_reader.async_runner.executor is None
+    assert async_reader.async_runner.max_concurrency == DEFAULT_MAX_CONCURRENCY
+
+
+def test_build_transparent_metadata_reader_with_read_result_cache(keys):
+    read_result_cache = ReadResultCache()
+    reader = build_transparent_metadata_reader(
+        keys["public_key"], read_result_cache=read_result_cache
+    )
+
+    assert reader.read_use_case.read_result_cache is read_result_cache
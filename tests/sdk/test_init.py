@@ -2,6 +2,11 @@
 # Copyright (c) 2025 Transparent Audio
 # Author: Valerio Velardo - valerio@transparentaudio.ai
 
+import subprocess
+import sys
+
+import pytest
+
 import transparentmeta.sdk as sdk
 
 
@@ -11,7 +16,49 @@ def test_sdk_public_api():
         "TransparentMetadataReader",
         "build_transparent_metadata_writer",
         "build_transparent_metadata_reader",
+        "AsyncTransparentMetadataWriter",
+        "AsyncTransparentMetadataReader",
+        "build_async_transparent_metadata_writer",
+        "build_async_transparent_metadata_reader",
     }
     actual_exports = set(sdk.__all__)
 
     assert actual_exports == expected_exports
+
+
+def test_sdk_exports_are_imported_on_first_access():
+    from transparentmeta.sdk.factory import build_transparent_metadata_reader
+
+    assert (
+        sdk.build_transparent_metadata_reader
+        is build_transparent_metadata_reader
+    )
+
+
+def test_sdk_raises_attribute_error_for_unknown_names():
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        sdk.missing
+
+
+def test_sdk_dir_lists_lazy_exports():
+    assert set(sdk.__all__) <= set(dir(sdk))
+
+
+def test_importing_sdk_does_not_import_heavy_dependencies():
+    # A fresh interpreter is needed, since the test session has already
+    # imported everything.
+    code = (
+        "import sys, transparentmeta.sdk; "
+        "print(sorted(name for name in "
+        "('asyncio', 'cryptography', 'mutagen', 'pydantic') "
+        "if name in sys.modules))"
+    )
+
+    completed_process = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed_process.stdout.strip() == "[]"
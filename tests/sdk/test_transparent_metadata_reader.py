@@ -2,18 +2,36 @@
 # Copyright (c) 2025 Transparent Audio
 # Author: Valerio Velardo - valerio@transparentaudio.ai
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
+from mutagen.mp3 import MP3
 
-from transparentmeta.crypto.key_management import generate_key_pair
+from transparentmeta.crypto.content_hasher import ContentHasher
+from transparentmeta.crypto.key_management import (
+    convert_public_key_to_hex,
+    generate_key_pair,
+)
+from transparentmeta.request.exceptions import InvalidAudioFileError
 from transparentmeta.request.write_request import WriteRequest
 from transparentmeta.result.result import ReadResult
+from transparentmeta.sdk import transparent_metadata_reader as reader_module
 from transparentmeta.sdk.transparent_metadata_reader import (
     TransparentMetadataReader,
 )
+from transparentmeta.serialization.metadata_serializer import (
+    MetadataSerializer,
+)
 from transparentmeta.use_case.read.factory import build_read_use_case
-from transparentmeta.use_case.read.reader_selector import ReaderSelector
+from transparentmeta.use_case.read.mp3_tag_only_metadata_reader import (
+    MP3TagOnlyMetadataReader,
+)
+from transparentmeta.use_case.read.read_result_cache import ReadResultCache
+from transparentmeta.use_case.read.reader_selector import (
+    ReaderSelector,
+    tag_only_metadata_reader_registry,
+)
 from transparentmeta.use_case.write.factory import build_write_use_case
 
 private_key, public_key = generate_key_pair()
@@ -47,6 +65,63 @@ def test_transparent_metadata_reader_reads_metadata_from_mp3_correctly(
     assert read_result.error is None
 
 
+def test_transparent_metadata_reader_parses_the_file_only_once(
+    mocker, tmp_mp3_file_with_signed_metadata, transparent_metadata_reader
+):
+    mp3_spy = mocker.patch(
+        "transparentmeta.use_case.read.mp3_metadata_reader.MP3",
+        wraps=MP3,
+    )
+    validator_mp3_spy = mocker.patch("mutagen.mp3.MP3", wraps=MP3)
+
+    read_result = transparent_metadata_reader.read(
+        filepath=tmp_mp3_file_with_signed_metadata
+    )
+
+    assert read_result.is_success
+    mp3_spy.assert_called_once()
+    validator_mp3_spy.assert_not_called()
+
+
+def test_transparent_metadata_reader_reads_metadata_from_bytes(
+    tmp_mp3_file_with_signed_metadata,
+    metadata,
+    caplog,
+    transparent_metadata_reader,
+):
+    with caplog.at_level("INFO"):
+        read_result = transparent_metadata_reader.read_bytes(
+            audio_data=tmp_mp3_file_with_signed_metadata.read_bytes(),
+            audio_format="MP3",
+        )
+
+    assert read_result.is_success
+    assert read_result.metadata == metadata
+    assert "Starting metadata read for in-memory MP3 audio" in caplog.text
+    assert (
+        "Successfully read metadata from file: <in-memory audio>"
+        in caplog.text
+    )
+
+
+def test_transparent_metadata_reader_raises_with_corrupt_bytes(
+    transparent_metadata_reader,
+):
+    with pytest.raises(
+        InvalidAudioFileError, match="Invalid audio file: <in-memory audio>"
+    ):
+        transparent_metadata_reader.read_bytes(
+            audio_data=b"corrupt mp3 file", audio_format="mp3"
+        )
+
+
+def test_transparent_metadata_reader_raises_with_corrupt_file(
+    temp_corrupt_mp3, transparent_metadata_reader
+):
+    with pytest.raises(InvalidAudioFileError, match="Invalid audio file"):
+        transparent_metadata_reader.read(filepath=temp_corrupt_mp3)
+
+
 def test_transparent_metadata_reader_logs_successful_read(
     tmp_mp3_file_with_signed_metadata, caplog, transparent_metadata_reader
 ):
@@ -83,3 +158,153 @@ def test_transparent_metadata_reader_logs_failed_read(
     assert (
         f"Metadata read failed for file {temp_mp3}: Dummy error" in caplog.text
     )
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_read_many_reads_metadata_from_all_files(
+    backend,
+    tmp_mp3_file_with_signed_metadata,
+    temp_wav,
+    metadata,
+    transparent_metadata_reader,
+):
+    filepaths = [tmp_mp3_file_with_signed_metadata, temp_wav]
+
+    read_results = list(
+        transparent_metadata_reader.read_many(
+            filepaths, workers=2, backend=backend
+        )
+    )
+
+    assert read_results[0] == ReadResult(is_success=True, metadata=metadata)
+    assert not read_results[1].is_success
+    assert (
+        read_results[1].error
+        == "Metadata and/or signature are not present in the file."
+    )
+
+
+def test_read_many_reports_failures_without_stopping_the_batch(
+    tmp_path,
+    tmp_mp3_file_with_signed_metadata,
+    metadata,
+    transparent_metadata_reader,
+):
+    filepaths = [tmp_path / "missing.mp3", tmp_mp3_file_with_signed_metadata]
+
+    read_results = list(transparent_metadata_reader.read_many(filepaths))
+
+    assert not read_results[0].is_success
+    assert "File not found" in read_results[0].error
+    assert read_results[1].metadata == metadata
+
+
+def test_read_many_raises_with_unsupported_backend(
+    transparent_metadata_reader,
+):
+    with pytest.raises(ValueError, match="Unsupported read backend"):
+        transparent_metadata_reader.read_many([], backend="dummy")
+
+
+def test_process_worker_reads_with_reader_built_from_public_key(
+    tmp_mp3_file_with_signed_metadata, metadata
+):
+    content_hasher = ContentHasher("blake2b")
+    reader_module._initialize_process_worker(
+        convert_public_key_to_hex(public_key),
+        {"mp3": MP3TagOnlyMetadataReader()},
+        MetadataSerializer(),
+        content_hasher,
+    )
+    read_result = reader_module._read_in_worker(
+        tmp_mp3_file_with_signed_metadata
+    )
+
+    assert read_result == ReadResult(is_success=True, metadata=metadata)
+    worker_reader = reader_module._worker_state.reader
+    assert isinstance(
+        worker_reader.reader_selector.get_reader("mp3"),
+        MP3TagOnlyMetadataReader,
+    )
+    assert worker_reader.read_use_case.content_hasher is content_hasher
+
+
+@pytest.mark.parametrize(
+    "use_case_settings",
+    [
+        {"read_result_cache": ReadResultCache()},
+        {"instrumentation": lambda *_: None},
+    ],
+)
+def test_read_many_raises_with_process_backend_and_process_local_settings(
+    use_case_settings,
+):
+    transparent_metadata_reader = TransparentMetadataReader(
+        build_read_use_case(public_key, "mp3", **use_case_settings),
+        ReaderSelector(),
+    )
+
+    with pytest.raises(ValueError, match="use the thread backend"):
+        transparent_metadata_reader.read_many([], backend="process")
+
+
+def test_thread_worker_shares_the_original_reader(
+    transparent_metadata_reader,
+):
+    reader_module._initialize_thread_worker(transparent_metadata_reader)
+    assert reader_module._worker_state.reader is transparent_metadata_reader
+
+
+def test_transparent_metadata_reader_does_not_change_its_use_case(
+    tmp_mp3_file_with_signed_metadata, transparent_metadata_reader
+):
+    original_metadata_reader = (
+        transparent_metadata_reader.read_use_case.metadata_reader
+    )
+    wav_file = tmp_mp3_file_with_signed_metadata.with_suffix(".wav")
+    wav_file.write_bytes(b"corrupt wav file")
+
+    transparent_metadata_reader.read(tmp_mp3_file_with_signed_metadata)
+    with pytest.raises(InvalidAudioFileError):
+        transparent_metadata_reader.read(wav_file)
+
+    assert (
+        transparent_metadata_reader.read_use_case.metadata_reader
+        is original_metadata_reader
+    )
+
+
+def test_transparent_metadata_reader_can_be_shared_across_threads(
+    tmp_mp3_file_with_signed_metadata,
+    temp_wav,
+    metadata,
+    transparent_metadata_reader,
+):
+    build_write_use_case(private_key, "wav").write(
+        WriteRequest(filepath=temp_wav, metadata=metadata)
+    )
+    filepaths = [tmp_mp3_file_with_signed_metadata, temp_wav] * 16
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        read_results = list(
+            executor.map(transparent_metadata_reader.read, filepaths)
+        )
+
+    assert all(
+        read_result.metadata == metadata for read_result in read_results
+    )
+
+
+def test_tag_only_transparent_metadata_reader_reads_metadata_from_mp3(
+    tmp_mp3_file_with_signed_metadata, metadata
+):
+    transparent_metadata_reader = TransparentMetadataReader(
+        build_read_use_case(public_key, "mp3"),
+        ReaderSelector(tag_only_metadata_reader_registry),
+    )
+
+    read_result = transparent_metadata_reader.read(
+        tmp_mp3_file_with_signed_metadata
+    )
+
+    assert read_result == ReadResult(is_success=True, metadata=metadata)
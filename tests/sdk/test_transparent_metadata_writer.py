@@ -2,15 +2,33 @@
 # Copyright (c) 2025 Transparent Audio
 # Author: Valerio Velardo - valerio@transparentaudio.ai
 
+import io
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from mutagen import File
 from mutagen.mp3 import MP3
+from mutagen.wave import WAVE
 
+from transparentmeta.crypto.content_hasher import ContentHasher
+from transparentmeta.crypto.key_management import convert_private_key_to_hex
+from transparentmeta.result.result import WriteResult
+from transparentmeta.sdk import transparent_metadata_writer as writer_module
 from transparentmeta.sdk.transparent_metadata_writer import (
     TransparentMetadataWriter,
 )
-from transparentmeta.use_case.write.factory import build_write_use_case
-from transparentmeta.use_case.write.writer_selector import WriterSelector
+from transparentmeta.serialization.metadata_serializer import MetadataFormat
+from transparentmeta.use_case.write.factory import (
+    build_metadata_writer_registry,
+    build_write_use_case,
+)
+from transparentmeta.use_case.write.padding_policy import PaddingPolicy
+from transparentmeta.use_case.write.writer_selector import (
+    WriterSelector,
+    metadata_writer_registry,
+)
 
 
 @pytest.fixture
@@ -47,6 +65,74 @@ def test_transparent_metadata_writer_writes_metadata_to_mp3(
     )  # Ensure signature is written
 
 
+def test_transparent_metadata_writer_parses_the_file_only_once(
+    mocker, temp_mp3, metadata_dict, transparent_metadata_writer
+):
+    mp3_spy = mocker.patch(
+        "transparentmeta.use_case.write.mp3_metadata_writer.MP3", wraps=MP3
+    )
+    validator_mp3_spy = mocker.patch("mutagen.mp3.MP3", wraps=MP3)
+
+    transparent_metadata_writer.write(
+        filepath=temp_mp3, metadata=metadata_dict
+    )
+
+    mp3_spy.assert_called_once()
+    validator_mp3_spy.assert_not_called()
+    assert "TXXX:transparency" in MP3(temp_mp3).tags
+
+
+def test_transparent_metadata_writer_writes_metadata_to_bytes(
+    temp_mp3, metadata_dict, transparent_metadata_writer
+):
+    audio_data = temp_mp3.read_bytes()
+
+    tagged_audio_data = transparent_metadata_writer.write_bytes(
+        audio_data=audio_data, audio_format="mp3", metadata=metadata_dict
+    )
+
+    # The input data and the file on disk are left untouched
+    assert temp_mp3.read_bytes() == audio_data
+    audio = MP3(io.BytesIO(tagged_audio_data))
+    assert (
+        '{"company":"Transparent Audio"'
+        in audio.tags["TXXX:transparency"].text[0]
+    )
+    assert isinstance(audio.tags["TXXX:signature"].text[0], str)
+
+
+def test_transparent_metadata_writer_can_be_shared_across_threads(
+    tmp_path, temp_mp3, temp_wav, metadata_dict, transparent_metadata_writer
+):
+    original_metadata_writer = (
+        transparent_metadata_writer.write_use_case.metadata_writer
+    )
+    filepaths = []
+    for index in range(16):
+        source = (temp_mp3, temp_wav)[index % 2]
+        filepath = tmp_path / f"track_{index}{source.suffix}"
+        shutil.copy(source, filepath)
+        filepaths.append(filepath)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(
+            executor.map(
+                lambda filepath: transparent_metadata_writer.write(
+                    filepath, metadata_dict
+                ),
+                filepaths,
+            )
+        )
+
+    assert all(
+        "TXXX:transparency" in File(filepath).tags for filepath in filepaths
+    )
+    assert (
+        transparent_metadata_writer.write_use_case.metadata_writer
+        is original_metadata_writer
+    )
+
+
 def test_transparent_metadata_writer_logs_correctly(
     temp_mp3, metadata_dict, caplog, transparent_metadata_writer
 ):
@@ -77,3 +163,146 @@ def test_log_output_string(
     assert record.levelname == "INFO"
     assert "transparentmeta.sdk.transparent_metadata_writer" in record.name
     assert "Starting metadata" in record.getMessage()
+
+
+@pytest.fixture
+def temp_audio_files(temp_mp3, temp_wav, tmp_path):
+    second_mp3 = tmp_path / "second.mp3"
+    shutil.copy(temp_mp3, second_mp3)
+    return [temp_mp3, temp_wav, second_mp3]
+
+
+def test_write_many_writes_metadata_to_all_files(
+    temp_audio_files, metadata_dict, transparent_metadata_writer
+):
+    items = [(filepath, metadata_dict) for filepath in temp_audio_files]
+
+    write_results = transparent_metadata_writer.write_many(items, workers=2)
+
+    assert write_results == [WriteResult(is_success=True)] * 3
+    assert "TXXX:transparency" in MP3(temp_audio_files[0]).tags
+    assert "TXXX:transparency" in WAVE(temp_audio_files[1]).tags
+    assert "TXXX:signature" in MP3(temp_audio_files[2]).tags
+
+
+def test_iter_write_many_streams_results_in_input_order(
+    temp_mp3, tmp_path, metadata_dict, transparent_metadata_writer
+):
+    items = [
+        (temp_mp3, metadata_dict),
+        (tmp_path / "missing.mp3", metadata_dict),
+    ]
+
+    write_results = transparent_metadata_writer.iter_write_many(
+        items, workers=2
+    )
+
+    assert next(write_results) == WriteResult(is_success=True)
+    assert not next(write_results).is_success
+    assert next(write_results, None) is None
+    assert "TXXX:transparency" in MP3(temp_mp3).tags
+
+
+def test_write_many_reports_failures_without_stopping_the_batch(
+    temp_mp3, tmp_path, metadata_dict, transparent_metadata_writer
+):
+    items = [
+        (tmp_path / "missing.mp3", metadata_dict),
+        (temp_mp3, metadata_dict),
+    ]
+
+    write_results = transparent_metadata_writer.write_many(items, workers=1)
+
+    assert not write_results[0].is_success
+    assert "File not found" in write_results[0].error
+    assert write_results[1].is_success
+    assert "TXXX:transparency" in MP3(temp_mp3).tags
+
+
+def test_write_many_logs_batch_outcome(
+    temp_mp3, tmp_path, metadata_dict, transparent_metadata_writer, caplog
+):
+    items = [
+        (tmp_path / "missing.mp3", metadata_dict),
+        (temp_mp3, metadata_dict),
+    ]
+
+    with caplog.at_level("INFO"):
+        transparent_metadata_writer.write_many(items, workers=1)
+
+    assert "Starting batch metadata write for 2 files" in caplog.text
+    assert "Succeeded: 1. Failed: 1" in caplog.text
+
+
+def test_worker_writes_with_writer_built_from_private_key(
+    temp_mp3, metadata_dict
+):
+    private_key = Ed25519PrivateKey.generate()
+
+    writer_module._initialize_worker(
+        convert_private_key_to_hex(private_key),
+        dict(metadata_writer_registry),
+    )
+    write_result = writer_module._write_in_worker((temp_mp3, metadata_dict))
+
+    assert write_result.is_success
+    assert "TXXX:transparency" in MP3(temp_mp3).tags
+
+
+def test_worker_writes_with_configuration_of_writer(temp_mp3, metadata_dict):
+    private_key = Ed25519PrivateKey.generate()
+
+    writer_module._initialize_worker(
+        convert_private_key_to_hex(private_key),
+        dict(metadata_writer_registry),
+        MetadataFormat.BINARY,
+        ContentHasher(),
+    )
+    write_result = writer_module._write_in_worker((temp_mp3, metadata_dict))
+
+    assert write_result.is_success
+    assert MP3(temp_mp3).tags.getall("PRIV")
+    write_use_case = writer_module._worker_writer.write_use_case
+    assert isinstance(write_use_case.content_hasher, ContentHasher)
+
+
+def test_worker_keeps_configuration_of_metadata_writers():
+    private_key = Ed25519PrivateKey.generate()
+    padding_policy = PaddingPolicy(reserved_padding=1024)
+
+    writer_module._initialize_worker(
+        convert_private_key_to_hex(private_key),
+        dict(build_metadata_writer_registry(padding_policy=padding_policy)),
+    )
+
+    writer_selector = writer_module._worker_writer.writer_selector
+    wav_metadata_writer = writer_selector.metadata_writers["wav"]
+    assert wav_metadata_writer.padding_policy == padding_policy
+
+
+def test_worker_returns_failed_result_when_write_raises(
+    tmp_path, metadata_dict
+):
+    private_key = Ed25519PrivateKey.generate()
+
+    writer_module._initialize_worker(
+        convert_private_key_to_hex(private_key),
+        dict(metadata_writer_registry),
+    )
+    write_result = writer_module._write_in_worker(
+        (tmp_path / "missing.mp3", metadata_dict)
+    )
+
+    assert not write_result.is_success
+    assert "File not found" in write_result.error
+
+
+@pytest.mark.parametrize(
+    "number_of_items, workers, expected_chunksize",
+    [(0, 4, 1), (10, 4, 1), (1000, 4, 62)],
+)
+def test_get_chunksize(number_of_items, workers, expected_chunksize):
+    assert (
+        TransparentMetadataWriter._get_chunksize(number_of_items, workers)
+        == expected_chunksize
+    )
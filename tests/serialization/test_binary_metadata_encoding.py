@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from transparentmeta.entity.metadata import AIUsageLevel, Metadata
+from transparentmeta.serialization import canonical_cbor
+from transparentmeta.serialization.binary_metadata_encoding import (
+    decode_metadata,
+    encode_metadata,
+)
+from transparentmeta.serialization.exceptions import InvalidCBORDataError
+
+
+@pytest.mark.parametrize(
+    "created_at",
+    [
+        datetime(2025, 1, 1, 12, 30, 15, 123456),
+        datetime(2025, 1, 1, tzinfo=timezone.utc),
+        datetime(2025, 1, 1, tzinfo=timezone(timedelta(hours=5, minutes=30))),
+        datetime(1960, 1, 1, tzinfo=timezone(timedelta(hours=-8))),
+    ],
+)
+def test_metadata_round_trips(metadata, created_at):
+    metadata = metadata.model_copy(update={"created_at": created_at})
+
+    decoded_metadata = decode_metadata(encode_metadata(metadata))
+
+    assert decoded_metadata == metadata
+    assert decoded_metadata.created_at.utcoffset() == created_at.utcoffset()
+
+
+@pytest.mark.parametrize("ai_usage_level", list(AIUsageLevel))
+def test_ai_usage_levels_round_trip(metadata, ai_usage_level):
+    metadata = metadata.model_copy(update={"ai_usage_level": ai_usage_level})
+
+    assert decode_metadata(encode_metadata(metadata)) == metadata
+
+
+def test_metadata_without_additional_info_round_trips(metadata):
+    metadata = metadata.model_copy(update={"additional_info": None})
+
+    assert decode_metadata(encode_metadata(metadata)) == metadata
+
+
+def test_metadata_with_content_hash_round_trips(metadata):
+    metadata = metadata.model_copy(update={"content_hash": "sha256:0a"})
+
+    assert decode_metadata(encode_metadata(metadata)) == metadata
+
+
+def test_encoding_is_canonical(metadata):
+    reordered_metadata = metadata.model_copy(
+        update={
+            "additional_info": dict(
+                reversed(list(metadata.additional_info.items()))
+            )
+        }
+    )
+
+    assert encode_metadata(reordered_metadata) == encode_metadata(metadata)
+
+
+def test_encoding_is_smaller_than_json(metadata):
+    assert len(encode_metadata(metadata)) < len(
+        metadata.model_dump_json().encode("utf-8")
+    )
+
+
+@pytest.mark.parametrize(
+    "value, message",
+    [([1, 2], "CBOR map"), ({0: 2}, "version: 2"), ({}, "version: None")],
+)
+def test_decode_raises_for_data_that_is_not_binary_metadata(value, message):
+    with pytest.raises(InvalidCBORDataError, match=message):
+        decode_metadata(canonical_cbor.encode(value))
+
+
+def test_decode_raises_for_invalid_fields(metadata):
+    encoded_fields = canonical_cbor.decode(encode_metadata(metadata))
+    encoded_fields[3] = "not a timestamp"
+    encoded_fields[5] = 42
+
+    with pytest.raises(ValidationError) as exc_info:
+        decode_metadata(canonical_cbor.encode(encoded_fields))
+
+    invalid_fields = {error["loc"][0] for error in exc_info.value.errors()}
+    assert invalid_fields == {"created_at", "ai_usage_level"}
@@ -0,0 +1,126 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import math
+
+import pytest
+
+from transparentmeta.entity.metadata import AIUsageLevel
+from transparentmeta.serialization import canonical_cbor
+from transparentmeta.serialization.exceptions import (
+    InvalidCBORDataError,
+    UnsupportedCBORTypeError,
+)
+
+
+# Examples from Appendix A of RFC 8949.
+@pytest.mark.parametrize(
+    "value, encoding",
+    [
+        (0, "00"),
+        (23, "17"),
+        (24, "1818"),
+        (1000, "1903e8"),
+        (1000000, "1a000f4240"),
+        (1000000000000, "1b000000e8d4a51000"),
+        (18446744073709551615, "1bffffffffffffffff"),
+        (-1, "20"),
+        (-1000, "3903e7"),
+        (-18446744073709551616, "3bffffffffffffffff"),
+        (0.0, "f90000"),
+        (1.5, "f93e00"),
+        (100000.0, "fa47c35000"),
+        (1.1, "fb3ff199999999999a"),
+        (1.0e300, "fb7e37e43c8800759c"),
+        (math.inf, "f97c00"),
+        (False, "f4"),
+        (True, "f5"),
+        (None, "f6"),
+        (b"\x01\x02\x03\x04", "4401020304"),
+        ("", "60"),
+        ("IETF", "6449455446"),
+        ("ü", "62c3bc"),
+        ([], "80"),
+        ([1, [2, 3], [4, 5]], "8301820203820405"),
+        ((1, 2), "820102"),
+        ({}, "a0"),
+        ({"a": 1, "b": [2, 3]}, "a26161016162820203"),
+    ],
+)
+def test_encode_matches_rfc_examples(value, encoding):
+    assert canonical_cbor.encode(value).hex() == encoding
+    assert canonical_cbor.decode(bytes.fromhex(encoding)) == (
+        list(value) if isinstance(value, tuple) else value
+    )
+
+
+def test_encode_nan_canonically():
+    assert canonical_cbor.encode(math.nan).hex() == "f97e00"
+    assert math.isnan(canonical_cbor.decode(bytes.fromhex("f97e00")))
+
+
+def test_encode_sorts_map_keys_by_their_encodings():
+    # 10 encodes to 0a, 100 to 1864, -1 to 20, "z" to 617a, "aa" to 626161
+    value = {"aa": 5, "z": 4, -1: 3, 100: 2, 10: 1}
+
+    assert canonical_cbor.encode(value).hex() == (
+        "a5" "0a01" "186402" "2003" "617a04" "62616105"
+    )
+
+
+def test_encoding_does_not_depend_on_key_order():
+    first = {"attribution": {"lyrics": "John", "composer": "Jane"}, "b": 1}
+    second = {"b": 1, "attribution": {"composer": "Jane", "lyrics": "John"}}
+
+    assert canonical_cbor.encode(first) == canonical_cbor.encode(second)
+
+
+def test_encode_str_enums_as_their_values():
+    assert canonical_cbor.encode(AIUsageLevel.AI_GENERATED) == (
+        canonical_cbor.encode("ai_generated")
+    )
+
+
+@pytest.mark.parametrize("value", [object(), {1, 2}, 2**64, -(2**64) - 1])
+def test_encode_raises_for_unsupported_values(value):
+    with pytest.raises(UnsupportedCBORTypeError):
+        canonical_cbor.encode(value)
+
+
+@pytest.mark.parametrize(
+    "encoding, message",
+    [
+        ("", "truncated"),
+        ("19ff", "truncated"),
+        ("6449", "truncated"),
+        ("0000", "trailing"),
+        ("5f", "Indefinite"),
+        ("c11a514b67b0", "tags"),
+        ("f0", "simple value"),
+        ("62c328", "UTF-8"),
+        ("a1800000", "map keys"),
+    ],
+)
+def test_decode_raises_for_invalid_data(encoding, message):
+    with pytest.raises(InvalidCBORDataError, match=message):
+        canonical_cbor.decode(bytes.fromhex(encoding))
+
+
+@pytest.mark.parametrize("container_head", [b"\x81", b"\xa1\x00"])
+def test_decode_raises_for_deeply_nested_data(container_head):
+    encoding = container_head * 5000 + b"\x00"
+
+    with pytest.raises(InvalidCBORDataError, match="nests more than"):
+        canonical_cbor.decode(encoding)
+
+
+def test_decode_accepts_data_nested_up_to_the_limit():
+    depth = canonical_cbor.MAX_NESTING_DEPTH
+    encoding = b"\x81" * depth + b"\x00"
+
+    value = canonical_cbor.decode(encoding)
+
+    for _ in range(depth):
+        value = value[0]
+    assert value == 0
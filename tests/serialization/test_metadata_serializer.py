@@ -6,7 +6,11 @@ import json
 from datetime import datetime
 
 from transparentmeta.entity.metadata import AIUsageLevel, Metadata
+from transparentmeta.serialization.binary_metadata_encoding import (
+    encode_metadata,
+)
 from transparentmeta.serialization.metadata_serializer import (
+    MetadataFormat,
     MetadataSerializer,
 )
 
@@ -78,3 +82,33 @@ def test_deserialize_metadata_json_string_to_metadata_object():
     assert metadata.additional_info == {"genre": "ambient"}
     assert metadata.created_at.isoformat() == "2024-01-01T12:00:01"
     assert metadata.created_at.year == 2024
+
+
+def test_serialize_metadata_with_binary_format(metadata):
+    serializer = MetadataSerializer(metadata_format=MetadataFormat.BINARY)
+    metadata_bytes = serializer.serialize(metadata)
+
+    assert metadata_bytes == encode_metadata(metadata)
+    assert serializer.serialize_binary(metadata) == metadata_bytes
+
+
+def test_deserialize_detects_format_of_serialized_metadata(metadata):
+    serializer = MetadataSerializer()
+
+    assert serializer.deserialize(encode_metadata(metadata)) == metadata
+    assert serializer.deserialize(metadata.model_dump_json()) == metadata
+
+
+def test_serialize_metadata_without_content_hash_omits_it(metadata):
+    json_string = MetadataSerializer().serialize(metadata)
+    assert "content_hash" not in json.loads(json_string)
+
+
+def test_serialize_metadata_with_content_hash(metadata):
+    metadata = metadata.model_copy(update={"content_hash": "sha256:0a"})
+    serializer = MetadataSerializer()
+
+    json_string = serializer.serialize(metadata)
+
+    assert json.loads(json_string)["content_hash"] == "sha256:0a"
+    assert serializer.deserialize(json_string) == metadata
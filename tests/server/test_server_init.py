@@ -0,0 +1,17 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import transparentmeta.server as server
+
+
+def test_server_public_api():
+    expected_exports = {
+        "RequestError",
+        "ServerConfig",
+        "VerificationRequestHandler",
+        "VerificationServer",
+    }
+    actual_exports = set(server.__all__)
+
+    assert actual_exports == expected_exports
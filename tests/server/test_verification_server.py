@@ -0,0 +1,442 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import http.client
+import json
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from transparentmeta.sdk.factory import (
+    build_transparent_metadata_reader,
+    build_transparent_metadata_writer,
+)
+from transparentmeta.server.verification_server import (
+    METADATA_HEADER,
+    ServerConfig,
+    VerificationServer,
+)
+
+
+def start_server(**kwargs):
+    server = VerificationServer(("127.0.0.1", 0), **kwargs)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,))
+    thread.start()
+    return server, thread
+
+
+@pytest.fixture
+def json_metadata(metadata):
+    return metadata.model_dump(mode="json")
+
+
+@pytest.fixture
+def verification_server(keys, tmp_path):
+    server, thread = start_server(
+        transparent_metadata_reader=build_transparent_metadata_reader(
+            keys["public_key"]
+        ),
+        transparent_metadata_writer=build_transparent_metadata_writer(
+            keys["private_key"]
+        ),
+        config=ServerConfig(
+            allowed_directories=(tmp_path,),
+            max_body_size=1024**2,
+            keep_alive_timeout=1.0,
+        ),
+    )
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def connection(verification_server):
+    connection = http.client.HTTPConnection(
+        "127.0.0.1", verification_server.server_port, timeout=5
+    )
+    yield connection
+    connection.close()
+
+
+def send(connection, method, path, body=None, headers=None):
+    connection.request(method, path, body=body, headers=headers or {})
+    response = connection.getresponse()
+    return response, response.read()
+
+
+def send_json(connection, path, value):
+    response, body = send(
+        connection,
+        "POST",
+        path,
+        json.dumps(value),
+        {"Content-Type": "application/json"},
+    )
+    return response, json.loads(body)
+
+
+def test_health_reports_capabilities(connection):
+    response, body = send(connection, "GET", "/health")
+
+    assert response.status == 200
+    assert json.loads(body) == {
+        "status": "ok",
+        "can_verify": True,
+        "can_sign": True,
+    }
+
+
+def test_sign_and_verify_uploaded_audio(connection, temp_mp3, json_metadata):
+    sign_response, tagged_audio_data = send(
+        connection,
+        "POST",
+        "/sign",
+        temp_mp3.read_bytes(),
+        {
+            "Content-Type": "audio/mpeg",
+            METADATA_HEADER: json.dumps(json_metadata),
+        },
+    )
+    verify_response, verify_body = send(
+        connection, "POST", "/verify?format=mp3", tagged_audio_data
+    )
+
+    assert sign_response.status == 200
+    assert sign_response.getheader("Content-Type") == "audio/mpeg"
+    assert verify_response.status == 200
+    record = json.loads(verify_body)
+    assert record["is_success"] is True
+    assert record["error"] is None
+    assert record["metadata"] == json_metadata
+
+
+def test_sign_and_verify_file_by_path(connection, temp_wav, json_metadata):
+    sign_response, sign_record = send_json(
+        connection,
+        "/sign",
+        {"path": str(temp_wav), "metadata": json_metadata},
+    )
+    verify_response, verify_record = send_json(
+        connection, "/verify", {"path": str(temp_wav)}
+    )
+
+    assert sign_response.status == 200
+    assert sign_record == {"is_success": True, "error": None}
+    assert verify_response.status == 200
+    assert verify_record["is_success"] is True
+    assert verify_record["metadata"] == json_metadata
+
+
+def test_verify_reports_untagged_audio(connection, temp_mp3):
+    response, body = send(
+        connection,
+        "POST",
+        "/verify",
+        temp_mp3.read_bytes(),
+        {"Content-Type": "audio/mpeg"},
+    )
+
+    assert response.status == 200
+    record = json.loads(body)
+    assert record["is_success"] is False
+    assert record["metadata"] is None
+
+
+def test_connection_is_kept_alive(verification_server, temp_mp3):
+    with socket.create_connection(
+        ("127.0.0.1", verification_server.server_port), timeout=5
+    ) as client:
+        connection = http.client.HTTPConnection("127.0.0.1")
+        connection.sock = client
+        for _ in range(3):
+            response, body = send_json(
+                connection, "/verify", {"path": str(temp_mp3)}
+            )
+            assert response.status == 200
+            assert not response.will_close
+            assert connection.sock is client
+
+
+@pytest.mark.parametrize(
+    "path, status",
+    [("/verify", 422), ("/sign", 422), ("/missing", 404)],
+)
+def test_errors_are_reported_as_json(connection, path, status):
+    response, body = send(
+        connection,
+        "POST",
+        path,
+        b"not audio",
+        {"Content-Type": "audio/mpeg", METADATA_HEADER: "{}"},
+    )
+
+    assert response.status == status
+    record = json.loads(body)
+    assert record["is_success"] is False
+    assert record["error"]
+
+
+def test_connection_is_kept_alive_after_client_error(
+    verification_server, temp_mp3
+):
+    with socket.create_connection(
+        ("127.0.0.1", verification_server.server_port), timeout=5
+    ) as client:
+        connection = http.client.HTTPConnection("127.0.0.1")
+        connection.sock = client
+        error_response, _ = send_json(
+            connection, "/verify", {"path": "/etc/passwd"}
+        )
+        response, _ = send_json(connection, "/verify", {"path": str(temp_mp3)})
+
+        assert error_response.status == 403
+        assert response.status == 200
+        assert connection.sock is client
+
+
+@pytest.mark.parametrize(
+    "path, body, headers, status, error",
+    [
+        (
+            "/verify",
+            b'{"path": "/etc/passwd"}',
+            {"Content-Type": "application/json"},
+            403,
+            "outside the allowed directories",
+        ),
+        (
+            "/verify",
+            b'{"file": "test.mp3"}',
+            {"Content-Type": "application/json"},
+            400,
+            "'path' string",
+        ),
+        (
+            "/verify",
+            b"{",
+            {"Content-Type": "application/json"},
+            400,
+            "Invalid JSON",
+        ),
+        (
+            "/verify",
+            b"[]",
+            {"Content-Type": "application/json"},
+            400,
+            "must be an object",
+        ),
+        (
+            "/verify",
+            b"audio",
+            {"Content-Type": "application/octet-stream"},
+            400,
+            "Audio format is unknown",
+        ),
+        (
+            "/sign",
+            b"audio",
+            {"Content-Type": "audio/mpeg"},
+            400,
+            METADATA_HEADER,
+        ),
+        (
+            "/verify",
+            b"audio",
+            {"Content-Length": "big"},
+            400,
+            "Invalid Content-Length",
+        ),
+        (
+            "/verify",
+            b"audio",
+            {"Content-Length": str(2 * 1024**2)},
+            413,
+            "can't be larger than",
+        ),
+    ],
+)
+def test_invalid_requests_are_rejected(
+    connection, path, body, headers, status, error
+):
+    response, response_body = send(connection, "POST", path, body, headers)
+
+    assert response.status == status
+    assert error in json.loads(response_body)["error"]
+
+
+def test_sign_by_path_rejects_missing_metadata(connection, temp_mp3):
+    response, record = send_json(
+        connection, "/sign", {"path": str(temp_mp3), "metadata": "none"}
+    )
+
+    assert response.status == 400
+    assert record["error"] == "Metadata must be a JSON object"
+
+
+def test_request_without_content_length_is_rejected(verification_server):
+    with socket.create_connection(
+        ("127.0.0.1", verification_server.server_port), timeout=5
+    ) as client:
+        client.sendall(b"POST /verify HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        response = http.client.HTTPResponse(client)
+        response.begin()
+
+        assert response.status == 411
+        assert response.will_close
+
+
+def test_incomplete_request_body_is_rejected(verification_server):
+    with socket.create_connection(
+        ("127.0.0.1", verification_server.server_port), timeout=5
+    ) as client:
+        client.sendall(
+            b"POST /verify HTTP/1.1\r\nHost: localhost\r\n"
+            b"Content-Length: 100\r\n\r\nshort"
+        )
+        client.shutdown(socket.SHUT_WR)
+        response = http.client.HTTPResponse(client)
+        response.begin()
+
+        assert response.status == 400
+        assert b"incomplete" in response.read()
+
+
+def test_idle_connection_is_closed_after_keep_alive_timeout(
+    verification_server,
+):
+    with socket.create_connection(
+        ("127.0.0.1", verification_server.server_port), timeout=5
+    ) as client:
+        start = time.monotonic()
+
+        assert client.recv(1) == b""
+        assert time.monotonic() - start < 4
+
+
+def test_server_without_keys_disables_endpoints():
+    server, thread = start_server()
+    try:
+        connection = http.client.HTTPConnection(
+            "127.0.0.1", server.server_port, timeout=5
+        )
+        _, health_body = send(connection, "GET", "/health")
+        verify_response, _ = send(connection, "POST", "/verify", b"")
+        sign_response, _ = send(connection, "POST", "/sign", b"")
+        connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    assert json.loads(health_body)["can_verify"] is False
+    assert json.loads(health_body)["can_sign"] is False
+    assert verify_response.status == 501
+    assert sign_response.status == 501
+
+
+def test_requests_are_served_in_parallel(verification_server, temp_mp3):
+    statuses = []
+
+    def verify_many():
+        connection = http.client.HTTPConnection(
+            "127.0.0.1", verification_server.server_port, timeout=5
+        )
+        for _ in range(5):
+            response, _ = send_json(
+                connection, "/verify", {"path": str(temp_mp3)}
+            )
+            statuses.append(response.status)
+        connection.close()
+
+    threads = [threading.Thread(target=verify_many) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert statuses == [200] * 20
+
+
+def test_unexpected_errors_close_the_connection(
+    verification_server, mocker, temp_mp3
+):
+    mocker.patch.object(
+        verification_server,
+        "finish_request",
+        side_effect=RuntimeError("boom"),
+    )
+    handle_error = mocker.patch.object(verification_server, "handle_error")
+
+    with socket.create_connection(
+        ("127.0.0.1", verification_server.server_port), timeout=5
+    ) as client:
+        assert client.recv(1) == b""
+
+    handle_error.assert_called_once()
+
+
+def test_client_disconnecting_before_the_body_is_not_an_error(
+    verification_server, connection, mocker
+):
+    write = socketserver._SocketWriter.write
+
+    def write_headers_only(writer, data):
+        if not data.startswith(b"HTTP/"):
+            raise BrokenPipeError
+        return write(writer, data)
+
+    mocker.patch.object(
+        socketserver._SocketWriter, "write", write_headers_only
+    )
+    handle_error = mocker.patch.object(verification_server, "handle_error")
+
+    connection.request("GET", "/health")
+    response = connection.getresponse()
+
+    assert response.status == 200
+    with pytest.raises(http.client.IncompleteRead):
+        response.read()
+    handle_error.assert_not_called()
+
+
+def test_sign_upload_with_utf8_metadata_header(
+    verification_server, temp_mp3, json_metadata, keys
+):
+    json_metadata["user_id"] = "usér_67890"
+    with socket.create_connection(
+        ("127.0.0.1", verification_server.server_port), timeout=5
+    ) as client:
+        connection = http.client.HTTPConnection("127.0.0.1")
+        connection.sock = client
+        connection.putrequest("POST", "/sign?format=mp3")
+        connection.putheader(
+            METADATA_HEADER,
+            json.dumps(json_metadata, ensure_ascii=False).encode("utf-8"),
+        )
+        audio_data = temp_mp3.read_bytes()
+        connection.putheader("Content-Length", str(len(audio_data)))
+        connection.endheaders(audio_data)
+        response = connection.getresponse()
+        tagged_audio_data = response.read()
+
+    assert response.status == 200
+    assert response.getheader("Content-Type") == "application/octet-stream"
+    read_result = build_transparent_metadata_reader(
+        keys["public_key"]
+    ).read_bytes(tagged_audio_data, "mp3")
+    assert read_result.metadata.user_id == "usér_67890"
+
+
+def test_server_config_resolves_allowed_directories(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    config = ServerConfig(allowed_directories=(Path("audio"),))
+
+    assert config.allowed_directories == (tmp_path.resolve() / "audio",)
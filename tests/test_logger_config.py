@@ -6,7 +6,11 @@ import logging
 
 import pytest
 
-from transparentmeta.logger_config import configure_logging
+from transparentmeta.logger_config import (
+    configure_logging,
+    is_quiet_mode,
+    set_quiet_mode,
+)
 
 
 @pytest.fixture
@@ -36,3 +40,40 @@ def test_configure_logging_does_not_duplicate_handlers(reset_logger):
 
     configure_logging()  # Should not add another handler
     assert len(logger.handlers) == initial_handler_count
+
+
+@pytest.fixture
+def restore_logger_level():
+    logger = logging.getLogger("transparentmeta")
+    level = logger.level
+    yield
+    set_quiet_mode(False)
+    logger.setLevel(level)
+
+
+def test_quiet_mode_discards_info_records_and_keeps_warnings(
+    restore_logger_level, caplog
+):
+    logger = logging.getLogger("transparentmeta.sdk")
+
+    set_quiet_mode()
+    with caplog.at_level(logging.DEBUG, logger="root"):
+        logger.info("Per-file record")
+        logger.warning("Warning record")
+
+    assert is_quiet_mode()
+    assert not logger.isEnabledFor(logging.INFO)
+    assert "Per-file record" not in caplog.text
+    assert "Warning record" in caplog.text
+
+
+def test_disabling_quiet_mode_restores_previous_level(restore_logger_level):
+    logger = logging.getLogger("transparentmeta")
+    logger.setLevel(logging.DEBUG)
+
+    set_quiet_mode()
+    set_quiet_mode()  # Enabling twice keeps the level to restore
+    set_quiet_mode(False)
+
+    assert not is_quiet_mode()
+    assert logger.level == logging.DEBUG
@@ -2,11 +2,14 @@
 # Copyright (c) 2025 Transparent Audio
 # Author: Valerio Velardo - valerio@transparentaudio.ai
 
-from mutagen.id3 import ID3, TXXX
+import pytest
+from mutagen.id3 import ID3, PRIV, TXXX
 from mutagen.mp3 import MP3
 
+from transparentmeta.request.exceptions import InvalidAudioFileError
 from transparentmeta.use_case.constants import (
     SIGNATURE_FIELD,
+    TRANSPARENCY_METADATA_FIELD,
 )
 from transparentmeta.use_case.read.mp3_metadata_reader import MP3MetadataReader
 
@@ -53,3 +56,39 @@ def test_initiate_metadata_field():
 def test_initiate_signature_field():
     reader = MP3MetadataReader("transparency-field", "signature-field")
     assert reader._signature_field == "TXXX:signature-field"
+
+
+def test_mp3_metadata_reader_raises_when_file_is_not_functioning(
+    temp_corrupt_mp3,
+):
+    reader = MP3MetadataReader()
+    with pytest.raises(InvalidAudioFileError, match="Invalid audio file"):
+        reader.read(temp_corrupt_mp3)
+
+
+def test_mp3_metadata_reader_reads_binary_metadata(temp_mp3):
+    audio = MP3(temp_mp3, ID3=ID3)
+    audio.add_tags()
+    audio.tags.add(PRIV(owner=TRANSPARENCY_METADATA_FIELD, data=b"\xa0"))
+    audio.tags.add(
+        TXXX(encoding=3, desc=SIGNATURE_FIELD, text="some_signature")
+    )
+    audio.save()
+
+    reader = MP3MetadataReader()
+    audio_file_data_reading = reader.read(temp_mp3)
+    assert audio_file_data_reading.is_success
+    assert audio_file_data_reading.metadata == b"\xa0"
+    assert audio_file_data_reading.signature == "some_signature"
+
+
+def test_mp3_metadata_reader_binary_metadata_without_signature(temp_mp3):
+    audio = MP3(temp_mp3, ID3=ID3)
+    audio.add_tags()
+    audio.tags.add(PRIV(owner=TRANSPARENCY_METADATA_FIELD, data=b"\xa0"))
+    audio.save()
+
+    reader = MP3MetadataReader()
+    audio_file_data_reading = reader.read(temp_mp3)
+    assert not audio_file_data_reading.is_success
+    assert audio_file_data_reading.metadata is None
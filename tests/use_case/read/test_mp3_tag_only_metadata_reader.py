@@ -0,0 +1,64 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+from mutagen.id3 import TXXX
+from mutagen.mp3 import MP3
+
+from transparentmeta.use_case.constants import TRANSPARENCY_METADATA_FIELD
+from transparentmeta.use_case.read.mp3_tag_only_metadata_reader import (
+    MP3TagOnlyMetadataReader,
+)
+
+
+def test_mp3_tag_only_metadata_reader_reads_successfully(
+    temp_mp3_file_with_metadata,
+):
+    reader = MP3TagOnlyMetadataReader()
+    audio_file_data_reading = reader.read(temp_mp3_file_with_metadata)
+    assert audio_file_data_reading.is_success
+    assert audio_file_data_reading.metadata == "some_metadata"
+    assert audio_file_data_reading.signature == "some_signature"
+
+
+def test_mp3_tag_only_metadata_reader_does_not_load_the_audio_stream(
+    mocker, temp_mp3_file_with_metadata
+):
+    load_audio_spy = mocker.spy(MP3TagOnlyMetadataReader, "_load_audio")
+
+    reader = MP3TagOnlyMetadataReader()
+    audio_file_data_reading = reader.read(temp_mp3_file_with_metadata)
+
+    assert audio_file_data_reading.is_success
+    load_audio_spy.assert_not_called()
+
+
+def test_mp3_tag_only_metadata_reader_when_file_has_no_tags(temp_mp3):
+    reader = MP3TagOnlyMetadataReader()
+    audio_file_data_reading = reader.read(temp_mp3)
+    assert not audio_file_data_reading.is_success
+    assert audio_file_data_reading.metadata is None
+    assert audio_file_data_reading.signature is None
+
+
+def test_mp3_tag_only_metadata_reader_missing_fields(temp_mp3):
+    audio = MP3(temp_mp3)
+    audio.add_tags()
+    audio.tags.add(
+        TXXX(
+            encoding=3, desc=TRANSPARENCY_METADATA_FIELD, text="some_metadata"
+        )
+    )
+    audio.save()
+
+    reader = MP3TagOnlyMetadataReader()
+    audio_file_data_reading = reader.read(temp_mp3)
+    assert not audio_file_data_reading.is_success
+
+
+def test_mp3_tag_only_metadata_reader_reports_file_without_id3_header(
+    temp_corrupt_mp3,
+):
+    reader = MP3TagOnlyMetadataReader()
+    audio_file_data_reading = reader.read(temp_corrupt_mp3)
+    assert not audio_file_data_reading.is_success
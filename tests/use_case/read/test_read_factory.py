@@ -15,8 +15,14 @@ from transparentmeta.use_case.read.factory import (
     build_read_use_case,
 )
 from transparentmeta.use_case.read.mp3_metadata_reader import MP3MetadataReader
+from transparentmeta.use_case.read.mp3_tag_only_metadata_reader import (
+    MP3TagOnlyMetadataReader,
+)
 from transparentmeta.use_case.read.read_use_case import ReadUseCase
 from transparentmeta.use_case.read.wav_metadata_reader import WAVMetadataReader
+from transparentmeta.use_case.read.wav_tag_only_metadata_reader import (
+    WAVTagOnlyMetadataReader,
+)
 
 
 def test_build_metadata_reader_returns_mp3_reader():
@@ -74,3 +80,20 @@ def test_build_read_use_case_with_custom_fields():
     assert isinstance(reader, MP3MetadataReader)
     assert reader.transparency_metadata_field == "custom_meta"
     assert reader.signature_field == "custom_sig"
+
+
+@pytest.mark.parametrize(
+    "audio_format, expected_reader_class",
+    [("mp3", MP3TagOnlyMetadataReader), ("wav", WAVTagOnlyMetadataReader)],
+)
+def test_build_metadata_reader_returns_tag_only_reader(
+    audio_format, expected_reader_class
+):
+    reader = build_metadata_reader(audio_format, tag_only=True)
+    assert isinstance(reader, expected_reader_class)
+
+
+def test_build_read_use_case_with_tag_only_reader():
+    public_key = ed25519.Ed25519PrivateKey.generate().public_key()
+    use_case = build_read_use_case(public_key, "mp3", tag_only=True)
+    assert isinstance(use_case.metadata_reader, MP3TagOnlyMetadataReader)
@@ -0,0 +1,135 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import pytest
+
+from transparentmeta.result.result import ReadResult
+from transparentmeta.use_case.read.read_result_cache import (
+    ReadResultCache,
+    SQLiteReadResultStore,
+)
+
+SCOPE = "fingerprint:full"
+OTHER_SCOPE = "other-fingerprint:full"
+FILE_IDENTITY = (1, 2, 3, 4)
+OTHER_FILE_IDENTITY = (1, 5, 3, 4)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def read_result(metadata):
+    return ReadResult(is_success=True, metadata=metadata)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteReadResultStore(tmp_path / "cache.sqlite")
+    yield store
+    store.close()
+
+
+def test_read_result_cache_returns_cached_result(read_result):
+    cache = ReadResultCache()
+    cache.put(SCOPE, FILE_IDENTITY, read_result)
+
+    assert cache.get(SCOPE, FILE_IDENTITY) is read_result
+    assert cache.get(SCOPE, OTHER_FILE_IDENTITY) is None
+
+
+def test_read_result_cache_evicts_least_recently_used_result(read_result):
+    cache = ReadResultCache(max_entries=2)
+    cache.put(SCOPE, (0, 0, 0, 0), read_result)
+    cache.put(SCOPE, (0, 1, 0, 0), read_result)
+    cache.get(SCOPE, (0, 0, 0, 0))
+    cache.put(SCOPE, (0, 2, 0, 0), read_result)
+
+    assert len(cache) == 2
+    assert cache.get(SCOPE, (0, 1, 0, 0)) is None
+    assert cache.get(SCOPE, (0, 0, 0, 0)) is read_result
+
+
+def test_read_result_cache_expires_results(read_result):
+    clock = FakeClock()
+    cache = ReadResultCache(ttl_seconds=60, clock=clock)
+    cache.put(SCOPE, FILE_IDENTITY, read_result)
+
+    clock.now += 59
+    assert cache.get(SCOPE, FILE_IDENTITY) is read_result
+    clock.now += 1
+    assert cache.get(SCOPE, FILE_IDENTITY) is None
+    assert len(cache) == 0
+
+
+def test_read_result_cache_clear(read_result, store):
+    cache = ReadResultCache(store=store)
+    cache.put(SCOPE, FILE_IDENTITY, read_result)
+    cache.clear()
+
+    assert len(cache) == 0
+    assert store.get(SCOPE, FILE_IDENTITY) is None
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"max_entries": 0}, "max_entries must be at least 1"),
+        ({"ttl_seconds": 0}, "ttl_seconds must be positive"),
+    ],
+)
+def test_read_result_cache_raises_with_invalid_bounds(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        ReadResultCache(**kwargs)
+
+
+def test_read_result_cache_loads_results_from_store(read_result, store):
+    ReadResultCache(store=store).put(SCOPE, FILE_IDENTITY, read_result)
+
+    cache = ReadResultCache(store=store)
+
+    assert cache.get(SCOPE, FILE_IDENTITY) == read_result
+    assert len(cache) == 1
+
+
+def test_read_result_cache_ignores_expired_results_in_store(
+    read_result, store
+):
+    clock = FakeClock()
+    ReadResultCache(store=store, clock=clock).put(
+        SCOPE, FILE_IDENTITY, read_result
+    )
+    clock.now += 60
+
+    cache = ReadResultCache(ttl_seconds=60, store=store, clock=clock)
+
+    assert cache.get(SCOPE, FILE_IDENTITY) is None
+    assert len(cache) == 0
+
+
+def test_sqlite_read_result_store_round_trips_failed_results(store):
+    failed_read_result = ReadResult(
+        is_success=False, error="Signature verification failed."
+    )
+    store.put(SCOPE, FILE_IDENTITY, 1000.0, failed_read_result)
+
+    assert store.get(SCOPE, FILE_IDENTITY) == (1000.0, failed_read_result)
+    assert store.get(SCOPE, OTHER_FILE_IDENTITY) is None
+    assert store.get(OTHER_SCOPE, FILE_IDENTITY) is None
+
+
+def test_read_result_cache_misses_results_from_other_scopes(
+    read_result, store
+):
+    ReadResultCache(store=store).put(SCOPE, FILE_IDENTITY, read_result)
+
+    cache = ReadResultCache(store=store)
+
+    assert cache.get(OTHER_SCOPE, FILE_IDENTITY) is None
+    assert cache.get(SCOPE, FILE_IDENTITY) == read_result
@@ -2,18 +2,27 @@
 # Copyright (c) 2025 Transparent Audio
 # Author: Valerio Velardo - valerio@transparentaudio.ai
 
+import struct
 from pathlib import Path
 
 import pytest
+from mutagen.mp3 import MP3
 
+from transparentmeta.crypto.content_hasher import ContentHasher
 from transparentmeta.crypto.key_management import generate_key_pair
 from transparentmeta.crypto.signature_verifier import SignatureVerifier
+from transparentmeta.request.read_bytes_request import ReadBytesRequest
 from transparentmeta.request.read_request import ReadRequest
 from transparentmeta.request.write_request import WriteRequest
 from transparentmeta.serialization.metadata_serializer import (
+    MetadataFormat,
     MetadataSerializer,
 )
 from transparentmeta.use_case.read.mp3_metadata_reader import MP3MetadataReader
+from transparentmeta.use_case.read.mp3_tag_only_metadata_reader import (
+    MP3TagOnlyMetadataReader,
+)
+from transparentmeta.use_case.read.read_result_cache import ReadResultCache
 from transparentmeta.use_case.read.read_use_case import ReadUseCase
 from transparentmeta.use_case.read.wav_metadata_reader import WAVMetadataReader
 from transparentmeta.use_case.write.factory import build_write_use_case
@@ -72,6 +81,158 @@ def test_read_use_case_provides_error_result_for_file_without_metadata(
     )
 
 
+def test_read_use_case_reads_metadata_from_bytes_correctly(
+    tmp_mp3_file_with_signed_metadata, read_use_case, metadata
+):
+    read_bytes_request = ReadBytesRequest(
+        audio_data=tmp_mp3_file_with_signed_metadata.read_bytes(),
+        audio_format="mp3",
+    )
+    read_result = read_use_case.read_bytes(read_bytes_request)
+    assert read_result.is_success
+    assert read_result.metadata == metadata
+
+
 def test_read_use_case_setter_switches_reader(read_use_case):
     read_use_case.metadata_reader = WAVMetadataReader()
     assert isinstance(read_use_case.metadata_reader, WAVMetadataReader)
+
+
+def test_read_use_case_returns_cached_result_for_unchanged_file(
+    mocker, read_request, read_use_case, metadata
+):
+    read_use_case.read_result_cache = ReadResultCache()
+    read_spy = mocker.spy(read_use_case.metadata_reader, "read")
+
+    first_read_result = read_use_case.read(read_request)
+    second_read_result = read_use_case.read(read_request)
+
+    assert second_read_result is first_read_result
+    assert second_read_result.metadata == metadata
+    read_spy.assert_called_once()
+
+
+def test_read_use_case_reads_again_file_changed_since_cached(
+    read_request, read_use_case
+):
+    read_use_case.read_result_cache = ReadResultCache()
+    assert read_use_case.read(read_request).is_success
+
+    audio = MP3(read_request.filepath)
+    audio.tags.delall("TXXX:signature")
+    audio.save()
+
+    assert not read_use_case.read(read_request).is_success
+
+
+def test_read_use_case_does_not_share_cached_results_across_keys(
+    read_request, read_use_case
+):
+    read_result_cache = ReadResultCache()
+    read_use_case.read_result_cache = read_result_cache
+    assert read_use_case.read(read_request).is_success
+
+    _, other_public_key = generate_key_pair()
+    other_read_use_case = ReadUseCase(
+        metadata_reader=MP3MetadataReader(),
+        signature_verifier=SignatureVerifier(other_public_key),
+        metadata_serializer=MetadataSerializer(),
+        read_result_cache=read_result_cache,
+    )
+
+    assert not other_read_use_case.read(read_request).is_success
+
+
+def test_read_use_case_does_not_share_cached_results_across_read_modes(
+    mocker, read_request, read_use_case
+):
+    read_result_cache = ReadResultCache()
+    read_use_case.read_result_cache = read_result_cache
+    assert read_use_case.read(read_request).is_success
+
+    tag_only_read_use_case = ReadUseCase(
+        metadata_reader=MP3TagOnlyMetadataReader(),
+        signature_verifier=SignatureVerifier(public_key),
+        metadata_serializer=MetadataSerializer(),
+        read_result_cache=read_result_cache,
+    )
+    read_spy = mocker.spy(tag_only_read_use_case.metadata_reader, "read")
+
+    assert tag_only_read_use_case.read(read_request).is_success
+    read_spy.assert_called_once()
+
+
+def test_read_use_case_reads_binary_metadata_correctly(
+    temp_mp3, read_use_case, metadata
+):
+    write_use_case = build_write_use_case(
+        private_key, "mp3", metadata_format=MetadataFormat.BINARY
+    )
+    write_use_case.write(WriteRequest(filepath=temp_mp3, metadata=metadata))
+
+    read_result = read_use_case.read(ReadRequest(filepath=temp_mp3))
+    assert read_result.is_success
+    assert read_result.metadata == metadata
+
+
+@pytest.mark.parametrize("metadata_format", list(MetadataFormat))
+def test_read_use_case_verifies_content_hash(
+    temp_mp3, read_use_case, metadata, metadata_format
+):
+    write_use_case = build_write_use_case(
+        private_key,
+        "mp3",
+        metadata_format=metadata_format,
+        content_hasher=ContentHasher(),
+    )
+    write_use_case.write(WriteRequest(filepath=temp_mp3, metadata=metadata))
+
+    read_result = read_use_case.read(ReadRequest(filepath=temp_mp3))
+    assert read_result.is_success
+    assert read_result.metadata.content_hash.startswith("sha256:")
+    assert read_result.metadata == metadata.model_copy(
+        update={"content_hash": read_result.metadata.content_hash}
+    )
+
+
+def test_read_use_case_verifies_content_hash_of_wav_with_relocated_tag(
+    temp_wav, read_use_case, metadata
+):
+    # An ID3 chunk followed by the data chunk is too small for the new tag,
+    # so it's replaced by a JUNK chunk and written again at the end.
+    riff_file = temp_wav.read_bytes()
+    id3_chunk = b"id3 " + struct.pack("<I", 10) + b"ID3\x04" + b"\x00" * 6
+    data_chunk = b"data" + struct.pack("<I", 1000) + b"\x01" * 1000
+    body = b"WAVE" + riff_file[12:36] + id3_chunk + data_chunk
+    temp_wav.write_bytes(b"RIFF" + struct.pack("<I", len(body)) + body)
+    write_use_case = build_write_use_case(
+        private_key, "wav", content_hasher=ContentHasher()
+    )
+    write_use_case.write(WriteRequest(filepath=temp_wav, metadata=metadata))
+    read_use_case.metadata_reader = WAVMetadataReader()
+
+    read_result = read_use_case.read(ReadRequest(filepath=temp_wav))
+    assert b"JUNK" in temp_wav.read_bytes()
+    assert read_result.is_success
+    assert read_result.metadata.content_hash.startswith("sha256:")
+
+
+def test_read_use_case_fails_when_audio_is_swapped_under_valid_tag(
+    temp_mp3, read_use_case, metadata
+):
+    write_use_case = build_write_use_case(
+        private_key, "mp3", content_hasher=ContentHasher()
+    )
+    write_use_case.write(WriteRequest(filepath=temp_mp3, metadata=metadata))
+    audio_data = bytearray(temp_mp3.read_bytes())
+    audio_data[-1000] ^= 0xFF
+    temp_mp3.write_bytes(audio_data)
+
+    read_result = read_use_case.read(ReadRequest(filepath=temp_mp3))
+    assert not read_result.is_success
+    assert "Content hash verification failed" in read_result.error
+
+    read_result = read_use_case.read_bytes(
+        ReadBytesRequest(audio_data=bytes(audio_data), audio_format="mp3")
+    )
+    assert not read_result.is_success
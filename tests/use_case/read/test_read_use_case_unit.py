@@ -26,7 +26,7 @@ def test_successful_read_use_case(mocker, use_case):
     # Setup
     fake_metadata = '{"foo": "bar"}'
     fake_signature = "valid_signature"
-    fake_metadata_obj = {"foo": "bar"}
+    fake_metadata_obj = mocker.Mock(content_hash=None)
     filepath = Path("fake_audio.mp3")
 
     mock_metadata_reader = use_case.metadata_reader
@@ -94,3 +94,18 @@ def test_read_use_case_fails_due_to_invalid_signature(mocker, use_case):
     assert not result.is_success
     assert result.error == "Signature verification failed."
     assert result.metadata is None
+
+
+def test_read_use_case_uses_reader_passed_per_call(mocker, use_case):
+    call_metadata_reader = mocker.Mock()
+    call_metadata_reader.read.return_value = AudioFileDataReading(
+        is_success=False, metadata=None, signature=None
+    )
+    mock_read_request = mocker.Mock()
+    mock_read_request.filepath = Path("fake_audio.wav")
+
+    result = use_case.read(mock_read_request, call_metadata_reader)
+
+    assert not result.is_success
+    call_metadata_reader.read.assert_called_once_with(Path("fake_audio.wav"))
+    use_case.metadata_reader.read.assert_not_called()
@@ -7,10 +7,19 @@ import pytest
 from transparentmeta.use_case.read.mp3_metadata_reader import (
     MP3MetadataReader,
 )
-from transparentmeta.use_case.read.reader_selector import ReaderSelector
+from transparentmeta.use_case.read.mp3_tag_only_metadata_reader import (
+    MP3TagOnlyMetadataReader,
+)
+from transparentmeta.use_case.read.reader_selector import (
+    ReaderSelector,
+    tag_only_metadata_reader_registry,
+)
 from transparentmeta.use_case.read.wav_metadata_reader import (
     WAVMetadataReader,
 )
+from transparentmeta.use_case.read.wav_tag_only_metadata_reader import (
+    WAVTagOnlyMetadataReader,
+)
 
 
 @pytest.fixture
@@ -31,3 +40,16 @@ def test_get_reader_wav(reader_selector):
 def test_get_reader_wave(reader_selector):
     reader = reader_selector.get_reader("wave")
     assert isinstance(reader, WAVMetadataReader)
+
+
+def test_get_reader_from_tag_only_registry():
+    reader_selector = ReaderSelector(tag_only_metadata_reader_registry)
+    assert isinstance(
+        reader_selector.get_reader("mp3"), MP3TagOnlyMetadataReader
+    )
+    assert isinstance(
+        reader_selector.get_reader("wav"), WAVTagOnlyMetadataReader
+    )
+    assert isinstance(
+        reader_selector.get_reader("wave"), WAVTagOnlyMetadataReader
+    )
@@ -2,9 +2,11 @@
 # Copyright (c) 2025 Transparent Audio
 # Author: Valerio Velardo - valerio@transparentaudio.ai
 
+import pytest
 from mutagen.id3 import TXXX
 from mutagen.wave import WAVE
 
+from transparentmeta.request.exceptions import InvalidAudioFileError
 from transparentmeta.use_case.constants import (
     TRANSPARENCY_METADATA_FIELD,
 )
@@ -42,3 +44,11 @@ def test_wav_metadata_reader_missing_fields(temp_wav):
     assert not audio_file_data_reading.is_success
     assert audio_file_data_reading.metadata is None
     assert audio_file_data_reading.signature is None
+
+
+def test_wav_metadata_reader_raises_when_file_is_not_functioning(
+    temp_corrupt_wav,
+):
+    reader = WAVMetadataReader()
+    with pytest.raises(InvalidAudioFileError, match="Invalid audio file"):
+        reader.read(temp_corrupt_wav)
@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import io
+import mmap
+import struct
+
+import pytest
+from mutagen.id3 import TXXX
+from mutagen.wave import WAVE
+
+from transparentmeta.request.exceptions import InvalidAudioFileError
+from transparentmeta.use_case.constants import TRANSPARENCY_METADATA_FIELD
+from transparentmeta.use_case.read.wav_tag_only_metadata_reader import (
+    WAVTagOnlyMetadataReader,
+)
+
+
+def test_wav_tag_only_metadata_reader_reads_successfully(
+    temp_wav_file_with_metadata,
+):
+    reader = WAVTagOnlyMetadataReader()
+    audio_file_data_reading = reader.read(temp_wav_file_with_metadata)
+    assert audio_file_data_reading.is_success
+    assert audio_file_data_reading.metadata == "some_metadata"
+    assert audio_file_data_reading.signature == "some_signature"
+
+
+def test_wav_tag_only_metadata_reader_reads_from_file_object(
+    temp_wav_file_with_metadata,
+):
+    reader = WAVTagOnlyMetadataReader()
+    audio_file_data_reading = reader.read(
+        io.BytesIO(temp_wav_file_with_metadata.read_bytes())
+    )
+    assert audio_file_data_reading.is_success
+    assert audio_file_data_reading.metadata == "some_metadata"
+    assert audio_file_data_reading.signature == "some_signature"
+
+
+def test_wav_tag_only_metadata_reader_does_not_load_the_audio_stream(
+    mocker, temp_wav_file_with_metadata
+):
+    load_audio_spy = mocker.spy(WAVTagOnlyMetadataReader, "_load_audio")
+
+    reader = WAVTagOnlyMetadataReader()
+    audio_file_data_reading = reader.read(temp_wav_file_with_metadata)
+
+    assert audio_file_data_reading.is_success
+    load_audio_spy.assert_not_called()
+
+
+def test_wav_tag_only_metadata_reader_when_file_has_no_tags(temp_wav):
+    reader = WAVTagOnlyMetadataReader()
+    audio_file_data_reading = reader.read(temp_wav)
+    assert not audio_file_data_reading.is_success
+    assert audio_file_data_reading.metadata is None
+    assert audio_file_data_reading.signature is None
+
+
+def test_wav_tag_only_metadata_reader_missing_fields(temp_wav):
+    audio = WAVE(temp_wav)
+    audio.add_tags()
+    audio.tags.add(
+        TXXX(
+            encoding=3, desc=TRANSPARENCY_METADATA_FIELD, text="some_metadata"
+        )
+    )
+    audio.save()
+
+    reader = WAVTagOnlyMetadataReader()
+    audio_file_data_reading = reader.read(temp_wav)
+    assert not audio_file_data_reading.is_success
+
+
+def test_wav_tag_only_metadata_reader_with_empty_id3_chunk(temp_wav):
+    with open(temp_wav, "r+b") as fileobj:
+        fileobj.seek(0, 2)
+        fileobj.write(b"id3 " + struct.pack("<I", 0))
+        fileobj.seek(4)
+        fileobj.write(struct.pack("<I", 44))
+
+    reader = WAVTagOnlyMetadataReader()
+    audio_file_data_reading = reader.read(temp_wav)
+    assert not audio_file_data_reading.is_success
+
+
+def test_wav_tag_only_metadata_reader_raises_when_file_is_not_riff(
+    temp_corrupt_wav,
+):
+    reader = WAVTagOnlyMetadataReader()
+    with pytest.raises(InvalidAudioFileError, match="Invalid audio file"):
+        reader.read(temp_corrupt_wav)
+
+
+def test_wav_tag_only_metadata_reader_memory_maps_files(
+    mocker, temp_wav_file_with_metadata
+):
+    mmap_spy = mocker.spy(mmap, "mmap")
+
+    reader = WAVTagOnlyMetadataReader()
+    audio_file_data_reading = reader.read(temp_wav_file_with_metadata)
+
+    assert audio_file_data_reading.is_success
+    assert mmap_spy.call_args.kwargs == {"access": mmap.ACCESS_READ}
+
+
+def test_wav_tag_only_metadata_reader_raises_when_file_is_empty(tmp_path):
+    empty_wav = tmp_path / "empty.wav"
+    empty_wav.touch()
+
+    reader = WAVTagOnlyMetadataReader()
+    with pytest.raises(InvalidAudioFileError, match="Invalid audio file"):
+        reader.read(empty_wav)
+
+
+def test_wav_tag_only_metadata_reader_when_file_object_has_no_tags(temp_wav):
+    reader = WAVTagOnlyMetadataReader()
+    audio_file_data_reading = reader.read(io.BytesIO(temp_wav.read_bytes()))
+    assert not audio_file_data_reading.is_success
+    assert audio_file_data_reading.metadata is None
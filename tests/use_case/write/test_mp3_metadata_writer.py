@@ -2,12 +2,17 @@
 # Copyright (c) 2025 Transparent Audio
 # Author: Valerio Velardo - valerio@transparentaudio.ai
 
+import io
+
+import pytest
 from mutagen.id3 import ID3
 from mutagen.mp3 import MP3
 
+from transparentmeta.request.exceptions import InvalidAudioFileError
 from transparentmeta.use_case.write.mp3_metadata_writer import (
     MP3MetadataWriter,
 )
+from transparentmeta.use_case.write.padding_policy import PaddingPolicy
 
 
 def test_write_metadata_to_mp3(temp_mp3):
@@ -64,3 +69,84 @@ def test_overwrite_existing_metadata_to_mp3(temp_mp3):
         == metadata2
     )
     assert audio.tags[f"TXXX:{writer.signature_field}"].text[0] == signature2
+
+
+def test_mp3_metadata_writer_raises_when_file_is_not_functioning(
+    temp_corrupt_mp3,
+):
+    writer = MP3MetadataWriter()
+    with pytest.raises(InvalidAudioFileError, match="Invalid audio file"):
+        writer.write(temp_corrupt_mp3, "metadata", "signature")
+
+
+def test_mp3_metadata_writer_reserves_padding_on_first_write(temp_mp3):
+    writer = MP3MetadataWriter(padding_policy=PaddingPolicy(2048))
+    size_before_write = temp_mp3.stat().st_size
+
+    writer.write(temp_mp3, "metadata", "signature")
+
+    assert temp_mp3.stat().st_size >= size_before_write + 2048
+
+
+def test_mp3_metadata_writer_rewrites_tag_in_place(temp_mp3):
+    writer = MP3MetadataWriter()
+    writer.write(temp_mp3, "company=Old Company", "sig_old123")
+    size_after_first_write = temp_mp3.stat().st_size
+
+    writer.write(temp_mp3, "company=New Company||model=v2", "sig_new456")
+
+    assert temp_mp3.stat().st_size == size_after_first_write
+
+
+def test_write_binary_metadata_to_mp3_replaces_text_metadata(temp_mp3):
+    writer = MP3MetadataWriter()
+    writer.write(temp_mp3, "field1=value1", "sig_old123")
+
+    writer.write(temp_mp3, b"\xa1\x00\x01", "sig_new456")
+
+    audio = MP3(temp_mp3, ID3=ID3)
+    assert f"TXXX:{writer.transparency_metadata_field}" not in audio.tags
+    (priv_frame,) = audio.tags.getall("PRIV")
+    assert priv_frame.owner == writer.transparency_metadata_field
+    assert priv_frame.data == b"\xa1\x00\x01"
+    assert audio.tags[f"TXXX:{writer.signature_field}"].text[0] == "sig_new456"
+
+
+def test_write_text_metadata_to_mp3_replaces_binary_metadata(temp_mp3):
+    writer = MP3MetadataWriter()
+    writer.write(temp_mp3, b"\xa1\x00\x01", "sig_old123")
+
+    writer.write(temp_mp3, "field1=value1", "sig_new456")
+
+    audio = MP3(temp_mp3, ID3=ID3)
+    assert audio.tags.getall("PRIV") == []
+    assert (
+        audio.tags[f"TXXX:{writer.transparency_metadata_field}"].text[0]
+        == "field1=value1"
+    )
+
+
+def test_mp3_metadata_writer_replaces_file_atomically(temp_mp3):
+    writer = MP3MetadataWriter(atomic=True)
+    original_inode = temp_mp3.stat().st_ino
+
+    writer.write(temp_mp3, "field1=value1", "sig_new456")
+
+    audio = MP3(temp_mp3, ID3=ID3)
+    assert audio.tags[f"TXXX:{writer.signature_field}"].text[0] == (
+        "sig_new456"
+    )
+    assert temp_mp3.stat().st_ino != original_inode
+
+
+def test_atomic_mp3_metadata_writer_edits_file_objects_in_place(temp_mp3):
+    audio_buffer = io.BytesIO(temp_mp3.read_bytes())
+    writer = MP3MetadataWriter(atomic=True)
+
+    writer.write(audio_buffer, "field1=value1", "sig_new456")
+
+    audio_buffer.seek(0)
+    audio = MP3(audio_buffer, ID3=ID3)
+    assert audio.tags[f"TXXX:{writer.signature_field}"].text[0] == (
+        "sig_new456"
+    )
@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import pytest
+from mutagen import PaddingInfo
+
+from transparentmeta.use_case.write.padding_policy import (
+    DEFAULT_RESERVED_PADDING,
+    PaddingPolicy,
+)
+
+
+def test_padding_policy_defaults():
+    padding_policy = PaddingPolicy()
+    assert padding_policy.reserved_padding == DEFAULT_RESERVED_PADDING
+    assert padding_policy.max_padding is None
+
+
+def test_padding_policy_reserves_padding_when_tag_grows():
+    padding_policy = PaddingPolicy(reserved_padding=1024)
+    assert padding_policy(PaddingInfo(-10, 2000)) == 1024
+
+
+def test_padding_policy_keeps_existing_padding_when_tag_fits():
+    padding_policy = PaddingPolicy(reserved_padding=1024)
+    assert padding_policy(PaddingInfo(300, 2000)) == 300
+
+
+def test_padding_policy_keeps_large_padding_without_max_padding():
+    padding_policy = PaddingPolicy(reserved_padding=1024)
+    assert padding_policy(PaddingInfo(10**6, 2000)) == 10**6
+
+
+def test_padding_policy_shrinks_padding_above_max_padding():
+    padding_policy = PaddingPolicy(reserved_padding=1024, max_padding=8192)
+    assert padding_policy(PaddingInfo(10000, 2000)) == 1024
+    assert padding_policy(PaddingInfo(8192, 2000)) == 8192
+
+
+def test_padding_policy_with_negative_reserved_padding_raises():
+    with pytest.raises(ValueError, match="must be non-negative"):
+        PaddingPolicy(reserved_padding=-1)
+
+
+def test_padding_policy_with_max_padding_below_reserved_padding_raises():
+    with pytest.raises(ValueError, match="must not be smaller"):
+        PaddingPolicy(reserved_padding=1024, max_padding=512)
@@ -2,12 +2,18 @@
 # Copyright (c) 2025 Transparent Audio
 # Author: Valerio Velardo - valerio@transparentaudio.ai
 
+import io
+import struct
+
+import pytest
 from mutagen.id3 import TXXX
 from mutagen.wave import WAVE
 
+from transparentmeta.request.exceptions import InvalidAudioFileError
 from transparentmeta.use_case.write.wav_metadata_writer import (
     WAVMetadataWriter,
 )
+from transparentmeta.utils.riff_utils import iter_riff_chunks
 
 
 def test_write_metadata_to_wav(temp_wav):
@@ -64,3 +70,103 @@ def test_write_metadata_preserves_existing_tags_in_wav(temp_wav):
         new_metadata
     ]
     assert audio.tags[f"TXXX:{writer.signature_field}"].text == [signature]
+
+
+def test_wav_metadata_writer_raises_when_file_is_not_functioning(
+    temp_corrupt_wav,
+):
+    writer = WAVMetadataWriter()
+    with pytest.raises(InvalidAudioFileError, match="Invalid audio file"):
+        writer.write(temp_corrupt_wav, "metadata", "signature")
+
+
+def test_wav_metadata_writer_rewrites_tag_in_place(temp_wav):
+    writer = WAVMetadataWriter()
+    writer.write(temp_wav, "company=Old Company", "sig_old123")
+    size_after_first_write = temp_wav.stat().st_size
+
+    writer.write(temp_wav, "company=New Company||model=v2", "sig_new456")
+
+    assert temp_wav.stat().st_size == size_after_first_write
+
+
+def test_wav_metadata_writer_replaces_file_atomically(temp_wav):
+    writer = WAVMetadataWriter(atomic=True)
+    original_inode = temp_wav.stat().st_ino
+
+    writer.write(temp_wav, "company=New Company", "sig_new456")
+
+    audio = WAVE(temp_wav)
+    assert audio.tags[f"TXXX:{writer.signature_field}"].text[0] == (
+        "sig_new456"
+    )
+    assert temp_wav.stat().st_ino != original_inode
+    assert list(temp_wav.parent.iterdir()) == [temp_wav]
+
+
+def test_atomic_wav_metadata_writer_keeps_file_when_save_fails(
+    temp_wav, mocker
+):
+    original_data = temp_wav.read_bytes()
+    mocker.patch(
+        "transparentmeta.use_case.write.wav_metadata_writer.write_riff_chunk",
+        side_effect=OSError("Disk full"),
+    )
+    writer = WAVMetadataWriter(atomic=True)
+
+    with pytest.raises(OSError, match="Disk full"):
+        writer.write(temp_wav, "company=New Company", "sig_new456")
+
+    assert temp_wav.read_bytes() == original_data
+    assert list(temp_wav.parent.iterdir()) == [temp_wav]
+
+
+@pytest.fixture
+def wav_with_id3_chunk_before_data(temp_wav):
+    # Some tools write the ID3 chunk before the data chunk, where growing it
+    # would move the whole audio data.
+    riff_file = temp_wav.read_bytes()
+    fmt_chunk, data_chunk = riff_file[12:36], riff_file[36:]
+    id3_chunk = b"id3 " + struct.pack("<I", 10) + b"ID3\x04" + b"\x00" * 6
+    data_chunk = b"data" + struct.pack("<I", 1000) + b"\x01" * 1000
+    body = b"WAVE" + fmt_chunk + id3_chunk + data_chunk
+    temp_wav.write_bytes(b"RIFF" + struct.pack("<I", len(body)) + body)
+    return temp_wav
+
+
+def test_wav_metadata_writer_never_moves_data_chunk(
+    wav_with_id3_chunk_before_data,
+):
+    writer = WAVMetadataWriter()
+    original_data = wav_with_id3_chunk_before_data.read_bytes()
+
+    writer.write(
+        wav_with_id3_chunk_before_data, "company=New Company", "sig_new456"
+    )
+
+    riff_file = wav_with_id3_chunk_before_data.read_bytes()
+    assert riff_file[12:1062] == original_data[12:1062].replace(
+        b"id3 ", b"JUNK"
+    )
+    chunk_ids = [
+        chunk.chunk_id for chunk in iter_riff_chunks(io.BytesIO(riff_file))
+    ]
+    assert chunk_ids == [b"fmt ", b"JUNK", b"data", b"id3 "]
+    assert struct.unpack("<I", riff_file[4:8])[0] == len(riff_file) - 8
+    audio = WAVE(wav_with_id3_chunk_before_data)
+    assert audio.tags[f"TXXX:{writer.signature_field}"].text[0] == (
+        "sig_new456"
+    )
+
+
+def test_wav_metadata_writer_writes_to_file_objects(temp_wav):
+    audio_buffer = io.BytesIO(temp_wav.read_bytes())
+    writer = WAVMetadataWriter()
+
+    writer.write(audio_buffer, "company=New Company", "sig_new456")
+
+    audio_buffer.seek(0)
+    audio = WAVE(audio_buffer)
+    assert audio.tags[f"TXXX:{writer.signature_field}"].text[0] == (
+        "sig_new456"
+    )
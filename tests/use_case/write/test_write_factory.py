@@ -12,11 +12,13 @@ from transparentmeta.use_case.constants import (
 from transparentmeta.use_case.exceptions import UnsupportedAudioFormatError
 from transparentmeta.use_case.write.factory import (
     build_metadata_writer,
+    build_metadata_writer_registry,
     build_write_use_case,
 )
 from transparentmeta.use_case.write.mp3_metadata_writer import (
     MP3MetadataWriter,
 )
+from transparentmeta.use_case.write.padding_policy import PaddingPolicy
 from transparentmeta.use_case.write.wav_metadata_writer import (
     WAVMetadataWriter,
 )
@@ -75,3 +77,38 @@ def test_build_write_use_case_with_custom_id3_tag_fields():
     assert isinstance(use_case.metadata_writer, MP3MetadataWriter)
     assert use_case.metadata_writer.transparency_metadata_field == "meta"
     assert use_case.metadata_writer.signature_field == "sig"
+
+
+def test_build_metadata_writer_with_padding_policy():
+    padding_policy = PaddingPolicy(reserved_padding=1024)
+    writer = build_metadata_writer("wav", padding_policy=padding_policy)
+    assert writer.padding_policy == padding_policy
+
+
+def test_build_metadata_writer_with_atomic_mode():
+    assert build_metadata_writer("mp3", atomic=True).atomic
+    assert not build_metadata_writer("mp3").atomic
+
+
+def test_build_write_use_case_with_padding_policy():
+    private_key = ed25519.Ed25519PrivateKey.generate()
+    padding_policy = PaddingPolicy(reserved_padding=1024)
+    use_case = build_write_use_case(
+        private_key, "mp3", padding_policy=padding_policy
+    )
+    assert use_case.metadata_writer.padding_policy == padding_policy
+
+
+def test_build_metadata_writer_registry_configures_all_writers():
+    padding_policy = PaddingPolicy(reserved_padding=1024)
+    registry = build_metadata_writer_registry(
+        "meta", "sig", padding_policy=padding_policy, atomic=True
+    )
+
+    assert isinstance(registry["mp3"], MP3MetadataWriter)
+    assert isinstance(registry["wav"], WAVMetadataWriter)
+    for writer in registry.values():
+        assert writer.transparency_metadata_field == "meta"
+        assert writer.signature_field == "sig"
+        assert writer.padding_policy == padding_policy
+        assert writer.atomic
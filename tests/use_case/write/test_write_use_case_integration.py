@@ -2,11 +2,16 @@
 # Copyright (c) 2025 Transparent Audio
 # Author: Valerio Velardo - valerio@transparentaudio.ai
 
+import io
+import json
+
 import pytest
 from mutagen.mp3 import MP3
 from mutagen.wave import WAVE
 
+from transparentmeta.crypto.content_hasher import ContentHasher
 from transparentmeta.crypto.signer import Signer
+from transparentmeta.request.write_bytes_request import WriteBytesRequest
 from transparentmeta.request.write_request import WriteRequest
 from transparentmeta.serialization.metadata_serializer import (
     MetadataSerializer,
@@ -90,3 +95,47 @@ def test_end_to_end_wav_write_use_case(
     assert isinstance(
         audio.tags["TXXX:signature"].text[0], str
     )  # Ensure signature is written
+
+
+def test_end_to_end_wav_write_bytes_use_case(
+    write_use_case_wav, temp_wav, metadata
+):
+    audio_data = temp_wav.read_bytes()
+    write_bytes_request = WriteBytesRequest(
+        audio_data=audio_data, audio_format="wav", metadata=metadata
+    )
+
+    tagged_audio_data = write_use_case_wav.write_bytes(write_bytes_request)
+
+    # The input data is left untouched
+    assert temp_wav.read_bytes() == audio_data
+    audio = WAVE(io.BytesIO(tagged_audio_data))
+    assert (
+        '{"company":"Transparent Audio"'
+        in audio.tags["TXXX:transparency"].text[0]
+    )
+    assert isinstance(audio.tags["TXXX:signature"].text[0], str)
+
+
+def test_write_bytes_use_case_includes_content_hash_of_audio(
+    signer, temp_wav, metadata
+):
+    write_use_case = WriteUseCase(
+        metadata_serializer=MetadataSerializer(),
+        signer=signer,
+        metadata_writer=WAVMetadataWriter(),
+        content_hasher=ContentHasher(),
+    )
+    audio_data = temp_wav.read_bytes()
+    write_bytes_request = WriteBytesRequest(
+        audio_data=audio_data, audio_format="wav", metadata=metadata
+    )
+
+    tagged_audio_data = write_use_case.write_bytes(write_bytes_request)
+
+    audio = WAVE(io.BytesIO(tagged_audio_data))
+    written_metadata = json.loads(audio.tags["TXXX:transparency"].text[0])
+    assert written_metadata["content_hash"] == (
+        ContentHasher().compute_content_hash(io.BytesIO(audio_data))
+    )
+    assert metadata.content_hash is None
@@ -62,6 +62,7 @@ def test_write_calls_serializer_signer_and_writer_correctly(
         mock_write_request.filepath,
         "serialized_metadata",
         "digital_signature",
+        None,
     )
 
 
@@ -73,3 +74,20 @@ def test_write_use_case_writer_setter_works(write_use_case, mocker):
     new_writer = mocker.Mock(spec=MetadataWriter)
     write_use_case.metadata_writer = new_writer
     assert write_use_case.metadata_writer == new_writer
+
+
+def test_write_uses_writer_passed_per_call(
+    write_use_case, mock_writer, mock_write_request, mocker
+):
+    call_writer = mocker.Mock(spec=MetadataWriter)
+
+    write_use_case.write(mock_write_request, call_writer)
+
+    call_writer.write.assert_called_once_with(
+        mock_write_request.filepath,
+        "serialized_metadata",
+        "digital_signature",
+        None,
+    )
+    mock_writer.write.assert_not_called()
+    assert write_use_case.metadata_writer is mock_writer
@@ -0,0 +1,22 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import struct
+
+import pytest
+
+
+@pytest.fixture
+def build_riff_file():
+    """Builds the bytes of a RIFF/WAVE file from (chunk ID, data) pairs."""
+
+    def build(*chunks):
+        body = b"WAVE"
+        for chunk_id, data in chunks:
+            body += chunk_id + struct.pack("<I", len(data)) + data
+            if len(data) % 2:
+                body += b"\x00"
+        return b"RIFF" + struct.pack("<I", len(body)) + body
+
+    return build
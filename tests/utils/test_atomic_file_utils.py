@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import fcntl
+import os
+import stat
+
+import pytest
+
+from transparentmeta.utils import atomic_file_utils
+from transparentmeta.utils.atomic_file_utils import (
+    atomic_replace,
+    clone_or_copy_file,
+    fsync_directory,
+)
+
+
+@pytest.fixture
+def original_file(tmp_path):
+    original_file = tmp_path / "original.wav"
+    original_file.write_bytes(b"original content")
+    original_file.chmod(0o640)
+    return original_file
+
+
+def test_atomic_replace_replaces_file_with_edited_copy(original_file):
+    original_inode = original_file.stat().st_ino
+
+    with atomic_replace(original_file) as temporary_file:
+        assert temporary_file.parent == original_file.parent
+        assert temporary_file.name.startswith(".original.wav.")
+        assert temporary_file.read_bytes() == b"original content"
+        with open(temporary_file, "r+b") as stream:
+            stream.write(b"replaced")
+        assert original_file.read_bytes() == b"original content"
+
+    assert original_file.read_bytes() == b"replaced content"
+    assert original_file.stat().st_ino != original_inode
+    assert stat.S_IMODE(original_file.stat().st_mode) == 0o640
+    assert list(original_file.parent.iterdir()) == [original_file]
+
+
+def test_atomic_replace_keeps_original_when_edit_fails(original_file):
+    with pytest.raises(RuntimeError, match="Crash"):
+        with atomic_replace(original_file) as temporary_file:
+            temporary_file.write_bytes(b"half-written")
+            raise RuntimeError("Crash")
+
+    assert original_file.read_bytes() == b"original content"
+    assert list(original_file.parent.iterdir()) == [original_file]
+
+
+def test_atomic_replace_replaces_target_of_symbolic_link(
+    original_file, tmp_path
+):
+    link = tmp_path / "link.wav"
+    link.symlink_to(original_file)
+
+    with atomic_replace(link) as temporary_file:
+        temporary_file.write_bytes(b"replaced")
+
+    assert link.is_symlink()
+    assert original_file.read_bytes() == b"replaced"
+
+
+def test_clone_or_copy_file_copies_when_reflinks_are_unsupported(
+    original_file, tmp_path, mocker
+):
+    mocker.patch.object(fcntl, "ioctl", side_effect=OSError("EOPNOTSUPP"))
+    copy = tmp_path / "copy.wav"
+
+    assert not clone_or_copy_file(original_file, copy)
+    assert copy.read_bytes() == b"original content"
+
+
+def test_clone_or_copy_file_uses_reflink_when_supported(
+    original_file, tmp_path, mocker
+):
+    ioctl = mocker.patch.object(fcntl, "ioctl")
+    copy = tmp_path / "copy.wav"
+
+    assert clone_or_copy_file(original_file, copy)
+    assert ioctl.call_args.args[1] == atomic_file_utils._FICLONE
+
+
+def test_fsync_directory_syncs_directory(tmp_path, mocker):
+    fsync = mocker.spy(os, "fsync")
+
+    fsync_directory(tmp_path)
+
+    fsync.assert_called_once()
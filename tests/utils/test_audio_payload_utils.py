@@ -0,0 +1,102 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import io
+
+import pytest
+
+from transparentmeta.utils.audio_payload_utils import (
+    find_audio_payload_ranges,
+)
+from transparentmeta.utils.exceptions import InvalidRIFFFileError
+
+
+def build_id3v2_tag(body, flags=0):
+    size = len(body)
+    synchsafe_size = bytes((size >> shift) & 0x7F for shift in (21, 14, 7, 0))
+    return b"ID3\x04\x00" + bytes((flags,)) + synchsafe_size + body
+
+
+def test_mp3_payload_without_tags_is_the_whole_file():
+    mp3_file = b"\xff\xfb" + b"a" * 100
+
+    assert find_audio_payload_ranges(io.BytesIO(mp3_file)) == [(0, 102)]
+
+
+def test_mp3_payload_skips_id3v2_tags():
+    id3v2_tags = build_id3v2_tag(b"t" * 20) + build_id3v2_tag(b"u" * 5)
+    mp3_file = id3v2_tags + b"\xff\xfb" + b"a" * 100
+
+    assert find_audio_payload_ranges(io.BytesIO(mp3_file)) == [
+        (len(id3v2_tags), len(mp3_file))
+    ]
+
+
+def test_mp3_payload_skips_id3v2_footer():
+    id3v2_tag = build_id3v2_tag(b"t" * 20, flags=0x10) + b"3DI" + b"f" * 7
+    mp3_file = id3v2_tag + b"\xff\xfb" + b"a" * 100
+
+    assert find_audio_payload_ranges(io.BytesIO(mp3_file)) == [
+        (40, len(mp3_file))
+    ]
+
+
+def test_mp3_payload_skips_id3v1_tag():
+    mp3_file = b"\xff\xfb" + b"a" * 100 + b"TAG" + b"v" * 125
+
+    assert find_audio_payload_ranges(io.BytesIO(mp3_file)) == [(0, 102)]
+
+
+def test_mp3_payload_is_empty_when_file_holds_only_tags():
+    mp3_file = build_id3v2_tag(b"t" * 200)
+
+    assert find_audio_payload_ranges(io.BytesIO(mp3_file)) == []
+
+
+def test_mp3_payload_is_empty_when_tag_is_truncated():
+    mp3_file = build_id3v2_tag(b"t" * 200)[:100]
+
+    assert find_audio_payload_ranges(io.BytesIO(mp3_file)) == []
+
+
+def test_wav_payload_skips_riff_header_and_id3_chunk(build_riff_file):
+    wav_file = build_riff_file(
+        (b"fmt ", b"f" * 16),
+        (b"id3 ", b"tag"),
+        (b"LIST", b"l" * 4),
+        (b"data", b"d" * 8),
+    )
+
+    assert find_audio_payload_ranges(io.BytesIO(wav_file)) == [
+        (12, 36),
+        (48, len(wav_file)),
+    ]
+
+
+def test_wav_payload_skips_padding_chunks(build_riff_file):
+    wav_file = build_riff_file(
+        (b"fmt ", b"f" * 16),
+        (b"JUNK", b"old tag"),
+        (b"data", b"d" * 8),
+        (b"PAD ", b"\x00" * 4),
+        (b"id3 ", b"new tag"),
+    )
+
+    assert find_audio_payload_ranges(io.BytesIO(wav_file)) == [
+        (12, 36),
+        (52, 68),
+    ]
+
+
+def test_wav_payload_of_truncated_file_ends_with_the_file(build_riff_file):
+    wav_file = build_riff_file((b"fmt ", b"f" * 16), (b"data", b"d" * 8))
+
+    assert find_audio_payload_ranges(io.BytesIO(wav_file[:-4])) == [
+        (12, len(wav_file) - 4)
+    ]
+
+
+def test_wav_payload_raises_with_invalid_riff_file():
+    with pytest.raises(InvalidRIFFFileError):
+        find_audio_payload_ranges(io.BytesIO(b"RIFF\x00\x00\x00\x00AVI "))
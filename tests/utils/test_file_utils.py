@@ -2,9 +2,18 @@
 # Copyright (c) 2025 Transparent Audio
 # Author: Valerio Velardo - valerio@transparentaudio.ai
 
+import io
 from pathlib import Path
 
-from transparentmeta.utils.file_utils import get_file_extension, get_file_size
+from transparentmeta.utils.file_utils import (
+    IN_MEMORY_AUDIO_NAME,
+    find_files_with_extensions,
+    get_audio_source_name,
+    get_audio_source_size,
+    get_file_extension,
+    get_file_identity,
+    get_file_size,
+)
 
 
 def test_get_file_extension():
@@ -37,3 +46,49 @@ def test_get_file_size_file_not_exists(tmp_path):
 
     size = get_file_size(missing)
     assert size == 0, f"Expected size 0 for missing file, got {size}"
+
+
+def test_get_audio_source_name(temp_wav):
+    assert get_audio_source_name(temp_wav) == temp_wav
+
+    # Test with a file object opened from disk
+    with open(temp_wav, "rb") as fileobj:
+        assert get_audio_source_name(fileobj) == str(temp_wav)
+
+    # Test with audio held in memory
+    assert get_audio_source_name(io.BytesIO(b"")) == IN_MEMORY_AUDIO_NAME
+
+
+def test_get_audio_source_size(temp_wav):
+    assert get_audio_source_size(temp_wav) == temp_wav.stat().st_size
+
+    # The position of file objects is preserved
+    audio_data = io.BytesIO(b"RIFF" * 10)
+    audio_data.seek(8)
+    assert get_audio_source_size(audio_data) == 40
+    assert audio_data.tell() == 8
+
+
+def test_get_file_identity_changes_when_file_is_written(tmp_path):
+    file_path = tmp_path / "sample.bin"
+    file_path.write_bytes(b"TransparentMeta")
+    file_identity = get_file_identity(file_path)
+
+    assert get_file_identity(file_path) == file_identity
+
+    file_path.write_bytes(b"TransparentMeta!")
+    assert get_file_identity(file_path) != file_identity
+
+
+def test_find_files_with_extensions(tmp_path):
+    (tmp_path / "b").mkdir()
+    for relative_path in ["b/track.MP3", "a.wav", "b/notes.txt", "c.mp3"]:
+        (tmp_path / relative_path).touch()
+
+    filepaths = find_files_with_extensions(tmp_path, ["mp3", "wav"])
+
+    assert list(filepaths) == [
+        tmp_path / "a.wav",
+        tmp_path / "c.mp3",
+        tmp_path / "b" / "track.MP3",
+    ]
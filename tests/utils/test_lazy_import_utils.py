@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+from fractions import Fraction
+
+import pytest
+
+from transparentmeta.utils.lazy_import_utils import (
+    LazyConstructor,
+    LazyRegistry,
+    build_lazy_exports,
+)
+
+
+def test_lazy_constructor_constructs_instances_of_the_class():
+    lazy_constructor = LazyConstructor("fractions", "Fraction")
+
+    assert lazy_constructor(1, 2) == Fraction(1, 2)
+    assert lazy_constructor(3) == Fraction(3)
+
+
+def test_lazy_constructor_repr():
+    lazy_constructor = LazyConstructor("fractions", "Fraction")
+
+    assert repr(lazy_constructor) == "LazyConstructor(fractions.Fraction)"
+
+
+def test_lazy_registry_builds_values_on_first_lookup():
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return object()
+
+    registry = LazyRegistry({"wav": factory, "wave": factory})
+
+    assert list(registry) == ["wav", "wave"]
+    assert len(registry) == 2
+    assert calls == []
+    assert registry["wav"] is registry["wave"]
+    assert calls == [1]
+
+
+def test_lazy_registry_keeps_values_of_different_factories_apart():
+    registry = LazyRegistry({"mp3": list, "wav": dict})
+
+    assert registry["mp3"] == []
+    assert registry["wav"] == {}
+    assert dict(registry) == {"mp3": [], "wav": {}}
+
+
+def test_build_lazy_exports_imports_interfaces_on_first_access():
+    namespace = {"__name__": "email"}
+    getattr_, dir_ = build_lazy_exports(
+        "email", {"Charset": "charset"}, namespace
+    )
+
+    from email.charset import Charset
+
+    assert getattr_("Charset") is Charset
+    assert namespace["Charset"] is Charset
+    assert dir_() == ["Charset", "__name__"]
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        getattr_("missing")
@@ -2,14 +2,19 @@
 # Copyright (c) 2025 Transparent Audio
 # Author: Valerio Velardo - valerio@transparentaudio.ai
 
-from mutagen.id3 import ID3
+from mutagen.id3 import ID3, TXXX
 from mutagen.mp3 import MP3
 from mutagen.wave import WAVE
 
 from transparentmeta.use_case.constants import TRANSPARENCY_METADATA_FIELD
 from transparentmeta.utils.metadata_tags_utils import (
     create_id3_tags_in_file_if_none_exists,
+    delete_priv_id3_tags,
+    delete_txxx_id3_tag,
     does_file_contain_any_id3_tags,
+    get_priv_id3_tag_data,
+    render_id3_tag,
+    set_priv_id3_tag,
     set_txxx_id3_tag,
 )
 
@@ -73,3 +78,70 @@ def test_does_file_contain_any_tags_return_true_when_tags_exist(
 ):
     audio = MP3(temp_mp3_file_with_metadata)
     assert does_file_contain_any_id3_tags(audio) is True
+
+
+def test_priv_id3_tag_is_set_correctly(temp_mp3):
+    audio = MP3(temp_mp3)
+    audio = create_id3_tags_in_file_if_none_exists(audio)
+
+    audio = set_priv_id3_tag(audio, "test-owner", b"\x00\x01")
+    audio = set_priv_id3_tag(audio, "other-owner", b"\x02")
+
+    assert get_priv_id3_tag_data(audio.tags, "test-owner") == b"\x00\x01"
+    assert get_priv_id3_tag_data(audio.tags, "other-owner") == b"\x02"
+
+
+def test_priv_id3_tag_is_reset_when_it_already_exists(temp_mp3):
+    audio = MP3(temp_mp3)
+    audio = create_id3_tags_in_file_if_none_exists(audio)
+
+    audio = set_priv_id3_tag(audio, "test-owner", b"old")
+    audio = set_priv_id3_tag(audio, "test-owner", b"new")
+
+    assert len(audio.tags.getall("PRIV")) == 1
+    assert get_priv_id3_tag_data(audio.tags, "test-owner") == b"new"
+
+
+def test_get_priv_id3_tag_data_returns_none_when_tag_not_exists(temp_mp3):
+    audio = MP3(temp_mp3)
+    audio = create_id3_tags_in_file_if_none_exists(audio)
+
+    assert get_priv_id3_tag_data(audio.tags, "test-owner") is None
+
+
+def test_priv_id3_tags_are_deleted_only_for_owner(temp_mp3):
+    audio = MP3(temp_mp3)
+    audio = create_id3_tags_in_file_if_none_exists(audio)
+    audio = set_priv_id3_tag(audio, "test-owner", b"data")
+    audio = set_priv_id3_tag(audio, "other-owner", b"data")
+
+    audio = delete_priv_id3_tags(audio, "test-owner")
+
+    assert get_priv_id3_tag_data(audio.tags, "test-owner") is None
+    assert get_priv_id3_tag_data(audio.tags, "other-owner") == b"data"
+
+
+def test_txxx_id3_tag_is_deleted(temp_mp3_file_with_metadata):
+    audio = MP3(temp_mp3_file_with_metadata)
+    field = TRANSPARENCY_METADATA_FIELD
+
+    audio = delete_txxx_id3_tag(audio, field)
+    audio = delete_txxx_id3_tag(audio, field)
+
+    assert f"TXXX:{field}" not in audio.tags
+
+
+def test_render_id3_tag_passes_available_space_to_padding_function():
+    tags = ID3()
+    tags.add(TXXX(encoding=3, desc="field", text="value"))
+    padding_infos = []
+
+    def padding(padding_info):
+        padding_infos.append(padding_info)
+        return 100
+
+    tag = render_id3_tag(tags, 1000, padding)
+
+    assert tag[:4] == b"ID3\x04"
+    assert tag.endswith(b"\x00" * 100)
+    assert padding_infos[0].padding == 1000 - (len(tag) - 100)
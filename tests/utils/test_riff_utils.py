@@ -0,0 +1,182 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import io
+import struct
+
+import pytest
+
+from transparentmeta.utils.exceptions import InvalidRIFFFileError
+from transparentmeta.utils.riff_utils import (
+    ID3_CHUNK_IDS,
+    RIFFChunk,
+    find_riff_chunk,
+    find_riff_chunk_in_buffer,
+    iter_riff_chunks,
+    read_riff_header,
+    write_riff_chunk,
+)
+
+
+def test_find_riff_chunk_returns_location_of_chunk(build_riff_file):
+    riff_file = build_riff_file(
+        (b"fmt ", b"f" * 16), (b"data", b"d" * 4), (b"id3 ", b"tag")
+    )
+
+    chunk = find_riff_chunk(io.BytesIO(riff_file), ID3_CHUNK_IDS)
+
+    assert chunk == RIFFChunk(b"id3 ", 48, 3)
+    assert riff_file[chunk.data_offset : chunk.data_offset + 3] == b"tag"
+
+
+def test_find_riff_chunk_skips_padding_byte_of_odd_sized_chunks(
+    build_riff_file,
+):
+    riff_file = build_riff_file((b"LIST", b"odd"), (b"ID3 ", b"tag"))
+
+    chunk = find_riff_chunk(io.BytesIO(riff_file), ID3_CHUNK_IDS)
+
+    assert chunk == RIFFChunk(b"ID3 ", 24, 3)
+    assert chunk.end_offset == len(riff_file)
+
+
+def test_find_riff_chunk_returns_none_when_chunk_is_missing(build_riff_file):
+    riff_file = build_riff_file((b"fmt ", b"f" * 16), (b"data", b""))
+    assert find_riff_chunk(io.BytesIO(riff_file), ID3_CHUNK_IDS) is None
+
+
+def test_find_riff_chunk_raises_with_non_riff_file():
+    with pytest.raises(InvalidRIFFFileError):
+        find_riff_chunk(io.BytesIO(b"corrupt wav file"), ID3_CHUNK_IDS)
+
+
+def test_iter_riff_chunks_yields_all_chunks_in_order(build_riff_file):
+    riff_file = build_riff_file(
+        (b"fmt ", b"f" * 16), (b"LIST", b"odd"), (b"data", b"d" * 4)
+    )
+
+    chunks = list(iter_riff_chunks(io.BytesIO(riff_file)))
+
+    assert chunks == [
+        RIFFChunk(b"fmt ", 12, 16),
+        RIFFChunk(b"LIST", 36, 3),
+        RIFFChunk(b"data", 48, 4),
+    ]
+
+
+def test_read_riff_header_returns_riff_size(build_riff_file):
+    riff_file = build_riff_file((b"data", b"dd"))
+    assert read_riff_header(io.BytesIO(riff_file)) == len(riff_file) - 8
+
+
+def test_read_riff_header_raises_with_truncated_header():
+    with pytest.raises(InvalidRIFFFileError):
+        read_riff_header(io.BytesIO(b"RIFF"))
+
+
+def test_write_riff_chunk_appends_missing_chunk(build_riff_file):
+    riff_file = io.BytesIO(build_riff_file((b"data", b"d" * 4)))
+
+    chunk = write_riff_chunk(riff_file, ID3_CHUNK_IDS, b"tag")
+
+    assert chunk == RIFFChunk(b"id3 ", 24, 3)
+    assert riff_file.getvalue() == build_riff_file(
+        (b"data", b"d" * 4), (b"id3 ", b"tag")
+    )
+
+
+def test_write_riff_chunk_resizes_last_chunk(build_riff_file):
+    riff_file = io.BytesIO(
+        build_riff_file((b"data", b"d" * 4), (b"ID3 ", b"old tag"))
+    )
+
+    chunk = write_riff_chunk(riff_file, ID3_CHUNK_IDS, b"tag")
+
+    assert chunk == RIFFChunk(b"ID3 ", 24, 3)
+    assert riff_file.getvalue() == build_riff_file(
+        (b"data", b"d" * 4), (b"ID3 ", b"tag")
+    )
+
+
+def test_write_riff_chunk_overwrites_chunk_of_same_size_in_place(
+    build_riff_file,
+):
+    riff_file = io.BytesIO(
+        build_riff_file((b"id3 ", b"old"), (b"data", b"d" * 4))
+    )
+
+    chunk = write_riff_chunk(riff_file, ID3_CHUNK_IDS, b"new")
+
+    assert chunk == RIFFChunk(b"id3 ", 12, 3)
+    assert riff_file.getvalue() == build_riff_file(
+        (b"id3 ", b"new"), (b"data", b"d" * 4)
+    )
+
+
+def test_write_riff_chunk_moves_resized_chunk_to_end_of_file(build_riff_file):
+    riff_file = io.BytesIO(
+        build_riff_file((b"id3 ", b"old"), (b"data", b"d" * 4))
+    )
+
+    chunk = write_riff_chunk(riff_file, ID3_CHUNK_IDS, b"new tag")
+
+    assert chunk == RIFFChunk(b"id3 ", 36, 7)
+    assert riff_file.getvalue() == build_riff_file(
+        (b"JUNK", b"old"), (b"data", b"d" * 4), (b"id3 ", b"new tag")
+    )
+
+
+def test_write_riff_chunk_raises_when_file_would_exceed_4gb():
+    # The header of the data chunk declares nearly 4GB of audio.
+    riff_file = b"RIFF\xff\xff\xff\xffWAVEdata" + struct.pack("<I", 2**32 - 20)
+
+    with pytest.raises(InvalidRIFFFileError, match="4GB"):
+        write_riff_chunk(io.BytesIO(riff_file), ID3_CHUNK_IDS, b"tag")
+
+
+def test_write_riff_chunk_raises_when_last_chunk_is_truncated(build_riff_file):
+    riff_file = build_riff_file((b"fmt ", b"f" * 16))
+    riff_file += b"data" + struct.pack("<I", 2**31) + b"d" * 4
+    fileobj = io.BytesIO(riff_file)
+
+    with pytest.raises(InvalidRIFFFileError, match="truncated"):
+        write_riff_chunk(fileobj, ID3_CHUNK_IDS, b"tag")
+
+    assert fileobj.getvalue() == riff_file
+
+
+def test_write_riff_chunk_accepts_missing_padding_byte_of_last_chunk(
+    build_riff_file,
+):
+    riff_file = build_riff_file((b"fmt ", b"f" * 16), (b"data", b"d" * 3))
+    fileobj = io.BytesIO(riff_file[:-1])
+
+    chunk = write_riff_chunk(fileobj, ID3_CHUNK_IDS, b"tag")
+
+    assert chunk == RIFFChunk(b"id3 ", 48, 3)
+    assert fileobj.getvalue() == build_riff_file(
+        (b"fmt ", b"f" * 16), (b"data", b"d" * 3), (b"id3 ", b"tag")
+    )
+
+
+def test_find_riff_chunk_in_buffer_returns_location_of_chunk(build_riff_file):
+    riff_file = build_riff_file(
+        (b"LIST", b"odd"), (b"data", b"d" * 4), (b"id3 ", b"tag")
+    )
+
+    chunk = find_riff_chunk_in_buffer(memoryview(riff_file), ID3_CHUNK_IDS)
+
+    assert chunk == RIFFChunk(b"id3 ", 36, 3)
+
+
+def test_find_riff_chunk_in_buffer_returns_none_when_chunk_is_missing(
+    build_riff_file,
+):
+    riff_file = build_riff_file((b"fmt ", b"f" * 16), (b"data", b""))
+    assert find_riff_chunk_in_buffer(riff_file, ID3_CHUNK_IDS) is None
+
+
+def test_find_riff_chunk_in_buffer_raises_with_non_riff_file():
+    with pytest.raises(InvalidRIFFFileError):
+        find_riff_chunk_in_buffer(b"corrupt wav file", ID3_CHUNK_IDS)
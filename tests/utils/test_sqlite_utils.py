@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import threading
+
+import pytest
+
+from transparentmeta.utils.sqlite_utils import SQLiteDatabase
+
+SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS items (name TEXT PRIMARY KEY, value INTEGER)",
+    "CREATE INDEX IF NOT EXISTS items_by_value ON items (value)",
+]
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = SQLiteDatabase(tmp_path / "items.sqlite", SCHEMA)
+    yield database
+    database.close()
+
+
+def test_sqlite_database_executes_and_fetches_rows(database):
+    assert database.execute("INSERT INTO items VALUES (?, ?)", ("a", 1)) == 1
+
+    assert database.fetch_one(
+        "SELECT value FROM items WHERE name = ?", ("a",)
+    ) == (1,)
+    assert (
+        database.fetch_one("SELECT value FROM items WHERE name = ?", ("b",))
+        is None
+    )
+
+
+def test_sqlite_database_executes_many_and_fetches_all_rows(database):
+    assert (
+        database.execute_many(
+            "INSERT INTO items VALUES (?, ?)", [("a", 1), ("b", 2)]
+        )
+        == 2
+    )
+
+    assert database.fetch_all(
+        "SELECT name, value FROM items ORDER BY name"
+    ) == [
+        ("a", 1),
+        ("b", 2),
+    ]
+
+
+def test_sqlite_database_persists_across_connections(tmp_path):
+    database_path = tmp_path / "items.sqlite"
+    first_database = SQLiteDatabase(database_path, SCHEMA)
+    first_database.execute("INSERT INTO items VALUES (?, ?)", ("a", 1))
+    first_database.close()
+
+    second_database = SQLiteDatabase(database_path, SCHEMA)
+    assert second_database.fetch_all("SELECT name FROM items") == [("a",)]
+    second_database.close()
+
+
+def test_sqlite_database_is_usable_from_other_threads(database):
+    thread = threading.Thread(
+        target=database.execute,
+        args=("INSERT INTO items VALUES (?, ?)", ("a", 1)),
+    )
+    thread.start()
+    thread.join()
+
+    assert database.fetch_all("SELECT name FROM items") == [("a",)]
@@ -2,7 +2,10 @@
 # Copyright (c) 2025 Transparent Audio
 # Author: Valerio Velardo - valerio@transparentaudio.ai
 
-from transparentmeta.utils.exceptions import InvalidHexadecimalStringError
+from transparentmeta.utils.exceptions import (
+    InvalidHexadecimalStringError,
+    InvalidRIFFFileError,
+)
 
 
 def test_invalid_hexadecimal_string_error():
@@ -13,3 +16,8 @@ def test_invalid_hexadecimal_string_error():
         str(error)
         == f"String {invalid_hex_string} is not a valid hexadecimal string"
     )
+
+
+def test_invalid_riff_file_error():
+    error = InvalidRIFFFileError()
+    assert str(error) == "File is not a valid RIFF/WAVE file"
@@ -0,0 +1,300 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import shutil
+import threading
+import time
+
+import pytest
+
+from transparentmeta.sdk.factory import (
+    build_transparent_metadata_reader,
+    build_transparent_metadata_writer,
+)
+from transparentmeta.watch.drop_folder_watcher import (
+    DropFolderWatcher,
+    WatchConfig,
+    WatchStatistics,
+)
+from transparentmeta.watch.file_debouncer import FileDebouncer
+from transparentmeta.watch.file_event_source import (
+    FileEventSource,
+    PollingFileEventSource,
+)
+from transparentmeta.watch.metadata_resolver import (
+    MetadataResolver,
+    TemplateMetadataResolver,
+)
+
+
+class SkippingMetadataResolver(MetadataResolver):
+    def resolve(self, filepath):
+        return None
+
+
+class QueuedFileEventSource(FileEventSource):
+    """Reports the batches of files put in its queue, one per call."""
+
+    def __init__(self, *batches):
+        self.batches = list(batches)
+        self.is_closed = False
+
+    def wait_for_changes(self, timeout):
+        if self.batches:
+            return self.batches.pop(0)
+        time.sleep(timeout)
+        return []
+
+    def close(self):
+        self.is_closed = True
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "Timed out"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def drop_folder(tmp_path):
+    drop_folder = tmp_path / "drop"
+    drop_folder.mkdir()
+    return drop_folder
+
+
+@pytest.fixture
+def writer(keys):
+    return build_transparent_metadata_writer(keys["private_key"])
+
+
+@pytest.fixture
+def start_watcher():
+    watchers = []
+
+    def start(watcher):
+        thread = threading.Thread(target=watcher.run)
+        thread.start()
+        watchers.append((watcher, thread))
+        return watcher
+
+    yield start
+    for watcher, thread in watchers:
+        watcher.stop()
+        thread.join(timeout=5)
+
+
+@pytest.fixture
+def watcher(writer, metadata_dict, drop_folder, start_watcher):
+    return start_watcher(
+        DropFolderWatcher(
+            writer,
+            TemplateMetadataResolver(metadata_dict),
+            PollingFileEventSource([drop_folder], interval=0.02),
+            FileDebouncer(settle_time=0.05),
+            WatchConfig(workers=2, tick=0.02),
+        )
+    )
+
+
+def test_drop_folder_watcher_tags_dropped_files(
+    watcher, drop_folder, temp_mp3, temp_wav, keys
+):
+    shutil.copy(temp_mp3, drop_folder / "first.mp3")
+    shutil.copy(temp_wav, drop_folder / "second.wav")
+
+    wait_until(lambda: watcher.get_statistics().tagged == 2)
+
+    reader = build_transparent_metadata_reader(keys["public_key"])
+    for filepath in drop_folder.iterdir():
+        assert reader.read(filepath).is_success
+    statistics = watcher.get_statistics()
+    assert statistics.failed == 0
+    assert statistics.in_flight == 0
+    assert statistics.tagged_bytes == sum(
+        filepath.stat().st_size for filepath in drop_folder.iterdir()
+    )
+    assert statistics.files_per_second > 0
+    assert statistics.bytes_per_second > 0
+
+
+def test_drop_folder_watcher_ignores_its_own_writes(
+    watcher, drop_folder, temp_mp3
+):
+    shutil.copy(temp_mp3, drop_folder / "first.mp3")
+    wait_until(lambda: watcher.get_statistics().tagged == 1)
+
+    time.sleep(0.3)
+
+    assert watcher.get_statistics().tagged == 1
+
+
+def test_drop_folder_watcher_tags_replaced_files_again(
+    watcher, drop_folder, temp_mp3
+):
+    shutil.copy(temp_mp3, drop_folder / "first.mp3")
+    wait_until(lambda: watcher.get_statistics().tagged == 1)
+
+    shutil.copy(temp_mp3, drop_folder / "first.mp3")
+
+    wait_until(lambda: watcher.get_statistics().tagged == 2)
+
+
+def test_drop_folder_watcher_counts_failed_files(watcher, drop_folder):
+    (drop_folder / "corrupt.mp3").write_bytes(b"not an mp3 file")
+
+    wait_until(lambda: watcher.get_statistics().failed == 1)
+
+    assert watcher.get_statistics().tagged == 0
+
+
+def test_drop_folder_watcher_skips_files_without_metadata(
+    writer, drop_folder, temp_mp3, start_watcher
+):
+    shutil.copy(temp_mp3, drop_folder / "first.mp3")
+    watcher = start_watcher(
+        DropFolderWatcher(
+            writer,
+            SkippingMetadataResolver(),
+            QueuedFileEventSource([drop_folder / "first.mp3"]),
+            FileDebouncer(settle_time=0),
+            WatchConfig(tick=0.01),
+        )
+    )
+
+    wait_until(lambda: watcher.get_statistics().skipped == 1)
+
+    assert watcher.get_statistics().tagged == 0
+
+
+def test_drop_folder_watcher_applies_backpressure(
+    metadata_dict, drop_folder, temp_mp3, mocker
+):
+    filepaths = [drop_folder / "first.mp3", drop_folder / "second.mp3"]
+    for filepath in filepaths:
+        shutil.copy(temp_mp3, filepath)
+    write_allowed = threading.Event()
+    writer = mocker.Mock()
+    writer.write.side_effect = lambda *_: write_allowed.wait()
+    file_event_source = QueuedFileEventSource(filepaths, [filepaths[0]])
+    watcher = DropFolderWatcher(
+        writer,
+        TemplateMetadataResolver(metadata_dict),
+        file_event_source,
+        FileDebouncer(settle_time=0),
+        WatchConfig(max_in_flight=1, tick=0.01),
+    )
+    thread = threading.Thread(target=watcher.run)
+    thread.start()
+
+    wait_until(lambda: writer.write.call_count == 1)
+    time.sleep(0.1)
+    assert writer.write.call_count == 1
+    assert watcher.get_statistics().in_flight == 1
+
+    write_allowed.set()
+    wait_until(lambda: watcher.get_statistics().tagged == 2)
+    watcher.stop()
+    thread.join(timeout=5)
+
+    assert writer.write.call_count == 2
+    assert file_event_source.is_closed
+
+
+def test_drop_folder_watcher_checks_files_changed_while_tagged_later(
+    metadata_dict, drop_folder, temp_mp3, mocker
+):
+    filepath = drop_folder / "first.mp3"
+    shutil.copy(temp_mp3, filepath)
+    write_allowed = threading.Event()
+    writer = mocker.Mock()
+    writer.write.side_effect = lambda *_: write_allowed.wait()
+    debouncer = FileDebouncer(settle_time=0)
+    watcher = DropFolderWatcher(
+        writer,
+        TemplateMetadataResolver(metadata_dict),
+        QueuedFileEventSource([filepath], [filepath]),
+        debouncer,
+        WatchConfig(tick=0.01),
+    )
+    add_spy = mocker.spy(debouncer, "add")
+    thread = threading.Thread(target=watcher.run)
+    thread.start()
+
+    wait_until(lambda: add_spy.call_count >= 3)
+    write_allowed.set()
+    wait_until(lambda: watcher.get_statistics().tagged == 1)
+    time.sleep(0.1)
+    watcher.stop()
+    thread.join(timeout=5)
+
+    # The file didn't change after it was tagged, so it isn't tagged again.
+    assert writer.write.call_count == 1
+
+
+def test_drop_folder_watcher_stops_while_waiting_for_a_slot(
+    metadata_dict, drop_folder, temp_mp3, mocker
+):
+    filepaths = [drop_folder / "first.mp3", drop_folder / "second.mp3"]
+    for filepath in filepaths:
+        shutil.copy(temp_mp3, filepath)
+    write_allowed = threading.Event()
+    writer = mocker.Mock()
+    writer.write.side_effect = lambda *_: write_allowed.wait()
+    watcher = DropFolderWatcher(
+        writer,
+        TemplateMetadataResolver(metadata_dict),
+        QueuedFileEventSource(filepaths),
+        FileDebouncer(settle_time=0),
+        WatchConfig(max_in_flight=1, tick=0.01),
+    )
+    thread = threading.Thread(target=watcher.run)
+    thread.start()
+    wait_until(lambda: writer.write.call_count == 1)
+
+    watcher.stop()
+    time.sleep(0.05)
+    write_allowed.set()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert writer.write.call_count == 1
+    assert watcher.get_statistics().tagged == 1
+
+
+def test_drop_folder_watcher_ignores_tagged_files_that_disappeared(
+    writer, metadata_dict, drop_folder
+):
+    watcher = DropFolderWatcher(
+        writer,
+        TemplateMetadataResolver(metadata_dict),
+        QueuedFileEventSource(),
+    )
+    watcher._state.tagged_file_identities[drop_folder / "gone.mp3"] = (
+        1,
+        2,
+        3,
+        4,
+    )
+
+    assert watcher._is_own_write(drop_folder / "gone.mp3")
+
+
+def test_watch_config_raises_with_invalid_max_in_flight():
+    with pytest.raises(ValueError, match="must be positive"):
+        WatchConfig(max_in_flight=0)
+
+
+def test_drop_folder_watcher_statistics_before_start(writer, metadata_dict):
+    watcher = DropFolderWatcher(
+        writer,
+        TemplateMetadataResolver(metadata_dict),
+        QueuedFileEventSource(),
+    )
+
+    statistics = watcher.get_statistics()
+
+    assert statistics == WatchStatistics(0, 0, 0, 0, 0, 0, 0.0)
+    assert statistics.files_per_second == 0.0
+    assert statistics.bytes_per_second == 0.0
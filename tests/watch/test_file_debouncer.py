@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import pytest
+
+from transparentmeta.watch.file_debouncer import FileDebouncer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def debouncer(clock):
+    return FileDebouncer(settle_time=2.0, clock=clock)
+
+
+def test_file_debouncer_releases_file_after_settle_time(
+    debouncer, clock, tmp_path
+):
+    filepath = tmp_path / "track.mp3"
+    filepath.write_bytes(b"complete")
+    debouncer.add(filepath)
+
+    clock.now += 1.0
+    assert debouncer.pop_settled() == []
+    assert len(debouncer) == 1
+
+    clock.now += 1.0
+    assert debouncer.pop_settled() == [filepath]
+    assert len(debouncer) == 0
+
+
+def test_file_debouncer_restarts_settle_time_when_file_changes(
+    debouncer, clock, tmp_path
+):
+    filepath = tmp_path / "track.mp3"
+    filepath.write_bytes(b"partial")
+    debouncer.add(filepath)
+
+    clock.now += 1.5
+    filepath.write_bytes(b"partial, then complete")
+    assert debouncer.pop_settled() == []
+
+    clock.now += 1.5
+    assert debouncer.pop_settled() == []
+    clock.now += 0.5
+    assert debouncer.pop_settled() == [filepath]
+
+
+def test_file_debouncer_drops_deleted_files(debouncer, clock, tmp_path):
+    filepath = tmp_path / "track.mp3"
+    filepath.write_bytes(b"partial")
+    debouncer.add(filepath)
+
+    filepath.unlink()
+    clock.now += 2.0
+
+    assert debouncer.pop_settled() == []
+    assert len(debouncer) == 0
+
+
+def test_file_debouncer_ignores_missing_files(debouncer, tmp_path):
+    filepath = tmp_path / "track.mp3"
+    filepath.write_bytes(b"partial")
+    debouncer.add(filepath)
+    filepath.unlink()
+
+    debouncer.add(filepath)
+
+    assert len(debouncer) == 0
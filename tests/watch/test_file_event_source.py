@@ -0,0 +1,250 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import logging
+import os
+import struct
+import sys
+
+import pytest
+
+from transparentmeta.watch import file_event_source
+from transparentmeta.watch.file_event_source import (
+    IN_IGNORED,
+    IN_Q_OVERFLOW,
+    InotifyFileEventSource,
+    PollingFileEventSource,
+    build_file_event_source,
+)
+
+linux_only = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux only"
+)
+
+
+@pytest.fixture
+def drop_folder(tmp_path):
+    drop_folder = tmp_path / "drop"
+    drop_folder.mkdir()
+    (drop_folder / "existing.mp3").write_bytes(b"existing")
+    return drop_folder
+
+
+@pytest.fixture
+def inotify_source(drop_folder):
+    inotify_source = InotifyFileEventSource([drop_folder])
+    yield inotify_source
+    inotify_source.close()
+
+
+def wait_for_all_changes(source, timeout=0.2):
+    changed_filepaths = []
+    while changes := source.wait_for_changes(timeout):
+        changed_filepaths.extend(changes)
+    return changed_filepaths
+
+
+def test_polling_file_event_source_reports_new_and_modified_files(
+    drop_folder,
+):
+    source = PollingFileEventSource([drop_folder], interval=0)
+    (drop_folder / "new.wav").write_bytes(b"new")
+    (drop_folder / "notes.txt").write_bytes(b"not audio")
+
+    assert source.wait_for_changes(1.0) == [drop_folder / "new.wav"]
+    assert source.wait_for_changes(1.0) == []
+
+    (drop_folder / "existing.mp3").write_bytes(b"modified")
+    assert source.wait_for_changes(1.0) == [drop_folder / "existing.mp3"]
+
+
+def test_polling_file_event_source_waits_for_next_walk(drop_folder, mocker):
+    sleep = mocker.patch.object(file_event_source.time, "sleep")
+    source = PollingFileEventSource([drop_folder], interval=60)
+    (drop_folder / "new.wav").write_bytes(b"new")
+
+    assert source.wait_for_changes(0.5) == []
+    sleep.assert_called_once_with(0.5)
+
+
+def test_polling_file_event_source_skips_files_deleted_during_walk(
+    drop_folder, mocker
+):
+    mocker.patch.object(
+        file_event_source, "get_file_identity", side_effect=FileNotFoundError
+    )
+
+    source = PollingFileEventSource([drop_folder], interval=0)
+
+    assert source.wait_for_changes(1.0) == []
+
+
+@linux_only
+def test_inotify_file_event_source_reports_written_files(
+    inotify_source, drop_folder
+):
+    (drop_folder / "new.mp3").write_bytes(b"new")
+    (drop_folder / "notes.txt").write_bytes(b"not audio")
+
+    assert wait_for_all_changes(inotify_source) == [drop_folder / "new.mp3"]
+
+
+@linux_only
+def test_inotify_file_event_source_watches_existing_subdirectories(
+    drop_folder,
+):
+    (drop_folder / "album").mkdir()
+    inotify_source = InotifyFileEventSource([drop_folder])
+    try:
+        (drop_folder / "album" / "track.wav").write_bytes(b"track")
+
+        assert wait_for_all_changes(inotify_source) == [
+            drop_folder / "album" / "track.wav"
+        ]
+    finally:
+        inotify_source.close()
+
+
+@linux_only
+def test_inotify_file_event_source_reports_files_moved_in(
+    inotify_source, drop_folder, tmp_path
+):
+    staged_file = tmp_path / "staged.wav"
+    staged_file.write_bytes(b"staged")
+
+    staged_file.rename(drop_folder / "moved.wav")
+
+    assert wait_for_all_changes(inotify_source) == [drop_folder / "moved.wav"]
+
+
+@linux_only
+def test_inotify_file_event_source_watches_new_directories(
+    inotify_source, drop_folder, tmp_path
+):
+    (drop_folder / "album").mkdir()
+    assert wait_for_all_changes(inotify_source) == []
+
+    (drop_folder / "album" / "track.mp3").write_bytes(b"track")
+    staged_directory = tmp_path / "staged"
+    staged_directory.mkdir()
+    (staged_directory / "single.wav").write_bytes(b"single")
+    staged_directory.rename(drop_folder / "single")
+
+    assert wait_for_all_changes(inotify_source) == [
+        drop_folder / "album" / "track.mp3",
+        drop_folder / "single" / "single.wav",
+    ]
+
+
+@linux_only
+def test_inotify_file_event_source_stops_watching_deleted_directories(
+    inotify_source, drop_folder
+):
+    (drop_folder / "album").mkdir()
+    wait_for_all_changes(inotify_source)
+    number_of_watches = len(inotify_source._watched_directories)
+
+    (drop_folder / "album").rmdir()
+    wait_for_all_changes(inotify_source)
+
+    assert len(inotify_source._watched_directories) == number_of_watches - 1
+
+
+@linux_only
+def test_inotify_file_event_source_logs_queue_overflow(inotify_source, caplog):
+    overflow_event = struct.pack("iIII", -1, IN_Q_OVERFLOW, 0, 0)
+    unknown_directory_event = struct.pack("iIII", 999, IN_IGNORED, 0, 0)
+
+    with caplog.at_level(logging.WARNING):
+        changed_filepaths = inotify_source._parse_events(
+            overflow_event + unknown_directory_event
+        )
+
+    assert changed_filepaths == []
+    assert "overflowed" in caplog.text
+
+
+@linux_only
+def test_inotify_file_event_source_ignores_events_of_unknown_directories(
+    inotify_source,
+):
+    name = b"new.mp3".ljust(16, b"\0")
+    event = struct.pack("iIII", 999, 0x8, 0, len(name)) + name
+
+    assert inotify_source._parse_events(event) == []
+
+
+@linux_only
+def test_inotify_file_event_source_logs_directories_it_cannot_watch(
+    inotify_source, drop_folder, mocker, caplog
+):
+    mocker.patch.object(
+        inotify_source, "_add_watch", side_effect=OSError("No space left")
+    )
+    (drop_folder / "album").mkdir()
+
+    with caplog.at_level(logging.WARNING):
+        assert wait_for_all_changes(inotify_source) == []
+
+    assert "Can't watch directory" in caplog.text
+
+
+@linux_only
+def test_inotify_file_event_source_raises_with_missing_directory(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        InotifyFileEventSource([tmp_path / "missing"])
+
+
+@linux_only
+def test_inotify_file_event_source_raises_when_inotify_fails(
+    drop_folder, mocker
+):
+    libc = mocker.patch.object(file_event_source.ctypes, "CDLL").return_value
+    libc.inotify_init1.return_value = -1
+
+    with pytest.raises(OSError, match="inotify_init1 failed"):
+        InotifyFileEventSource([drop_folder])
+
+
+@linux_only
+def test_inotify_file_event_source_can_be_closed_twice(drop_folder):
+    inotify_source = InotifyFileEventSource([drop_folder])
+
+    inotify_source.close()
+    inotify_source.close()
+
+    assert inotify_source._fd == -1
+
+
+@linux_only
+def test_build_file_event_source_prefers_inotify(drop_folder):
+    source = build_file_event_source([drop_folder])
+    try:
+        assert isinstance(source, InotifyFileEventSource)
+    finally:
+        source.close()
+
+
+def test_build_file_event_source_falls_back_to_polling(drop_folder, mocker):
+    mocker.patch.object(
+        file_event_source,
+        "InotifyFileEventSource",
+        side_effect=OSError("inotify is only available on Linux"),
+    )
+
+    source = build_file_event_source([drop_folder], polling_interval=10)
+
+    assert isinstance(source, PollingFileEventSource)
+    assert source.interval == 10
+
+
+def test_build_file_event_source_with_forced_polling(drop_folder):
+    source = build_file_event_source([drop_folder], force_polling=True)
+    assert isinstance(source, PollingFileEventSource)
+
+
+def test_file_event_source_close_does_nothing_by_default(drop_folder):
+    source = PollingFileEventSource([drop_folder])
+    source.close()
+    assert os.path.isdir(drop_folder)
@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from transparentmeta.watch.metadata_resolver import (
+    TemplateMetadataResolver,
+    derive_content_id,
+)
+
+
+def test_template_metadata_resolver_fills_missing_fields():
+    resolver = TemplateMetadataResolver({"company": "Transparent Audio"})
+
+    metadata = resolver.resolve(Path("/drop/track_01.wav"))
+
+    assert metadata["company"] == "Transparent Audio"
+    assert metadata["content_id"] == "track_01"
+    assert datetime.fromisoformat(metadata["created_at"]).tzinfo is not None
+
+
+def test_template_metadata_resolver_keeps_fields_of_template():
+    metadata_template = {"content_id": "12345", "created_at": "2025-01-01"}
+    resolver = TemplateMetadataResolver(metadata_template)
+
+    metadata = resolver.resolve(Path("/drop/track_01.wav"))
+
+    assert metadata == metadata_template
+    assert metadata is not metadata_template
+
+
+@pytest.mark.parametrize(
+    "filepath, content_id",
+    [
+        (Path("/drop/track_01.wav"), "track_01"),
+        (Path("/drop/a.wav"), "a.wav"),
+        (Path("/drop/a"), "a_"),
+        (Path(f"/drop/{'x' * 50}.wav"), "x" * 50),
+    ],
+)
+def test_derive_content_id_fits_content_id_length(filepath, content_id):
+    assert derive_content_id(filepath) == content_id
+
+
+def test_derive_content_id_shortens_long_names_keeping_them_distinct():
+    first_content_id = derive_content_id(Path(f"/drop/{'x' * 60}_1.wav"))
+    second_content_id = derive_content_id(Path(f"/drop/{'x' * 60}_2.wav"))
+
+    assert len(first_content_id) == 50
+    assert first_content_id.startswith("x" * 41 + "-")
+    assert first_content_id != second_content_id
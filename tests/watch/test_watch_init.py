@@ -0,0 +1,23 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+import transparentmeta.watch as watch
+
+
+def test_watch_public_api():
+    expected_exports = {
+        "DropFolderWatcher",
+        "WatchConfig",
+        "WatchStatistics",
+        "FileDebouncer",
+        "FileEventSource",
+        "InotifyFileEventSource",
+        "PollingFileEventSource",
+        "build_file_event_source",
+        "MetadataResolver",
+        "TemplateMetadataResolver",
+    }
+    actual_exports = set(watch.__all__)
+
+    assert actual_exports == expected_exports
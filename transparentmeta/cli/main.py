@@ -0,0 +1,589 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module provides the `transparentmeta` command line interface, which
+processes whole directory trees of audio files in parallel.
+
+It offers five commands:
+- `tag` writes signed metadata to the audio files of a directory tree.
+- `verify` reads and verifies the metadata of the audio files.
+- `watch` writes signed metadata to the audio files dropped into folders,
+  as soon as they're complete, until it's stopped.
+- `scan` updates a catalogue index with the audio files.
+- `serve` runs a local HTTP service that signs and verifies audio files,
+  for services that are not written in Python.
+
+`tag` and `verify` write one JSON line per file to the results file, or to
+standard output, and report progress and throughput on standard error. With
+`--resume`, files already recorded as successful in the results file are
+skipped, so an interrupted run can pick up where it stopped, and files that
+failed are retried.
+"""
+
+import argparse
+import json
+import logging
+import signal
+import sys
+import threading
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from transparentmeta.cli.progress import ProgressReporter
+from transparentmeta.cli.results_file import ResultsFile
+from transparentmeta.crypto.content_hasher import ContentHasher
+from transparentmeta.crypto.key_management import (
+    load_private_key_from_pem_file,
+    load_public_key_from_pem_file,
+)
+from transparentmeta.result.result import ReadResult, WriteResult
+from transparentmeta.sdk.factory import (
+    build_transparent_metadata_reader,
+    build_transparent_metadata_writer,
+)
+from transparentmeta.sdk.transparent_metadata_writer import (
+    TransparentMetadataWriter,
+)
+from transparentmeta.serialization.metadata_serializer import MetadataFormat
+from transparentmeta.server.constants import (
+    DEFAULT_HOST,
+    DEFAULT_KEEP_ALIVE_TIMEOUT,
+    DEFAULT_MAX_BODY_SIZE,
+    DEFAULT_PORT,
+)
+from transparentmeta.use_case.constants import SUPPORTED_AUDIO_FORMATS
+from transparentmeta.utils.file_utils import find_files_with_extensions
+from transparentmeta.watch.constants import (
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_POLLING_INTERVAL,
+    DEFAULT_SETTLE_TIME,
+)
+from transparentmeta.watch.metadata_resolver import TemplateMetadataResolver
+
+logger = logging.getLogger(__name__)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser of the command line interface.
+
+    Returns:
+        argparse.ArgumentParser: The parser, with one subparser per command.
+    """
+    parser = argparse.ArgumentParser(
+        prog="transparentmeta",
+        description=(
+            "Write, verify and index transparency metadata in the audio "
+            "files of a directory tree."
+        ),
+    )
+    parser.add_argument(
+        "--log-level",
+        default="WARNING",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="Logging level. Defaults to WARNING.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    tag_parser = subparsers.add_parser(
+        "tag", help="Write signed metadata to audio files."
+    )
+    tag_parser.add_argument("directory", type=Path)
+    _add_writer_arguments(tag_parser)
+    _add_batch_arguments(tag_parser)
+
+    verify_parser = subparsers.add_parser(
+        "verify", help="Read and verify the metadata of audio files."
+    )
+    verify_parser.add_argument("directory", type=Path)
+    verify_parser.add_argument(
+        "--public-key",
+        type=Path,
+        required=True,
+        help="PEM file of the public key used for verification.",
+    )
+    verify_parser.add_argument(
+        "--backend",
+        default="thread",
+        choices=["thread", "process"],
+        help="Run workers in threads or processes. Defaults to thread.",
+    )
+    verify_parser.add_argument(
+        "--tag-only",
+        action="store_true",
+        help="Parse only the ID3 tags, without scanning the audio stream.",
+    )
+    _add_batch_arguments(verify_parser)
+
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Write signed metadata to audio files dropped into folders.",
+    )
+    watch_parser.add_argument("directories", type=Path, nargs="+")
+    _add_writer_arguments(watch_parser)
+    watch_parser.add_argument(
+        "--poll",
+        action="store_true",
+        help=(
+            "Walk the folders at a fixed interval instead of using inotify, "
+            "e.g., for network file systems."
+        ),
+    )
+    watch_parser.add_argument(
+        "--polling-interval",
+        type=float,
+        default=DEFAULT_POLLING_INTERVAL,
+        help="Seconds between two walks of the folders. Defaults to 5.",
+    )
+    watch_parser.add_argument(
+        "--settle-time",
+        type=float,
+        default=DEFAULT_SETTLE_TIME,
+        help=(
+            "Seconds a file must stay unchanged before it's tagged. "
+            "Defaults to 2."
+        ),
+    )
+    watch_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of parallel workers. Defaults to one per CPU.",
+    )
+    watch_parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=DEFAULT_MAX_IN_FLIGHT,
+        help=(
+            "Maximum number of files queued or being tagged. Defaults "
+            "to 64."
+        ),
+    )
+
+    scan_parser = subparsers.add_parser(
+        "scan", help="Update a catalogue index with audio files."
+    )
+    scan_parser.add_argument("directory", type=Path)
+    scan_parser.add_argument(
+        "--public-key",
+        type=Path,
+        required=True,
+        help="PEM file of the public key used for verification.",
+    )
+    scan_parser.add_argument(
+        "--index",
+        type=Path,
+        required=True,
+        help="SQLite database file of the catalogue index.",
+    )
+    scan_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of parallel workers. Defaults to one per CPU.",
+    )
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run a local HTTP service that signs and verifies audio files.",
+    )
+    serve_parser.add_argument(
+        "--host",
+        default=DEFAULT_HOST,
+        help=f"Address to listen on. Defaults to {DEFAULT_HOST}.",
+    )
+    serve_parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help=f"Port to listen on. Defaults to {DEFAULT_PORT}.",
+    )
+    serve_parser.add_argument(
+        "--public-key",
+        type=Path,
+        default=None,
+        help="PEM file of the public key used for verification.",
+    )
+    serve_parser.add_argument(
+        "--private-key",
+        type=Path,
+        default=None,
+        help="PEM file of the private key used for signing.",
+    )
+    serve_parser.add_argument(
+        "--allow-dir",
+        type=Path,
+        action="append",
+        default=[],
+        help=(
+            "Directory whose files can be passed by path. Can be repeated. "
+            "By default, only uploads are accepted."
+        ),
+    )
+    serve_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker threads. Defaults to one per CPU, plus 4.",
+    )
+    serve_parser.add_argument(
+        "--max-body-size",
+        type=int,
+        default=DEFAULT_MAX_BODY_SIZE,
+        help="Maximum size in bytes of uploads. Defaults to 256MB.",
+    )
+    serve_parser.add_argument(
+        "--keep-alive-timeout",
+        type=float,
+        default=DEFAULT_KEEP_ALIVE_TIMEOUT,
+        help=(
+            "Seconds after which idle connections are closed. Defaults "
+            "to 5."
+        ),
+    )
+    serve_parser.add_argument(
+        "--metadata-format",
+        default=MetadataFormat.JSON.value,
+        choices=[metadata_format.value for metadata_format in MetadataFormat],
+        help=(
+            "Write metadata as JSON, or in the compact binary encoding. "
+            "Defaults to json."
+        ),
+    )
+    serve_parser.add_argument(
+        "--bind-content-hash",
+        action="store_true",
+        help="Include a hash of the audio in the signed metadata.",
+    )
+    serve_parser.add_argument(
+        "--tag-only",
+        action="store_true",
+        help="Parse only the ID3 tags, without scanning the audio stream.",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs the command line interface.
+
+    Args:
+        argv (Optional[Sequence[str]]): The command line arguments, without
+            the program name. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The exit status: 0 if all files were processed successfully,
+            1 otherwise.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if (
+        args.command == "serve"
+        and args.public_key is None
+        and args.private_key is None
+    ):
+        parser.error("serve needs --public-key, --private-key, or both")
+    logging.basicConfig(level=args.log_level)
+
+    if args.command == "tag":
+        return _tag(args)
+    if args.command == "verify":
+        return _verify(args)
+    if args.command == "watch":
+        return _watch(args)
+    if args.command == "serve":
+        return _serve(args)
+    return _scan(args)
+
+
+def _add_writer_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--private-key",
+        type=Path,
+        required=True,
+        help="PEM file of the private key used for signing.",
+    )
+    parser.add_argument(
+        "--metadata",
+        type=Path,
+        required=True,
+        help=(
+            "JSON file with the metadata to write. If content_id or "
+            "created_at are missing, the file name, made to fit the length "
+            "of a content ID, and the current time are used."
+        ),
+    )
+    parser.add_argument(
+        "--metadata-format",
+        default=MetadataFormat.JSON.value,
+        choices=[metadata_format.value for metadata_format in MetadataFormat],
+        help=(
+            "Write metadata as JSON, or in the compact binary encoding. "
+            "Defaults to json."
+        ),
+    )
+    parser.add_argument(
+        "--bind-content-hash",
+        action="store_true",
+        help=(
+            "Include a hash of the audio in the signed metadata, so that "
+            "verification fails if the audio is replaced."
+        ),
+    )
+    parser.add_argument(
+        "--atomic",
+        action="store_true",
+        help=(
+            "Replace each file with a tagged copy instead of editing it in "
+            "place, so that a crash never leaves a file half-written."
+        ),
+    )
+
+
+def _add_batch_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of parallel workers. Defaults to one per CPU.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="JSON lines results file. Defaults to standard output.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Skip the files already recorded as successful in the results "
+            "file. Files that failed are processed again."
+        ),
+    )
+
+
+def _tag(args: argparse.Namespace) -> int:
+    writer = _build_writer(args)
+    metadata_resolver = TemplateMetadataResolver(_load_metadata_template(args))
+
+    results_file = ResultsFile(args.output)
+    filepaths = _find_pending_filepaths(args, results_file)
+    items = [
+        (filepath, metadata_resolver.resolve(filepath))
+        for filepath in filepaths
+    ]
+    write_results = writer.iter_write_many(items, workers=args.jobs)
+    return _record_results(
+        results_file, zip(filepaths, write_results), len(filepaths)
+    )
+
+
+def _verify(args: argparse.Namespace) -> int:
+    reader = build_transparent_metadata_reader(
+        load_public_key_from_pem_file(args.public_key),
+        tag_only=args.tag_only,
+    )
+    results_file = ResultsFile(args.output)
+    filepaths = _find_pending_filepaths(args, results_file)
+    read_results = reader.read_many(
+        filepaths, workers=args.jobs, backend=args.backend
+    )
+    return _record_results(
+        results_file, zip(filepaths, read_results), len(filepaths)
+    )
+
+
+def _watch(args: argparse.Namespace) -> int:
+    # The watcher is only imported by this command.
+    # pylint: disable-next=import-outside-toplevel
+    from transparentmeta.watch import (
+        DropFolderWatcher,
+        FileDebouncer,
+        WatchConfig,
+        build_file_event_source,
+    )
+
+    watcher = DropFolderWatcher(
+        _build_writer(args),
+        TemplateMetadataResolver(_load_metadata_template(args)),
+        build_file_event_source(
+            args.directories, args.polling_interval, force_polling=args.poll
+        ),
+        FileDebouncer(args.settle_time),
+        WatchConfig(workers=args.jobs, max_in_flight=args.max_in_flight),
+    )
+    # The watcher stops gracefully, finishing the files being tagged, on
+    # Ctrl+C or when the service manager stops it.
+    previous_handlers = {
+        signum: signal.signal(signum, lambda *_: watcher.stop())
+        for signum in (signal.SIGINT, signal.SIGTERM)
+    }
+    try:
+        watcher.run()
+    finally:
+        for signum, previous_handler in previous_handlers.items():
+            signal.signal(signum, previous_handler)
+
+    statistics = watcher.get_statistics()
+    print(
+        json.dumps(
+            {
+                **asdict(statistics),
+                "files_per_second": statistics.files_per_second,
+                "bytes_per_second": statistics.bytes_per_second,
+            }
+        )
+    )
+    return 0 if statistics.failed == 0 else 1
+
+
+def _scan(args: argparse.Namespace) -> int:
+    # The catalogue index, and sqlite3, are only imported by this command.
+    # pylint: disable-next=import-outside-toplevel
+    from transparentmeta.index import CatalogueIndex, CatalogueScanner
+
+    reader = build_transparent_metadata_reader(
+        load_public_key_from_pem_file(args.public_key)
+    )
+    catalogue_index = CatalogueIndex(args.index)
+    try:
+        scan_summary = CatalogueScanner(
+            reader, catalogue_index, workers=args.jobs
+        ).scan(args.directory)
+    finally:
+        catalogue_index.close()
+    print(json.dumps(asdict(scan_summary)))
+    return 0
+
+
+def _serve(args: argparse.Namespace) -> int:
+    # The server, and http.server, are only imported by this command.
+    # pylint: disable-next=import-outside-toplevel
+    from transparentmeta.server import ServerConfig, VerificationServer
+
+    server = VerificationServer(
+        (args.host, args.port),
+        transparent_metadata_reader=(
+            build_transparent_metadata_reader(
+                load_public_key_from_pem_file(args.public_key),
+                tag_only=args.tag_only,
+            )
+            if args.public_key is not None
+            else None
+        ),
+        transparent_metadata_writer=(
+            build_transparent_metadata_writer(
+                load_private_key_from_pem_file(args.private_key),
+                metadata_format=MetadataFormat(args.metadata_format),
+                content_hasher=(
+                    ContentHasher() if args.bind_content_hash else None
+                ),
+            )
+            if args.private_key is not None
+            else None
+        ),
+        config=ServerConfig(
+            allowed_directories=tuple(args.allow_dir),
+            workers=args.jobs,
+            max_body_size=args.max_body_size,
+            keep_alive_timeout=args.keep_alive_timeout,
+        ),
+    )
+    print(
+        f"Listening on http://{args.host}:{server.server_port}",
+        file=sys.stderr,
+        flush=True,
+    )
+
+    # serve_forever runs on this thread, so it's stopped from another one,
+    # on Ctrl+C or when the service manager stops the server.
+    previous_handlers = {
+        signum: signal.signal(
+            signum,
+            lambda *_: threading.Thread(target=server.shutdown).start(),
+        )
+        for signum in (signal.SIGINT, signal.SIGTERM)
+    }
+    try:
+        server.serve_forever()
+    finally:
+        for signum, previous_handler in previous_handlers.items():
+            signal.signal(signum, previous_handler)
+        server.server_close()
+    return 0
+
+
+def _find_pending_filepaths(
+    args: argparse.Namespace, results_file: ResultsFile
+) -> List[Path]:
+    filepaths = list(
+        find_files_with_extensions(
+            args.directory.resolve(), SUPPORTED_AUDIO_FORMATS
+        )
+    )
+    if not args.resume:
+        return filepaths
+    completed_filepaths = results_file.load_completed_filepaths()
+    pending_filepaths = [
+        filepath
+        for filepath in filepaths
+        if filepath not in completed_filepaths
+    ]
+    logger.info(
+        "Resuming: skipping %d files already processed",
+        len(filepaths) - len(pending_filepaths),
+    )
+    return pending_filepaths
+
+
+def _build_writer(args: argparse.Namespace) -> TransparentMetadataWriter:
+    return build_transparent_metadata_writer(
+        load_private_key_from_pem_file(args.private_key),
+        metadata_format=MetadataFormat(args.metadata_format),
+        content_hasher=ContentHasher() if args.bind_content_hash else None,
+        atomic=args.atomic,
+    )
+
+
+def _load_metadata_template(args: argparse.Namespace) -> Dict[str, Any]:
+    with open(args.metadata, encoding="utf-8") as stream:
+        return json.load(stream)
+
+
+def _record_results(
+    results_file: ResultsFile,
+    results: Iterator[Tuple[Path, Union[WriteResult, ReadResult]]],
+    total: int,
+) -> int:
+    progress_reporter = ProgressReporter(total)
+    all_succeeded = True
+    with results_file:
+        for filepath, result in results:
+            results_file.write(_to_record(filepath, result))
+            progress_reporter.update(result.is_success)
+            all_succeeded = all_succeeded and result.is_success
+    progress_reporter.finish()
+    return 0 if all_succeeded else 1
+
+
+def _to_record(
+    filepath: Path, result: Union[WriteResult, ReadResult]
+) -> Dict[str, Any]:
+    record: Dict[str, Any] = {
+        "filepath": str(filepath),
+        "is_success": result.is_success,
+        "error": result.error,
+    }
+    if isinstance(result, ReadResult):
+        record["metadata"] = (
+            result.metadata.model_dump(mode="json")
+            if result.metadata is not None
+            else None
+        )
+    return record
+
+
+if __name__ == "__main__":
+    sys.exit(main())
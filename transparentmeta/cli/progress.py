@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module provides the `ProgressReporter` class, which reports the
+progress and throughput of long-running CLI commands.
+"""
+
+import sys
+import time
+from collections import Counter
+from typing import Callable, Optional, TextIO
+
+
+class ProgressReporter:
+    """Reports how many files have been processed, and how fast.
+
+    Progress lines are written at most once per interval, so that reporting
+    doesn't slow down commands processing many small files.
+
+    Attributes:
+        total (int): Total number of files to process.
+        stream (TextIO): The stream progress lines are written to.
+        interval_seconds (float): Minimum time between two progress lines.
+    """
+
+    def __init__(
+        self,
+        total: int,
+        stream: Optional[TextIO] = None,
+        interval_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initializes the ProgressReporter and starts its timer.
+
+        Args:
+            total (int): Total number of files to process.
+            stream (Optional[TextIO]): The stream progress lines are
+                written to. Defaults to standard error.
+            interval_seconds (float): Minimum time between two progress
+                lines. Defaults to 1 second.
+            clock (Callable[[], float]): Returns the current time in seconds.
+                Defaults to `time.monotonic`.
+        """
+        self.total = total
+        self.stream = stream if stream is not None else sys.stderr
+        self.interval_seconds = interval_seconds
+        self._clock = clock
+        self._start_time = clock()
+        self._last_report_time = self._start_time
+        self._counts: Counter[str] = Counter()
+
+    def update(self, is_success: bool) -> None:
+        """Records that a file was processed, and reports progress if the
+        interval has elapsed.
+
+        Args:
+            is_success (bool): Whether the file was processed successfully.
+        """
+        self._counts["processed"] += 1
+        if not is_success:
+            self._counts["failed"] += 1
+        now = self._clock()
+        if now - self._last_report_time >= self.interval_seconds:
+            self._last_report_time = now
+            self._report(now, prefix="Processed")
+
+    def finish(self) -> None:
+        """Reports the final progress and throughput."""
+        self._report(self._clock(), prefix="Completed")
+
+    def _report(self, now: float, prefix: str) -> None:
+        elapsed = now - self._start_time
+        processed = self._counts["processed"]
+        throughput = processed / elapsed if elapsed > 0 else 0.0
+        self.stream.write(
+            f"{prefix} {processed}/{self.total} files "
+            f"({self._counts['failed']} failed) in {elapsed:.1f}s, "
+            f"{throughput:.1f} files/s\n"
+        )
+        self.stream.flush()
@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module provides the `ResultsFile` class, which writes the results of
+CLI commands as JSON lines, one per file, and doubles as a checkpoint.
+
+Each line is flushed as soon as it's written, so when a command is
+interrupted, the files already processed successfully can be skipped when
+it's resumed. Files whose processing failed are processed again, so that
+transient failures are retried.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Dict, Optional, Set, TextIO, Type
+
+TAIL_CHUNK_SIZE = 64 * 1024
+
+
+class ResultsFile:
+    """JSON lines results file, usable as a context manager.
+
+    Attributes:
+        filepath (Optional[Path]): Path to the results file. If None, results
+            are written to standard output and there's no checkpoint.
+    """
+
+    def __init__(self, filepath: Optional[Path]) -> None:
+        """Initializes the ResultsFile.
+
+        Args:
+            filepath (Optional[Path]): Path to the results file, or None for
+                standard output.
+        """
+        self.filepath = filepath
+        self._stream: Optional[TextIO] = None
+
+    def load_completed_filepaths(self) -> Set[Path]:
+        """Loads the paths of the files recorded as successful in the
+        results file.
+
+        Lines that aren't records of a file, e.g., truncated lines, are
+        skipped.
+
+        Returns:
+            Set[Path]: The paths of the files processed successfully. Empty
+                if the results file doesn't exist or results go to standard
+                output.
+        """
+        if self.filepath is None or not self.filepath.exists():
+            return set()
+        completed_filepaths = set()
+        with open(self.filepath, encoding="utf-8") as stream:
+            for line in stream:
+                # The last line is truncated if the command was killed while
+                # writing it, in which case its file is processed again.
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                filepath = record.get("filepath")
+                if isinstance(filepath, str) and record.get("is_success"):
+                    completed_filepaths.add(Path(filepath))
+        return completed_filepaths
+
+    def __enter__(self) -> "ResultsFile":
+        """Opens the results file for appending.
+
+        If the results file ends with a truncated line, the line is removed
+        first, so that new records aren't appended to it.
+
+        Returns:
+            ResultsFile: The opened results file.
+        """
+        if self.filepath is None:
+            self._stream = sys.stdout
+        else:
+            if self.filepath.exists():
+                self._truncate_partial_last_line(self.filepath)
+            self._stream = open(self.filepath, "a", encoding="utf-8")
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Closes the results file."""
+        if self._stream is not None and self._stream is not sys.stdout:
+            self._stream.close()
+        self._stream = None
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Writes a record as a JSON line and flushes it.
+
+        Args:
+            record (Dict[str, Any]): A JSON-serializable record, with the
+                path of the file it refers to under "filepath".
+        """
+        assert self._stream is not None, "ResultsFile is not open"
+        self._stream.write(json.dumps(record) + "\n")
+        self._stream.flush()
+
+    @staticmethod
+    def _truncate_partial_last_line(filepath: Path) -> None:
+        # Only the tail of the file is scanned, backwards, so that resuming
+        # doesn't read the records of a long run again.
+        with open(filepath, "rb+") as stream:
+            position = stream.seek(0, os.SEEK_END)
+            while position > 0:
+                chunk_start = max(0, position - TAIL_CHUNK_SIZE)
+                stream.seek(chunk_start)
+                chunk = stream.read(position - chunk_start)
+                newline_index = chunk.rfind(b"\n")
+                if newline_index != -1:
+                    stream.truncate(chunk_start + newline_index + 1)
+                    return
+                position = chunk_start
+            stream.truncate(0)
@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module provides a `ContentHasher` class that computes and verifies
+content hashes, i.e., hashes of the audio payload of MP3 and WAV files.
+
+A content hash covers every byte of a file except its ID3 tags, so writing
+metadata doesn't change it. Once it's included in the signed metadata, it
+binds the metadata to the audio: if the audio is swapped under a valid tag,
+the signature still verifies, but the content hash doesn't.
+
+Content hashes are strings made of the name of the hash algorithm and the
+hexadecimal digest, separated by a colon, e.g., "sha256:9f86d0...". Since
+the algorithm is part of the hash, hashes are verified with the algorithm
+they were computed with.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import BinaryIO, Union
+
+from transparentmeta.crypto.hasher import DEFAULT_BUFFER_SIZE, Hasher
+from transparentmeta.utils.audio_payload_utils import (
+    find_audio_payload_ranges,
+)
+
+logger = logging.getLogger(__name__)
+
+CONTENT_HASH_SEPARATOR = ":"
+
+
+class ContentHasher:
+    """Computes and verifies hashes of the audio payload of MP3 and WAV
+    files, streaming the payload in constant memory.
+
+    Attributes:
+        hash_algorithm_name (str): The name of the hash algorithm used to
+            compute content hashes.
+        buffer_size (int): Size in bytes of the buffer the payload is read
+            through.
+    """
+
+    def __init__(
+        self,
+        hash_algorithm_name: str = "sha256",
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        """Initializes the ContentHasher.
+
+        Args:
+            hash_algorithm_name (str, optional): The name of the hash
+                algorithm. Defaults to "sha256".
+            buffer_size (int, optional): Size in bytes of the read buffer.
+                Defaults to 1MB.
+
+        Raises:
+            ValueError: If the algorithm is not supported by hashlib.
+        """
+        self.hash_algorithm_name = hash_algorithm_name
+        self.buffer_size = buffer_size
+        self._hasher = Hasher(hash_algorithm_name)
+
+    def compute_content_hash(self, source: Union[Path, BinaryIO]) -> str:
+        """Computes the content hash of an audio file.
+
+        Args:
+            source (Union[Path, BinaryIO]): The path to the audio file, or
+                a seekable binary file object holding it. The position of
+                file objects is restored afterwards.
+
+        Returns:
+            str: The content hash, e.g., "sha256:9f86d0...".
+
+        Raises:
+            InvalidRIFFFileError: If a file starting with a RIFF header is
+                not a valid WAV file.
+        """
+        digest = self._hash_audio_payload(self._hasher, source)
+        return f"{self.hash_algorithm_name}{CONTENT_HASH_SEPARATOR}{digest}"
+
+    def is_content_hash_valid(
+        self, source: Union[Path, BinaryIO], content_hash: str
+    ) -> bool:
+        """Checks whether a content hash matches the audio payload of a
+        file.
+
+        The payload is hashed with the algorithm named in the content hash,
+        which may differ from the algorithm of this hasher.
+
+        Args:
+            source (Union[Path, BinaryIO]): The path to the audio file, or
+                a seekable binary file object holding it.
+            content_hash (str): The content hash to check.
+
+        Returns:
+            bool: True if the content hash matches the payload, False
+                otherwise, including when its algorithm is not supported.
+
+        Raises:
+            InvalidRIFFFileError: If a file starting with a RIFF header is
+                not a valid WAV file.
+        """
+        hash_algorithm_name, _, expected_digest = content_hash.partition(
+            CONTENT_HASH_SEPARATOR
+        )
+        try:
+            hasher = Hasher(hash_algorithm_name)
+        except ValueError:
+            logger.warning(
+                "Unsupported content hash algorithm: %s", hash_algorithm_name
+            )
+            return False
+        return self._hash_audio_payload(hasher, source) == expected_digest
+
+    def _hash_audio_payload(
+        self, hasher: Hasher, source: Union[Path, BinaryIO]
+    ) -> str:
+        if isinstance(source, Path):
+            with open(source, "rb") as stream:
+                return self._hash_stream(hasher, stream)
+        position = source.tell()
+        try:
+            return self._hash_stream(hasher, source)
+        finally:
+            source.seek(position, os.SEEK_SET)
+
+    def _hash_stream(self, hasher: Hasher, stream: BinaryIO) -> str:
+        return hasher.hash_stream(
+            stream, find_audio_payload_ranges(stream), self.buffer_size
+        )
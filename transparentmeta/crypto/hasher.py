@@ -6,13 +6,20 @@
 This module provides a simple wrapper around Python's hashlib library to
 compute cryptographic hash digests using various algorithms such as SHA-256,
 SHA-512, and MD5.
+
+Digests can be computed from data in memory, or streamed from ranges of a
+file through a bounded buffer, so that files of any size are hashed in
+constant memory.
 """
 
 import hashlib
 import logging
+from typing import BinaryIO, Iterable, Tuple
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
 
 class Hasher:
     """A utility class for computing hash digests using various cryptographic
@@ -59,6 +66,62 @@ class Hasher:
 
         return hexadecimal_hash_digest
 
+    def hash_stream(
+        self,
+        stream: BinaryIO,
+        byte_ranges: Iterable[Tuple[int, int]],
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> str:
+        """Computes the hash digest of ranges of bytes of a stream, as if
+        they were a single piece of data.
+
+        The ranges are read in chunks through a buffer of fixed size, which
+        is reused for the whole stream, so memory usage doesn't depend on
+        the size of the ranges.
+
+        Args:
+            stream (BinaryIO): A seekable binary stream, e.g., a file.
+            byte_ranges (Iterable[Tuple[int, int]]): The start and end
+                offsets of the ranges to hash, the end being excluded.
+            buffer_size (int, optional): Size of the read buffer in bytes.
+                Defaults to 1MB.
+
+        Returns:
+            hexadecimal_hash_digest (str): The hexadecimal digest of the
+                hashed ranges.
+
+        Raises:
+            EOFError: If a range extends past the end of the stream.
+        """
+        hash_algorithm = hashlib.new(self.hash_algorithm_name)
+        buffer = memoryview(bytearray(buffer_size))
+        # Binary files and BytesIO objects have readinto, even though
+        # BinaryIO doesn't declare it.
+        readinto = stream.readinto  # type: ignore[attr-defined]
+        for start, end in byte_ranges:
+            stream.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                number_of_bytes = readinto(
+                    buffer[: min(remaining, buffer_size)]
+                )
+                if not number_of_bytes:
+                    raise EOFError(
+                        f"Stream ends before the end of range {start}-{end}"
+                    )
+                hash_algorithm.update(buffer[:number_of_bytes])
+                remaining -= number_of_bytes
+        hexadecimal_hash_digest = hash_algorithm.hexdigest()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Computed %s hexadecimal hash of stream: %s",
+                self.hash_algorithm_name,
+                hexadecimal_hash_digest,
+            )
+
+        return hexadecimal_hash_digest
+
     def _raise_value_error_if_hash_algorithm_is_not_available(self) -> None:
         if self.hash_algorithm_name not in hashlib.algorithms_available:
             raise ValueError(
@@ -32,6 +32,9 @@ Functions:
     convert_public_key_to_hex(public_key) -> str:
         Converts a public key to a hex string.
 
+    get_public_key_fingerprint(public_key) -> str:
+        Computes a short, stable identifier of a public key.
+
     load_private_key_from_hex_string(hex_string) -> ed25519.Ed25519PrivateKey:
         Converts a hex-encoded private key back to an Ed25519PrivateKey object.
 
@@ -40,6 +43,7 @@ Functions:
 """
 
 import binascii
+import hashlib
 import logging
 from pathlib import Path
 from typing import Tuple, cast
@@ -188,6 +192,24 @@ def convert_public_key_to_hex(public_key: ed25519.Ed25519PublicKey) -> str:
     return hexadecimal_encoded_public_key
 
 
+def get_public_key_fingerprint(public_key: ed25519.Ed25519PublicKey) -> str:
+    """Computes the fingerprint of a public key, i.e., the SHA-256 hash of
+    its raw bytes, e.g., to tell apart results verified with different keys.
+
+    Args:
+        public_key (ed25519.Ed25519PublicKey): The public key.
+
+    Returns:
+        str: The hex-encoded SHA-256 hash of the public key.
+    """
+    return hashlib.sha256(
+        public_key.public_bytes(
+            encoding=serialization.Encoding.Raw,
+            format=serialization.PublicFormat.Raw,
+        )
+    ).hexdigest()
+
+
 def load_private_key_from_hex_string(
     hex_encoded_private_key: str,
 ) -> ed25519.Ed25519PrivateKey:
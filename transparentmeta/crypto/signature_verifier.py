@@ -5,10 +5,13 @@
 """
 This module provides a `SignatureVerifier` class that enables verifying
 messages signed with the Ed25519 cryptographic algorithm. It supports
-different character encodings for message conversion before verification.
+different character encodings for message conversion before verification,
+and verifying many signatures in one call.
 """
 
+import binascii
 import logging
+from typing import Iterable, List, Tuple, Union
 
 from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.primitives.asymmetric import ed25519
@@ -49,11 +52,15 @@ class SignatureVerifier:
         self.public_key = public_key
         self.character_encoding = character_encoding
 
-    def is_signature_valid(self, message: str, signature: str) -> bool:
+    def is_signature_valid(
+        self, message: Union[str, bytes], signature: str
+    ) -> bool:
         """Verifies an Ed25519 hex-encoded signature for a given message.
 
         Args:
-            message (str): The original message that was signed.
+            message (Union[str, bytes]): The original message that was
+                signed. Strings are encoded with the character encoding of
+                the verifier, and bytes are verified as they are.
             signature (str): The hex-encoded digital signature.
 
         Returns:
@@ -64,25 +71,70 @@ class SignatureVerifier:
             signature_bytes = self._encode_signature(signature)
             self._verify_signature(signature_bytes, message_bytes)
 
-            logger.debug(
-                "Signature '%s' for message '%s' is valid",
-                signature,
-                message,
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Signature '%s' for message '%.40s' is valid",
+                    signature,
+                    message,
+                )
 
             return True
 
         except (InvalidSignature, InvalidHexadecimalStringError):
 
-            logger.debug(
-                "Signature '%s' for message '%s' is invalid",
-                signature,
-                message,
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Signature '%s' for message '%.40s' is invalid",
+                    signature,
+                    message,
+                )
 
             return False
 
-    def _encode_message(self, message: str) -> bytes:
+    def verify_many(
+        self, signed_messages: Iterable[Tuple[Union[str, bytes], str]]
+    ) -> List[bool]:
+        """Verifies many Ed25519 hex-encoded signatures in one call.
+
+        This gives the same results as calling `is_signature_valid` for each
+        message, with less overhead per signature, which adds up when
+        auditing large catalogues. Ed25519 has no batch verification in
+        `cryptography`, so each signature is still verified on its own.
+
+        Args:
+            signed_messages (Iterable[Tuple[Union[str, bytes], str]]): Pairs
+                of message and hex-encoded signature.
+
+        Returns:
+            List[bool]: One flag per pair, in the same order as the input,
+                which is True if the signature is valid, False otherwise.
+        """
+        # Attribute lookups and helper calls are hoisted out of the loop,
+        # since they cost as much as decoding a signature.
+        verify = self.public_key.verify
+        character_encoding = self.character_encoding.value
+        unhexlify = binascii.unhexlify
+
+        validity_flags = []
+        for message, signature in signed_messages:
+            try:
+                if isinstance(message, str):
+                    message = message.encode(character_encoding)
+                verify(unhexlify(signature), message)
+                validity_flags.append(True)
+            except (InvalidSignature, ValueError):
+                validity_flags.append(False)
+
+        logger.debug(
+            "Verified %d signatures. Invalid: %d",
+            len(validity_flags),
+            validity_flags.count(False),
+        )
+        return validity_flags
+
+    def _encode_message(self, message: Union[str, bytes]) -> bytes:
+        if isinstance(message, bytes):
+            return message
         return encode_string_to_bytes(message, self.character_encoding.value)
 
     def _encode_signature(self, signature: str) -> bytes:
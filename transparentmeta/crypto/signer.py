@@ -9,6 +9,7 @@ encodings for message conversion before signing.
 """
 
 import logging
+from typing import Union
 
 from cryptography.hazmat.primitives.asymmetric import ed25519
 
@@ -48,11 +49,13 @@ class Signer:
         self.private_key = private_key
         self.character_encoding = character_encoding
 
-    def sign(self, message: str) -> str:
+    def sign(self, message: Union[str, bytes]) -> str:
         """Signs a message using Ed25519 and returns a hex-encoded signature.
 
         Args:
-            message (str): The message to sign.
+            message (Union[str, bytes]): The message to sign. Strings are
+                encoded with the character encoding of the signer, and bytes
+                are signed as they are.
 
         Returns:
             str: Hex-encoded digital signature.
@@ -60,15 +63,18 @@ class Signer:
         signature_bytes = self._sign(message)
         signature = self._decode_signature(signature_bytes)
 
-        logger.debug(
-            "Signed message '%.40s' with signature: '%s'",
-            message,
-            signature,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Signed message '%.40s' with signature: '%s'",
+                message,
+                signature,
+            )
 
         return signature
 
-    def _sign(self, message: str) -> bytes:
+    def _sign(self, message: Union[str, bytes]) -> bytes:
+        if isinstance(message, bytes):
+            return self.private_key.sign(message)
         message_bytes = encode_string_to_bytes(
             message, self.character_encoding.value
         )
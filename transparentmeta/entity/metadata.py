@@ -57,6 +57,10 @@ class Metadata(BaseModel):
                     ...
                 }
             }
+        content_hash (Optional[str]): Hash of the audio payload of the file
+            the metadata is written to, e.g., "sha256:9f86d0...". It binds
+            the signed metadata to the audio, and is checked when the
+            metadata is read. Set by writers that bind content hashes.
     """
 
     company: str = Field(..., min_length=2, max_length=50)
@@ -67,3 +71,6 @@ class Metadata(BaseModel):
     user_id: str = Field(..., min_length=2, max_length=50)
     private_key_id: str = Field(..., min_length=2, max_length=50)
     additional_info: Optional[Dict] = None
+    content_hash: Optional[str] = Field(
+        None, max_length=200, pattern=r"^[a-z0-9_]+:[0-9a-f]+$"
+    )
@@ -0,0 +1,27 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Exposes the catalogue index of transparentmeta, a persistent SQLite index of
+tagged audio files kept up to date by incremental scans, for direct import
+from the `transparentmeta.index` package.
+"""
+
+from transparentmeta.index.catalogue_index import (
+    CatalogueIndex,
+    IndexedFile,
+    IndexedMetadata,
+)
+from transparentmeta.index.catalogue_scanner import (
+    CatalogueScanner,
+    ScanSummary,
+)
+
+__all__ = [
+    "CatalogueIndex",
+    "IndexedFile",
+    "IndexedMetadata",
+    "CatalogueScanner",
+    "ScanSummary",
+]
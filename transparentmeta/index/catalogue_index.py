@@ -0,0 +1,330 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module provides the `CatalogueIndex` class, a persistent SQLite index of
+the audio files of a catalogue and of their transparency metadata.
+
+For each file, the index records its path, its stat identity, the
+fingerprint of the public key it was verified with, whether its metadata was
+verified, and the metadata fields that compliance queries
+filter on. Queries such as "all AI-generated tracks signed with key X" are
+answered from the index, without reading the files again.
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from transparentmeta.entity.metadata import AIUsageLevel
+from transparentmeta.result.result import ReadResult
+from transparentmeta.utils.file_utils import FileIdentity
+from transparentmeta.utils.sqlite_utils import SQLiteDatabase
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = (
+    "path, device, inode, size, mtime_ns, key_fingerprint, is_verified, "
+    "error, content_id, private_key_id, ai_usage_level, created_at"
+)
+
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS indexed_files ("
+    "path TEXT PRIMARY KEY, device INTEGER, inode INTEGER, "
+    "size INTEGER, mtime_ns INTEGER, key_fingerprint TEXT, "
+    "is_verified INTEGER, "
+    "error TEXT, content_id TEXT, private_key_id TEXT, "
+    "ai_usage_level TEXT, created_at TEXT)",
+    "CREATE INDEX IF NOT EXISTS indexed_files_by_key "
+    "ON indexed_files (private_key_id, ai_usage_level)",
+    "CREATE INDEX IF NOT EXISTS indexed_files_by_usage "
+    "ON indexed_files (ai_usage_level)",
+    "CREATE INDEX IF NOT EXISTS indexed_files_by_content "
+    "ON indexed_files (content_id)",
+)
+
+
+@dataclass(frozen=True)
+class IndexedMetadata:
+    """The metadata fields of a verified file that the index filters on.
+
+    Attributes:
+        content_id (str): The content ID in the metadata.
+        private_key_id (str): The ID of the private key that signed the
+            metadata.
+        ai_usage_level (AIUsageLevel): The AI usage level in the metadata.
+        created_at (datetime): The creation time in the metadata.
+    """
+
+    content_id: str
+    private_key_id: str
+    ai_usage_level: AIUsageLevel
+    created_at: datetime
+
+
+@dataclass(frozen=True)
+class IndexedFile:
+    """An audio file recorded in the catalogue index.
+
+    Attributes:
+        filepath (Path): Absolute path to the audio file.
+        file_identity (FileIdentity): Stat identity of the file when it was
+            indexed.
+        is_verified (bool): True if the file has metadata with a valid
+            signature, False otherwise.
+        error (Optional[str]): The reason why the file isn't verified.
+        metadata (Optional[IndexedMetadata]): The indexed metadata fields,
+            or None if the file isn't verified.
+        key_fingerprint (Optional[str]): Fingerprint of the public key the
+            file was verified with.
+    """
+
+    filepath: Path
+    file_identity: FileIdentity
+    is_verified: bool
+    error: Optional[str] = None
+    metadata: Optional[IndexedMetadata] = None
+    key_fingerprint: Optional[str] = None
+
+    @classmethod
+    def from_read_result(
+        cls,
+        filepath: Path,
+        file_identity: FileIdentity,
+        read_result: ReadResult,
+        key_fingerprint: Optional[str] = None,
+    ) -> "IndexedFile":
+        """Creates an IndexedFile from the result of reading the file.
+
+        Args:
+            filepath (Path): Absolute path to the audio file.
+            file_identity (FileIdentity): Stat identity of the file before it
+                was read.
+            read_result (ReadResult): The result of reading the file.
+            key_fingerprint (Optional[str]): Fingerprint of the public key
+                the file was verified with. Defaults to None.
+
+        Returns:
+            IndexedFile: The file as recorded in the index.
+        """
+        metadata = read_result.metadata
+        if not read_result.is_success or metadata is None:
+            return cls(
+                filepath,
+                file_identity,
+                False,
+                error=read_result.error,
+                key_fingerprint=key_fingerprint,
+            )
+        return cls(
+            filepath,
+            file_identity,
+            True,
+            metadata=IndexedMetadata(
+                content_id=metadata.content_id,
+                private_key_id=metadata.private_key_id,
+                ai_usage_level=metadata.ai_usage_level,
+                created_at=metadata.created_at,
+            ),
+            key_fingerprint=key_fingerprint,
+        )
+
+
+class CatalogueIndex:
+    """Persistent, thread-safe SQLite index of catalogue audio files.
+
+    Attributes:
+        database_path (Union[str, Path]): Path to the SQLite database file,
+            created if it doesn't exist, or ":memory:" for an in-memory
+            index.
+    """
+
+    def __init__(self, database_path: Union[str, Path]) -> None:
+        """Initializes the index, creating its table and indexes if needed.
+
+        Args:
+            database_path (Union[str, Path]): Path to the SQLite database
+                file, or ":memory:".
+        """
+        self.database_path = database_path
+        self._database = SQLiteDatabase(database_path, _SCHEMA)
+
+    def get_file_identities(
+        self, directory: Path, key_fingerprint: str
+    ) -> Dict[Path, Optional[FileIdentity]]:
+        """Gets the stat identities of the indexed files in a directory tree.
+
+        A file is only up to date in the index if it was verified with the
+        same public key, so files verified with another key have no
+        identity, which never matches the current identity of a file.
+
+        Args:
+            directory (Path): Absolute path to the root of the directory tree.
+            key_fingerprint (str): Fingerprint of the public key the files
+                are verified with.
+
+        Returns:
+            Dict[Path, Optional[FileIdentity]]: The stat identity of each
+                indexed file in the directory tree, keyed by path, or None if
+                the file was verified with another key.
+        """
+        # Paths in the tree sort between the directory followed by the path
+        # separator, and the directory followed by the next character, which
+        # lets SQLite answer with a range scan of the primary key.
+        prefix = str(directory).rstrip(os.sep) + os.sep
+        upper_bound = prefix[:-1] + chr(ord(os.sep) + 1)
+        rows = self._database.fetch_all(
+            "SELECT path, device, inode, size, mtime_ns, key_fingerprint "
+            "FROM indexed_files WHERE path >= ? AND path < ?",
+            (prefix, upper_bound),
+        )
+        return {
+            Path(row[0]): (
+                tuple(row[1:5]) if row[5] == key_fingerprint else None
+            )
+            for row in rows
+        }
+
+    def upsert(self, indexed_files: Iterable[IndexedFile]) -> int:
+        """Records files in the index, replacing previous records of the
+        same paths.
+
+        Args:
+            indexed_files (Iterable[IndexedFile]): The files to record.
+
+        Returns:
+            int: The number of files recorded.
+        """
+        rows = [self._to_row(indexed_file) for indexed_file in indexed_files]
+        self._database.execute_many(
+            f"INSERT OR REPLACE INTO indexed_files ({_COLUMNS}) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        logger.debug("Recorded %d files in the catalogue index", len(rows))
+        return len(rows)
+
+    def remove(self, filepaths: Iterable[Path]) -> int:
+        """Removes files from the index.
+
+        Args:
+            filepaths (Iterable[Path]): Absolute paths of the files to remove.
+
+        Returns:
+            int: The number of files removed.
+        """
+        return self._database.execute_many(
+            "DELETE FROM indexed_files WHERE path = ?",
+            [(str(filepath),) for filepath in filepaths],
+        )
+
+    def find(
+        self,
+        ai_usage_level: Optional[AIUsageLevel] = None,
+        private_key_id: Optional[str] = None,
+        content_id: Optional[str] = None,
+        is_verified: Optional[bool] = None,
+    ) -> List[IndexedFile]:
+        """Finds the indexed files matching all the given criteria.
+
+        Criteria left to None match any file.
+
+        Args:
+            ai_usage_level (Optional[AIUsageLevel]): The AI usage level.
+            private_key_id (Optional[str]): The ID of the signing key.
+            content_id (Optional[str]): The content ID.
+            is_verified (Optional[bool]): Whether the metadata is verified.
+
+        Returns:
+            List[IndexedFile]: The matching files, sorted by path.
+        """
+        criteria: List[Tuple[str, object]] = [
+            (
+                "ai_usage_level",
+                ai_usage_level.value if ai_usage_level is not None else None,
+            ),
+            ("private_key_id", private_key_id),
+            ("content_id", content_id),
+            ("is_verified", is_verified),
+        ]
+        conditions = [
+            (f"{column} = ?", value)
+            for column, value in criteria
+            if value is not None
+        ]
+        query = f"SELECT {_COLUMNS} FROM indexed_files"
+        if conditions:
+            query += " WHERE " + " AND ".join(
+                condition for condition, _ in conditions
+            )
+        query += " ORDER BY path"
+
+        rows = self._database.fetch_all(
+            query, [value for _, value in conditions]
+        )
+        return [self._from_row(row) for row in rows]
+
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        self._database.close()
+
+    @staticmethod
+    def _to_row(indexed_file: IndexedFile) -> Tuple:
+        metadata = indexed_file.metadata
+        metadata_columns = (
+            (
+                metadata.content_id,
+                metadata.private_key_id,
+                metadata.ai_usage_level.value,
+                metadata.created_at.isoformat(),
+            )
+            if metadata is not None
+            else (None,) * 4
+        )
+        return (
+            str(indexed_file.filepath),
+            *indexed_file.file_identity,
+            indexed_file.key_fingerprint,
+            indexed_file.is_verified,
+            indexed_file.error,
+            *metadata_columns,
+        )
+
+    @staticmethod
+    def _from_row(row: Tuple) -> IndexedFile:
+        (
+            path,
+            device,
+            inode,
+            size,
+            mtime_ns,
+            key_fingerprint,
+            is_verified,
+            error,
+            content_id,
+            private_key_id,
+            ai_usage_level,
+            created_at,
+        ) = row
+        return IndexedFile(
+            filepath=Path(path),
+            file_identity=(device, inode, size, mtime_ns),
+            is_verified=bool(is_verified),
+            error=error,
+            metadata=(
+                IndexedMetadata(
+                    content_id=content_id,
+                    private_key_id=private_key_id,
+                    ai_usage_level=AIUsageLevel(ai_usage_level),
+                    created_at=datetime.fromisoformat(created_at),
+                )
+                if content_id is not None
+                else None
+            ),
+            key_fingerprint=key_fingerprint,
+        )
@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module provides the `CatalogueScanner` class, which scans a directory
+tree of audio files and keeps a `CatalogueIndex` up to date with it.
+
+Scans are incremental: files whose stat identity hasn't changed since they
+were indexed with the same public key are skipped, and only new or modified
+files, or files indexed with another key, are read and verified, in
+parallel. Files that disappeared from the tree are removed from the index.
+"""
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from transparentmeta.crypto.key_management import get_public_key_fingerprint
+from transparentmeta.index.catalogue_index import CatalogueIndex, IndexedFile
+from transparentmeta.sdk.transparent_metadata_reader import (
+    TransparentMetadataReader,
+)
+from transparentmeta.use_case.constants import SUPPORTED_AUDIO_FORMATS
+from transparentmeta.utils.file_utils import (
+    FileIdentity,
+    find_files_with_extensions,
+    get_file_identity,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ScanSummary:
+    """Summary of a catalogue scan.
+
+    Attributes:
+        indexed (int): Number of new or modified files read and recorded.
+        skipped (int): Number of unchanged files skipped.
+        removed (int): Number of files removed from the index because they
+            no longer exist.
+    """
+
+    indexed: int
+    skipped: int
+    removed: int
+
+
+class CatalogueScanner:
+    """Scans directory trees of audio files into a catalogue index.
+
+    Attributes:
+        transparent_metadata_reader (TransparentMetadataReader): Reads and
+            verifies the metadata of new or modified files.
+        catalogue_index (CatalogueIndex): The index kept up to date.
+        workers (Optional[int]): Number of threads reading files in
+            parallel. Defaults to the thread pool default.
+    """
+
+    def __init__(
+        self,
+        transparent_metadata_reader: TransparentMetadataReader,
+        catalogue_index: CatalogueIndex,
+        workers: Optional[int] = None,
+    ) -> None:
+        """Initializes the CatalogueScanner.
+
+        Args:
+            transparent_metadata_reader (TransparentMetadataReader): The
+                reader used to verify files.
+            catalogue_index (CatalogueIndex): The index to update.
+            workers (Optional[int]): Number of threads reading files in
+                parallel. Defaults to the thread pool default.
+        """
+        self.transparent_metadata_reader = transparent_metadata_reader
+        self.catalogue_index = catalogue_index
+        self.workers = workers
+
+    def scan(self, directory: Path) -> ScanSummary:
+        """Scans a directory tree and updates the index with its audio files.
+
+        Args:
+            directory (Path): The root of the directory tree.
+
+        Returns:
+            ScanSummary: How many files were indexed, skipped and removed.
+        """
+        directory = directory.resolve()
+        logger.info("Starting catalogue scan of directory: %s", directory)
+
+        # Files verified with another key, e.g., before a key rotation,
+        # are read again.
+        read_use_case = self.transparent_metadata_reader.read_use_case
+        key_fingerprint = get_public_key_fingerprint(
+            read_use_case.signature_verifier.public_key
+        )
+        indexed_identities = self.catalogue_index.get_file_identities(
+            directory, key_fingerprint
+        )
+        changed_files: List[Tuple[Path, FileIdentity]] = []
+        skipped = 0
+        for filepath in find_files_with_extensions(
+            directory, SUPPORTED_AUDIO_FORMATS
+        ):
+            try:
+                file_identity = get_file_identity(filepath)
+            except FileNotFoundError:
+                # The file was removed since the directory was walked. It's
+                # left in `indexed_identities`, so it's removed from the
+                # index.
+                logger.debug("File disappeared during scan: %s", filepath)
+                continue
+            if indexed_identities.pop(filepath, None) == file_identity:
+                skipped += 1
+            else:
+                changed_files.append((filepath, file_identity))
+
+        read_results = self.transparent_metadata_reader.read_many(
+            [filepath for filepath, _ in changed_files], workers=self.workers
+        )
+        indexed = self.catalogue_index.upsert(
+            IndexedFile.from_read_result(
+                filepath, file_identity, read_result, key_fingerprint
+            )
+            for (filepath, file_identity), read_result in zip(
+                changed_files, read_results
+            )
+        )
+        # Files still in `indexed_identities` weren't found in the tree.
+        removed = self.catalogue_index.remove(indexed_identities)
+
+        scan_summary = ScanSummary(indexed, skipped, removed)
+        logger.info(
+            "Catalogue scan completed. Indexed: %d. Skipped: %d. Removed: %d",
+            indexed,
+            skipped,
+            removed,
+        )
+        return scan_summary
@@ -0,0 +1,27 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Exposes the instrumentation interface of transparentmeta, which reports
+per-stage timings of the write and read paths, and its adapters, for direct
+import from the `transparentmeta.instrumentation` package.
+"""
+
+from transparentmeta.instrumentation.instrumentation import (
+    Instrumentation,
+    Stage,
+)
+from transparentmeta.instrumentation.opentelemetry_instrumentation import (
+    OpenTelemetrySpanInstrumentation,
+)
+from transparentmeta.instrumentation.prometheus_instrumentation import (
+    PrometheusHistogramInstrumentation,
+)
+
+__all__ = [
+    "Instrumentation",
+    "Stage",
+    "PrometheusHistogramInstrumentation",
+    "OpenTelemetrySpanInstrumentation",
+]
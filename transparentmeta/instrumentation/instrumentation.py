@@ -0,0 +1,123 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module defines the `Instrumentation` interface, through which the
+write and read paths of transparentmeta report how long each of their
+stages takes.
+
+The stages are the validation of the request, the loading and parsing of
+the audio file, the serialization, signing, verification and
+deserialization of the metadata, and the saving of the audio file. Timings
+tell whether a slow batch is waiting on audio file IO or on cryptography.
+
+Instrumentation is optional. When none is configured, stages run without
+being timed.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from enum import Enum
+from pathlib import Path
+from typing import Callable, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+
+class Stage(str, Enum):
+    """Stages of the write and read paths.
+
+    Attributes:
+        VALIDATE: Validation of the write or read request.
+        LOAD: Loading and parsing of the audio file and its ID3 tags.
+        SERIALIZE: Serialization of the metadata to JSON.
+        SIGN: Signing of the serialized metadata.
+        VERIFY: Verification of the signature of the serialized metadata.
+        DESERIALIZE: Deserialization of the metadata from JSON.
+        SAVE: Saving of the ID3 tags to the audio file.
+        HASH: Hashing of the audio payload, when metadata is bound to it by
+            a content hash.
+    """
+
+    VALIDATE = "validate"
+    LOAD = "load"
+    SERIALIZE = "serialize"
+    SIGN = "sign"
+    VERIFY = "verify"
+    DESERIALIZE = "deserialize"
+    SAVE = "save"
+    HASH = "hash"
+
+
+class Instrumentation(ABC):
+    """Receives the timings of the stages of the write and read paths.
+
+    Implementations are called from the threads running the stages, so they
+    must be thread-safe, and they should be cheap, since they're called
+    several times per file.
+    """
+
+    @abstractmethod
+    def on_stage(
+        self,
+        stage: Stage,
+        filepath: Union[str, Path],
+        duration_ns: int,
+        num_bytes: int,
+    ) -> None:
+        """Called when a stage completes, successfully or not.
+
+        Args:
+            stage (Stage): The stage that completed.
+            filepath (Union[str, Path]): The audio file the stage processed,
+                or a placeholder name for audio held in memory.
+            duration_ns (int): Duration of the stage in nanoseconds.
+            num_bytes (int): Number of bytes the stage processed: the size
+                of the audio file for the validate, load and save stages,
+                and the size of the serialized metadata for the others.
+        """
+
+
+def run_stage(
+    instrumentation: Optional[Instrumentation],
+    stage: Stage,
+    filepath: Union[str, Path],
+    num_bytes: Callable[[Optional[T]], int],
+    func: Callable[[], T],
+) -> T:
+    """Runs a stage, reporting its duration to the instrumentation, if any.
+
+    Without instrumentation, the stage is run directly, and the number of
+    bytes isn't computed.
+
+    Args:
+        instrumentation (Optional[Instrumentation]): Receives the timing.
+        stage (Stage): The stage to run.
+        filepath (Union[str, Path]): The audio file the stage processes.
+        num_bytes (Callable[[Optional[T]], int]): Computes the number of
+            bytes the stage processed from its return value, which is None
+            if the stage failed.
+        func (Callable[[], T]): Runs the stage.
+
+    Returns:
+        T: The value returned by the stage.
+
+    Raises:
+        Exception: Any exception raised by the stage, after its timing is
+            reported.
+    """
+    if instrumentation is None:
+        return func()
+    result: Optional[T] = None
+    start_ns = time.perf_counter_ns()
+    try:
+        result = func()
+        return result
+    finally:
+        instrumentation.on_stage(
+            stage,
+            filepath,
+            time.perf_counter_ns() - start_ns,
+            num_bytes(result),
+        )
@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module provides the `OpenTelemetrySpanInstrumentation` class, which
+records each stage as an OpenTelemetry span.
+
+transparentmeta doesn't depend on OpenTelemetry: any tracer with the
+`start_span(name, start_time=..., attributes=...)` interface of the
+OpenTelemetry API can be used, e.g., `trace.get_tracer("transparentmeta")`.
+Spans are children of the span current when the stage ran, e.g., a span
+wrapping a whole batch.
+"""
+
+import time
+from pathlib import Path
+from typing import Any, Union
+
+from transparentmeta.instrumentation.instrumentation import (
+    Instrumentation,
+    Stage,
+)
+
+
+class OpenTelemetrySpanInstrumentation(Instrumentation):
+    """Records each stage as a span named after it.
+
+    Spans are recorded when stages complete, with start and end times
+    computed from the stage duration.
+
+    Attributes:
+        tracer (Any): The tracer creating the spans.
+        span_name_prefix (str): Prefix of the span names, followed by the
+            stage, e.g., "transparentmeta.sign".
+    """
+
+    def __init__(
+        self, tracer: Any, span_name_prefix: str = "transparentmeta."
+    ) -> None:
+        """Initializes the OpenTelemetrySpanInstrumentation.
+
+        Args:
+            tracer (Any): The tracer creating the spans.
+            span_name_prefix (str): Prefix of the span names. Defaults to
+                "transparentmeta.".
+        """
+        self.tracer = tracer
+        self.span_name_prefix = span_name_prefix
+
+    def on_stage(
+        self,
+        stage: Stage,
+        filepath: Union[str, Path],
+        duration_ns: int,
+        num_bytes: int,
+    ) -> None:
+        """Records a span for a stage.
+
+        Args:
+            stage (Stage): The stage that completed.
+            filepath (Union[str, Path]): The audio file the stage processed,
+                recorded in the "file.path" attribute.
+            duration_ns (int): Duration of the stage in nanoseconds.
+            num_bytes (int): Number of bytes the stage processed, recorded
+                in the "transparentmeta.bytes" attribute.
+        """
+        end_time_ns = time.time_ns()
+        span = self.tracer.start_span(
+            f"{self.span_name_prefix}{stage.value}",
+            start_time=end_time_ns - duration_ns,
+            attributes={
+                "file.path": str(filepath),
+                "transparentmeta.bytes": num_bytes,
+            },
+        )
+        span.end(end_time=end_time_ns)
@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module provides the `PrometheusHistogramInstrumentation` class, which
+records stage timings in Prometheus-style histograms labelled by stage.
+
+transparentmeta doesn't depend on a Prometheus client: any histogram with
+the `labels(stage=...).observe(value)` interface of `prometheus_client`'s
+`Histogram` can be used, e.g.:
+
+    Histogram(
+        "transparentmeta_stage_duration_seconds",
+        "Duration of the stages of transparentmeta",
+        ["stage"],
+    )
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from transparentmeta.instrumentation.instrumentation import (
+    Instrumentation,
+    Stage,
+)
+
+
+class PrometheusHistogramInstrumentation(Instrumentation):
+    """Observes stage durations, and optionally sizes, in histograms with a
+    "stage" label.
+
+    Attributes:
+        duration_histogram (Any): Histogram observing durations in seconds.
+        bytes_histogram (Optional[Any]): Histogram observing the number of
+            bytes processed by each stage. If None, sizes aren't recorded.
+    """
+
+    def __init__(
+        self, duration_histogram: Any, bytes_histogram: Optional[Any] = None
+    ) -> None:
+        """Initializes the PrometheusHistogramInstrumentation.
+
+        Args:
+            duration_histogram (Any): Histogram observing durations in
+                seconds, with a "stage" label.
+            bytes_histogram (Optional[Any]): Histogram observing sizes in
+                bytes, with a "stage" label. Defaults to None.
+        """
+        self.duration_histogram = duration_histogram
+        self.bytes_histogram = bytes_histogram
+        # Labelled children are looked up once per stage, not once per call.
+        self._duration_children: Dict[Stage, Any] = {}
+        self._bytes_children: Dict[Stage, Any] = {}
+
+    def on_stage(
+        self,
+        stage: Stage,
+        filepath: Union[str, Path],
+        duration_ns: int,
+        num_bytes: int,
+    ) -> None:
+        """Observes the duration of a stage, and its size if configured.
+
+        Args:
+            stage (Stage): The stage that completed.
+            filepath (Union[str, Path]): The audio file the stage processed.
+                It isn't used as a label, to keep cardinality bounded.
+            duration_ns (int): Duration of the stage in nanoseconds.
+            num_bytes (int): Number of bytes the stage processed.
+        """
+        duration_child = self._duration_children.get(stage)
+        if duration_child is None:
+            duration_child = self.duration_histogram.labels(stage=stage.value)
+            self._duration_children[stage] = duration_child
+        duration_child.observe(duration_ns / 1e9)
+
+        if self.bytes_histogram is None:
+            return
+        bytes_child = self._bytes_children.get(stage)
+        if bytes_child is None:
+            bytes_child = self.bytes_histogram.labels(stage=stage.value)
+            self._bytes_children[stage] = bytes_child
+        bytes_child.observe(num_bytes)
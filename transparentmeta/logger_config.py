@@ -9,9 +9,18 @@ This module provides a utility function to configure a default logger
 for the library. In most cases, users of the library should configure their
 own logging and control output from `transparentmeta` using standard Python
 logging.
+
+It also provides a quiet mode for batch runs, which silences the per-file
+records of the library without touching the logging of the application.
 """
 
 import logging
+from typing import Optional
+
+# Level of the library logger before quiet mode was enabled, restored when
+# quiet mode is disabled.
+# pylint: disable-next=invalid-name
+_level_before_quiet_mode: Optional[int] = None
 
 
 def configure_logging(level=logging.INFO):
@@ -39,3 +48,38 @@ def configure_logging(level=logging.INFO):
         handler.setFormatter(formatter)
         logger.addHandler(handler)
         logger.setLevel(level)
+
+
+def set_quiet_mode(enabled: bool = True) -> None:
+    """Enables or disables quiet mode for the transparentmeta library.
+
+    In quiet mode, the 'transparentmeta' logger only lets warnings and
+    errors through, so the debug and info records emitted for each file are
+    discarded as soon as they're logged, without being formatted. This is
+    useful for batch runs over many files, where per-file records add
+    overhead and noise.
+
+    Disabling quiet mode restores the level the logger had before.
+
+    Args:
+        enabled (bool): True to enable quiet mode, False to disable it.
+            Defaults to True.
+    """
+    global _level_before_quiet_mode  # pylint: disable=global-statement
+    logger = logging.getLogger("transparentmeta")
+    if enabled:
+        if _level_before_quiet_mode is None:
+            _level_before_quiet_mode = logger.level
+        logger.setLevel(logging.WARNING)
+    elif _level_before_quiet_mode is not None:
+        logger.setLevel(_level_before_quiet_mode)
+        _level_before_quiet_mode = None
+
+
+def is_quiet_mode() -> bool:
+    """Checks whether quiet mode is enabled.
+
+    Returns:
+        bool: True if quiet mode is enabled, False otherwise.
+    """
+    return _level_before_quiet_mode is not None
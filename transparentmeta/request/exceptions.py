@@ -5,12 +5,13 @@
 """This module defines custom exceptions for the request component."""
 
 from pathlib import Path
+from typing import Union
 
 
 class InvalidAudioFileError(Exception):
     """Raised when an audio file is invalid or corrupted."""
 
-    def __init__(self, filepath: Path, error_message: str) -> None:
+    def __init__(self, filepath: Union[str, Path], error_message: str) -> None:
         self.filepath = filepath
         self.error_message = error_message
         super().__init__(
@@ -10,9 +10,6 @@ requests with audio files using Pydantic models.
 import os
 from pathlib import Path
 
-from mutagen.mp3 import MP3
-from mutagen.wave import WAVE
-
 from transparentmeta.request.exceptions import (
     InvalidAudioFileError,
     NoWritePermissionsError,
@@ -60,6 +57,27 @@ def validate_audio_format_is_supported(filepath: Path) -> Path:
     return filepath
 
 
+def validate_audio_format_name_is_supported(audio_format: str) -> str:
+    """Validates that an audio format name, e.g., for audio held in memory,
+    is supported.
+
+    Args:
+        audio_format (str): The audio format name, e.g., "mp3" or "wav".
+
+    Raises:
+        UnsupportedAudioFormatError: If the audio format is not supported.
+
+    Returns:
+        audio_format (str): The validated audio format in lowercase.
+    """
+    lower_audio_format = audio_format.lower()
+    if lower_audio_format not in SUPPORTED_AUDIO_FORMATS:
+        raise UnsupportedAudioFormatError(
+            audio_format, SUPPORTED_AUDIO_FORMATS
+        )
+    return lower_audio_format
+
+
 def validate_audio_file_is_functioning(filepath: Path) -> Path:
     """Validates that the audio file is a supported and correctly functioning
     audio file.
@@ -73,6 +91,15 @@ def validate_audio_file_is_functioning(filepath: Path) -> Path:
     Returns:
         filepath (Path): The validated filepath.
     """
+    # The mutagen format modules are imported here, so that importing the
+    # request models doesn't pull them in: readers and writers parse files
+    # themselves, and import them only for the formats they handle.
+    # pylint: disable-next=import-outside-toplevel
+    from mutagen.mp3 import MP3
+
+    # pylint: disable-next=import-outside-toplevel
+    from mutagen.wave import WAVE
+
     extension = get_file_extension(filepath)
     try:
         if extension == "mp3":
@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Defines the Pydantic model for handling metadata read requests on audio held
+in memory.
+
+This model is the in-memory counterpart of `ReadRequest`. There's no file
+path to validate, so it ensures that the audio format of the data is
+supported. Checking that the data is a valid, functioning audio file is left
+to the metadata reader, which parses the data anyway.
+"""
+
+from pydantic import BaseModel, field_validator
+
+from transparentmeta.request.file_validators import (
+    validate_audio_format_name_is_supported,
+)
+
+
+class ReadBytesRequest(BaseModel):
+    """Pydantic model representing a request to read metadata from audio
+    held in memory.
+
+    Attributes:
+        audio_data (bytes): The content of the audio file.
+        audio_format (str): The audio format of the data, e.g., "mp3" or
+            "wav". Validated to be supported and normalized to lowercase.
+    """
+
+    audio_data: bytes
+    audio_format: str
+
+    @field_validator("audio_format")
+    @classmethod
+    def validate_audio_format(cls, value: str) -> str:
+        """Validates that the audio format is supported.
+
+        Args:
+            value (str): The audio format.
+
+        Returns:
+            str: The validated audio format in lowercase.
+
+        Raises:
+            UnsupportedAudioFormatError: If the format is not supported.
+        """
+        return validate_audio_format_name_is_supported(value)
@@ -10,8 +10,11 @@ processing by the metadata read use case. It ensures that the given file path:
 
 1. Exists on disk,
 2. Is in a supported audio format,
-3. Is a valid, functioning audio file,
-4. Is not too large (for WAV files).
+3. Is not too large (for WAV files).
+
+Checking that the file is a valid, functioning audio file requires parsing
+it. This is left to the metadata reader, which parses the file anyway, so
+that each file is parsed only once per read.
 """
 
 from pathlib import Path
@@ -19,7 +22,6 @@ from pathlib import Path
 from pydantic import BaseModel, field_validator
 
 from transparentmeta.request.file_validators import (
-    validate_audio_file_is_functioning,
     validate_audio_format_is_supported,
     validate_file_exists,
     validate_wav_file_is_not_too_large,
@@ -32,7 +34,7 @@ class ReadRequest(BaseModel):
 
     Attributes:
         filepath (Path): Path to the audio file. Validated for existence,
-        supported format, and file integrity.
+        supported format, and size.
     """
 
     filepath: Path
@@ -46,9 +48,7 @@ class ReadRequest(BaseModel):
         Ensures that:
         1. The file exists.
         2. The file format is supported.
-        3. The file is a valid audio file.
-        4. The file is not too large (for WAV files).
-
+        3. The file is not too large (for WAV files).
 
         Args:
             value (Path): The path to the file.
@@ -59,11 +59,9 @@ class ReadRequest(BaseModel):
         Raises:
             FileNotFoundError: If the file does not exist.
             UnsupportedAudioFormatError: If the file format is not supported.
-            InvalidAudioFileError: If the file is not a functioning audio file.
             WAVTooLargeError: If the WAV file exceeds the maximum size limit.
         """
         value = validate_file_exists(value)
         value = validate_audio_format_is_supported(value)
-        value = validate_audio_file_is_functioning(value)
         value = validate_wav_file_is_not_too_large(value)
         return value
@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Defines the Pydantic model for handling metadata write requests on audio held
+in memory.
+
+This model is the in-memory counterpart of `WriteRequest`. There's no file
+path whose existence or permissions need checking, so it ensures that:
+
+1. The audio format of the data is supported,
+2. The metadata conforms to structured validation rules.
+
+Checking that the data is a valid, functioning audio file is left to the
+metadata writer, which parses the data anyway.
+"""
+
+from pydantic import BaseModel, field_validator
+
+from transparentmeta.entity.metadata import Metadata
+from transparentmeta.request.file_validators import (
+    validate_audio_format_name_is_supported,
+)
+
+
+class WriteBytesRequest(BaseModel):
+    """Pydantic model representing a request to write metadata to audio held
+    in memory.
+
+    Attributes:
+        audio_data (bytes): The content of the audio file.
+        audio_format (str): The audio format of the data, e.g., "mp3" or
+            "wav". Validated to be supported and normalized to lowercase.
+        metadata (Metadata): Metadata to be written to the audio data.
+    """
+
+    audio_data: bytes
+    audio_format: str
+    metadata: Metadata
+
+    @field_validator("audio_format")
+    @classmethod
+    def validate_audio_format(cls, value: str) -> str:
+        """Validates that the audio format is supported.
+
+        Args:
+            value (str): The audio format.
+
+        Returns:
+            str: The validated audio format in lowercase.
+
+        Raises:
+            UnsupportedAudioFormatError: If the format is not supported.
+        """
+        return validate_audio_format_name_is_supported(value)
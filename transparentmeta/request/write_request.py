@@ -10,10 +10,13 @@ processing by the metadata write use case. It ensures that:
 
 1. The file path exists,
 2. The file is in a supported audio format,
-3. The file is a valid, functioning audio file,
-4. The file has write permissions,
-5. The file is not too large (for WAV files),
-6. The metadata conforms to structured validation rules.
+3. The file has write permissions,
+4. The file is not too large (for WAV files),
+5. The metadata conforms to structured validation rules.
+
+Checking that the file is a valid, functioning audio file requires parsing
+it. This is left to the metadata writer, which parses the file anyway, so
+that each file is parsed only once per write.
 """
 
 from pathlib import Path
@@ -22,7 +25,6 @@ from pydantic import BaseModel, field_validator
 
 from transparentmeta.entity.metadata import Metadata
 from transparentmeta.request.file_validators import (
-    validate_audio_file_is_functioning,
     validate_audio_format_is_supported,
     validate_file_exists,
     validate_file_has_write_permissions,
@@ -36,7 +38,7 @@ class WriteRequest(BaseModel):
 
     Attributes:
         filepath (Path): Path to the audio file. Validated for existence,
-            supported format, integrity, and write permissions.
+            supported format, write permissions, and size.
         metadata (Metadata): Metadata to be written to the audio file.
     """
 
@@ -52,9 +54,8 @@ class WriteRequest(BaseModel):
         Ensures that:
         1. The file exists.
         2. The file format is supported.
-        3. The file is a valid audio file.
-        4. The file has write permissions.
-        5. The file is not too large (for WAV files).
+        3. The file has write permissions.
+        4. The file is not too large (for WAV files).
 
         Args:
             value (Path): The path to the file.
@@ -65,13 +66,11 @@ class WriteRequest(BaseModel):
         Raises:
             FileNotFoundError: If the file does not exist.
             UnsupportedAudioFormatError: If the format is not supported.
-            InvalidAudioFileError: If the file is not a functioning audio file.
             FilePermissionError: If the file is not writable.
             WAVTooLargeError: If the WAV file exceeds the maximum size limit.
         """
         value = validate_file_exists(value)
         value = validate_audio_format_is_supported(value)
-        value = validate_audio_file_is_functioning(value)
         value = validate_file_has_write_permissions(value)
         value = validate_wav_file_is_not_too_large(value)
         return value
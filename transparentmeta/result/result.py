@@ -42,3 +42,12 @@ class ReadResult(Result):
     """
 
     metadata: Optional[Metadata] = None
+
+
+@dataclass(frozen=True)
+class WriteResult(Result):
+    """Represents the result of a metadata write use case.
+
+    Used when writes are reported rather than raised, for example in batch
+    writes, where one failing file should not stop the others.
+    """
@@ -5,22 +5,47 @@
 """
 Exposes the main interfaces of the transparentmeta SDK for direct import from
 the `transparentmeta.sdk` package.
+
+The interfaces are imported lazily, on first access, so that importing the
+package doesn't pull in cryptography, pydantic, mutagen or asyncio until the
+code paths that need them are used.
 """
 
-from transparentmeta.sdk.factory import (
-    build_transparent_metadata_reader,
-    build_transparent_metadata_writer,
-)
-from transparentmeta.sdk.transparent_metadata_reader import (
-    TransparentMetadataReader,
-)
-from transparentmeta.sdk.transparent_metadata_writer import (
-    TransparentMetadataWriter,
-)
-
-__all__ = [
-    "TransparentMetadataWriter",
-    "TransparentMetadataReader",
-    "build_transparent_metadata_writer",
-    "build_transparent_metadata_reader",
-]
+from typing import TYPE_CHECKING
+
+from transparentmeta.utils.lazy_import_utils import build_lazy_exports
+
+if TYPE_CHECKING:
+    from transparentmeta.sdk.async_transparent_metadata_reader import (
+        AsyncTransparentMetadataReader,
+    )
+    from transparentmeta.sdk.async_transparent_metadata_writer import (
+        AsyncTransparentMetadataWriter,
+    )
+    from transparentmeta.sdk.factory import (
+        build_async_transparent_metadata_reader,
+        build_async_transparent_metadata_writer,
+        build_transparent_metadata_reader,
+        build_transparent_metadata_writer,
+    )
+    from transparentmeta.sdk.transparent_metadata_reader import (
+        TransparentMetadataReader,
+    )
+    from transparentmeta.sdk.transparent_metadata_writer import (
+        TransparentMetadataWriter,
+    )
+
+_EXPORT_MODULES = {
+    "TransparentMetadataWriter": "transparent_metadata_writer",
+    "TransparentMetadataReader": "transparent_metadata_reader",
+    "build_transparent_metadata_writer": "factory",
+    "build_transparent_metadata_reader": "factory",
+    "AsyncTransparentMetadataWriter": "async_transparent_metadata_writer",
+    "AsyncTransparentMetadataReader": "async_transparent_metadata_reader",
+    "build_async_transparent_metadata_writer": "factory",
+    "build_async_transparent_metadata_reader": "factory",
+}
+
+__all__ = list(_EXPORT_MODULES)
+
+__getattr__, __dir__ = build_lazy_exports(__name__, _EXPORT_MODULES, globals())
@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module provides the `AsyncRunner` class, which runs blocking calls of
+the SDK, i.e., audio file IO and Ed25519 signing and verification, on an
+executor, so that they don't block the asyncio event loop.
+
+It's shared by the asyncio facades of the SDK, `AsyncTransparentMetadataReader`
+and `AsyncTransparentMetadataWriter`.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import Any, Callable, Optional, TypeVar
+
+from transparentmeta.sdk.constants import DEFAULT_MAX_CONCURRENCY
+
+T = TypeVar("T")
+
+
+class AsyncRunner:
+    """Runs blocking calls on an executor, with a limit on how many of them
+    run at once.
+
+    Calls beyond the concurrency limit wait on the event loop, without
+    taking up a worker of the executor.
+
+    Attributes:
+        executor (Optional[Executor]): The executor the calls run on. If
+            None, the default executor of the event loop is used.
+        max_concurrency (int): The maximum number of calls running at once.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        """Initializes the AsyncRunner.
+
+        Args:
+            executor (Optional[Executor]): The executor the calls run on.
+                Defaults to the default executor of the event loop.
+            max_concurrency (int): The maximum number of calls running at
+                once. Defaults to 16.
+
+        Raises:
+            ValueError: If max_concurrency is lower than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {max_concurrency}"
+            )
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """Runs a blocking call on the executor and waits for its result.
+
+        Args:
+            func (Callable[..., T]): The blocking function to call.
+            *args (Any): Positional arguments passed to the function.
+            **kwargs (Any): Keyword arguments passed to the function.
+
+        Returns:
+            T: The value returned by the function.
+
+        Raises:
+            Exception: Any exception raised by the function.
+        """
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor, functools.partial(func, *args, **kwargs)
+            )
@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Asyncio SDK entry point for reading digitally signed metadata from audio
+files.
+
+The `AsyncTransparentMetadataReader` class mirrors `TransparentMetadataReader`
+for asyncio applications, e.g., web services. Reads run on an executor, so
+they don't block the event loop.
+"""
+
+import logging
+from pathlib import Path
+
+from transparentmeta.result.result import ReadResult
+from transparentmeta.sdk.async_runner import AsyncRunner
+from transparentmeta.sdk.transparent_metadata_reader import (
+    TransparentMetadataReader,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTransparentMetadataReader:
+    """Asyncio interface for reading transparency metadata from audio files.
+
+    The AsyncTransparentMetadataReader wraps a TransparentMetadataReader,
+    which does the actual reading and verification, and runs its calls with
+    an AsyncRunner. The wrapped reader is shared by all the calls.
+
+    Attributes:
+        transparent_metadata_reader (TransparentMetadataReader): The reader
+            doing the actual work.
+        async_runner (AsyncRunner): Runs the reads on an executor, with a
+            concurrency limit.
+    """
+
+    def __init__(
+        self,
+        transparent_metadata_reader: TransparentMetadataReader,
+        async_runner: AsyncRunner,
+    ) -> None:
+        """Initializes the AsyncTransparentMetadataReader.
+
+        Args:
+            transparent_metadata_reader (TransparentMetadataReader): The
+                reader doing the actual work.
+            async_runner (AsyncRunner): Runs the reads on an executor.
+        """
+        self.transparent_metadata_reader = transparent_metadata_reader
+        self.async_runner = async_runner
+
+    async def read(self, filepath: Path) -> ReadResult:
+        """Reads and verifies transparency metadata from an audio file.
+
+        Args:
+            filepath (Path): Path to the audio file from which metadata should
+                be read and verified.
+
+        Returns:
+            ReadResult: Contains the extracted metadata, validation status,
+                and any related error information.
+        """
+        logger.debug("Scheduling metadata read for file: %s", filepath)
+        return await self.async_runner.run(
+            self.transparent_metadata_reader.read, filepath
+        )
+
+    async def read_bytes(
+        self, audio_data: bytes, audio_format: str
+    ) -> ReadResult:
+        """Reads and verifies transparency metadata from audio held in memory.
+
+        Args:
+            audio_data (bytes): The content of the audio file.
+            audio_format (str): The audio format of the data (e.g., 'mp3',
+                'wav', 'wave').
+
+        Returns:
+            ReadResult: Contains the extracted metadata, validation status,
+                and any related error information.
+        """
+        logger.debug(
+            "Scheduling metadata read for in-memory %s audio", audio_format
+        )
+        return await self.async_runner.run(
+            self.transparent_metadata_reader.read_bytes,
+            audio_data,
+            audio_format,
+        )
@@ -0,0 +1,90 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Asyncio SDK entry point for writing digitally signed metadata to audio files.
+
+The `AsyncTransparentMetadataWriter` class mirrors `TransparentMetadataWriter`
+for asyncio applications, e.g., upload handlers of a web service. Signing
+and tagging run on an executor, so they don't block the event loop.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict
+
+from transparentmeta.sdk.async_runner import AsyncRunner
+from transparentmeta.sdk.transparent_metadata_writer import (
+    TransparentMetadataWriter,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTransparentMetadataWriter:
+    """Asyncio interface for writing transparency metadata to audio files.
+
+    The AsyncTransparentMetadataWriter wraps a TransparentMetadataWriter,
+    which does the actual signing and writing, and runs its calls with an
+    AsyncRunner. The wrapped writer is shared by all the calls.
+
+    Attributes:
+        transparent_metadata_writer (TransparentMetadataWriter): The writer
+            doing the actual work.
+        async_runner (AsyncRunner): Runs the writes on an executor, with a
+            concurrency limit.
+    """
+
+    def __init__(
+        self,
+        transparent_metadata_writer: TransparentMetadataWriter,
+        async_runner: AsyncRunner,
+    ) -> None:
+        """Initializes the AsyncTransparentMetadataWriter.
+
+        Args:
+            transparent_metadata_writer (TransparentMetadataWriter): The
+                writer doing the actual work.
+            async_runner (AsyncRunner): Runs the writes on an executor.
+        """
+        self.transparent_metadata_writer = transparent_metadata_writer
+        self.async_runner = async_runner
+
+    async def write(self, filepath: Path, metadata: Dict) -> None:
+        """Writes signed transparency metadata to an audio file.
+
+        Args:
+            filepath (Path): Path to the target audio file (e.g., 'track.mp3').
+            metadata (Dict): A dictionary of metadata fields, as accepted by
+                `TransparentMetadataWriter.write`.
+        """
+        logger.debug("Scheduling metadata write for file: %s", filepath)
+        await self.async_runner.run(
+            self.transparent_metadata_writer.write, filepath, metadata
+        )
+
+    async def write_bytes(
+        self, audio_data: bytes, audio_format: str, metadata: Dict
+    ) -> bytes:
+        """Writes signed transparency metadata to audio held in memory.
+
+        Args:
+            audio_data (bytes): The content of the audio file.
+            audio_format (str): The audio format of the data (e.g., 'mp3',
+                'wav', 'wave').
+            metadata (Dict): A dictionary of metadata fields, as accepted by
+                `TransparentMetadataWriter.write`.
+
+        Returns:
+            bytes: The content of the audio file with the signed metadata.
+        """
+        logger.debug(
+            "Scheduling metadata write for in-memory %s audio", audio_format
+        )
+        return await self.async_runner.run(
+            self.transparent_metadata_writer.write_bytes,
+            audio_data,
+            audio_format,
+            metadata,
+        )
@@ -0,0 +1,9 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Module featuring constants for the sdk package.
+"""
+
+DEFAULT_MAX_CONCURRENCY: int = 16
@@ -14,33 +14,84 @@ transparentmeta.
 """
 
 import logging
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Optional
 
 from cryptography.hazmat.primitives.asymmetric.ed25519 import (
     Ed25519PrivateKey,
     Ed25519PublicKey,
 )
 
+from transparentmeta.crypto.content_hasher import ContentHasher
+from transparentmeta.instrumentation.instrumentation import Instrumentation
+from transparentmeta.sdk.constants import DEFAULT_MAX_CONCURRENCY
 from transparentmeta.sdk.transparent_metadata_reader import (
     TransparentMetadataReader,
 )
 from transparentmeta.sdk.transparent_metadata_writer import (
     TransparentMetadataWriter,
 )
+from transparentmeta.serialization.metadata_serializer import MetadataFormat
 from transparentmeta.use_case.read.factory import build_read_use_case
-from transparentmeta.use_case.read.reader_selector import ReaderSelector
-from transparentmeta.use_case.write.factory import build_write_use_case
+from transparentmeta.use_case.read.read_result_cache import ReadResultCache
+from transparentmeta.use_case.read.reader_selector import (
+    ReaderSelector,
+    metadata_reader_registry,
+    tag_only_metadata_reader_registry,
+)
+from transparentmeta.use_case.write.factory import (
+    build_metadata_writer_registry,
+    build_write_use_case,
+)
+from transparentmeta.use_case.write.padding_policy import PaddingPolicy
 from transparentmeta.use_case.write.writer_selector import WriterSelector
 
+if TYPE_CHECKING:
+    from transparentmeta.sdk.async_transparent_metadata_reader import (
+        AsyncTransparentMetadataReader,
+    )
+    from transparentmeta.sdk.async_transparent_metadata_writer import (
+        AsyncTransparentMetadataWriter,
+    )
+
 logger = logging.getLogger(__name__)
 
 
+# The options of the factories are independent and all have defaults, so
+# they're keyword-only rather than grouped in an object users must build.
+# pylint: disable-next=too-many-arguments
 def build_transparent_metadata_writer(
     private_key: Ed25519PrivateKey,
+    *,
+    padding_policy: PaddingPolicy = PaddingPolicy(),
+    instrumentation: Optional[Instrumentation] = None,
+    metadata_format: MetadataFormat = MetadataFormat.JSON,
+    content_hasher: Optional[ContentHasher] = None,
+    atomic: bool = False,
 ) -> TransparentMetadataWriter:
     """Creates an instance of TransparentWriter with all dependencies resolved.
 
     Args:
         private_key (Ed25519PrivateKey): The private key used for signing.
+        padding_policy (PaddingPolicy): Decides how much padding to reserve
+            in ID3 tags, so that rewriting metadata later, e.g., to re-sign
+            it, happens in place. Defaults to reserving 4KB.
+        instrumentation (Optional[Instrumentation]): If given, receives the
+            timings of the stages of each write, e.g., to feed Prometheus
+            histograms or OpenTelemetry spans. Defaults to None.
+        metadata_format (MetadataFormat): The format metadata is written in.
+            JSON is stored as text in a TXXX frame. BINARY is a compact,
+            canonical encoding stored in a PRIV frame, which makes tags
+            smaller. Readers detect the format automatically. Defaults to
+            JSON.
+        content_hasher (Optional[ContentHasher]): If given, the hash of the
+            audio payload of each file is included in its signed metadata,
+            which binds the metadata to the audio. Readers check it
+            automatically. Defaults to None.
+        atomic (bool): If True, each file is replaced atomically by a
+            tagged copy, made with a reflink where the file system supports
+            it, rather than edited in place. A crash then never leaves a
+            file half-written. Defaults to False.
 
     Returns:
         transparent_metadata_writer (TransparentMetadataWriter): An instance
@@ -50,12 +101,20 @@ def build_transparent_metadata_writer(
         "Building TransparentMetadataWriter instance with provided private key"
     )
 
-    writer_selector = WriterSelector()
+    writer_selector = WriterSelector(
+        build_metadata_writer_registry(
+            padding_policy=padding_policy, atomic=atomic
+        )
+    )
     logger.debug("WriterSelector instance created ")
 
     write_use_case = build_write_use_case(
         private_key,
         "mp3",
+        padding_policy=padding_policy,
+        instrumentation=instrumentation,
+        metadata_format=metadata_format,
+        content_hasher=content_hasher,
     )
 
     transparent_metadata_writer = TransparentMetadataWriter(
@@ -68,12 +127,25 @@ def build_transparent_metadata_writer(
 
 def build_transparent_metadata_reader(
     public_key: Ed25519PublicKey,
+    *,
+    tag_only: bool = False,
+    read_result_cache: Optional[ReadResultCache] = None,
+    instrumentation: Optional[Instrumentation] = None,
 ) -> TransparentMetadataReader:
     """Creates an instance of TransparentReader with all dependencies resolved.
 
     Args:
         public_key (Ed25519PrivateKey): The public key used for signature
             verification.
+        tag_only (bool): If True, the reader parses only the ID3 tags of the
+            audio files, without scanning the audio stream. This is faster,
+            but it doesn't check that the audio stream is functioning.
+            Defaults to False.
+        read_result_cache (Optional[ReadResultCache]): If given, results of
+            file reads are cached, and files that haven't changed since they
+            were last read aren't read again. Defaults to None.
+        instrumentation (Optional[Instrumentation]): If given, receives the
+            timings of the stages of each read. Defaults to None.
 
     Returns:
         transparent_metadata_reader (TransparentMetadataReader): An instance
@@ -84,12 +156,19 @@ def build_transparent_metadata_reader(
         "public key"
     )
 
-    reader_selector = ReaderSelector()
+    reader_selector = ReaderSelector(
+        tag_only_metadata_reader_registry
+        if tag_only
+        else metadata_reader_registry
+    )
     logger.debug("ReaderSelector instance created")
 
     read_use_case = build_read_use_case(
         public_key,
         "mp3",
+        tag_only=tag_only,
+        read_result_cache=read_result_cache,
+        instrumentation=instrumentation,
     )
 
     transparent_metadata_reader = TransparentMetadataReader(
@@ -98,3 +177,124 @@ def build_transparent_metadata_reader(
     logger.info("TransparentMetadataReader instance created")
 
     return transparent_metadata_reader
+
+
+# Keyword-only options, like those of the synchronous factory.
+# pylint: disable-next=too-many-arguments
+def build_async_transparent_metadata_writer(
+    private_key: Ed25519PrivateKey,
+    *,
+    padding_policy: PaddingPolicy = PaddingPolicy(),
+    executor: Optional[Executor] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    instrumentation: Optional[Instrumentation] = None,
+    metadata_format: MetadataFormat = MetadataFormat.JSON,
+    content_hasher: Optional[ContentHasher] = None,
+    atomic: bool = False,
+) -> "AsyncTransparentMetadataWriter":
+    """Creates an instance of AsyncTransparentMetadataWriter with all
+    dependencies resolved.
+
+    Args:
+        private_key (Ed25519PrivateKey): The private key used for signing.
+        padding_policy (PaddingPolicy): Decides how much padding to reserve
+            in ID3 tags. Defaults to reserving 4KB.
+        executor (Optional[Executor]): The executor writes run on. It must
+            be a thread pool, since the writer is shared by all writes.
+            Defaults to the default executor of the event loop.
+        max_concurrency (int): The maximum number of writes running at once.
+            Defaults to 16.
+        instrumentation (Optional[Instrumentation]): Receives the timings of
+            the stages of each write. Defaults to None.
+        metadata_format (MetadataFormat): The format metadata is written in.
+            Defaults to JSON.
+        content_hasher (Optional[ContentHasher]): If given, binds the
+            metadata to the audio with a content hash. Defaults to None.
+        atomic (bool): If True, files are replaced atomically by a tagged
+            copy, rather than edited in place. Defaults to False.
+
+    Returns:
+        async_transparent_metadata_writer (AsyncTransparentMetadataWriter):
+            An instance of AsyncTransparentMetadataWriter ready to be used
+            for metadata writing in asyncio applications.
+    """
+    # The asyncio facades are imported here, so that synchronous code paths
+    # don't pay for importing asyncio.
+    # pylint: disable-next=import-outside-toplevel
+    from transparentmeta.sdk.async_runner import AsyncRunner
+
+    # pylint: disable-next=import-outside-toplevel
+    from transparentmeta.sdk.async_transparent_metadata_writer import (
+        AsyncTransparentMetadataWriter,
+    )
+
+    transparent_metadata_writer = build_transparent_metadata_writer(
+        private_key,
+        padding_policy=padding_policy,
+        instrumentation=instrumentation,
+        metadata_format=metadata_format,
+        content_hasher=content_hasher,
+        atomic=atomic,
+    )
+    async_transparent_metadata_writer = AsyncTransparentMetadataWriter(
+        transparent_metadata_writer, AsyncRunner(executor, max_concurrency)
+    )
+    logger.info("AsyncTransparentMetadataWriter instance created")
+
+    return async_transparent_metadata_writer
+
+
+# Keyword-only options, like those of the synchronous factory.
+# pylint: disable-next=too-many-arguments
+def build_async_transparent_metadata_reader(
+    public_key: Ed25519PublicKey,
+    *,
+    tag_only: bool = False,
+    read_result_cache: Optional[ReadResultCache] = None,
+    executor: Optional[Executor] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    instrumentation: Optional[Instrumentation] = None,
+) -> "AsyncTransparentMetadataReader":
+    """Creates an instance of AsyncTransparentMetadataReader with all
+    dependencies resolved.
+
+    Args:
+        public_key (Ed25519PublicKey): The public key used for signature
+            verification.
+        tag_only (bool): If True, the reader parses only the ID3 tags of the
+            audio files. Defaults to False.
+        read_result_cache (Optional[ReadResultCache]): Cache of read results
+            for unchanged files. Defaults to None, i.e., no caching.
+        executor (Optional[Executor]): The executor reads run on. It must be
+            a thread pool, since the reader is shared by all reads. Defaults
+            to the default executor of the event loop.
+        max_concurrency (int): The maximum number of reads running at once.
+            Defaults to 16.
+        instrumentation (Optional[Instrumentation]): Receives the timings of
+            the stages of each read. Defaults to None.
+
+    Returns:
+        async_transparent_metadata_reader (AsyncTransparentMetadataReader):
+            An instance of AsyncTransparentMetadataReader ready to be used
+            for metadata reading in asyncio applications.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from transparentmeta.sdk.async_runner import AsyncRunner
+
+    # pylint: disable-next=import-outside-toplevel
+    from transparentmeta.sdk.async_transparent_metadata_reader import (
+        AsyncTransparentMetadataReader,
+    )
+
+    transparent_metadata_reader = build_transparent_metadata_reader(
+        public_key,
+        tag_only=tag_only,
+        read_result_cache=read_result_cache,
+        instrumentation=instrumentation,
+    )
+    async_transparent_metadata_reader = AsyncTransparentMetadataReader(
+        transparent_metadata_reader, AsyncRunner(executor, max_concurrency)
+    )
+    logger.info("AsyncTransparentMetadataReader instance created")
+
+    return async_transparent_metadata_reader
@@ -8,19 +8,54 @@ SDK entry point for reading digitally signed metadata from audio files.
 The `TransparentMetadataReader` class acts as a user-facing API that handles
 deserialization and signature verification of metadata embedded in MP3 or
 WAV files through a single method call.
+
+It also supports batch reads, where many files are read and verified in
+parallel across a pool of worker threads or processes, and reads from audio
+held in memory, which never touch the disk.
 """
 
 import logging
+import threading
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, Literal, Optional, Union
 
+from transparentmeta.crypto.content_hasher import ContentHasher
+from transparentmeta.crypto.key_management import (
+    convert_public_key_to_hex,
+    load_public_key_from_hex_string,
+)
+from transparentmeta.crypto.signature_verifier import SignatureVerifier
+from transparentmeta.instrumentation.instrumentation import Stage, run_stage
+from transparentmeta.request.read_bytes_request import ReadBytesRequest
 from transparentmeta.request.read_request import ReadRequest
 from transparentmeta.result.result import ReadResult
+from transparentmeta.serialization.metadata_serializer import (
+    MetadataSerializer,
+)
+from transparentmeta.use_case.read.metadata_reader import MetadataReader
 from transparentmeta.use_case.read.read_use_case import ReadUseCase
 from transparentmeta.use_case.read.reader_selector import ReaderSelector
-from transparentmeta.utils.file_utils import get_file_extension
+from transparentmeta.utils.file_utils import (
+    IN_MEMORY_AUDIO_NAME,
+    get_file_extension,
+    get_file_size,
+)
 
 logger = logging.getLogger(__name__)
 
+ReadBackend = Literal["thread", "process"]
+
+# Reader used by each worker of a batch read. It's set once per worker by the
+# pool initializer and stored per thread, which works for both backends since
+# process workers run their tasks on their main thread.
+_worker_state = threading.local()
+
 
 class TransparentMetadataReader:
     """High-level interface for reading transparency metadata from audio files.
@@ -30,6 +65,9 @@ class TransparentMetadataReader:
     It delegates verification to the ReadUseCase and uses a ReaderSelector to
     choose the appropriate metadata reader based on file extension.
 
+    The chosen metadata reader is passed to the ReadUseCase for each read,
+    rather than stored on it, so one instance can be shared across threads.
+
     Attributes:
         read_use_case (ReadUseCase): Handles deserialization and signature
             verification.
@@ -68,21 +106,146 @@ class TransparentMetadataReader:
         """
         logger.info("Starting metadata read for file: %s", filepath)
 
-        read_request = ReadRequest(filepath=filepath)
+        read_request = run_stage(
+            self.read_use_case.instrumentation,
+            Stage.VALIDATE,
+            filepath,
+            lambda _: get_file_size(Path(filepath)),
+            lambda: ReadRequest(filepath=filepath),
+        )
         read_result = self._read_metadata(read_request)
 
         self._log_read_outcome(filepath, read_result)
         return read_result
 
+    def read_bytes(self, audio_data: bytes, audio_format: str) -> ReadResult:
+        """Reads and verifies transparency metadata from audio held in memory.
+
+        This is the in-memory counterpart of `read`, for audio that doesn't
+        live on disk, e.g., audio just downloaded or generated.
+
+        Args:
+            audio_data (bytes): The content of the audio file.
+            audio_format (str): The audio format of the data (e.g., 'mp3',
+                'wav', 'wave').
+
+        Returns:
+            ReadResult: Contains the extracted metadata, validation status,
+                and any related error information.
+        """
+        logger.info(
+            "Starting metadata read for in-memory %s audio", audio_format
+        )
+
+        read_bytes_request = run_stage(
+            self.read_use_case.instrumentation,
+            Stage.VALIDATE,
+            IN_MEMORY_AUDIO_NAME,
+            lambda _: len(audio_data),
+            lambda: ReadBytesRequest(
+                audio_data=audio_data, audio_format=audio_format
+            ),
+        )
+        metadata_reader = self.reader_selector.get_reader(
+            read_bytes_request.audio_format
+        )
+        read_result = self.read_use_case.read_bytes(
+            read_bytes_request, metadata_reader
+        )
+
+        self._log_read_outcome(IN_MEMORY_AUDIO_NAME, read_result)
+        return read_result
+
+    def read_many(
+        self,
+        filepaths: Iterable[Path],
+        workers: Optional[int] = None,
+        backend: ReadBackend = "thread",
+    ) -> Iterator[ReadResult]:
+        """Reads and verifies transparency metadata from many audio files in
+        parallel.
+
+        Results are streamed back through a generator as soon as they are
+        available, in the same order as the input file paths. Failures don't
+        interrupt the batch: they are reported in the corresponding result.
+
+        Args:
+            filepaths (Iterable[Path]): Paths to the audio files to read.
+            workers (Optional[int]): Number of workers. Defaults to the
+                executor's default for the chosen backend.
+            backend (Literal["thread", "process"]): "thread" runs workers in
+                a thread pool, which is cheap to start. "process" runs workers
+                in a process pool, where each worker rebuilds the reader once
+                from the public key, the metadata readers, the metadata
+                serializer and the content hasher of this reader, so that it
+                verifies files the same way. Defaults to "thread".
+
+        Returns:
+            Iterator[ReadResult]: A generator yielding one result per file
+                path.
+
+        Raises:
+            ValueError: If the backend is not supported, or if the backend
+                is "process" and the reader has a read result cache or an
+                instrumentation, which can't be carried into worker
+                processes.
+        """
+        executor = self._build_executor(workers, backend)
+        logger.info("Starting batch metadata read with %s backend", backend)
+        return self._stream_read_results(executor, filepaths)
+
+    def _build_executor(
+        self, workers: Optional[int], backend: ReadBackend
+    ) -> Executor:
+        if backend == "thread":
+            return ThreadPoolExecutor(
+                max_workers=workers,
+                initializer=_initialize_thread_worker,
+                initargs=(self,),
+            )
+        if backend == "process":
+            read_use_case = self.read_use_case
+            # Caches and instrumentations hold state of this process, e.g.,
+            # locks and metrics, that worker processes wouldn't share.
+            if (
+                read_use_case.read_result_cache is not None
+                or read_use_case.instrumentation is not None
+            ):
+                raise ValueError(
+                    "Readers with a read result cache or an instrumentation "
+                    "can't read in worker processes: use the thread backend"
+                )
+            public_key_hex = convert_public_key_to_hex(
+                read_use_case.signature_verifier.public_key
+            )
+            metadata_readers = dict(self.reader_selector.metadata_readers)
+            return ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_initialize_process_worker,
+                initargs=(
+                    public_key_hex,
+                    metadata_readers,
+                    read_use_case.metadata_serializer,
+                    read_use_case.content_hasher,
+                ),
+            )
+        raise ValueError(f"Unsupported read backend: {backend}")
+
+    @staticmethod
+    def _stream_read_results(
+        executor: Executor, filepaths: Iterable[Path]
+    ) -> Iterator[ReadResult]:
+        with executor:
+            yield from executor.map(_read_in_worker, filepaths)
+        logger.info("Batch metadata read completed")
+
     def _read_metadata(self, read_request: ReadRequest) -> ReadResult:
         extension = get_file_extension(read_request.filepath)
-        self.read_use_case.metadata_reader = self.reader_selector.get_reader(
-            extension
-        )
-        return self.read_use_case.read(read_request)
+        metadata_reader = self.reader_selector.get_reader(extension)
+        return self.read_use_case.read(read_request, metadata_reader)
 
     def _log_read_outcome(
-        self, filepath: Path, read_result: ReadResult
+        self, filepath: Union[str, Path], read_result: ReadResult
     ) -> None:
         if not read_result.is_success:
             logger.info(
@@ -92,3 +255,37 @@ class TransparentMetadataReader:
             )
         else:
             logger.info("Successfully read metadata from file: %s", filepath)
+
+
+def _initialize_thread_worker(reader: TransparentMetadataReader) -> None:
+    # The reader is stateless across reads, so all the threads share it.
+    _worker_state.reader = reader
+
+
+def _initialize_process_worker(
+    public_key_hex: str,
+    metadata_readers: Dict[str, MetadataReader],
+    metadata_serializer: MetadataSerializer,
+    content_hasher: ContentHasher,
+) -> None:
+    # Metadata readers, e.g., tag-only readers, and the other collaborators
+    # of the use case are shipped to the workers, so that they verify files
+    # with the same configuration as the reader of the parent process.
+    public_key = load_public_key_from_hex_string(public_key_hex)
+    read_use_case = ReadUseCase(
+        next(iter(metadata_readers.values())),
+        SignatureVerifier(public_key),
+        metadata_serializer,
+        content_hasher=content_hasher,
+    )
+    _worker_state.reader = TransparentMetadataReader(
+        read_use_case, ReaderSelector(MappingProxyType(metadata_readers))
+    )
+
+
+def _read_in_worker(filepath: Path) -> ReadResult:
+    try:
+        return _worker_state.reader.read(filepath)
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        logger.info("Metadata read failed for file %s: %s", filepath, err)
+        return ReadResult(is_success=False, error=str(err))
@@ -10,20 +10,49 @@ high-level orchestrator for embedding transparency metadata into
 AI-generated audio content (e.g., MP3 or WAV). It handles metadata
 preparation, format-specific writer selection, and invocation of the
 underlying write use case.
+
+It also supports batch writes, where many files are tagged in parallel
+across a pool of worker processes, and writes to audio held in memory, which
+never touch the disk.
 """
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
+from transparentmeta.crypto.content_hasher import ContentHasher
+from transparentmeta.crypto.key_management import (
+    convert_private_key_to_hex,
+    load_private_key_from_hex_string,
+)
 from transparentmeta.entity.metadata import Metadata
+from transparentmeta.instrumentation.instrumentation import Stage, run_stage
+from transparentmeta.request.write_bytes_request import WriteBytesRequest
 from transparentmeta.request.write_request import WriteRequest
+from transparentmeta.result.result import WriteResult
+from transparentmeta.serialization.metadata_serializer import MetadataFormat
+from transparentmeta.use_case.write.factory import build_write_use_case
+from transparentmeta.use_case.write.metadata_writer import MetadataWriter
 from transparentmeta.use_case.write.write_use_case import WriteUseCase
 from transparentmeta.use_case.write.writer_selector import WriterSelector
-from transparentmeta.utils.file_utils import get_file_extension
+from transparentmeta.utils.file_utils import (
+    IN_MEMORY_AUDIO_NAME,
+    get_file_extension,
+    get_file_size,
+)
 
 logger = logging.getLogger(__name__)
 
+WriteItem = Tuple[Path, Dict]
+
+# Writer owned by each worker process of a batch write. It's built once per
+# process by `_initialize_worker`, so the signer isn't rebuilt for each file.
+# pylint: disable-next=invalid-name
+_worker_writer: Optional["TransparentMetadataWriter"] = None
+
 
 class TransparentMetadataWriter:
     """High-level interface for writing transparency metadata to audio files.
@@ -33,6 +62,9 @@ class TransparentMetadataWriter:
     the WriteUseCase and uses a WriterSelector to choose the appropriate
     metadata writer based on file extension.
 
+    Writes don't modify the instance, so it's safe to call `write` from
+    many threads at once.
+
     Attributes:
         write_use_case (WriteUseCase): Handles signing and writing of metadata.
         writer_selector (WriterSelector): Resolves the appropriate writer for
@@ -83,8 +115,14 @@ class TransparentMetadataWriter:
         """
         logger.info("Starting metadata write for file: %s", filepath)
 
-        write_request = WriteRequest(
-            filepath=filepath, metadata=Metadata(**metadata)
+        write_request = run_stage(
+            self.write_use_case.instrumentation,
+            Stage.VALIDATE,
+            filepath,
+            lambda _: get_file_size(Path(filepath)),
+            lambda: WriteRequest(
+                filepath=filepath, metadata=Metadata(**metadata)
+            ),
         )
         self._write_metadata(write_request)
 
@@ -92,9 +130,186 @@ class TransparentMetadataWriter:
             "Successfully wrote metadata with signature to file: %s", filepath
         )
 
+    def write_bytes(
+        self, audio_data: bytes, audio_format: str, metadata: Dict
+    ) -> bytes:
+        """Writes signed transparency metadata to audio held in memory.
+
+        This is the in-memory counterpart of `write`, for audio that doesn't
+        live on disk, e.g., audio just generated that is about to be
+        uploaded. The input data is left untouched.
+
+        Args:
+            audio_data (bytes): The content of the audio file.
+            audio_format (str): The audio format of the data (e.g., 'mp3',
+                'wav', 'wave').
+            metadata (Dict): A dictionary of metadata fields, as accepted by
+                `write`.
+
+        Returns:
+            bytes: The content of the audio file with the signed metadata.
+        """
+        logger.info(
+            "Starting metadata write for in-memory %s audio", audio_format
+        )
+
+        write_bytes_request = run_stage(
+            self.write_use_case.instrumentation,
+            Stage.VALIDATE,
+            IN_MEMORY_AUDIO_NAME,
+            lambda _: len(audio_data),
+            lambda: WriteBytesRequest(
+                audio_data=audio_data,
+                audio_format=audio_format,
+                metadata=Metadata(**metadata),
+            ),
+        )
+        metadata_writer = self.writer_selector.get_writer(
+            write_bytes_request.audio_format
+        )
+        tagged_audio_data = self.write_use_case.write_bytes(
+            write_bytes_request, metadata_writer
+        )
+
+        logger.info(
+            "Successfully wrote metadata with signature to in-memory audio"
+        )
+        return tagged_audio_data
+
+    def write_many(
+        self, items: Iterable[WriteItem], workers: Optional[int] = None
+    ) -> List[WriteResult]:
+        """Writes signed transparency metadata to many audio files in
+        parallel.
+
+        The files are distributed across a pool of worker processes. Each
+        worker rebuilds the writer from the private key and the metadata
+        writers once, when it starts, and then reuses it for all the files
+        it processes. Failures don't interrupt the batch: they are reported
+        in the corresponding result. Since files are written in other
+        processes, the instrumentation of the writer, if any, isn't called.
+
+        Args:
+            items (Iterable[Tuple[Path, Dict]]): Pairs of audio file path and
+                metadata dictionary, as accepted by `write`.
+            workers (Optional[int]): Number of worker processes. Defaults to
+                the number of CPUs on the machine.
+
+        Returns:
+            List[WriteResult]: One result per item, in the same order as the
+                input items.
+        """
+        write_results = list(self.iter_write_many(items, workers))
+        self._log_batch_outcome(write_results)
+        return write_results
+
+    def iter_write_many(
+        self, items: Iterable[WriteItem], workers: Optional[int] = None
+    ) -> Iterator[WriteResult]:
+        """Writes signed transparency metadata to many audio files in
+        parallel, streaming the results back.
+
+        This works like `write_many`, but results are yielded through a
+        generator as soon as they are available, in the same order as the
+        input items, e.g., to report progress on long batches.
+
+        Args:
+            items (Iterable[Tuple[Path, Dict]]): Pairs of audio file path and
+                metadata dictionary, as accepted by `write`.
+            workers (Optional[int]): Number of worker processes. Defaults to
+                the number of CPUs on the machine.
+
+        Returns:
+            Iterator[WriteResult]: A generator yielding one result per item.
+        """
+        items = list(items)
+        workers = workers or os.cpu_count() or 1
+        logger.info(
+            "Starting batch metadata write for %d files with %d workers",
+            len(items),
+            workers,
+        )
+
+        private_key_hex = convert_private_key_to_hex(
+            self.write_use_case.signer.private_key
+        )
+        metadata_writers = dict(self.writer_selector.metadata_writers)
+        metadata_format = (
+            self.write_use_case.metadata_serializer.metadata_format
+        )
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_initialize_worker,
+            initargs=(
+                private_key_hex,
+                metadata_writers,
+                metadata_format,
+                self.write_use_case.content_hasher,
+            ),
+        )
+        chunksize = self._get_chunksize(len(items), workers)
+        return self._stream_write_results(executor, items, chunksize)
+
     def _write_metadata(self, write_request: WriteRequest) -> None:
         extension = get_file_extension(write_request.filepath)
-        self.write_use_case.metadata_writer = self.writer_selector.get_writer(
-            extension
+        metadata_writer = self.writer_selector.get_writer(extension)
+        self.write_use_case.write(write_request, metadata_writer)
+
+    @staticmethod
+    def _stream_write_results(
+        executor: ProcessPoolExecutor, items: List[WriteItem], chunksize: int
+    ) -> Iterator[WriteResult]:
+        with executor:
+            yield from executor.map(
+                _write_in_worker, items, chunksize=chunksize
+            )
+
+    @staticmethod
+    def _get_chunksize(number_of_items: int, workers: int) -> int:
+        # Sending a few chunks to each worker keeps the load balanced while
+        # cutting the inter-process overhead of one message per file.
+        return max(1, number_of_items // (workers * 4))
+
+    @staticmethod
+    def _log_batch_outcome(write_results: List[WriteResult]) -> None:
+        number_of_failures = sum(
+            1 for write_result in write_results if not write_result.is_success
         )
-        self.write_use_case.write(write_request)
+        logger.info(
+            "Batch metadata write completed. Succeeded: %d. Failed: %d",
+            len(write_results) - number_of_failures,
+            number_of_failures,
+        )
+
+
+def _initialize_worker(
+    private_key_hex: str,
+    metadata_writers: Dict[str, MetadataWriter],
+    metadata_format: MetadataFormat = MetadataFormat.JSON,
+    content_hasher: Optional[ContentHasher] = None,
+) -> None:
+    # Metadata writers, the metadata format and the content hasher are
+    # shipped to the workers, so that they write files like the writer of
+    # the parent process.
+    global _worker_writer  # pylint: disable=global-statement
+    private_key = load_private_key_from_hex_string(private_key_hex)
+    _worker_writer = TransparentMetadataWriter(
+        build_write_use_case(
+            private_key,
+            "mp3",
+            metadata_format=metadata_format,
+            content_hasher=content_hasher,
+        ),
+        WriterSelector(MappingProxyType(metadata_writers)),
+    )
+
+
+def _write_in_worker(item: WriteItem) -> WriteResult:
+    assert _worker_writer is not None
+    filepath, metadata = item
+    try:
+        _worker_writer.write(filepath, metadata)
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        logger.info("Metadata write failed for file %s: %s", filepath, err)
+        return WriteResult(is_success=False, error=str(err))
+    return WriteResult(is_success=True)
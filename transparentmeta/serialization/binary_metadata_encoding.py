@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module provides the compact binary encoding of `Metadata`, an
+alternative to JSON that makes tags about three times smaller.
+
+Metadata is encoded as a canonical CBOR map with small integer keys instead
+of field names. The AI usage level is encoded as an integer code, and the
+creation time as an integer number of microseconds since the Unix epoch,
+plus the UTC offset in seconds for timezone-aware times. Since the encoding
+is canonical, the same metadata always has the same encoding, regardless of
+the order of the keys of `additional_info`.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+
+from transparentmeta.entity.metadata import AIUsageLevel, Metadata
+from transparentmeta.serialization import canonical_cbor
+from transparentmeta.serialization.exceptions import InvalidCBORDataError
+
+BINARY_METADATA_VERSION = 1
+
+_VERSION_KEY = 0
+_COMPANY_KEY = 1
+_MODEL_KEY = 2
+_CREATED_AT_KEY = 3
+_UTC_OFFSET_KEY = 4
+_AI_USAGE_LEVEL_KEY = 5
+_CONTENT_ID_KEY = 6
+_USER_ID_KEY = 7
+_PRIVATE_KEY_ID_KEY = 8
+_ADDITIONAL_INFO_KEY = 9
+_CONTENT_HASH_KEY = 10
+
+# Codes are part of the format: new levels must get new codes.
+_AI_USAGE_LEVEL_CODES = {
+    AIUsageLevel.AI_GENERATED: 0,
+    AIUsageLevel.AI_ASSISTED: 1,
+    AIUsageLevel.HUMAN_CREATED: 2,
+}
+_AI_USAGE_LEVELS_BY_CODE: Dict[Any, AIUsageLevel] = {
+    code: ai_usage_level
+    for ai_usage_level, code in _AI_USAGE_LEVEL_CODES.items()
+}
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def encode_metadata(metadata: Metadata) -> bytes:
+    """Encodes metadata to its compact binary form.
+
+    Args:
+        metadata (Metadata): The metadata to encode.
+
+    Returns:
+        bytes: The canonical CBOR encoding of the metadata.
+    """
+    created_at = metadata.created_at
+    utc_offset = created_at.utcoffset()
+    if utc_offset is not None:
+        created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+
+    encoded_fields: Dict[int, Any] = {
+        _VERSION_KEY: BINARY_METADATA_VERSION,
+        _COMPANY_KEY: metadata.company,
+        _MODEL_KEY: metadata.model,
+        _CREATED_AT_KEY: (created_at - _EPOCH) // _MICROSECOND,
+        _AI_USAGE_LEVEL_KEY: _AI_USAGE_LEVEL_CODES[metadata.ai_usage_level],
+        _CONTENT_ID_KEY: metadata.content_id,
+        _USER_ID_KEY: metadata.user_id,
+        _PRIVATE_KEY_ID_KEY: metadata.private_key_id,
+    }
+    if utc_offset is not None:
+        encoded_fields[_UTC_OFFSET_KEY] = utc_offset // timedelta(seconds=1)
+    if metadata.additional_info is not None:
+        # Values are converted to their JSON form, e.g., datetimes to
+        # strings, as they would be by the JSON encoding.
+        encoded_fields[_ADDITIONAL_INFO_KEY] = metadata.model_dump(
+            mode="json", include={"additional_info"}
+        )["additional_info"]
+    if metadata.content_hash is not None:
+        encoded_fields[_CONTENT_HASH_KEY] = metadata.content_hash
+    return canonical_cbor.encode(encoded_fields)
+
+
+def decode_metadata(data: bytes) -> Metadata:
+    """Decodes metadata from its compact binary form.
+
+    Args:
+        data (bytes): The canonical CBOR encoding of the metadata.
+
+    Returns:
+        Metadata: The decoded metadata.
+
+    Raises:
+        InvalidCBORDataError: If the data is not the CBOR encoding of a map,
+            or has an unsupported version.
+        pydantic.ValidationError: If the decoded fields are not valid
+            metadata.
+    """
+    encoded_fields = canonical_cbor.decode(data)
+    if not isinstance(encoded_fields, dict):
+        raise InvalidCBORDataError("Binary metadata must be a CBOR map")
+    version = encoded_fields.get(_VERSION_KEY)
+    if version != BINARY_METADATA_VERSION:
+        raise InvalidCBORDataError(
+            f"Unsupported binary metadata version: {version}"
+        )
+
+    return Metadata.model_validate(
+        {
+            "company": encoded_fields.get(_COMPANY_KEY),
+            "model": encoded_fields.get(_MODEL_KEY),
+            "created_at": _decode_created_at(encoded_fields),
+            "ai_usage_level": _AI_USAGE_LEVELS_BY_CODE.get(
+                encoded_fields.get(_AI_USAGE_LEVEL_KEY)
+            ),
+            "content_id": encoded_fields.get(_CONTENT_ID_KEY),
+            "user_id": encoded_fields.get(_USER_ID_KEY),
+            "private_key_id": encoded_fields.get(_PRIVATE_KEY_ID_KEY),
+            "additional_info": encoded_fields.get(_ADDITIONAL_INFO_KEY),
+            "content_hash": encoded_fields.get(_CONTENT_HASH_KEY),
+        }
+    )
+
+
+def _decode_created_at(encoded_fields: Dict[int, Any]) -> Any:
+    microseconds = encoded_fields.get(_CREATED_AT_KEY)
+    if not isinstance(microseconds, int):
+        # Left to the validation of Metadata to report.
+        return microseconds
+    created_at = _EPOCH + microseconds * _MICROSECOND
+    utc_offset = encoded_fields.get(_UTC_OFFSET_KEY)
+    if utc_offset is None:
+        return created_at
+    return created_at.replace(tzinfo=timezone.utc).astimezone(
+        timezone(timedelta(seconds=utc_offset))
+    )
@@ -0,0 +1,345 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+A minimal encoder and decoder of canonical CBOR (RFC 8949).
+
+Values are encoded with the core deterministic encoding rules of RFC 8949,
+section 4.2.1: integers and lengths take the fewest bytes possible, floats
+take the shortest of half, single and double precision that preserves them,
+lengths are always definite, and map keys are sorted by the bytewise order
+of their encodings. Equal values therefore always have the same encoding,
+which makes it suitable for signing.
+
+Only the JSON data model is supported, plus byte strings: None, booleans,
+integers, floats, strings, bytes, lists and dicts. Tags are not supported.
+"""
+
+import math
+import struct
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from transparentmeta.serialization.exceptions import (
+    InvalidCBORDataError,
+    UnsupportedCBORTypeError,
+)
+
+_UNSIGNED_INTEGER = 0
+_NEGATIVE_INTEGER = 1
+_BYTE_STRING = 2
+_TEXT_STRING = 3
+_ARRAY = 4
+_MAP = 5
+_SIMPLE_AND_FLOAT = 7
+
+_FALSE = b"\xf4"
+_TRUE = b"\xf5"
+_NULL = b"\xf6"
+
+# Additional information values of major type 7 for floats, with the struct
+# format of each precision.
+_FLOAT_FORMATS = ((25, ">e"), (26, ">f"), (27, ">d"))
+_FLOAT_FORMATS_BY_INFO = dict(_FLOAT_FORMATS)
+# Additional information values of major type 7 for false, true and null.
+_SIMPLE_VALUES_BY_INFO = {20: False, 21: True, 22: None}
+# Additional information values of the other major types for arguments
+# following the initial byte, with their struct and size in bytes.
+_ARGUMENT_STRUCTS_BY_INFO = {
+    24: struct.Struct(">B"),
+    25: struct.Struct(">H"),
+    26: struct.Struct(">I"),
+    27: struct.Struct(">Q"),
+}
+_MAX_INTEGER = 2**64 - 1
+# Maximum nesting depth of arrays and maps when decoding. Metadata only nests
+# a few levels deep, and the limit keeps hostile data from exhausting the
+# stack of the recursive decoder.
+MAX_NESTING_DEPTH = 32
+
+
+def encode(value: Any) -> bytes:
+    """Encodes a value to canonical CBOR.
+
+    Args:
+        value (Any): The value to encode. Tuples are encoded as lists.
+
+    Returns:
+        bytes: The canonical CBOR encoding of the value.
+
+    Raises:
+        UnsupportedCBORTypeError: If the value, or a value it contains, has
+            an unsupported type, or is an integer out of the 64-bit range.
+    """
+    chunks: List[bytes] = []
+    _encode_value(value, chunks.append)
+    return b"".join(chunks)
+
+
+def decode(data: bytes) -> Any:
+    """Decodes a CBOR data item.
+
+    Args:
+        data (bytes): The encoding of exactly one CBOR data item.
+
+    Returns:
+        Any: The decoded value. Arrays are decoded as lists, and maps as
+            dicts.
+
+    Raises:
+        InvalidCBORDataError: If the data is not a single well-formed CBOR
+            data item, uses indefinite lengths or tags, or nests arrays and
+            maps more than `MAX_NESTING_DEPTH` levels deep.
+    """
+    try:
+        value, offset = _decode_value(data, 0, 0)
+    except (IndexError, struct.error) as err:
+        raise InvalidCBORDataError("CBOR data is truncated") from err
+    if offset != len(data):
+        raise InvalidCBORDataError("CBOR data has trailing bytes")
+    return value
+
+
+def _encode_value(value: Any, write: Callable[[bytes], Any]) -> None:
+    # The exact type is looked up first, since it's the fastest. Instances
+    # of subclasses, e.g., string enums, are encoded as their closest base
+    # type.
+    encoder = _ENCODERS_BY_TYPE.get(type(value))
+    if encoder is None:
+        encoder = _find_base_type_encoder(value)
+    encoder(value, write)
+
+
+def _find_base_type_encoder(
+    value: Any,
+) -> Callable[[Any, Callable[[bytes], Any]], None]:
+    for cls in type(value).__mro__:
+        encoder = _ENCODERS_BY_TYPE.get(cls)
+        if encoder is not None:
+            return encoder
+    raise UnsupportedCBORTypeError(value)
+
+
+def _encode_null(_: None, write: Callable[[bytes], Any]) -> None:
+    write(_NULL)
+
+
+def _encode_bool(value: bool, write: Callable[[bytes], Any]) -> None:
+    write(_TRUE if value else _FALSE)
+
+
+def _encode_int(value: int, write: Callable[[bytes], Any]) -> None:
+    if not -_MAX_INTEGER - 1 <= value <= _MAX_INTEGER:
+        raise UnsupportedCBORTypeError(value)
+    if value >= 0:
+        write(_encode_head(_UNSIGNED_INTEGER, value))
+    else:
+        write(_encode_head(_NEGATIVE_INTEGER, -1 - value))
+
+
+def _encode_float_value(value: float, write: Callable[[bytes], Any]) -> None:
+    write(_encode_float(value))
+
+
+def _encode_text(value: str, write: Callable[[bytes], Any]) -> None:
+    encoded_value = value.encode("utf-8")
+    write(_encode_head(_TEXT_STRING, len(encoded_value)))
+    write(encoded_value)
+
+
+def _encode_bytes(
+    value: Union[bytes, bytearray], write: Callable[[bytes], Any]
+) -> None:
+    write(_encode_head(_BYTE_STRING, len(value)))
+    write(bytes(value))
+
+
+def _encode_array(
+    value: Union[list, tuple], write: Callable[[bytes], Any]
+) -> None:
+    write(_encode_head(_ARRAY, len(value)))
+    for item in value:
+        _encode_value(item, write)
+
+
+def _encode_map(value: dict, write: Callable[[bytes], Any]) -> None:
+    write(_encode_head(_MAP, len(value)))
+    # Keys are sorted by the bytewise order of their encodings, and each item
+    # is encoded right after its key.
+    for encoded_key, key in sorted(zip(map(encode, value), value)):
+        write(encoded_key)
+        _encode_value(value[key], write)
+
+
+_ENCODERS_BY_TYPE: Dict[
+    type, Callable[[Any, Callable[[bytes], Any]], None]
+] = {
+    str: _encode_text,
+    type(None): _encode_null,
+    bool: _encode_bool,
+    int: _encode_int,
+    float: _encode_float_value,
+    bytes: _encode_bytes,
+    bytearray: _encode_bytes,
+    list: _encode_array,
+    tuple: _encode_array,
+    dict: _encode_map,
+}
+
+
+def _encode_head(major_type: int, argument: int) -> bytes:
+    initial_byte = major_type << 5
+    if argument < 24:
+        return bytes((initial_byte | argument,))
+    if argument < 2**8:
+        return struct.pack(">BB", initial_byte | 24, argument)
+    if argument < 2**16:
+        return struct.pack(">BH", initial_byte | 25, argument)
+    if argument < 2**32:
+        return struct.pack(">BI", initial_byte | 26, argument)
+    return struct.pack(">BQ", initial_byte | 27, argument)
+
+
+def _encode_float(value: float) -> bytes:
+    if math.isnan(value):
+        # RFC 8949 canonical NaN.
+        return b"\xf9\x7e\x00"
+    for additional_info, float_format in _FLOAT_FORMATS:
+        try:
+            packed = struct.pack(float_format, value)
+        except OverflowError:
+            continue
+        if struct.unpack(float_format, packed)[0] == value:
+            initial_byte = (_SIMPLE_AND_FLOAT << 5) | additional_info
+            return bytes((initial_byte,)) + packed
+    raise AssertionError("Doubles represent all floats")  # pragma: no cover
+
+
+def _decode_value(data: bytes, offset: int, depth: int) -> Tuple[Any, int]:
+    initial_byte = data[offset]
+    major_type, additional_info = initial_byte >> 5, initial_byte & 0x1F
+    offset += 1
+
+    if major_type == _SIMPLE_AND_FLOAT:
+        return _decode_simple_or_float(data, offset, additional_info)
+
+    argument, offset = _decode_argument(data, offset, additional_info)
+    decoder = _DECODERS_BY_MAJOR_TYPE.get(major_type)
+    if decoder is None:
+        raise InvalidCBORDataError("CBOR tags are not supported")
+    return decoder(data, offset, argument, depth)
+
+
+def _decode_argument(
+    data: bytes, offset: int, additional_info: int
+) -> Tuple[int, int]:
+    if additional_info < 24:
+        return additional_info, offset
+    argument_struct = _ARGUMENT_STRUCTS_BY_INFO.get(additional_info)
+    if argument_struct is None:
+        raise InvalidCBORDataError("Indefinite lengths are not supported")
+    return (
+        argument_struct.unpack_from(data, offset)[0],
+        offset + argument_struct.size,
+    )
+
+
+def _decode_unsigned_integer(
+    _: bytes, offset: int, argument: int, _depth: int
+) -> Tuple[int, int]:
+    return argument, offset
+
+
+def _decode_negative_integer(
+    _: bytes, offset: int, argument: int, _depth: int
+) -> Tuple[int, int]:
+    return -1 - argument, offset
+
+
+def _decode_byte_string(
+    data: bytes, offset: int, argument: int, _depth: int
+) -> Tuple[bytes, int]:
+    end = offset + argument
+    if end > len(data):
+        raise InvalidCBORDataError("CBOR data is truncated")
+    return data[offset:end], end
+
+
+def _decode_text_string(
+    data: bytes, offset: int, argument: int, depth: int
+) -> Tuple[str, int]:
+    string, end = _decode_byte_string(data, offset, argument, depth)
+    try:
+        return string.decode("utf-8"), end
+    except UnicodeDecodeError as err:
+        raise InvalidCBORDataError(
+            "CBOR text string is not valid UTF-8"
+        ) from err
+
+
+def _decode_array(
+    data: bytes, offset: int, argument: int, depth: int
+) -> Tuple[List[Any], int]:
+    # The check is inlined, since it runs for every array and map.
+    if depth >= MAX_NESTING_DEPTH:
+        _raise_nesting_error()
+    depth += 1
+    items = []
+    for _ in range(argument):
+        item, offset = _decode_value(data, offset, depth)
+        items.append(item)
+    return items, offset
+
+
+def _decode_map(
+    data: bytes, offset: int, argument: int, depth: int
+) -> Tuple[Dict[Any, Any], int]:
+    # The check is inlined, since it runs for every array and map.
+    if depth >= MAX_NESTING_DEPTH:
+        _raise_nesting_error()
+    depth += 1
+    mapping: Dict[Any, Any] = {}
+    for _ in range(argument):
+        key, offset = _decode_value(data, offset, depth)
+        item, offset = _decode_value(data, offset, depth)
+        try:
+            mapping[key] = item
+        except TypeError as err:
+            raise InvalidCBORDataError(
+                "CBOR map keys must be strings or numbers"
+            ) from err
+    return mapping, offset
+
+
+def _raise_nesting_error() -> None:
+    raise InvalidCBORDataError(
+        f"CBOR data nests more than {MAX_NESTING_DEPTH} levels deep"
+    )
+
+
+def _decode_simple_or_float(
+    data: bytes, offset: int, additional_info: int
+) -> Tuple[Any, int]:
+    if additional_info in _SIMPLE_VALUES_BY_INFO:
+        return _SIMPLE_VALUES_BY_INFO[additional_info], offset
+    float_format = _FLOAT_FORMATS_BY_INFO.get(additional_info)
+    if float_format is None:
+        raise InvalidCBORDataError("CBOR simple value is not supported")
+    return (
+        struct.unpack_from(float_format, data, offset)[0],
+        offset + struct.calcsize(float_format),
+    )
+
+
+# Decoders of the major types whose items are read from their argument.
+# Major type 6, i.e., tags, is not supported.
+_DECODERS_BY_MAJOR_TYPE: Dict[
+    int, Callable[[bytes, int, int, int], Tuple[Any, int]]
+] = {
+    _UNSIGNED_INTEGER: _decode_unsigned_integer,
+    _NEGATIVE_INTEGER: _decode_negative_integer,
+    _BYTE_STRING: _decode_byte_string,
+    _TEXT_STRING: _decode_text_string,
+    _ARRAY: _decode_array,
+    _MAP: _decode_map,
+}
@@ -0,0 +1,22 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""This module hosts all custom exceptions used in serialization."""
+
+
+class InvalidCBORDataError(Exception):
+    """Raised when data is not well-formed CBOR, or uses CBOR features that
+    aren't supported."""
+
+    def __init__(self, message="Data is not valid CBOR"):
+        super().__init__(message)
+
+
+class UnsupportedCBORTypeError(Exception):
+    """Raised when a value has a type that can't be encoded to CBOR."""
+
+    def __init__(self, value):
+        super().__init__(
+            f"Values of type {type(value).__name__} can't be encoded to CBOR"
+        )
@@ -4,64 +4,139 @@
 
 """
 Provides the `MetadataSerializer` class for converting Metadata objects
-to and from JSON strings.
+to and from JSON strings, or their compact binary encoding.
 """
 
 import logging
-from typing import Optional
+from enum import Enum
+from typing import Optional, Union
 
 from transparentmeta.entity.metadata import Metadata
+from transparentmeta.serialization.binary_metadata_encoding import (
+    decode_metadata,
+    encode_metadata,
+)
 
 logger = logging.getLogger(__name__)
 
+# Metadata serialized to a JSON string, or to its binary encoding.
+SerializedMetadata = Union[str, bytes]
+
+
+class MetadataFormat(str, Enum):
+    """Formats metadata can be serialized to.
+
+    Attributes:
+        JSON: JSON string, stored in a TXXX frame of the ID3 tag.
+        BINARY: Compact, canonical CBOR encoding, stored in a PRIV frame of
+            the ID3 tag.
+    """
+
+    JSON = "json"
+    BINARY = "binary"
+
 
 class MetadataSerializer:
     """Handles serialization and deserialization of Metadata objects to and
-    from JSON strings.
+    from JSON strings, or their compact binary encoding.
+
+    Deserialization detects the format from the type of the serialized
+    metadata, so a serializer reads metadata in both formats.
 
     Args:
         indent (Optional[int]): Number of spaces to use for indentation in the
             JSON output. If None, the JSON will be compact (no
             pretty-printing).
+        metadata_format (MetadataFormat): The format metadata is serialized
+            to. Defaults to JSON.
     """
 
-    def __init__(self, indent: Optional[int] = None):
+    def __init__(
+        self,
+        indent: Optional[int] = None,
+        metadata_format: MetadataFormat = MetadataFormat.JSON,
+    ):
         self.indent = indent
+        self.metadata_format = metadata_format
 
-    def serialize(self, metadata: Metadata) -> str:
-        """Serialize the given Metadata object to a JSON string.
+    def serialize(self, metadata: Metadata) -> SerializedMetadata:
+        """Serialize the given Metadata object to a JSON string, or to bytes
+        if the serializer uses the binary format.
 
         Args:
             metadata (Metadata): The metadata object to serialize.
 
         Returns:
-            metadata_string (str): A JSON-formatted string representation of
-                the metadata.
+            metadata_string (SerializedMetadata): A JSON-formatted string
+                representation of the metadata, or its binary encoding.
         """
-        metadata_string = metadata.model_dump_json(indent=self.indent)
-
-        logger.debug(
-            "Serialized Metadata object to JSON string: '%.40s'",
-            metadata_string,
+        if self.metadata_format == MetadataFormat.BINARY:
+            return self.serialize_binary(metadata)
+
+        # Metadata without a content hash is serialized as it was before
+        # content hashes existed.
+        metadata_string = metadata.model_dump_json(
+            indent=self.indent,
+            exclude=(
+                {"content_hash"} if metadata.content_hash is None else None
+            ),
         )
 
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Serialized Metadata object to JSON string: '%.40s'",
+                metadata_string,
+            )
+
         return metadata_string
 
-    def deserialize(self, json_str: str) -> Metadata:
-        """Deserialize a JSON string back into a Metadata object.
+    def serialize_binary(self, metadata: Metadata) -> bytes:
+        """Serialize the given Metadata object to its compact binary
+        encoding.
 
         Args:
-            json_str (str): The JSON string to deserialize.
+            metadata (Metadata): The metadata object to serialize.
 
         Returns:
-            metadata_obj (Metadata): A Metadata object created from the JSON
-                string.
+            metadata_bytes (bytes): The canonical CBOR encoding of the
+                metadata.
         """
-        metadata_obj = Metadata.model_validate_json(json_str)
+        metadata_bytes = encode_metadata(metadata)
 
-        logger.debug(
-            "Deserialized JSON string to Metadata object '%.40s'",
-            metadata_obj.model_dump(),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Serialized Metadata object to %d bytes", len(metadata_bytes)
+            )
+
+        return metadata_bytes
+
+    def deserialize(self, json_str: SerializedMetadata) -> Metadata:
+        """Deserialize a JSON string, or a binary encoding, back into a
+        Metadata object.
+
+        Args:
+            json_str (SerializedMetadata): The JSON string to deserialize,
+                or the bytes of the binary encoding.
+
+        Returns:
+            metadata_obj (Metadata): A Metadata object created from the JSON
+                string or the binary encoding.
+
+        Raises:
+            InvalidCBORDataError: If binary metadata isn't valid CBOR.
+            pydantic.ValidationError: If the fields aren't valid metadata.
+        """
+        if isinstance(json_str, bytes):
+            metadata_obj = decode_metadata(json_str)
+        else:
+            metadata_obj = Metadata.model_validate_json(json_str)
+
+        # Dumping the metadata costs as much as deserializing it, so it's
+        # only done when the record is emitted.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Deserialized JSON string to Metadata object '%.40s'",
+                metadata_obj.model_dump(),
+            )
 
         return metadata_obj
@@ -0,0 +1,35 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Exposes the verification server of transparentmeta, a local HTTP service
+that signs and verifies the metadata of audio files, for direct import from
+the `transparentmeta.server` package.
+
+The interfaces are imported lazily, on first access, so that importing the
+package, e.g., for its constants, doesn't pull in the HTTP server.
+"""
+
+from typing import TYPE_CHECKING
+
+from transparentmeta.utils.lazy_import_utils import build_lazy_exports
+
+if TYPE_CHECKING:
+    from transparentmeta.server.verification_server import (
+        RequestError,
+        ServerConfig,
+        VerificationRequestHandler,
+        VerificationServer,
+    )
+
+_EXPORT_MODULES = {
+    "RequestError": "verification_server",
+    "ServerConfig": "verification_server",
+    "VerificationRequestHandler": "verification_server",
+    "VerificationServer": "verification_server",
+}
+
+__all__ = list(_EXPORT_MODULES)
+
+__getattr__, __dir__ = build_lazy_exports(__name__, _EXPORT_MODULES, globals())
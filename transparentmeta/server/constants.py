@@ -0,0 +1,12 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Module featuring constants for the server package.
+"""
+
+DEFAULT_HOST: str = "127.0.0.1"
+DEFAULT_PORT: int = 8080
+DEFAULT_MAX_BODY_SIZE: int = 256 * 1024**2  # 256MB
+DEFAULT_KEEP_ALIVE_TIMEOUT: float = 5.0  # in seconds
@@ -0,0 +1,454 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module provides a `VerificationServer` class, a local HTTP service that
+signs and verifies the metadata of audio files, for services that are not
+written in Python.
+
+Keys are loaded, and the reader and the writer are built, once when the
+server starts. Requests are then served by a fixed pool of worker threads
+sharing them, so each request only pays for the work on its file, rather
+than for starting an interpreter and loading keys. Connections are kept
+alive between requests, so clients can also skip the TCP handshake.
+
+The server exposes three endpoints:
+- `GET /health` reports whether the server is up, and whether it can sign
+  and verify.
+- `POST /verify` reads and verifies the metadata of an audio file.
+- `POST /sign` writes signed metadata to an audio file.
+
+`/verify` and `/sign` accept either an audio file uploaded as the request
+body, or a JSON body with the path of an audio file on the machine of the
+server. The audio format of uploads is given by the `format` query
+parameter or by the Content-Type header, and the metadata to sign them with
+by the `Transparentmeta-Metadata` header, as JSON. Paths are only accepted
+within the directories the server is allowed to access.
+"""
+
+import json
+import logging
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
+from urllib.parse import parse_qs, urlsplit
+
+from transparentmeta.result.result import ReadResult
+from transparentmeta.sdk.transparent_metadata_reader import (
+    TransparentMetadataReader,
+)
+from transparentmeta.sdk.transparent_metadata_writer import (
+    TransparentMetadataWriter,
+)
+from transparentmeta.server.constants import (
+    DEFAULT_KEEP_ALIVE_TIMEOUT,
+    DEFAULT_MAX_BODY_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+METADATA_HEADER = "Transparentmeta-Metadata"
+JSON_CONTENT_TYPE = "application/json"
+BINARY_CONTENT_TYPE = "application/octet-stream"
+AUDIO_FORMATS_BY_CONTENT_TYPE = {
+    "audio/mpeg": "mp3",
+    "audio/mp3": "mp3",
+    "audio/wav": "wav",
+    "audio/wave": "wav",
+    "audio/x-wav": "wav",
+}
+
+
+class RequestError(Exception):
+    """Exception raised when a request can't be served, holding the HTTP
+    status of the response."""
+
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        """Initializes the RequestError.
+
+        Args:
+            status (HTTPStatus): The status of the response.
+            message (str): The error message sent to the client.
+        """
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass(frozen=True)
+class ServerConfig:
+    """Settings of a verification server.
+
+    Attributes:
+        allowed_directories (Tuple[Path, ...]): The directories whose files
+            can be passed by path, resolved to absolute paths. Defaults to
+            none, in which case only uploads are accepted.
+        workers (Optional[int]): Number of worker threads. Defaults to the
+            thread pool default.
+        max_body_size (int): Maximum size in bytes of request bodies.
+            Defaults to 256MB.
+        keep_alive_timeout (float): Time in seconds after which idle
+            connections are closed. Defaults to 5 seconds.
+    """
+
+    allowed_directories: Tuple[Path, ...] = ()
+    workers: Optional[int] = None
+    max_body_size: int = DEFAULT_MAX_BODY_SIZE
+    keep_alive_timeout: float = DEFAULT_KEEP_ALIVE_TIMEOUT
+
+    def __post_init__(self) -> None:
+        # The directories are resolved once, rather than on each request.
+        object.__setattr__(
+            self,
+            "allowed_directories",
+            tuple(
+                Path(directory).resolve()
+                for directory in self.allowed_directories
+            ),
+        )
+
+
+class VerificationServer(HTTPServer):
+    """HTTP server that signs and verifies the metadata of audio files,
+    serving connections from a fixed pool of worker threads.
+
+    Each connection is served by one worker until the client closes it, or
+    leaves it idle for longer than the keep-alive timeout. Connections
+    accepted while all the workers are busy wait in the queue of the pool.
+
+    Attributes:
+        transparent_metadata_reader (Optional[TransparentMetadataReader]):
+            The reader of the metadata, or None if the server doesn't
+            verify.
+        transparent_metadata_writer (Optional[TransparentMetadataWriter]):
+            The writer of the metadata, or None if the server doesn't sign.
+        config (ServerConfig): Settings of the server.
+    """
+
+    def __init__(
+        self,
+        server_address: Tuple[str, int],
+        transparent_metadata_reader: Optional[
+            TransparentMetadataReader
+        ] = None,
+        transparent_metadata_writer: Optional[
+            TransparentMetadataWriter
+        ] = None,
+        config: Optional[ServerConfig] = None,
+    ) -> None:
+        """Initializes the VerificationServer, and binds it to its address.
+
+        Args:
+            server_address (Tuple[str, int]): The host and port to listen
+                on. Port 0 picks a free port.
+            transparent_metadata_reader (Optional[TransparentMetadataReader]):
+                The reader of the metadata. Defaults to None, in which case
+                `/verify` is disabled.
+            transparent_metadata_writer (Optional[TransparentMetadataWriter]):
+                The writer of the metadata. Defaults to None, in which case
+                `/sign` is disabled.
+            config (Optional[ServerConfig]): Settings of the server.
+                Defaults to the default settings.
+        """
+        self.transparent_metadata_reader = transparent_metadata_reader
+        self.transparent_metadata_writer = transparent_metadata_writer
+        self.config = config if config is not None else ServerConfig()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.config.workers,
+            thread_name_prefix="transparentmeta-server",
+        )
+        super().__init__(server_address, VerificationRequestHandler)
+
+    def process_request(
+        self, request: Any, client_address: Tuple[str, int]
+    ) -> None:
+        """Hands an accepted connection over to the worker pool.
+
+        Args:
+            request (Any): The socket of the connection.
+            client_address (Tuple[str, int]): The address of the client.
+        """
+        self._executor.submit(
+            self._process_request_in_worker, request, client_address
+        )
+
+    def server_close(self) -> None:
+        """Closes the listening socket, and waits for the workers to finish
+        the connections they're serving."""
+        super().server_close()
+        self._executor.shutdown(wait=True)
+
+    def _process_request_in_worker(
+        self, request: Any, client_address: Tuple[str, int]
+    ) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+
+class VerificationRequestHandler(BaseHTTPRequestHandler):
+    """Handles the requests of one connection to a `VerificationServer`."""
+
+    # HTTP/1.1 keeps connections alive between requests.
+    protocol_version = "HTTP/1.1"
+    # Headers and bodies are sent in separate writes, so Nagle's algorithm
+    # would hold bodies back until the headers are acknowledged.
+    disable_nagle_algorithm = True
+
+    server: VerificationServer
+
+    def setup(self) -> None:
+        """Sets up the connection, with the keep-alive timeout of the
+        server as the timeout of its socket."""
+        super().setup()
+        # Whether the body of the current request was read, which is
+        # required to reuse the connection.
+        self._is_body_read = False
+        self.connection.settimeout(self.server.config.keep_alive_timeout)
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Serves GET requests."""
+        self._serve({"/health": self._health})
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Serves POST requests."""
+        self._serve({"/verify": self._verify, "/sign": self._sign})
+
+    # pylint: disable-next=redefined-builtin
+    def log_message(self, format: str, *args: Any) -> None:
+        """Logs requests with the logger of the module, rather than to
+        standard error.
+
+        Args:
+            format (str): The format string of the message.
+            *args (Any): The arguments of the format string.
+        """
+        logger.debug("%s - " + format, self.address_string(), *args)
+
+    def _serve(self, routes: Dict[str, Callable[[], None]]) -> None:
+        self._is_body_read = False
+        try:
+            route = routes.get(urlsplit(self.path).path)
+            if route is None:
+                raise RequestError(
+                    HTTPStatus.NOT_FOUND, f"Not found: {self.path}"
+                )
+            route()
+        except RequestError as err:
+            # The connection can only be reused if the body was read.
+            self.close_connection = (
+                self.close_connection or not self._is_body_read
+            )
+            self._send_json(
+                err.status, {"is_success": False, "error": str(err)}
+            )
+
+    def _health(self) -> None:
+        self._send_json(
+            HTTPStatus.OK,
+            {
+                "status": "ok",
+                "can_verify": self.server.transparent_metadata_reader
+                is not None,
+                "can_sign": self.server.transparent_metadata_writer
+                is not None,
+            },
+        )
+
+    def _verify(self) -> None:
+        reader = self.server.transparent_metadata_reader
+        if reader is None:
+            raise RequestError(
+                HTTPStatus.NOT_IMPLEMENTED,
+                "Verification is disabled: the server has no public key",
+            )
+        body = self._read_body()
+
+        if self._is_json_request():
+            filepath = self._get_allowed_filepath(self._parse_json(body))
+            read_result = _call_sdk(reader.read, filepath)
+        else:
+            read_result = _call_sdk(
+                reader.read_bytes, body, self._get_audio_format()
+            )
+        self._send_json(HTTPStatus.OK, self._to_record(read_result))
+
+    def _sign(self) -> None:
+        writer = self.server.transparent_metadata_writer
+        if writer is None:
+            raise RequestError(
+                HTTPStatus.NOT_IMPLEMENTED,
+                "Signing is disabled: the server has no private key",
+            )
+        body = self._read_body()
+
+        if self._is_json_request():
+            request = self._parse_json(body)
+            filepath = self._get_allowed_filepath(request)
+            _call_sdk(writer.write, filepath, self._get_metadata(request))
+            self._send_json(HTTPStatus.OK, {"is_success": True, "error": None})
+            return
+        metadata = self._parse_json(self._get_metadata_header())
+        tagged_audio_data = _call_sdk(
+            writer.write_bytes, body, self._get_audio_format(), metadata
+        )
+        content_type = self.headers.get_content_type()
+        if content_type not in AUDIO_FORMATS_BY_CONTENT_TYPE:
+            content_type = BINARY_CONTENT_TYPE
+        self._send(HTTPStatus.OK, content_type, tagged_audio_data)
+
+    def _read_body(self) -> bytes:
+        content_length = self.headers.get("Content-Length")
+        if content_length is None:
+            raise RequestError(
+                HTTPStatus.LENGTH_REQUIRED, "Content-Length is required"
+            )
+        try:
+            body_size = int(content_length)
+        except ValueError as err:
+            raise RequestError(
+                HTTPStatus.BAD_REQUEST,
+                f"Invalid Content-Length: {content_length}",
+            ) from err
+        if not 0 <= body_size <= self.server.config.max_body_size:
+            raise RequestError(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                f"Request bodies can't be larger than "
+                f"{self.server.config.max_body_size} bytes",
+            )
+        body = self.rfile.read(body_size)
+        if len(body) < body_size:
+            raise RequestError(
+                HTTPStatus.BAD_REQUEST, "Request body is incomplete"
+            )
+        self._is_body_read = True
+        return body
+
+    def _is_json_request(self) -> bool:
+        return self.headers.get_content_type() == JSON_CONTENT_TYPE
+
+    def _get_allowed_filepath(self, request: Dict[str, Any]) -> Path:
+        path = request.get("path")
+        if not isinstance(path, str):
+            raise RequestError(
+                HTTPStatus.BAD_REQUEST, "Request must have a 'path' string"
+            )
+        filepath = Path(path).resolve()
+        if not any(
+            filepath.is_relative_to(directory)
+            for directory in self.server.config.allowed_directories
+        ):
+            raise RequestError(
+                HTTPStatus.FORBIDDEN,
+                f"Path is outside the allowed directories: {path}",
+            )
+        return filepath
+
+    def _get_audio_format(self) -> str:
+        query = parse_qs(urlsplit(self.path).query)
+        if "format" in query:
+            return query["format"][0]
+        audio_format = AUDIO_FORMATS_BY_CONTENT_TYPE.get(
+            self.headers.get_content_type()
+        )
+        if audio_format is None:
+            raise RequestError(
+                HTTPStatus.BAD_REQUEST,
+                "Audio format is unknown: pass it with the 'format' query "
+                "parameter or the Content-Type header",
+            )
+        return audio_format
+
+    def _get_metadata_header(self) -> bytes:
+        metadata_header = self.headers.get(METADATA_HEADER)
+        if metadata_header is None:
+            raise RequestError(
+                HTTPStatus.BAD_REQUEST,
+                f"Uploads must have a {METADATA_HEADER} header",
+            )
+        # Headers are decoded as ISO-8859-1, which gives back the raw bytes
+        # of UTF-8 JSON when encoded again.
+        return metadata_header.encode("latin-1")
+
+    @staticmethod
+    def _get_metadata(request: Dict[str, Any]) -> Dict[str, Any]:
+        metadata = request.get("metadata")
+        if not isinstance(metadata, dict):
+            raise RequestError(
+                HTTPStatus.BAD_REQUEST,
+                "Metadata must be a JSON object",
+            )
+        return metadata
+
+    @staticmethod
+    def _parse_json(data: bytes) -> Dict[str, Any]:
+        try:
+            value = json.loads(data)
+        except ValueError as err:
+            raise RequestError(
+                HTTPStatus.BAD_REQUEST, f"Invalid JSON: {err}"
+            ) from err
+        if not isinstance(value, dict):
+            raise RequestError(
+                HTTPStatus.BAD_REQUEST, "JSON must be an object"
+            )
+        return cast(Dict[str, Any], value)
+
+    @staticmethod
+    def _to_record(read_result: ReadResult) -> Dict[str, Any]:
+        return {
+            "is_success": read_result.is_success,
+            "error": read_result.error,
+            "metadata": (
+                read_result.metadata.model_dump(mode="json")
+                if read_result.metadata is not None
+                else None
+            ),
+        }
+
+    def _send_json(self, status: HTTPStatus, value: Dict[str, Any]) -> None:
+        self._send(
+            status, JSON_CONTENT_TYPE, json.dumps(value).encode("utf-8")
+        )
+
+    def _send(
+        self, status: HTTPStatus, content_type: str, body: bytes
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError, socket.timeout):
+            self.close_connection = True
+
+
+def _call_sdk(function: Callable[..., T], *args: Any) -> T:
+    # Failures of the SDK are caused by the file or the metadata of the
+    # request, e.g., a file that is not valid audio, so they are reported
+    # to the client rather than treated as server errors.
+    try:
+        return function(*args)
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        logger.info("Request failed: %s", err)
+        raise RequestError(HTTPStatus.UNPROCESSABLE_ENTITY, str(err)) from err
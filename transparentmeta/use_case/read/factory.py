@@ -8,11 +8,12 @@ MetadataReader classes and ReadUseCase.
 """
 
 import logging
-from typing import Callable, Dict
+from typing import Optional
 
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
 
 from transparentmeta.crypto.signature_verifier import SignatureVerifier
+from transparentmeta.instrumentation.instrumentation import Instrumentation
 from transparentmeta.serialization.metadata_serializer import (
     MetadataSerializer,
 )
@@ -23,26 +24,21 @@ from transparentmeta.use_case.constants import (
 )
 from transparentmeta.use_case.exceptions import UnsupportedAudioFormatError
 from transparentmeta.use_case.read.metadata_reader import MetadataReader
-from transparentmeta.use_case.read.mp3_metadata_reader import MP3MetadataReader
+from transparentmeta.use_case.read.read_result_cache import ReadResultCache
 from transparentmeta.use_case.read.read_use_case import ReadUseCase
-from transparentmeta.use_case.read.wav_metadata_reader import WAVMetadataReader
+from transparentmeta.use_case.read.reader_selector import (
+    metadata_reader_constructors_map,
+    tag_only_metadata_reader_constructors_map,
+)
 
 logger = logging.getLogger(__name__)
 
 
-metadata_reader_constructors_map: Dict[
-    str, Callable[[str, str], MetadataReader]
-] = {
-    "mp3": MP3MetadataReader,
-    "wav": WAVMetadataReader,
-    "wave": WAVMetadataReader,
-}
-
-
 def build_metadata_reader(
     audio_format: str,
     transparency_metadata_field: str = TRANSPARENCY_METADATA_FIELD,
     signature_field: str = SIGNATURE_FIELD,
+    tag_only: bool = False,
 ) -> MetadataReader:
     """Creates an instance of the appropriate concrete MetadataReader based on
     audio format.
@@ -52,10 +48,12 @@ def build_metadata_reader(
         transparency_metadata_field (str): ID3 TXXX field for storing metadata.
         signature_field (str): ID3 TXXX field for storing the metadata
             signature.
+        tag_only (bool): If True, builds a reader that parses the ID3 tags
+            only, without loading the whole audio file. Defaults to False.
 
     Returns:
         metadata_reader (MetadataReader): An instance of MP3MetadataReader or
-            WAVMetadataReader.
+            WAVMetadataReader, or of their tag-only variants.
 
     Raises:
         UnsupportedAudioFormatError: If the audio format is unsupported.
@@ -63,9 +61,12 @@ def build_metadata_reader(
     logger.debug("Building ReadUseCase instance for format: %s", audio_format)
 
     lowered_audio_format = audio_format.lower()
-    metadata_reader_constructor = metadata_reader_constructors_map.get(
-        lowered_audio_format
+    constructors_map = (
+        tag_only_metadata_reader_constructors_map
+        if tag_only
+        else metadata_reader_constructors_map
     )
+    metadata_reader_constructor = constructors_map.get(lowered_audio_format)
     if metadata_reader_constructor is None:
         raise UnsupportedAudioFormatError(
             audio_format, SUPPORTED_AUDIO_FORMATS
@@ -79,11 +80,18 @@ def build_metadata_reader(
     return metadata_reader
 
 
+# Besides the key and the format, every argument is an optional, keyword-only
+# setting passed through to the reader or the use case.
+# pylint: disable-next=too-many-arguments
 def build_read_use_case(
     public_key: Ed25519PublicKey,
     audio_format: str,
+    *,
     transparency_metadata_field: str = TRANSPARENCY_METADATA_FIELD,
     signature_field: str = SIGNATURE_FIELD,
+    tag_only: bool = False,
+    read_result_cache: Optional[ReadResultCache] = None,
+    instrumentation: Optional[Instrumentation] = None,
 ) -> ReadUseCase:
     """Creates an instance of ReadUseCase by resolving all dependencies.
 
@@ -95,6 +103,12 @@ def build_read_use_case(
             Defaults to "transparency".
         signature_field (str): ID3 TXXX field for storing the metadata
             signature. Defaults to "signature".
+        tag_only (bool): If True, the use case reads the ID3 tags only,
+            without loading the whole audio file. Defaults to False.
+        read_result_cache (Optional[ReadResultCache]): Cache of read results
+            for unchanged files. Defaults to None, i.e., no caching.
+        instrumentation (Optional[Instrumentation]): Receives the timings of
+            the stages of each read. Defaults to None.
 
     Returns:
         read_use_case (ReadUseCase): An instance of ReadUseCase configured
@@ -104,7 +118,7 @@ def build_read_use_case(
         UnsupportedAudioFormatError: If the audio format is unsupported.
     """
     reader = build_metadata_reader(
-        audio_format, transparency_metadata_field, signature_field
+        audio_format, transparency_metadata_field, signature_field, tag_only
     )
 
     verifier = SignatureVerifier(public_key)
@@ -113,7 +127,13 @@ def build_read_use_case(
     serializer = MetadataSerializer()
     logger.debug("MetadataSerializer instance created")
 
-    read_use_case = ReadUseCase(reader, verifier, serializer)
+    read_use_case = ReadUseCase(
+        reader,
+        verifier,
+        serializer,
+        read_result_cache=read_result_cache,
+        instrumentation=instrumentation,
+    )
     logger.debug("ReadUseCase instance created")
 
     return read_use_case
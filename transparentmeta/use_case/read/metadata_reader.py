@@ -11,19 +11,21 @@ ID3, using the Mutagen library for audio file handling.
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Optional, cast
+from typing import ClassVar, Optional
 
 from mutagen.id3 import ID3
 
+from transparentmeta.request.exceptions import InvalidAudioFileError
+from transparentmeta.serialization.metadata_serializer import (
+    SerializedMetadata,
+)
 from transparentmeta.use_case.constants import (
     SIGNATURE_FIELD,
     TRANSPARENCY_METADATA_FIELD,
 )
-from transparentmeta.use_case.types import MutagenID3AudioTypes
-from transparentmeta.utils.metadata_tags_utils import (
-    does_file_contain_any_id3_tags,
-)
+from transparentmeta.use_case.types import AudioSource, MutagenID3AudioTypes
+from transparentmeta.utils.file_utils import get_audio_source_name
+from transparentmeta.utils.metadata_tags_utils import get_priv_id3_tag_data
 
 logger = logging.getLogger(__name__)
 
@@ -34,14 +36,15 @@ class AudioFileDataReading:
     Represents the result of reading metadata and signature from an audio file.
 
     Attributes:
-        metadata (Optional[str]): The serialized metadata string, if found.
+        metadata (Optional[SerializedMetadata]): The serialized metadata
+            string, or the bytes of binary metadata, if found.
         signature (Optional[str]): The digital signature string, if found.
         is_success (bool): Indicates whether both metadata and signature were
             successfully retrieved.
     """
 
     is_success: bool
-    metadata: Optional[str] = None
+    metadata: Optional[SerializedMetadata] = None
     signature: Optional[str] = None
 
 
@@ -50,7 +53,8 @@ class MetadataReader(ABC):
     ID3 metadata tags.
 
     Subclasses should implement the `_load_audio()` method for specific file
-    formats (e.g., MP3, WAV).
+    formats (e.g., MP3, WAV). Subclasses that can locate the ID3 tags without
+    loading the whole audio file can also override `_load_id3_tags()`.
 
     This class ensures consistency in how transparency metadata and its
     signature are retrieved.
@@ -60,8 +64,12 @@ class MetadataReader(ABC):
             transparency metadata. Defaults to "transparency".
         signature_field (str): ID3 TXXX field used to store the metadata
             signature. Defaults to "signature".
+        is_tag_only (bool): Whether the reader parses the ID3 tags only,
+            without checking that the audio stream is functioning.
     """
 
+    is_tag_only: ClassVar[bool] = False
+
     def __init__(
         self,
         transparency_metadata_field: str = TRANSPARENCY_METADATA_FIELD,
@@ -81,31 +89,41 @@ class MetadataReader(ABC):
         self._metadata_field = self._initiate_metadata_field()
         self._signature_field = self._initiate_signature_field()
 
-    def read(self, filepath: Path) -> AudioFileDataReading:
+    def read(self, filepath: AudioSource) -> AudioFileDataReading:
         """Reads metadata and its signature from the specified audio file.
 
         This method uses the tags defined by `transparency_metadata_field` and
-        `signature_field` to extract the information from ID3 tags.
+        `signature_field` to extract the information from ID3 tags. Binary
+        metadata, stored in a PRIV frame owned by
+        `transparency_metadata_field`, is detected automatically and
+        returned as bytes.
+
+        The file is parsed once. Parsing also validates that the file is a
+        functioning audio file.
 
         Args:
-            filepath (Path): Path to the audio file to read.
+            filepath (AudioSource): Path to the audio file to read, or a
+                seekable binary file object holding the audio file.
 
         Returns:
             audio_file_data_reading (AudioFileDataReading): An object
                 containing the metadata, signature, and success info. If
                 either the metadata or the signature is missing,
                 `is_success` will be False.
+
+        Raises:
+            InvalidAudioFileError: If the file is not a functioning audio file.
         """
-        audio = self._load_audio(filepath)
+        tags = self._load_functioning_id3_tags(filepath)
 
-        if not does_file_contain_any_id3_tags(audio):
+        if not tags:
             return AudioFileDataReading(
                 metadata=None,
                 signature=None,
                 is_success=False,
             )
 
-        if not self._do_metadata_and_signature_tags_exist(audio):
+        if not self._do_metadata_and_signature_tags_exist(tags):
             return AudioFileDataReading(
                 metadata=None,
                 signature=None,
@@ -113,35 +131,63 @@ class MetadataReader(ABC):
             )
 
         audio_file_data_reading = AudioFileDataReading(
-            metadata=self._extract_metadata(audio),
-            signature=self._extract_signature(audio),
+            metadata=self._extract_metadata(tags),
+            signature=self._extract_signature(tags),
             is_success=True,
         )
 
-        logger.debug(
-            "Read metadata and signature from file %s. Metadata: '%.40s'. "
-            "Signature: '%s'",
-            filepath,
-            audio_file_data_reading.metadata,
-            audio_file_data_reading.signature,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Read metadata and signature from file %s. Metadata: "
+                "'%.40s'. Signature: '%s'",
+                get_audio_source_name(filepath),
+                audio_file_data_reading.metadata,
+                audio_file_data_reading.signature,
+            )
 
         return audio_file_data_reading
 
     @abstractmethod
-    def _load_audio(self, filepath: Path) -> MutagenID3AudioTypes:
+    def _load_audio(self, filepath: AudioSource) -> MutagenID3AudioTypes:
         """Loads and returns an audio object for the given file path.
 
         Subclasses must implement this method to provide format-specific
         loading logic.
 
         Args:
-            filepath (Path): The path to the audio file.
+            filepath (AudioSource): The path to the audio file, or a binary
+                file object holding it.
 
         Returns:
             An audio object that supports ID3 tagging.
         """
 
+    def _load_id3_tags(self, filepath: AudioSource) -> Optional[ID3]:
+        """Loads and returns the ID3 tags of the given audio file.
+
+        By default, the whole audio file is loaded with `_load_audio()`.
+        Subclasses can override this method to load the tags only.
+
+        Args:
+            filepath (AudioSource): The path to the audio file, or a binary
+                file object holding it.
+
+        Returns:
+            Optional[ID3]: The ID3 tags of the file, or None if the file has
+                no ID3 tags.
+        """
+        return self._load_audio(filepath).tags
+
+    def _load_functioning_id3_tags(
+        self, filepath: AudioSource
+    ) -> Optional[ID3]:
+        try:
+            return self._load_id3_tags(filepath)
+        except Exception as err:
+            raise InvalidAudioFileError(
+                get_audio_source_name(filepath), str(err)
+            ) from err
+
     def _initiate_metadata_field(self) -> str:
         return (
             f"{self._custom_id3_tag_field}:{self.transparency_metadata_field}"
@@ -150,19 +196,22 @@ class MetadataReader(ABC):
     def _initiate_signature_field(self) -> str:
         return f"{self._custom_id3_tag_field}:{self.signature_field}"
 
-    def _extract_metadata(self, audio: MutagenID3AudioTypes) -> str:
-        tags = cast(ID3, audio.tags)
+    def _extract_metadata(self, tags: ID3) -> SerializedMetadata:
+        binary_metadata = get_priv_id3_tag_data(
+            tags, self.transparency_metadata_field
+        )
+        if binary_metadata is not None:
+            return binary_metadata
         return tags[self._metadata_field].text[0]
 
-    def _extract_signature(self, audio: MutagenID3AudioTypes) -> str:
-        tags = cast(ID3, audio.tags)
+    def _extract_signature(self, tags: ID3) -> str:
         return tags[self._signature_field].text[0]
 
-    def _do_metadata_and_signature_tags_exist(
-        self, audio: MutagenID3AudioTypes
-    ) -> bool:
-        assert audio.tags is not None
+    def _do_metadata_and_signature_tags_exist(self, tags: ID3) -> bool:
+        if self._signature_field not in tags:
+            return False
         return (
-            self._metadata_field in audio.tags
-            and self._signature_field in audio.tags
+            self._metadata_field in tags
+            or get_priv_id3_tag_data(tags, self.transparency_metadata_field)
+            is not None
         )
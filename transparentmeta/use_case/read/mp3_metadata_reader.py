@@ -8,12 +8,11 @@ metadata and a digital signature from MP3 files using Mutagen's ID3 tagging
 system.
 """
 
-from pathlib import Path
-
 from mutagen.id3 import ID3
 from mutagen.mp3 import MP3
 
 from transparentmeta.use_case.read.metadata_reader import MetadataReader
+from transparentmeta.use_case.types import AudioSource
 
 
 class MP3MetadataReader(MetadataReader):
@@ -23,11 +22,12 @@ class MP3MetadataReader(MetadataReader):
     fields, providing consistent access to signed metadata.
     """
 
-    def _load_audio(self, filepath: Path) -> MP3:
+    def _load_audio(self, filepath: AudioSource) -> MP3:
         """Loads the MP3 file and returns an object that supports ID3 tags.
 
         Args:
-            filepath (Path): The path to the MP3 file.
+            filepath (AudioSource): The path to the MP3 file, or a binary
+                file object holding it.
 
         Returns:
             MP3: A Mutagen MP3 object with ID3 tag support.
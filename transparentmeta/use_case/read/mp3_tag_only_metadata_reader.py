@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module provides an `MP3TagOnlyMetadataReader` class that reads
+transparency metadata and a digital signature from MP3 files by parsing their
+ID3v2 tag only, without touching the MPEG audio frames.
+"""
+
+from typing import Optional
+
+from mutagen.id3 import ID3, ID3NoHeaderError
+
+from transparentmeta.use_case.read.mp3_metadata_reader import MP3MetadataReader
+from transparentmeta.use_case.types import AudioSource
+
+
+class MP3TagOnlyMetadataReader(MP3MetadataReader):
+    """Reads transparency metadata and a digital signature from the ID3v2 tag
+    of MP3 files.
+
+    Loading a full Mutagen MP3 object also scans the MPEG frames to compute
+    stream information, which is not needed to read metadata. This reader
+    reads the 10-byte ID3v2 header at the start of the file and then exactly
+    the number of bytes of the tag it declares.
+
+    Since the audio frames are never parsed, this reader doesn't check that
+    the file is a functioning MP3 file. A file without an ID3v2 header is
+    reported as a file without metadata.
+    """
+
+    is_tag_only = True
+
+    def _load_id3_tags(self, filepath: AudioSource) -> Optional[ID3]:
+        """Loads the ID3v2 tag at the start of the MP3 file.
+
+        Args:
+            filepath (AudioSource): The path to the MP3 file, or a binary
+                file object holding it.
+
+        Returns:
+            Optional[ID3]: The ID3 tags of the file, or None if the file has
+                no ID3v2 header.
+        """
+        try:
+            return ID3(filepath, load_v1=False)
+        except ID3NoHeaderError:
+            return None
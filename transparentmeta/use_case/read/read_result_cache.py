@@ -0,0 +1,274 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module provides the `ReadResultCache` class, which caches the results of
+verified metadata reads, so that audio files read over and over aren't
+parsed, verified and deserialized every time.
+
+Results are keyed by the stat identity of the file, i.e., its device, inode,
+size and modification time in nanoseconds. Any write to the file changes its
+identity, so a stale result is never returned for a modified file.
+
+Results are also keyed by a scope, which identifies how they were produced,
+e.g., the public key that verified them. A result verified with one key is
+never returned to a reader using another one, even if they share a cache or
+a store.
+
+The cache lives in memory, bounded by a maximum number of entries, with
+least-recently-used eviction and an optional time to live. It can be backed
+by a `SQLiteReadResultStore`, so that results survive process restarts.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from transparentmeta.entity.metadata import Metadata
+from transparentmeta.result.result import ReadResult
+from transparentmeta.utils.file_utils import FileIdentity
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 4096
+
+CacheEntry = Tuple[float, ReadResult]
+CacheKey = Tuple[str, FileIdentity]
+
+
+class SQLiteReadResultStore:
+    """Disk-backed store of read results in a SQLite database.
+
+    Metadata is stored as JSON, and validated again when it's loaded.
+
+    Attributes:
+        database_path (Path): Path to the SQLite database file. It's created
+            if it doesn't exist.
+    """
+
+    def __init__(self, database_path: Path) -> None:
+        """Initializes the store, creating its table if needed.
+
+        Args:
+            database_path (Path): Path to the SQLite database file.
+        """
+        # sqlite3 is imported here, so that in-memory caches don't pay for
+        # importing it.
+        # pylint: disable-next=import-outside-toplevel
+        from transparentmeta.utils.sqlite_utils import SQLiteDatabase
+
+        self.database_path = database_path
+        self._database = SQLiteDatabase(
+            database_path,
+            [
+                "CREATE TABLE IF NOT EXISTS read_results ("
+                "scope TEXT, device INTEGER, inode INTEGER, size INTEGER, "
+                "mtime_ns INTEGER, stored_at REAL, is_success INTEGER, "
+                "error TEXT, metadata TEXT, "
+                "PRIMARY KEY (scope, device, inode, size, mtime_ns))"
+            ],
+        )
+
+    def get(
+        self, scope: str, file_identity: FileIdentity
+    ) -> Optional[CacheEntry]:
+        """Gets the stored read result for a file identity.
+
+        Args:
+            scope (str): The scope of the result.
+            file_identity (FileIdentity): The stat identity of the file.
+
+        Returns:
+            Optional[Tuple[float, ReadResult]]: The time the result was
+                stored and the result, or None if nothing is stored.
+        """
+        row = self._database.fetch_one(
+            "SELECT stored_at, is_success, error, metadata "
+            "FROM read_results WHERE scope = ? AND device = ? "
+            "AND inode = ? AND size = ? AND mtime_ns = ?",
+            (scope, *file_identity),
+        )
+        if row is None:
+            return None
+
+        stored_at, is_success, error, metadata_json = row
+        metadata = (
+            Metadata.model_validate_json(metadata_json)
+            if metadata_json is not None
+            else None
+        )
+        return stored_at, ReadResult(
+            is_success=bool(is_success), error=error, metadata=metadata
+        )
+
+    def put(
+        self,
+        scope: str,
+        file_identity: FileIdentity,
+        stored_at: float,
+        read_result: ReadResult,
+    ) -> None:
+        """Stores a read result for a file identity.
+
+        Args:
+            scope (str): The scope of the result.
+            file_identity (FileIdentity): The stat identity of the file.
+            stored_at (float): The time the result is stored at.
+            read_result (ReadResult): The result to store.
+        """
+        metadata_json = (
+            read_result.metadata.model_dump_json()
+            if read_result.metadata is not None
+            else None
+        )
+        self._database.execute(
+            "INSERT OR REPLACE INTO read_results "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                scope,
+                *file_identity,
+                stored_at,
+                read_result.is_success,
+                read_result.error,
+                metadata_json,
+            ),
+        )
+
+    def clear(self) -> None:
+        """Deletes all the stored read results."""
+        self._database.execute("DELETE FROM read_results")
+
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        self._database.close()
+
+
+class ReadResultCache:
+    """Thread-safe LRU cache of read results keyed by scope and file
+    identity.
+
+    Attributes:
+        max_entries (int): Maximum number of results kept in memory. The
+            least recently used results are evicted first.
+        ttl_seconds (Optional[float]): Time to live of the results, in
+            seconds. If None, results never expire.
+        store (Optional[SQLiteReadResultStore]): Disk-backed store consulted
+            on memory misses, and updated with every new result.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: Optional[float] = None,
+        store: Optional[SQLiteReadResultStore] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initializes the ReadResultCache.
+
+        Args:
+            max_entries (int): Maximum number of results kept in memory.
+                Defaults to 4096.
+            ttl_seconds (Optional[float]): Time to live of the results, in
+                seconds. Defaults to None, i.e., results never expire.
+            store (Optional[SQLiteReadResultStore]): Disk-backed store.
+                Defaults to None, i.e., results are kept in memory only.
+            clock (Callable[[], float]): Returns the current time in seconds.
+                Defaults to `time.time`, which is comparable across
+                processes sharing a store.
+
+        Raises:
+            ValueError: If max_entries is lower than 1, or ttl_seconds isn't
+                positive.
+        """
+        if max_entries < 1:
+            raise ValueError(
+                f"max_entries must be at least 1, got {max_entries}"
+            )
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError(
+                f"ttl_seconds must be positive, got {ttl_seconds}"
+            )
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.store = store
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of results kept in memory."""
+        return len(self._entries)
+
+    def get(
+        self, scope: str, file_identity: FileIdentity
+    ) -> Optional[ReadResult]:
+        """Gets the cached read result for a file identity.
+
+        Args:
+            scope (str): The scope of the result, e.g., identifying the key
+                and the reader mode it was verified with.
+            file_identity (FileIdentity): The stat identity of the file.
+
+        Returns:
+            Optional[ReadResult]: The cached result, or None if there's no
+                cached result in the scope or it has expired.
+        """
+        cache_key = (scope, file_identity)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                self._entries.move_to_end(cache_key)
+
+        if entry is None and self.store is not None:
+            entry = self.store.get(scope, file_identity)
+            if entry is not None and not self._is_expired(entry):
+                self._add_entry(cache_key, entry)
+
+        if entry is None:
+            return None
+        if self._is_expired(entry):
+            with self._lock:
+                self._entries.pop(cache_key, None)
+            return None
+
+        logger.debug("Read result cache hit for file %s", file_identity)
+        return entry[1]
+
+    def put(
+        self, scope: str, file_identity: FileIdentity, read_result: ReadResult
+    ) -> None:
+        """Caches the read result for a file identity.
+
+        Args:
+            scope (str): The scope of the result.
+            file_identity (FileIdentity): The stat identity of the file.
+            read_result (ReadResult): The result to cache.
+        """
+        entry = (self._clock(), read_result)
+        self._add_entry((scope, file_identity), entry)
+        if self.store is not None:
+            self.store.put(scope, file_identity, *entry)
+
+    def clear(self) -> None:
+        """Removes all the cached results, including those in the store."""
+        with self._lock:
+            self._entries.clear()
+        if self.store is not None:
+            self.store.clear()
+
+    def _add_entry(self, cache_key: CacheKey, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[cache_key] = entry
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _is_expired(self, entry: CacheEntry) -> bool:
+        if self.ttl_seconds is None:
+            return False
+        stored_at = entry[0]
+        return self._clock() - stored_at >= self.ttl_seconds
@@ -6,23 +6,41 @@
 This module provides a `ReadUseCase` class with the core business logic for
 reading, verifying, and deserializing transparency metadata from audio files.
 It acts as a facade over `MetadataReader`, `SignatureVerifier`, and
-`MetadataSerializer`.
+`MetadataSerializer`. Metadata bound to the audio by a content hash is also
+checked against the audio payload, with a `ContentHasher`.
 """
 
+import io
 import logging
-from typing import cast
+from typing import Optional, cast
 
+from transparentmeta.crypto.content_hasher import ContentHasher
+from transparentmeta.crypto.key_management import get_public_key_fingerprint
 from transparentmeta.crypto.signature_verifier import SignatureVerifier
 from transparentmeta.entity.metadata import Metadata
+from transparentmeta.instrumentation.instrumentation import (
+    Instrumentation,
+    Stage,
+    run_stage,
+)
+from transparentmeta.request.read_bytes_request import ReadBytesRequest
 from transparentmeta.request.read_request import ReadRequest
 from transparentmeta.result.result import ReadResult
 from transparentmeta.serialization.metadata_serializer import (
     MetadataSerializer,
+    SerializedMetadata,
 )
 from transparentmeta.use_case.read.metadata_reader import (
     AudioFileDataReading,
     MetadataReader,
 )
+from transparentmeta.use_case.read.read_result_cache import ReadResultCache
+from transparentmeta.use_case.types import AudioSource
+from transparentmeta.utils.file_utils import (
+    get_audio_source_name,
+    get_audio_source_size,
+    get_file_identity,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +54,8 @@ class ReadUseCase:
        `MetadataReader`.
     2. Verifying the signature using `SignatureVerifier`.
     3. Deserializing the metadata using `MetadataSerializer`.
+    4. Checking the content hash of the metadata, if any, using
+       `ContentHasher`.
 
     Attributes:
         metadata_reader (MetadataReader): The reader responsible for extracting
@@ -44,13 +64,25 @@ class ReadUseCase:
             of the metadata.
         metadata_serializer (MetadataSerializer): Deserializes the raw metadata
             string into a metadata object.
+        read_result_cache (Optional[ReadResultCache]): Caches the results of
+            file reads, so that unchanged files aren't read again.
+        instrumentation (Optional[Instrumentation]): Receives the timings of
+            the stages of each read.
+        content_hasher (ContentHasher): Checks the content hashes of
+            metadata against the audio payload.
     """
 
+    # The collaborators past the serializer are optional and keyword-only.
+    # pylint: disable-next=too-many-arguments
     def __init__(
         self,
         metadata_reader: MetadataReader,
         signature_verifier: SignatureVerifier,
         metadata_serializer: MetadataSerializer,
+        *,
+        read_result_cache: Optional[ReadResultCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        content_hasher: Optional[ContentHasher] = None,
     ) -> None:
         """Initializes the ReadUseCase with reader, verifier, and serializer.
 
@@ -58,10 +90,19 @@ class ReadUseCase:
             metadata_reader (MetadataReader): The metadata reader.
             signature_verifier (SignatureVerifier): The signature verifier.
             metadata_serializer (MetadataSerializer): The metadata deserializer.
+            read_result_cache (Optional[ReadResultCache]): The cache of read
+                results. Defaults to None, i.e., no caching.
+            instrumentation (Optional[Instrumentation]): Receives stage
+                timings. Defaults to None, i.e., stages aren't timed.
+            content_hasher (Optional[ContentHasher]): Checks content
+                hashes. Defaults to a ContentHasher with default settings.
         """
         self._metadata_reader = metadata_reader
         self.signature_verifier = signature_verifier
         self.metadata_serializer = metadata_serializer
+        self.read_result_cache = read_result_cache
+        self.instrumentation = instrumentation
+        self.content_hasher = content_hasher or ContentHasher()
 
     @property
     def metadata_reader(self) -> MetadataReader:
@@ -81,19 +122,100 @@ class ReadUseCase:
         """
         self._metadata_reader = reader
 
-    def read(self, read_request: ReadRequest) -> ReadResult:
+    def read(
+        self,
+        read_request: ReadRequest,
+        metadata_reader: Optional[MetadataReader] = None,
+    ) -> ReadResult:
         """Reads metadata and its signature from the audio file, verifies the
         signature, and deserializes the metadata.
 
+        The use case itself isn't modified, so one instance can serve many
+        threads at once, each passing the reader for its own file.
+
+        If the use case has a read result cache, and the file hasn't changed
+        since it was last read, the cached result is returned.
+
         Args:
             read_request (ReadRequest): Path to the audio file.
+            metadata_reader (Optional[MetadataReader]): The reader to use for
+                this file. Defaults to the metadata reader of the use case.
+
+        Returns:
+            ReadResult: A result object indicating whether the read was
+                successful, and if so, includes the deserialized metadata.
+
+        Raises:
+            InvalidAudioFileError: If the file is not a functioning audio file.
+        """
+        metadata_reader = metadata_reader or self.metadata_reader
+        if self.read_result_cache is None:
+            return self._read_and_verify(
+                read_request.filepath, metadata_reader
+            )
+
+        # The file is stat'ed before it's read, so that if it changes while
+        # it's read, the result is cached under an identity that's stale.
+        file_identity = get_file_identity(read_request.filepath)
+        cache_scope = self._get_cache_scope(metadata_reader)
+        read_result = self.read_result_cache.get(cache_scope, file_identity)
+        if read_result is None:
+            read_result = self._read_and_verify(
+                read_request.filepath, metadata_reader
+            )
+            self.read_result_cache.put(cache_scope, file_identity, read_result)
+        return read_result
+
+    def read_bytes(
+        self,
+        read_bytes_request: ReadBytesRequest,
+        metadata_reader: Optional[MetadataReader] = None,
+    ) -> ReadResult:
+        """Reads metadata and its signature from audio held in memory,
+        verifies the signature, and deserializes the metadata.
+
+        Args:
+            read_bytes_request (ReadBytesRequest): The content of the audio
+                file.
+            metadata_reader (Optional[MetadataReader]): The reader to use for
+                this data. Defaults to the metadata reader of the use case.
 
         Returns:
             ReadResult: A result object indicating whether the read was
                 successful, and if so, includes the deserialized metadata.
+
+        Raises:
+            InvalidAudioFileError: If the data is not a functioning audio
+                file.
         """
-        logger.debug("Reading metadata for file %s", read_request.filepath)
-        audio_file_data_reading = self._read_metadata(read_request)
+        return self._read_and_verify(
+            io.BytesIO(read_bytes_request.audio_data),
+            metadata_reader or self.metadata_reader,
+        )
+
+    def _get_cache_scope(self, metadata_reader: MetadataReader) -> str:
+        # A result only holds for the key that verified it, and for the
+        # checks of the reader that produced it: tag-only readers don't
+        # check that the audio stream is functioning.
+        public_key_fingerprint = get_public_key_fingerprint(
+            self.signature_verifier.public_key
+        )
+        read_mode = "tag-only" if metadata_reader.is_tag_only else "full"
+        return f"{public_key_fingerprint}:{read_mode}"
+
+    def _read_and_verify(
+        self, source: AudioSource, metadata_reader: MetadataReader
+    ) -> ReadResult:
+        instrumentation = self.instrumentation
+        source_name = get_audio_source_name(source)
+        logger.debug("Reading metadata for file %s", source_name)
+        audio_file_data_reading = run_stage(
+            instrumentation,
+            Stage.LOAD,
+            source_name,
+            lambda _: get_audio_source_size(source),
+            lambda: metadata_reader.read(source),
+        )
 
         if not self._is_audio_file_data_reading_successful(
             audio_file_data_reading
@@ -103,29 +225,53 @@ class ReadUseCase:
                 error="Metadata and/or signature are not present in the file.",
             )
 
-        metadata = cast(str, audio_file_data_reading.metadata)
+        metadata = cast(SerializedMetadata, audio_file_data_reading.metadata)
         signature = cast(str, audio_file_data_reading.signature)
 
-        logger.debug(
-            "Verifying signature is valid for file %s", read_request.filepath
+        logger.debug("Verifying signature is valid for file %s", source_name)
+        is_signature_valid = run_stage(
+            instrumentation,
+            Stage.VERIFY,
+            source_name,
+            lambda _: len(metadata),
+            lambda: self._is_signature_valid(metadata, signature),
         )
-        if not self._is_signature_valid(metadata, signature):
+        if not is_signature_valid:
             return ReadResult(
                 is_success=False, error="Signature verification failed."
             )
 
-        logger.debug(
-            "Deserializing metadata for file %s", read_request.filepath
+        logger.debug("Deserializing metadata for file %s", source_name)
+        metadata_obj = run_stage(
+            instrumentation,
+            Stage.DESERIALIZE,
+            source_name,
+            lambda _: len(metadata),
+            lambda: self._deserialize_metadata(metadata),
         )
-        metadata_obj = self._deserialize_metadata(metadata)
-        return ReadResult(is_success=True, metadata=metadata_obj)
 
-    def _read_metadata(
-        self, read_request: ReadRequest
-    ) -> AudioFileDataReading:
-        filepath = read_request.filepath
-        audio_file_data_reading = self.metadata_reader.read(filepath)
-        return audio_file_data_reading
+        content_hash = metadata_obj.content_hash
+        if content_hash is not None:
+            logger.debug(
+                "Verifying content hash is valid for file %s", source_name
+            )
+            is_content_hash_valid = run_stage(
+                instrumentation,
+                Stage.HASH,
+                source_name,
+                lambda _: get_audio_source_size(source),
+                lambda: self.content_hasher.is_content_hash_valid(
+                    source, content_hash
+                ),
+            )
+            if not is_content_hash_valid:
+                return ReadResult(
+                    is_success=False,
+                    error="Content hash verification failed: the audio "
+                    "doesn't match the metadata.",
+                )
+
+        return ReadResult(is_success=True, metadata=metadata_obj)
 
     @staticmethod
     def _is_audio_file_data_reading_successful(
@@ -133,8 +279,10 @@ class ReadUseCase:
     ) -> bool:
         return audio_file_data_reading.is_success
 
-    def _deserialize_metadata(self, metadata: str) -> Metadata:
+    def _deserialize_metadata(self, metadata: SerializedMetadata) -> Metadata:
         return self.metadata_serializer.deserialize(metadata)
 
-    def _is_signature_valid(self, metadata: str, signature: str) -> bool:
+    def _is_signature_valid(
+        self, metadata: SerializedMetadata, signature: str
+    ) -> bool:
         return self.signature_verifier.is_signature_valid(metadata, signature)
@@ -5,30 +5,58 @@
 """
 Module for selecting the appropriate metadata reader based on audio file format.
 
-This module defines a registry of available metadata readers (e.g., for MP3 and
-WAV) and provides the `ReaderSelector` class to dispatch the correct reader
-instance based on the file extension. It serves as an abstraction layer to
-decouple audio format-specific logic from higher-level orchestration.
+This module defines registries of available metadata readers (e.g., for MP3 and
+WAV), in both a full and a tag-only flavour, and provides the `ReaderSelector`
+class to dispatch the correct reader instance based on the file extension. It
+serves as an abstraction layer to decouple audio format-specific logic from
+higher-level orchestration.
 """
 
 import logging
-from types import MappingProxyType
-from typing import Mapping
+from typing import Callable, Dict, Mapping
 
 from transparentmeta.use_case.read.metadata_reader import MetadataReader
-from transparentmeta.use_case.read.mp3_metadata_reader import MP3MetadataReader
-from transparentmeta.use_case.read.wav_metadata_reader import WAVMetadataReader
+from transparentmeta.utils.lazy_import_utils import (
+    LazyConstructor,
+    LazyRegistry,
+)
 
-mp3_metadata_reader = MP3MetadataReader()
-wav_metadata_reader = WAVMetadataReader()
+# Readers are built, and their audio format modules imported, only when a
+# file of their format is first read.
+_READ_PACKAGE = "transparentmeta.use_case.read"
+_wav_metadata_reader = LazyConstructor(
+    f"{_READ_PACKAGE}.wav_metadata_reader", "WAVMetadataReader"
+)
+_wav_tag_only_metadata_reader = LazyConstructor(
+    f"{_READ_PACKAGE}.wav_tag_only_metadata_reader",
+    "WAVTagOnlyMetadataReader",
+)
+
+MetadataReaderConstructor = Callable[..., MetadataReader]
+metadata_reader_constructors_map: Dict[str, MetadataReaderConstructor] = {
+    "mp3": LazyConstructor(
+        f"{_READ_PACKAGE}.mp3_metadata_reader", "MP3MetadataReader"
+    ),
+    "wav": _wav_metadata_reader,
+    "wave": _wav_metadata_reader,
+}
+tag_only_metadata_reader_constructors_map: Dict[
+    str, MetadataReaderConstructor
+] = {
+    "mp3": LazyConstructor(
+        f"{_READ_PACKAGE}.mp3_tag_only_metadata_reader",
+        "MP3TagOnlyMetadataReader",
+    ),
+    "wav": _wav_tag_only_metadata_reader,
+    "wave": _wav_tag_only_metadata_reader,
+}
 
 MetadataReaderRegistry = Mapping[str, MetadataReader]
-metadata_reader_registry = MappingProxyType(
-    {
-        "mp3": mp3_metadata_reader,
-        "wav": wav_metadata_reader,
-        "wave": wav_metadata_reader,
-    }
+metadata_reader_registry: MetadataReaderRegistry = LazyRegistry(
+    metadata_reader_constructors_map
+)
+tag_only_metadata_reader_registry: MetadataReaderRegistry = LazyRegistry(
+    tag_only_metadata_reader_constructors_map
 )
 
 logger = logging.getLogger(__name__)
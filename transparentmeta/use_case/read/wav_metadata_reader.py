@@ -8,11 +8,10 @@ metadata and a digital signature from WAV files using Mutagen's ID3 tagging
 system.
 """
 
-from pathlib import Path
-
 from mutagen.wave import WAVE
 
 from transparentmeta.use_case.read.metadata_reader import MetadataReader
+from transparentmeta.use_case.types import AudioSource
 
 
 class WAVMetadataReader(MetadataReader):
@@ -22,11 +21,12 @@ class WAVMetadataReader(MetadataReader):
     fields, enabling consistent extraction of signed metadata.
     """
 
-    def _load_audio(self, filepath: Path) -> WAVE:
+    def _load_audio(self, filepath: AudioSource) -> WAVE:
         """Loads the WAV file and returns an object that supports ID3 tags.
 
         Args:
-            filepath (Path): The path to the WAV file.
+            filepath (AudioSource): The path to the WAV file, or a binary
+                file object holding it.
 
         Returns:
             WAVE: A Mutagen WAVE object with ID3 tag support.
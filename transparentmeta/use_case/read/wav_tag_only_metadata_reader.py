@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module provides a `WAVTagOnlyMetadataReader` class that reads
+transparency metadata and a digital signature from WAV files by parsing their
+ID3 chunk only, without touching the other RIFF chunks.
+
+Files on disk are memory-mapped: the RIFF chunk headers are read straight
+from the map, and Mutagen parses the tag from the map, seeked to the ID3
+chunk, so the tag is copied once, when Mutagen reads it. The operating
+system only reads the pages holding the headers and the tag, so a read takes
+the same time whether the file holds a few seconds of audio or 4GB of it.
+"""
+
+import mmap
+import os
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+from mutagen.id3 import ID3, ID3NoHeaderError
+
+from transparentmeta.use_case.read.wav_metadata_reader import WAVMetadataReader
+from transparentmeta.use_case.types import AudioSource
+from transparentmeta.utils.exceptions import InvalidRIFFFileError
+from transparentmeta.utils.riff_utils import (
+    ID3_CHUNK_IDS,
+    find_riff_chunk,
+    find_riff_chunk_in_buffer,
+)
+
+
+class WAVTagOnlyMetadataReader(WAVMetadataReader):
+    """Reads transparency metadata and a digital signature from the ID3 chunk
+    of WAV files.
+
+    This reader jumps from one RIFF chunk header to the next until it finds
+    the ID3 chunk, and then reads that chunk only. It doesn't parse the
+    format chunk or compute stream information, so the cost of a read doesn't
+    depend on the size of the audio data. Files on disk are memory-mapped,
+    and file objects are read with seeks.
+    """
+
+    is_tag_only = True
+
+    def _load_id3_tags(self, filepath: AudioSource) -> Optional[ID3]:
+        """Loads the ID3 tags stored in the ID3 chunk of the WAV file.
+
+        Args:
+            filepath (AudioSource): The path to the WAV file, or a binary
+                file object holding it.
+
+        Returns:
+            Optional[ID3]: The ID3 tags of the file, or None if the file has
+                no ID3 chunk.
+
+        Raises:
+            InvalidRIFFFileError: If the file is not a RIFF/WAVE file.
+        """
+        if isinstance(filepath, Path):
+            return self._load_memory_mapped_id3_tags(filepath)
+        chunk = find_riff_chunk(filepath, ID3_CHUNK_IDS)
+        if chunk is None:
+            return None
+        filepath.seek(chunk.data_offset)
+        return self._parse_id3_tags(filepath)
+
+    def _load_memory_mapped_id3_tags(self, filepath: Path) -> Optional[ID3]:
+        with open(filepath, "rb") as fileobj:
+            # Empty files can't be memory-mapped.
+            if os.fstat(fileobj.fileno()).st_size == 0:
+                raise InvalidRIFFFileError()
+            with mmap.mmap(
+                fileobj.fileno(), 0, access=mmap.ACCESS_READ
+            ) as memory_map:
+                chunk = find_riff_chunk_in_buffer(memory_map, ID3_CHUNK_IDS)
+                if chunk is None:
+                    return None
+                # Memory maps are file objects too, so Mutagen reads the tag
+                # straight from the map.
+                memory_map.seek(chunk.data_offset)
+                return self._parse_id3_tags(memory_map)
+
+    @staticmethod
+    def _parse_id3_tags(fileobj: Union[BinaryIO, mmap.mmap]) -> Optional[ID3]:
+        # The file object is positioned at the start of the ID3 chunk data.
+        try:
+            return ID3(fileobj, load_v1=False)
+        except ID3NoHeaderError:
+            return None
@@ -6,10 +6,20 @@
 This module defines type aliases used across the use_case package.
 
 This includes shared types for ID3-tagged audio files compatible with the
-Mutagen library (e.g., MP3 and WAV).
+Mutagen library (e.g., MP3 and WAV), and for the sources audio can be read
+from and written to: a path on disk, or a seekable binary file object such
+as `io.BytesIO` for audio held in memory.
 """
 
-from mutagen.mp3 import MP3
-from mutagen.wave import WAVE
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Union
 
-MutagenID3AudioTypes = MP3 | WAVE
+if TYPE_CHECKING:
+    from mutagen.mp3 import MP3
+    from mutagen.wave import WAVE
+
+# Mutagen format modules are only imported by the readers and writers of
+# their format.
+MutagenID3AudioTypes = Union["MP3", "WAVE"]
+
+AudioSource = Path | BinaryIO
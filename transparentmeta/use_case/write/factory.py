@@ -8,12 +8,16 @@ MetadataWriter classes and WriteUseCase.
 """
 
 import logging
-from typing import Callable, Dict
+from functools import partial
+from typing import Mapping, Optional
 
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
+from transparentmeta.crypto.content_hasher import ContentHasher
 from transparentmeta.crypto.signer import Signer
+from transparentmeta.instrumentation.instrumentation import Instrumentation
 from transparentmeta.serialization.metadata_serializer import (
+    MetadataFormat,
     MetadataSerializer,
 )
 from transparentmeta.use_case.constants import (
@@ -23,29 +27,22 @@ from transparentmeta.use_case.constants import (
 )
 from transparentmeta.use_case.exceptions import UnsupportedAudioFormatError
 from transparentmeta.use_case.write.metadata_writer import MetadataWriter
-from transparentmeta.use_case.write.mp3_metadata_writer import (
-    MP3MetadataWriter,
-)
-from transparentmeta.use_case.write.wav_metadata_writer import (
-    WAVMetadataWriter,
-)
+from transparentmeta.use_case.write.padding_policy import PaddingPolicy
 from transparentmeta.use_case.write.write_use_case import WriteUseCase
+from transparentmeta.use_case.write.writer_selector import (
+    metadata_writer_constructors_map,
+)
+from transparentmeta.utils.lazy_import_utils import LazyRegistry
 
 logger = logging.getLogger(__name__)
 
-metadata_writer_constructors_map: Dict[
-    str, Callable[[str, str], MetadataWriter]
-] = {
-    "mp3": MP3MetadataWriter,
-    "wav": WAVMetadataWriter,
-    "wave": WAVMetadataWriter,
-}
-
 
 def build_metadata_writer(
     audio_format: str,
     transparency_metadata_field: str = TRANSPARENCY_METADATA_FIELD,
     signature_field: str = SIGNATURE_FIELD,
+    padding_policy: PaddingPolicy = PaddingPolicy(),
+    atomic: bool = False,
 ) -> MetadataWriter:
     """Creates an instance of the appropriate concrete MetadataWriter based on
     audio format.
@@ -55,6 +52,10 @@ def build_metadata_writer(
         transparency_metadata_field (str): ID3 TXXX field for storing metadata.
         signature_field (str): ID3 TXXX field for storing the metadata
             signature.
+        padding_policy (PaddingPolicy): Padding policy applied when the ID3
+            tag is saved.
+        atomic (bool): Whether files are replaced atomically by a tagged
+            copy, rather than edited in place. Defaults to False.
 
     Returns:
         metadata_writer (MetadataWriter): An instance of MP3MetadataWriter or
@@ -75,17 +76,25 @@ def build_metadata_writer(
         )
 
     metadata_writer = metadata_writer_constructor(
-        transparency_metadata_field, signature_field
+        transparency_metadata_field, signature_field, padding_policy, atomic
     )
     logger.debug("%s instance created", metadata_writer.__class__.__name__)
     return metadata_writer
 
 
+# Besides the key and the format, every argument is an optional, keyword-only
+# setting passed through to the writer, the serializer or the use case.
+# pylint: disable-next=too-many-arguments
 def build_write_use_case(
     private_key: Ed25519PrivateKey,
     audio_format: str,
+    *,
     transparency_metadata_field: str = TRANSPARENCY_METADATA_FIELD,
     signature_field: str = SIGNATURE_FIELD,
+    padding_policy: PaddingPolicy = PaddingPolicy(),
+    instrumentation: Optional[Instrumentation] = None,
+    metadata_format: MetadataFormat = MetadataFormat.JSON,
+    content_hasher: Optional[ContentHasher] = None,
 ) -> WriteUseCase:
     """Creates an instance of WriteUseCase resolving all dependencies.
 
@@ -95,6 +104,15 @@ def build_write_use_case(
         transparency_metadata_field (str): ID3 TXXX field for storing metadata.
         signature_field (str): ID3 TXXX field for storing the metadata
             signature.
+        padding_policy (PaddingPolicy): Padding policy applied when the ID3
+            tag is saved.
+        instrumentation (Optional[Instrumentation]): Receives the timings of
+            the stages of each write. Defaults to None.
+        metadata_format (MetadataFormat): The format metadata is written in,
+            either JSON or the compact binary encoding. Defaults to JSON.
+        content_hasher (Optional[ContentHasher]): If given, computes the
+            hash of the audio payload, which is included in the signed
+            metadata. Defaults to None.
 
     Returns:
         write_use_case (WriteUseCase): An instance of WriteUseCase configured
@@ -107,15 +125,58 @@ def build_write_use_case(
         audio_format,
         transparency_metadata_field=transparency_metadata_field,
         signature_field=signature_field,
+        padding_policy=padding_policy,
     )
 
-    serializer = MetadataSerializer()
+    serializer = MetadataSerializer(metadata_format=metadata_format)
     logger.debug("MetadataSerializer instance created")
 
     signer = Signer(private_key)
     logger.debug("Signer instance created")
 
-    write_use_case = WriteUseCase(serializer, signer, writer)
+    write_use_case = WriteUseCase(
+        serializer, signer, writer, instrumentation, content_hasher
+    )
     logger.debug("WriteUseCase instance created")
 
     return write_use_case
+
+
+def build_metadata_writer_registry(
+    transparency_metadata_field: str = TRANSPARENCY_METADATA_FIELD,
+    signature_field: str = SIGNATURE_FIELD,
+    padding_policy: PaddingPolicy = PaddingPolicy(),
+    atomic: bool = False,
+) -> Mapping[str, MetadataWriter]:
+    """Creates an immutable registry mapping each supported audio format to
+    a MetadataWriter configured with the given options.
+
+    Writers are built when they are first looked up in the registry.
+
+    Args:
+        transparency_metadata_field (str): ID3 TXXX field for storing metadata.
+        signature_field (str): ID3 TXXX field for storing the metadata
+            signature.
+        padding_policy (PaddingPolicy): Padding policy applied when the ID3
+            tag is saved.
+        atomic (bool): Whether files are replaced atomically by a tagged
+            copy, rather than edited in place. Defaults to False.
+
+    Returns:
+        metadata_writer_registry (Mapping[str, MetadataWriter]): A mapping of
+            file extensions to metadata writers, usable by WriterSelector.
+    """
+    metadata_writer_registry: Mapping[str, MetadataWriter] = LazyRegistry(
+        {
+            audio_format: partial(
+                build_metadata_writer,
+                audio_format,
+                transparency_metadata_field,
+                signature_field,
+                padding_policy,
+                atomic,
+            )
+            for audio_format in SUPPORTED_AUDIO_FORMATS
+        }
+    )
+    return metadata_writer_registry
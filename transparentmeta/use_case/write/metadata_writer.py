@@ -10,14 +10,33 @@ interface for writing metadata and a digital signature to audio files using ID3.
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Optional
 
+from transparentmeta.instrumentation.instrumentation import (
+    Instrumentation,
+    Stage,
+    run_stage,
+)
+from transparentmeta.request.exceptions import InvalidAudioFileError
+from transparentmeta.serialization.metadata_serializer import (
+    SerializedMetadata,
+)
 from transparentmeta.use_case.constants import (
     SIGNATURE_FIELD,
     TRANSPARENCY_METADATA_FIELD,
 )
-from transparentmeta.use_case.types import MutagenID3AudioTypes
+from transparentmeta.use_case.types import AudioSource, MutagenID3AudioTypes
+from transparentmeta.use_case.write.padding_policy import PaddingPolicy
+from transparentmeta.utils.atomic_file_utils import atomic_replace
+from transparentmeta.utils.file_utils import (
+    get_audio_source_name,
+    get_audio_source_size,
+)
 from transparentmeta.utils.metadata_tags_utils import (
     create_id3_tags_in_file_if_none_exists,
+    delete_priv_id3_tags,
+    delete_txxx_id3_tag,
+    set_priv_id3_tag,
     set_txxx_id3_tag,
 )
 
@@ -31,24 +50,32 @@ class MetadataWriter(ABC):
 
     This class provides a standard interface for writing metadata in ID3-based
     formats like MP3 and WAV. It ensures metadata consistency across
-    different audio file types by using TXXX frames.
+    different audio file types by using TXXX frames for JSON metadata and
+    signatures, and a PRIV frame, owned by the transparency metadata field,
+    for binary metadata.
 
     The class uses the mutagen library to inject ID3 tags into audio files.
 
-    Subclasses should implement the `write()` method for specific file formats
-    (e.g., MP3, WAV).
+    Subclasses should implement the `_load_audio()` method for specific file
+    formats (e.g., MP3, WAV).
 
     Attributes:
         transparency_metadata_field (str): ID3 TXXX field for storing
             metadata.
         signature_field (str): ID3 TXXX field for storing the metadata
             signature.
+        padding_policy (PaddingPolicy): Decides how much padding to reserve
+            after the ID3 tag, so that later writes can happen in place.
+        atomic (bool): Whether files are replaced atomically, rather than
+            edited in place, so that a crash never leaves them half-written.
     """
 
     def __init__(
         self,
         transparency_metadata_field: str = TRANSPARENCY_METADATA_FIELD,
         signature_field: str = SIGNATURE_FIELD,
+        padding_policy: PaddingPolicy = PaddingPolicy(),
+        atomic: bool = False,
     ) -> None:
         """
         Initializes the MetadataWriter with custom metadata and signature
@@ -59,34 +86,138 @@ class MetadataWriter(ABC):
                 metadata.
             signature_field (str): ID3 TXXX field for storing the metadata
                 signature.
+            padding_policy (PaddingPolicy): Padding policy applied when the
+                ID3 tag is saved. Defaults to a policy that reserves 4KB of
+                padding when the tag grows, and never shrinks it.
+            atomic (bool): If True, tags are saved to a copy of the file,
+                which is then renamed over the file, rather than to the
+                file itself. The copy is a reflink where the file system
+                supports it. Only applies to files on disk. Defaults to
+                False.
         """
         self.transparency_metadata_field = transparency_metadata_field
         self.signature_field = signature_field
+        self.padding_policy = padding_policy
+        self.atomic = atomic
 
-    @abstractmethod
-    def write(self, filepath: Path, metadata: str, signature: str) -> None:
-        """Writes metadata and a digital signature to an audio file. This
-        method must be implemented by subclasses.
+    def write(
+        self,
+        filepath: AudioSource,
+        metadata: SerializedMetadata,
+        signature: str,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> None:
+        """Writes metadata and a digital signature to an audio file.
+
+        The file is parsed once, and the same parsed audio object is tagged
+        and saved. Parsing also validates that the file is a functioning
+        audio file. If the new tag fits in the existing tag and its padding,
+        it's overwritten in place, otherwise padding is reserved according
+        to the padding policy.
+
+        In atomic mode, the tags are saved to a copy of the file, which then
+        replaces the file, so that the file is never left half-written.
 
         Args:
-            filepath (Path): The path to the audio file.
-            metadata (str): The serialized metadata string with transparency
-                info.
+            filepath (AudioSource): The path to the audio file, or a seekable
+                and writable binary file object holding it, which is updated
+                in place.
+            metadata (SerializedMetadata): The serialized metadata string
+                with transparency info, or its binary encoding. Metadata in
+                the other format is removed from the file.
             signature (str): The signature string.
+            instrumentation (Optional[Instrumentation]): Receives the
+                timings of the load and save stages. Defaults to None.
+
+        Raises:
+            InvalidAudioFileError: If the file is not a functioning audio file.
         """
+        source_name = get_audio_source_name(filepath)
+        audio = run_stage(
+            instrumentation,
+            Stage.LOAD,
+            source_name,
+            lambda _: get_audio_source_size(filepath),
+            lambda: self._load_functioning_audio(filepath),
+        )
+        audio = self._write_id3_tags(audio, metadata, signature)
+        run_stage(
+            instrumentation,
+            Stage.SAVE,
+            source_name,
+            lambda _: get_audio_source_size(filepath),
+            lambda: self._save_audio(audio, filepath),
+        )
+
+    @abstractmethod
+    def _load_audio(self, filepath: AudioSource) -> MutagenID3AudioTypes:
+        """Loads and returns an audio object for the given file path.
+
+        Subclasses must implement this method to provide format-specific
+        loading logic.
+
+        Args:
+            filepath (AudioSource): The path to the audio file, or a binary
+                file object holding it.
+
+        Returns:
+            An audio object that supports ID3 tagging.
+        """
+
+    def _load_functioning_audio(
+        self, filepath: AudioSource
+    ) -> MutagenID3AudioTypes:
+        try:
+            return self._load_audio(filepath)
+        except Exception as err:
+            raise InvalidAudioFileError(
+                get_audio_source_name(filepath), str(err)
+            ) from err
+
+    def _save_audio(
+        self, audio: MutagenID3AudioTypes, filepath: AudioSource
+    ) -> None:
+        if not self.atomic or not isinstance(filepath, Path):
+            self._save_tags(audio, filepath)
+            return
+        # The audio was parsed from the file, and the copy is identical, so
+        # the tags can be saved to the copy.
+        with atomic_replace(filepath) as temporary_filepath:
+            self._save_tags(audio, temporary_filepath)
+
+    def _save_tags(
+        self, audio: MutagenID3AudioTypes, filepath: AudioSource
+    ) -> None:
+        """Saves the ID3 tags of an audio object to a file.
+
+        Subclasses can override this method to save tags with a
+        format-specific strategy. By default, Mutagen saves them.
+
+        Args:
+            audio (MutagenID3AudioTypes): The audio object whose tags are
+                saved.
+            filepath (AudioSource): The path to the audio file, or a seekable
+                and writable binary file object holding it.
+        """
+        audio.save(filepath, padding=self.padding_policy)
 
     def _write_id3_tags(
-        self, audio: MutagenID3AudioTypes, metadata: str, signature: str
+        self,
+        audio: MutagenID3AudioTypes,
+        metadata: SerializedMetadata,
+        signature: str,
     ) -> MutagenID3AudioTypes:
         """Applies metadata and a digital signature to an ID3-tagged audio file.
 
         This method ensures the audio file has ID3 tags and then writes
-        metadata and signature to TXXX frames.
+        metadata to a TXXX frame, or to a PRIV frame if it's binary, and the
+        signature to a TXXX frame.
 
         Args:
             audio (MutagenID3AudioTypes): A Mutagen audio file object with ID3
                 support.
-            metadata (str): Serialized metadata string.
+            metadata (SerializedMetadata): Serialized metadata string, or its
+                binary encoding.
             signature (str): The digital signature string.
 
         Returns:
@@ -97,17 +228,28 @@ class MetadataWriter(ABC):
         audio = self._set_metadata_id3_tag(audio, metadata)
         audio = self._set_signature_id3_tag(audio, signature)
 
-        logger.debug(
-            "Data written to ID3 tags. Metadata: '%.40s'. Signature: '%s'",
-            metadata,
-            signature,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Data written to ID3 tags. Metadata: '%.40s'. Signature: '%s'",
+                metadata,
+                signature,
+            )
 
         return audio
 
     def _set_metadata_id3_tag(
-        self, audio: MutagenID3AudioTypes, metadata: str
+        self, audio: MutagenID3AudioTypes, metadata: SerializedMetadata
     ) -> MutagenID3AudioTypes:
+        # A file holds metadata in one format only, so that readers never
+        # pick up stale metadata written in the other format.
+        if isinstance(metadata, bytes):
+            audio = delete_txxx_id3_tag(
+                audio, self.transparency_metadata_field
+            )
+            return set_priv_id3_tag(
+                audio, self.transparency_metadata_field, metadata
+            )
+        audio = delete_priv_id3_tags(audio, self.transparency_metadata_field)
         return set_txxx_id3_tag(
             audio, self.transparency_metadata_field, metadata
         )
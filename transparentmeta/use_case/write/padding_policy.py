@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module provides the `PaddingPolicy` class, which decides how much
+padding to reserve in ID3 tags when metadata is written to audio files.
+
+ID3 tags can be followed by padding, i.e., unused bytes reserved for future
+growth. When a rewritten tag fits in the space taken by the old tag and its
+padding, Mutagen overwrites the tag in place. Otherwise, the data that
+follows the tag has to be moved, which for MP3 files means rewriting the
+whole audio stream. Reserving padding on the first write lets later
+re-signing or key rotation update the TXXX frames in place.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from mutagen import PaddingInfo
+
+DEFAULT_RESERVED_PADDING: int = 4096  # 4KB in bytes
+
+
+@dataclass(frozen=True)
+class PaddingPolicy:
+    """Padding policy for ID3 tags, usable as a Mutagen padding function.
+
+    Existing padding is always reused when the new tag fits in it, so that
+    the tag is rewritten in place. When the tag doesn't fit, it grows and
+    `reserved_padding` bytes are reserved after it for future writes.
+
+    Attributes:
+        reserved_padding (int): Padding in bytes reserved when a tag is
+            created or has to grow. Defaults to 4096.
+        max_padding (Optional[int]): Maximum padding in bytes to keep. Tags
+            with more padding than this are shrunk back to
+            `reserved_padding`, which requires moving the audio data. If
+            None, padding is never shrunk. Defaults to None.
+    """
+
+    reserved_padding: int = DEFAULT_RESERVED_PADDING
+    max_padding: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.reserved_padding < 0:
+            raise ValueError(
+                f"Reserved padding must be non-negative: "
+                f"{self.reserved_padding}"
+            )
+        if (
+            self.max_padding is not None
+            and self.max_padding < self.reserved_padding
+        ):
+            raise ValueError(
+                f"Max padding {self.max_padding} must not be smaller than "
+                f"reserved padding {self.reserved_padding}"
+            )
+
+    def __call__(self, padding_info: PaddingInfo) -> int:
+        """Computes the padding to leave after the tag once it's saved.
+
+        Args:
+            padding_info (PaddingInfo): Padding information provided by
+                Mutagen. `padding_info.padding` is the padding left if the
+                tag is rewritten in place, and is negative if the tag doesn't
+                fit in the available space.
+
+        Returns:
+            int: The amount of padding in bytes to leave after the tag.
+        """
+        if padding_info.padding < 0:
+            return self.reserved_padding
+        if (
+            self.max_padding is not None
+            and padding_info.padding > self.max_padding
+        ):
+            return self.reserved_padding
+        return padding_info.padding
@@ -5,27 +5,77 @@
 """
 This module provides a `WAVMetadataWriter` class that writes metadata and
 a digital signature to WAV files using the Mutagen library for ID3 tagging.
+
+Mutagen is used to parse the file and build the ID3 tag, but the tag is
+saved to the ID3 chunk by a dedicated RIFF chunk writer. Mutagen resizes the
+ID3 chunk where it is, which moves all the chunks that follow it, e.g., the
+whole audio data when the ID3 chunk comes first. The chunk writer never
+moves other chunks, so saving a tag only touches the end of the file, and
+takes milliseconds even for multi-GB files.
 """
 
 from pathlib import Path
-from typing import cast
+from typing import BinaryIO
 
+from mutagen.id3 import ID3
 from mutagen.wave import WAVE
 
+from transparentmeta.use_case.types import AudioSource, MutagenID3AudioTypes
 from transparentmeta.use_case.write.metadata_writer import MetadataWriter
+from transparentmeta.utils.metadata_tags_utils import render_id3_tag
+from transparentmeta.utils.riff_utils import (
+    ID3_CHUNK_IDS,
+    find_riff_chunk,
+    write_riff_chunk,
+)
 
 
 class WAVMetadataWriter(MetadataWriter):
     """Writes metadata and a digital signature to WAV files using Mutagen."""
 
-    def write(self, filepath: Path, metadata: str, signature: str) -> None:
-        """Writes metadata and signature ID3 TXXX fields of a WAV file.
+    def _load_audio(self, filepath: AudioSource) -> WAVE:
+        """Loads the WAV file and returns an object that supports ID3 tags.
+
+        Args:
+            filepath (AudioSource): The path to the WAV file, or a binary
+                file object holding it.
+
+        Returns:
+            WAVE: A Mutagen WAVE object with ID3 tag support.
+        """
+        return WAVE(filepath)
+
+    def _save_tags(
+        self, audio: MutagenID3AudioTypes, filepath: AudioSource
+    ) -> None:
+        """Saves the ID3 tags of a WAV file to its ID3 chunk, without moving
+        any other chunk.
+
+        If the ID3 chunk is the last chunk, it's rewritten at the end of the
+        file. If it's followed by other chunks, it's overwritten in place
+        when the new tag fits in the existing tag and its padding, which
+        the padding policy reuses. Otherwise, it's replaced by a JUNK chunk
+        and written again at the end of the file. Content hashes skip JUNK
+        chunks, so this doesn't change the content hash of the file.
 
         Args:
-            filepath (Path): The WAV file path.
-            metadata (str): Serialized metadata string with transparency info.
-            signature (str): The signature string.
+            audio (MutagenID3AudioTypes): The WAV audio object whose tags
+                are saved.
+            filepath (AudioSource): The path to the WAV file, or a seekable
+                and writable binary file object holding it.
         """
-        audio = WAVE(filepath)
-        audio = cast(WAVE, self._write_id3_tags(audio, metadata, signature))
-        audio.save()
+        assert isinstance(audio.tags, ID3)
+        if isinstance(filepath, Path):
+            with open(filepath, "r+b") as stream:
+                self._write_id3_chunk(audio.tags, stream)
+        else:
+            self._write_id3_chunk(audio.tags, filepath)
+
+    def _write_id3_chunk(self, tags: ID3, stream: BinaryIO) -> None:
+        id3_chunk = find_riff_chunk(stream, ID3_CHUNK_IDS)
+        available_size = id3_chunk.data_size if id3_chunk is not None else 0
+        write_riff_chunk(
+            stream,
+            ID3_CHUNK_IDS,
+            render_id3_tag(tags, available_size, self.padding_policy),
+        )
@@ -8,19 +8,34 @@ the process of serializing metadata, signing it, and writing it to ID3
 tags in audio files.
 
 This class acts as a facade over `MetadataSerializer`, `Signer`, and
-`MetadataWriter`.
+`MetadataWriter`. With a `ContentHasher`, it also binds the metadata to the
+audio, by including the hash of the audio payload in the signed metadata.
 """
 
+import io
 import logging
-from pathlib import Path
+from typing import Optional
 
+from transparentmeta.crypto.content_hasher import ContentHasher
 from transparentmeta.crypto.signer import Signer
 from transparentmeta.entity.metadata import Metadata
+from transparentmeta.instrumentation.instrumentation import (
+    Instrumentation,
+    Stage,
+    run_stage,
+)
+from transparentmeta.request.write_bytes_request import WriteBytesRequest
 from transparentmeta.request.write_request import WriteRequest
 from transparentmeta.serialization.metadata_serializer import (
     MetadataSerializer,
+    SerializedMetadata,
 )
+from transparentmeta.use_case.types import AudioSource
 from transparentmeta.use_case.write.metadata_writer import MetadataWriter
+from transparentmeta.utils.file_utils import (
+    get_audio_source_name,
+    get_audio_source_size,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +55,11 @@ class WriteUseCase:
         metadata_serializer (MetadataSerializer): Handles serialization.
         signer (Signer): Handles signing metadata.
         metadata_writer (MetadataWriter): Writes metadata to audio files.
+        instrumentation (Optional[Instrumentation]): Receives the timings of
+            the stages of each write.
+        content_hasher (Optional[ContentHasher]): Computes the content hash
+            included in the metadata. If None, metadata isn't bound to the
+            audio.
     """
 
     def __init__(
@@ -47,6 +67,8 @@ class WriteUseCase:
         metadata_serializer: MetadataSerializer,
         signer: Signer,
         metadata_writer: MetadataWriter,
+        instrumentation: Optional[Instrumentation] = None,
+        content_hasher: Optional[ContentHasher] = None,
     ) -> None:
         """Initializes the WriteUseCase with serializer, signer, and
         writer.
@@ -56,10 +78,17 @@ class WriteUseCase:
             signer (Signer): The signer for generating metadata signatures.
             metadata_writer (MetadataWriter): The writer for embedding
                 metadata.
+            instrumentation (Optional[Instrumentation]): Receives stage
+                timings. Defaults to None, i.e., stages aren't timed.
+            content_hasher (Optional[ContentHasher]): Computes the hash of
+                the audio payload, which is included in the signed
+                metadata. Defaults to None, i.e., no content hash.
         """
         self.metadata_serializer = metadata_serializer
         self.signer = signer
         self._metadata_writer = metadata_writer
+        self.instrumentation = instrumentation
+        self.content_hasher = content_hasher
 
     @property
     def metadata_writer(self) -> MetadataWriter:
@@ -79,40 +108,110 @@ class WriteUseCase:
         """
         self._metadata_writer = writer
 
-    def write(self, write_request: WriteRequest) -> None:
+    def write(
+        self,
+        write_request: WriteRequest,
+        metadata_writer: Optional[MetadataWriter] = None,
+    ) -> None:
         """Serializes metadata, signs it, and writes it to the audio file in
         ID3 tags.
 
+        The use case itself isn't modified, so one instance can serve many
+        threads at once, each passing the writer for its own file.
+
         Args:
             write_request (WriteRequest): The request containing the
                 filepath and metadata to write.
+            metadata_writer (Optional[MetadataWriter]): The writer to use for
+                this file. Defaults to the metadata writer of the use case.
         """
-        metadata = write_request.metadata
-        filepath = write_request.filepath
+        self._sign_and_write(
+            write_request.filepath,
+            write_request.metadata,
+            metadata_writer or self.metadata_writer,
+        )
 
-        logger.debug(
-            "Serializing metadata for file %s", write_request.filepath
+    def write_bytes(
+        self,
+        write_bytes_request: WriteBytesRequest,
+        metadata_writer: Optional[MetadataWriter] = None,
+    ) -> bytes:
+        """Serializes metadata, signs it, and writes it in ID3 tags to audio
+        held in memory.
+
+        The input data is left untouched: the metadata is written to a copy
+        of it, which is returned.
+
+        Args:
+            write_bytes_request (WriteBytesRequest): The request containing
+                the content of the audio file and the metadata to write.
+            metadata_writer (Optional[MetadataWriter]): The writer to use for
+                this data. Defaults to the metadata writer of the use case.
+
+        Returns:
+            bytes: The content of the audio file with the metadata and its
+                signature.
+        """
+        audio_buffer = io.BytesIO(write_bytes_request.audio_data)
+        self._sign_and_write(
+            audio_buffer,
+            write_bytes_request.metadata,
+            metadata_writer or self.metadata_writer,
+        )
+        return audio_buffer.getvalue()
+
+    def _sign_and_write(
+        self,
+        source: AudioSource,
+        metadata: Metadata,
+        metadata_writer: MetadataWriter,
+    ) -> None:
+        source_name = get_audio_source_name(source)
+
+        instrumentation = self.instrumentation
+
+        content_hasher = self.content_hasher
+        if content_hasher is not None:
+            logger.debug("Hashing audio payload of file %s", source_name)
+            content_hash = run_stage(
+                instrumentation,
+                Stage.HASH,
+                source_name,
+                lambda _: get_audio_source_size(source),
+                lambda: content_hasher.compute_content_hash(source),
+            )
+            metadata = metadata.model_copy(
+                update={"content_hash": content_hash}
+            )
+
+        logger.debug("Serializing metadata for file %s", source_name)
+        serialized_metadata = run_stage(
+            instrumentation,
+            Stage.SERIALIZE,
+            source_name,
+            lambda serialized: len(serialized or ""),
+            lambda: self._serialize_metadata(metadata),
         )
-        serialized_metadata = self._serialize_metadata(metadata)
 
-        logger.debug("Signing metadata for file %s", write_request.filepath)
-        signature_payload = self._sign_metadata(serialized_metadata)
+        logger.debug("Signing metadata for file %s", source_name)
+        signature_payload = run_stage(
+            instrumentation,
+            Stage.SIGN,
+            source_name,
+            lambda _: len(serialized_metadata),
+            lambda: self._sign_metadata(serialized_metadata),
+        )
 
         logger.debug(
             "Writing metadata and signature to ID3 tags for file %s",
-            write_request.filepath,
+            source_name,
         )
-        self._write_metadata_and_signature_in_id3_tags(
-            filepath, serialized_metadata, signature_payload
+        metadata_writer.write(
+            source, serialized_metadata, signature_payload, instrumentation
         )
 
-    def _serialize_metadata(self, metadata: Metadata) -> str:
+    def _serialize_metadata(self, metadata: Metadata) -> SerializedMetadata:
         return self.metadata_serializer.serialize(metadata)
 
-    def _sign_metadata(self, serialized_metadata: str) -> str:
+    def _sign_metadata(self, serialized_metadata: SerializedMetadata) -> str:
         return self.signer.sign(serialized_metadata)
-
-    def _write_metadata_and_signature_in_id3_tags(
-        self, filepath: Path, serialized_metadata: str, signature: str
-    ) -> None:
-        self.metadata_writer.write(filepath, serialized_metadata, signature)
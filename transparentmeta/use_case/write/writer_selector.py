@@ -11,27 +11,33 @@ orchestration.
 """
 
 import logging
-from types import MappingProxyType
-from typing import Mapping
+from typing import Callable, Dict, Mapping
 
 from transparentmeta.use_case.write.metadata_writer import MetadataWriter
-from transparentmeta.use_case.write.mp3_metadata_writer import (
-    MP3MetadataWriter,
+from transparentmeta.utils.lazy_import_utils import (
+    LazyConstructor,
+    LazyRegistry,
 )
-from transparentmeta.use_case.write.wav_metadata_writer import (
-    WAVMetadataWriter,
+
+# Writers are built, and their audio format modules imported, only when a
+# file of their format is first written.
+_wav_metadata_writer = LazyConstructor(
+    "transparentmeta.use_case.write.wav_metadata_writer", "WAVMetadataWriter"
 )
 
-mp3_metadata_writer = MP3MetadataWriter()
-wav_metadata_writer = WAVMetadataWriter()
+MetadataWriterConstructor = Callable[..., MetadataWriter]
+metadata_writer_constructors_map: Dict[str, MetadataWriterConstructor] = {
+    "mp3": LazyConstructor(
+        "transparentmeta.use_case.write.mp3_metadata_writer",
+        "MP3MetadataWriter",
+    ),
+    "wav": _wav_metadata_writer,
+    "wave": _wav_metadata_writer,
+}
 
 MetadataWriterRegistry = Mapping[str, MetadataWriter]
-metadata_writer_registry = MappingProxyType(
-    {
-        "mp3": mp3_metadata_writer,
-        "wav": wav_metadata_writer,
-        "wave": wav_metadata_writer,
-    }
+metadata_writer_registry: MetadataWriterRegistry = LazyRegistry(
+    metadata_writer_constructors_map
 )
 
 logger = logging.getLogger(__name__)
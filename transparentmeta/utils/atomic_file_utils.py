@@ -0,0 +1,150 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Utility functions to replace files atomically.
+
+A file edited in place is left half-written if the process crashes, or the
+machine loses power, in the middle of the edit. `atomic_replace` instead
+lets the edit happen on a temporary copy of the file, in the same
+directory, and then renames the copy over the original. Renames within a
+file system are atomic, so the file is always either entirely old or
+entirely new.
+
+The copy is made with a reflink where the file system supports it, e.g.,
+Btrfs and XFS on Linux: the copy shares the data blocks of the original, so
+it's instant and takes no space, whatever the size of the file. Elsewhere,
+the file is copied with `shutil.copyfile`, which uses in-kernel copies where
+available.
+"""
+
+import contextlib
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+TEMPORARY_FILE_SUFFIX = ".tmp"
+
+# Linux ioctl that makes a file share the data blocks of another one.
+_FICLONE = 0x40049409
+
+
+@contextlib.contextmanager
+def atomic_replace(filepath: Path) -> Iterator[Path]:
+    """Context manager to edit a copy of a file, which replaces the file
+    atomically when the context exits without errors.
+
+    The copy is a hidden file next to the original, named after it, with
+    the same permissions. When the context exits without errors, the copy
+    is flushed to disk, renamed over the original, and the rename itself is
+    flushed to disk. If an error is raised, the copy is deleted and the
+    original is left untouched.
+
+    Symbolic links are followed, so the file they point to is replaced. The
+    file gets a new inode, so hard links to it keep pointing to the old
+    content, and its owner is the user running the process.
+
+    Args:
+        filepath (Path): The path to the file to replace.
+
+    Yields:
+        Path: The path to the copy to edit.
+    """
+    filepath = Path(os.path.realpath(filepath))
+    temporary_fd, temporary_name = tempfile.mkstemp(
+        suffix=TEMPORARY_FILE_SUFFIX,
+        prefix=f".{filepath.name}.",
+        dir=filepath.parent,
+    )
+    os.close(temporary_fd)
+    temporary_filepath = Path(temporary_name)
+    try:
+        is_reflink = clone_or_copy_file(filepath, temporary_filepath)
+        logger.debug(
+            "Copied %s to %s (reflink: %s)",
+            filepath,
+            temporary_filepath,
+            is_reflink,
+        )
+        shutil.copymode(filepath, temporary_filepath)
+
+        yield temporary_filepath
+
+        fsync_file(temporary_filepath)
+        os.replace(temporary_filepath, filepath)
+    except BaseException:
+        temporary_filepath.unlink(missing_ok=True)
+        raise
+    fsync_directory(filepath.parent)
+
+
+def clone_or_copy_file(source: Path, destination: Path) -> bool:
+    """Copies a file, sharing its data blocks with a reflink if the file
+    system supports it.
+
+    Args:
+        source (Path): The path to the file to copy.
+        destination (Path): The path to the copy, which is overwritten if
+            it exists.
+
+    Returns:
+        bool: True if the copy is a reflink, False if the data was copied.
+    """
+    if _clone_file(source, destination):
+        return True
+    shutil.copyfile(source, destination)
+    return False
+
+
+def fsync_file(filepath: Path) -> None:
+    """Flushes the content of a file to disk.
+
+    Args:
+        filepath (Path): The path to the file.
+    """
+    with open(filepath, "rb+") as stream:
+        os.fsync(stream.fileno())
+
+
+def fsync_directory(directory: Path) -> None:
+    """Flushes the entries of a directory to disk, e.g., so that a rename
+    in it survives a power loss. Does nothing on Windows, where directories
+    can't be opened.
+
+    Args:
+        directory (Path): The path to the directory.
+    """
+    if sys.platform == "win32":  # pragma: no cover
+        return
+    directory_fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(directory_fd)
+    finally:
+        os.close(directory_fd)
+
+
+def _clone_file(source: Path, destination: Path) -> bool:
+    try:
+        # fcntl only exists on Unix.
+        import fcntl  # pylint: disable=import-outside-toplevel
+    except ImportError:  # pragma: no cover
+        return False
+
+    with open(source, "rb") as source_stream, open(
+        destination, "wb"
+    ) as destination_stream:
+        try:
+            fcntl.ioctl(
+                destination_stream.fileno(), _FICLONE, source_stream.fileno()
+            )
+        except OSError:
+            # The file system, or the platform, doesn't support reflinks.
+            return False
+    return True
@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Utility functions to locate the audio payload of MP3 and WAV files, i.e.,
+all of their bytes except their tags.
+
+Writing metadata only changes the tags of a file, so the audio payload is
+what stays the same when metadata is written, and what a content hash must
+cover. Payloads are located by reading a few header bytes, without reading
+the audio data itself.
+
+- In MP3 files, the payload is everything between the ID3v2 tags at the
+  start of the file and the ID3v1 tag at its end, if any.
+- In WAV files, the payload is made of all the top-level chunks except the
+  ID3 chunk and the padding chunks, e.g., JUNK chunks. The RIFF header is
+  left out too, since it holds the size of the file, which changes with the
+  size of the ID3 chunk. Padding chunks are left out because writing a tag
+  can turn an ID3 chunk into a JUNK chunk, when the tag is written again at
+  the end of the file.
+"""
+
+import os
+from typing import BinaryIO, List, Tuple
+
+from transparentmeta.utils.riff_utils import (
+    ID3_CHUNK_IDS,
+    PADDING_CHUNK_IDS,
+    iter_riff_chunks,
+)
+
+ID3V2_HEADER_SIZE = 10
+ID3V2_FOOTER_FLAG = 0x10
+ID3V1_TAG_SIZE = 128
+NON_PAYLOAD_CHUNK_IDS = ID3_CHUNK_IDS + PADDING_CHUNK_IDS
+
+# Start and end offsets of a range of bytes, the end being excluded.
+ByteRange = Tuple[int, int]
+
+
+def find_audio_payload_ranges(fileobj: BinaryIO) -> List[ByteRange]:
+    """Finds the ranges of bytes holding the audio payload of an MP3 or WAV
+    file.
+
+    Files starting with a RIFF header are treated as WAV files, and all
+    other files as MP3 files.
+
+    Args:
+        fileobj (BinaryIO): A seekable binary file object of the audio file.
+
+    Returns:
+        List[ByteRange]: The start and end offsets of each range, in file
+            order. The ranges don't overlap, and are within the file.
+    """
+    fileobj.seek(0)
+    if fileobj.read(4) == b"RIFF":
+        return find_wav_audio_payload_ranges(fileobj)
+    return find_mp3_audio_payload_ranges(fileobj)
+
+
+def find_mp3_audio_payload_ranges(fileobj: BinaryIO) -> List[ByteRange]:
+    """Finds the range of bytes holding the audio payload of an MP3 file,
+    skipping its ID3v2 tags and its ID3v1 tag.
+
+    Args:
+        fileobj (BinaryIO): A seekable binary file object of the MP3 file.
+
+    Returns:
+        List[ByteRange]: The start and end offsets of the payload, or no
+            range if the file holds nothing but tags.
+    """
+    file_size = fileobj.seek(0, os.SEEK_END)
+
+    start = 0
+    while True:
+        fileobj.seek(start)
+        header = fileobj.read(ID3V2_HEADER_SIZE)
+        if len(header) < ID3V2_HEADER_SIZE or header[:3] != b"ID3":
+            break
+        start += ID3V2_HEADER_SIZE + _decode_synchsafe_integer(header[6:10])
+        if header[5] & ID3V2_FOOTER_FLAG:
+            start += ID3V2_HEADER_SIZE
+
+    end = file_size
+    if file_size - ID3V1_TAG_SIZE >= start:
+        fileobj.seek(file_size - ID3V1_TAG_SIZE)
+        if fileobj.read(3) == b"TAG":
+            end -= ID3V1_TAG_SIZE
+
+    if start >= end:
+        return []
+    return [(start, end)]
+
+
+def find_wav_audio_payload_ranges(fileobj: BinaryIO) -> List[ByteRange]:
+    """Finds the ranges of bytes holding the audio payload of a WAV file,
+    i.e., its top-level chunks, skipping its ID3 chunks and its padding
+    chunks.
+
+    Chunks next to each other are merged into a single range.
+
+    Args:
+        fileobj (BinaryIO): A seekable binary file object of the WAV file.
+
+    Returns:
+        List[ByteRange]: The start and end offsets of each range.
+
+    Raises:
+        InvalidRIFFFileError: If the file doesn't start with a RIFF/WAVE
+            header.
+    """
+    file_size = fileobj.seek(0, os.SEEK_END)
+
+    byte_ranges: List[ByteRange] = []
+    for chunk in iter_riff_chunks(fileobj):
+        if chunk.chunk_id in NON_PAYLOAD_CHUNK_IDS:
+            continue
+        end = min(chunk.end_offset, file_size)
+        if byte_ranges and byte_ranges[-1][1] == chunk.header_offset:
+            byte_ranges[-1] = (byte_ranges[-1][0], end)
+        else:
+            byte_ranges.append((chunk.header_offset, end))
+    return byte_ranges
+
+
+def _decode_synchsafe_integer(data: bytes) -> int:
+    # ID3v2 sizes use 7 bits per byte, so that they never look like an MPEG
+    # frame sync.
+    value = 0
+    for byte in data:
+        value = (value << 7) | (byte & 0x7F)
+    return value
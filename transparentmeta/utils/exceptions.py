@@ -10,3 +10,10 @@ class InvalidHexadecimalStringError(Exception):
 
     def __init__(self, string):
         super().__init__(f"String {string} is not a valid hexadecimal string")
+
+
+class InvalidRIFFFileError(Exception):
+    """Raised when a file is not a valid RIFF/WAVE file."""
+
+    def __init__(self, message="File is not a valid RIFF/WAVE file"):
+        super().__init__(message)
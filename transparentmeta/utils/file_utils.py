@@ -9,7 +9,14 @@ This module provides helper functions to work with files, such as extracting
 file extensions in a normalized format.
 """
 
+import os
 from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Tuple, Union
+
+IN_MEMORY_AUDIO_NAME = "<in-memory audio>"
+
+# Device, inode, size and modification time in nanoseconds of a file.
+FileIdentity = Tuple[int, int, int, int]
 
 
 def get_file_extension(filepath: Path) -> str:
@@ -36,3 +43,83 @@ def get_file_size(filepath: Path) -> int:
     if not filepath.exists():
         return 0
     return filepath.stat().st_size
+
+
+def get_file_identity(filepath: Path) -> FileIdentity:
+    """Gets the stat identity of a file, which changes whenever the file is
+    replaced or written to.
+
+    Args:
+        filepath (Path): The path to the file.
+
+    Returns:
+        FileIdentity: The device, inode, size and modification time in
+            nanoseconds of the file.
+    """
+    stat_result = filepath.stat()
+    return (
+        stat_result.st_dev,
+        stat_result.st_ino,
+        stat_result.st_size,
+        stat_result.st_mtime_ns,
+    )
+
+
+def find_files_with_extensions(
+    directory: Path, extensions: Iterable[str]
+) -> Iterator[Path]:
+    """Finds the files with the given extensions in a directory tree.
+
+    Files are yielded in a deterministic order, sorted by directory and then
+    by name.
+
+    Args:
+        directory (Path): The root of the directory tree.
+        extensions (Iterable[str]): Lowercase extensions without the leading
+            dot, e.g., "mp3". Matching is case-insensitive.
+
+    Returns:
+        Iterator[Path]: A generator yielding the paths of the files found.
+    """
+    extensions = frozenset(extensions)
+    for dirpath, dirnames, filenames in os.walk(directory):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            filepath = Path(dirpath) / filename
+            if get_file_extension(filepath) in extensions:
+                yield filepath
+
+
+def get_audio_source_name(source: Union[Path, BinaryIO]) -> Union[str, Path]:
+    """Gets a name identifying an audio source in messages and logs.
+
+    Args:
+        source (Union[Path, BinaryIO]): The path to the audio file, or a
+            binary file object holding it.
+
+    Returns:
+        Union[str, Path]: The path itself, the name of the file object if it
+            has one, or a placeholder for audio held in memory.
+    """
+    if isinstance(source, Path):
+        return source
+    return getattr(source, "name", IN_MEMORY_AUDIO_NAME)
+
+
+def get_audio_source_size(source: Union[Path, BinaryIO]) -> int:
+    """Gets the size of an audio source in bytes.
+
+    Args:
+        source (Union[Path, BinaryIO]): The path to the audio file, or a
+            seekable binary file object holding it.
+
+    Returns:
+        int: The size of the audio source in bytes, or 0 if the file
+            doesn't exist.
+    """
+    if isinstance(source, Path):
+        return get_file_size(source)
+    position = source.tell()
+    size = source.seek(0, os.SEEK_END)
+    source.seek(position)
+    return size
@@ -0,0 +1,139 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Utilities to defer imports and object construction until first use.
+
+Importing transparentmeta should be cheap for applications that only touch a
+few of its code paths, e.g., a CLI or a serverless function handling one
+audio format. `LazyConstructor` imports a class when it's first called,
+`LazyRegistry` builds the values of a registry when they're first looked up,
+and `build_lazy_exports` lets a package import its interfaces when they're
+first accessed.
+"""
+
+import importlib
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+V = TypeVar("V")
+
+
+class LazyConstructor:
+    """Callable that imports a class on its first call, and constructs
+    instances of it.
+
+    Attributes:
+        module_name (str): Name of the module defining the class.
+        class_name (str): Name of the class.
+    """
+
+    def __init__(self, module_name: str, class_name: str) -> None:
+        """Initializes the LazyConstructor without importing the module.
+
+        Args:
+            module_name (str): Name of the module defining the class.
+            class_name (str): Name of the class.
+        """
+        self.module_name = module_name
+        self.class_name = class_name
+        self._cls: Optional[type] = None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Constructs an instance of the class, importing it if needed."""
+        if self._cls is None:
+            module = importlib.import_module(self.module_name)
+            self._cls = getattr(module, self.class_name)
+        return self._cls(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"LazyConstructor({self.module_name}.{self.class_name})"
+
+
+class LazyRegistry(Mapping[str, V], Generic[V]):
+    """Immutable, thread-safe mapping whose values are built by factories
+    on first lookup.
+
+    Keys mapped to the same factory share the same value, e.g., "wav" and
+    "wave" share a single metadata reader.
+    """
+
+    def __init__(self, factories: Mapping[str, Callable[[], V]]) -> None:
+        """Initializes the LazyRegistry without building any value.
+
+        Args:
+            factories (Mapping[str, Callable[[], V]]): The factory building
+                the value of each key.
+        """
+        self._factories = dict(factories)
+        self._values: Dict[Callable[[], V], V] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: str) -> V:
+        """Returns the value of a key, building it on first lookup."""
+        factory = self._factories[key]
+        with self._lock:
+            if factory not in self._values:
+                self._values[factory] = factory()
+            return self._values[factory]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the keys, without building any value."""
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        """Returns the number of keys."""
+        return len(self._factories)
+
+
+def build_lazy_exports(
+    package_name: str,
+    export_modules: Mapping[str, str],
+    package_namespace: MutableMapping[str, Any],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Builds the module-level `__getattr__` and `__dir__` of a package that
+    imports its interfaces on first access (PEP 562).
+
+    Args:
+        package_name (str): Name of the package, i.e., its `__name__`.
+        export_modules (Mapping[str, str]): The name of the submodule
+            defining each interface of the package.
+        package_namespace (MutableMapping[str, Any]): The namespace of the
+            package, i.e., its `globals()`.
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: The
+            `__getattr__` and `__dir__` functions of the package.
+    """
+
+    def getattr_(name: str) -> Any:
+        """Imports an interface of the package on first access."""
+        module_name = export_modules.get(name)
+        if module_name is None:
+            raise AttributeError(
+                f"module {package_name!r} has no attribute {name!r}"
+            )
+        module = importlib.import_module(f"{package_name}.{module_name}")
+        value = getattr(module, name)
+        # Later accesses find the interface in the package namespace.
+        package_namespace[name] = value
+        return value
+
+    def dir_() -> List[str]:
+        """Lists the attributes of the package, including lazy interfaces."""
+        return sorted(set(package_namespace) | set(export_modules))
+
+    return getattr_, dir_
@@ -12,7 +12,11 @@ These functions are used to embed or validate structured transparency
 metadata within audio files.
 """
 
-from mutagen.id3 import ID3, TXXX
+import io
+from typing import Callable, Optional
+
+from mutagen import PaddingInfo
+from mutagen.id3 import ID3, PRIV, TXXX
 
 from transparentmeta.use_case.types import MutagenID3AudioTypes
 
@@ -30,8 +34,8 @@ def create_id3_tags_in_file_if_none_exists(
         audio (MutagenID3AudioTypes): The audio file object with ID3 support.
 
     Returns:
-        MutagenID3AudioTypes: The audio file object with ID3 tags added if they were
-            missing.
+        MutagenID3AudioTypes: The audio file object with ID3 tags added if
+            they were missing.
     """
     if audio.tags is None:
         audio.add_tags()
@@ -52,13 +56,93 @@ def set_txxx_id3_tag(
         value (str): The value to set for the specified field.
 
     Returns:
-        MutagenID3AudioTypes: The modified audio file object with the updated tag.
+        MutagenID3AudioTypes: The modified audio file object with the
+            updated tag.
     """
     assert isinstance(audio.tags, ID3)
     audio.tags.setall(field, [TXXX(encoding=3, desc=field, text=value)])
     return audio
 
 
+def set_priv_id3_tag(
+    audio: MutagenID3AudioTypes,
+    owner: str,
+    data: bytes,
+) -> MutagenID3AudioTypes:
+    """Sets the PRIV id3v2 tag of an owner in an audio file, replacing any
+    PRIV tag of the same owner. PRIV tags hold private binary data,
+    identified by their owner.
+
+    Args:
+        audio (MutagenID3AudioTypes): The audio file object.
+        owner (str): The owner of the PRIV tag.
+        data (bytes): The binary data of the tag.
+
+    Returns:
+        MutagenID3AudioTypes: The modified audio file object with the
+            updated tag.
+    """
+    audio = delete_priv_id3_tags(audio, owner)
+    assert isinstance(audio.tags, ID3)
+    audio.tags.add(PRIV(owner=owner, data=data))
+    return audio
+
+
+def get_priv_id3_tag_data(tags: ID3, owner: str) -> Optional[bytes]:
+    """Gets the data of the PRIV id3v2 tag of an owner.
+
+    Args:
+        tags (ID3): The ID3 tags of an audio file.
+        owner (str): The owner of the PRIV tag.
+
+    Returns:
+        Optional[bytes]: The data of the tag, or None if there is no PRIV
+            tag of the owner.
+    """
+    for frame in tags.getall("PRIV"):
+        if frame.owner == owner:
+            return frame.data
+    return None
+
+
+def delete_priv_id3_tags(
+    audio: MutagenID3AudioTypes, owner: str
+) -> MutagenID3AudioTypes:
+    """Deletes the PRIV id3v2 tags of an owner from an audio file.
+
+    Args:
+        audio (MutagenID3AudioTypes): The audio file object.
+        owner (str): The owner of the PRIV tags.
+
+    Returns:
+        MutagenID3AudioTypes: The modified audio file object.
+    """
+    assert isinstance(audio.tags, ID3)
+    # The keys of PRIV frames include their data, so frames are looked up by
+    # owner rather than by key.
+    for frame in audio.tags.getall("PRIV"):
+        if frame.owner == owner:
+            del audio.tags[frame.HashKey]
+    return audio
+
+
+def delete_txxx_id3_tag(
+    audio: MutagenID3AudioTypes, field: str
+) -> MutagenID3AudioTypes:
+    """Deletes a TXXX id3v2 tag from an audio file, if it exists.
+
+    Args:
+        audio (MutagenID3AudioTypes): The audio file object.
+        field (str): The TXXX field to delete.
+
+    Returns:
+        MutagenID3AudioTypes: The modified audio file object.
+    """
+    assert isinstance(audio.tags, ID3)
+    audio.tags.delall(f"TXXX:{field}")
+    return audio
+
+
 def does_file_contain_any_id3_tags(audio: MutagenID3AudioTypes) -> bool:
     """Checks if the audio file contains any ID3 tags.
 
@@ -71,3 +155,40 @@ def does_file_contain_any_id3_tags(audio: MutagenID3AudioTypes) -> bool:
     if audio.tags:
         return True
     return False
+
+
+def render_id3_tag(
+    tags: ID3,
+    available_size: int,
+    padding: Callable[[PaddingInfo], int],
+) -> bytes:
+    """Renders ID3v2.4 tags to bytes, followed by padding, as they would be
+    saved to a file.
+
+    The padding function is called the way Mutagen calls it when saving
+    tags to a file: `PaddingInfo.padding` is the space left if the tag is
+    written over `available_size` bytes, and is negative if it doesn't fit.
+
+    Args:
+        tags (ID3): The ID3 tags to render.
+        available_size (int): Size in bytes of the space the tag would be
+            written over, e.g., the size of the existing tag and its
+            padding.
+        padding (Callable[[PaddingInfo], int]): Decides the padding to leave
+            after the tag, e.g., a `PaddingPolicy`.
+
+    Returns:
+        bytes: The ID3v2 header, frames and padding.
+    """
+    buffer = io.BytesIO()
+    # Saved to an empty buffer, the padding Mutagen reports is minus the
+    # size the tag needs.
+    ID3.save(
+        tags,
+        buffer,
+        v1=0,
+        padding=lambda padding_info: padding(
+            PaddingInfo(available_size + padding_info.padding, 0)
+        ),
+    )
+    return buffer.getvalue()
@@ -0,0 +1,275 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Utility functions for navigating RIFF/WAVE files.
+
+A WAV file is a RIFF container made of a 12-byte header followed by a
+sequence of chunks. Each chunk starts with an 8-byte header holding a
+4-byte identifier and the little-endian size of its data. These helpers
+locate chunks by jumping from one chunk header to the next, so they only
+read a few bytes per chunk, no matter how large the audio data is.
+
+`find_riff_chunk_in_buffer` locates chunks the same way in a buffer, e.g.,
+a memory map of the file, where reading a chunk header doesn't take a
+system call, and only the pages holding the headers are read from disk.
+
+`write_riff_chunk` edits chunks the same way: it never moves the chunks
+that follow the edited one, so writing a chunk only touches its own bytes
+and the end of the file, no matter how large the audio data is.
+"""
+
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, Optional, Tuple, Union
+
+from transparentmeta.utils.exceptions import InvalidRIFFFileError
+
+RIFF_HEADER_SIZE = 12
+CHUNK_HEADER_SIZE = 8
+ID3_CHUNK_IDS: Tuple[bytes, ...] = (b"id3 ", b"ID3 ")
+JUNK_CHUNK_ID = b"JUNK"
+PADDING_CHUNK_IDS: Tuple[bytes, ...] = (JUNK_CHUNK_ID, b"PAD ")
+MAX_RIFF_SIZE = 2**32 - 1
+
+# Objects exposing the buffer protocol that RIFF files can be read from.
+RIFFBuffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+@dataclass(frozen=True)
+class RIFFChunk:
+    """Location of a chunk inside a RIFF file.
+
+    Attributes:
+        chunk_id (bytes): The 4-byte identifier of the chunk.
+        header_offset (int): Offset of the chunk header from the start of the
+            file.
+        data_size (int): Size of the chunk data in bytes, excluding the
+            header and the padding byte.
+    """
+
+    chunk_id: bytes
+    header_offset: int
+    data_size: int
+
+    @property
+    def data_offset(self) -> int:
+        """Offset of the chunk data from the start of the file."""
+        return self.header_offset + CHUNK_HEADER_SIZE
+
+    @property
+    def end_offset(self) -> int:
+        """Offset right after the chunk, including its padding byte.
+
+        RIFF chunks are aligned to even offsets, so chunks with an odd data
+        size are followed by one padding byte.
+        """
+        return self.data_offset + self.data_size + (self.data_size & 1)
+
+
+def find_riff_chunk(
+    fileobj: BinaryIO, chunk_ids: Tuple[bytes, ...]
+) -> Optional[RIFFChunk]:
+    """Finds the first top-level chunk of a RIFF/WAVE file with one of the
+    given identifiers.
+
+    Args:
+        fileobj (BinaryIO): A seekable binary file object of the WAV file.
+        chunk_ids (Tuple[bytes, ...]): Accepted 4-byte chunk identifiers.
+
+    Returns:
+        Optional[RIFFChunk]: The location of the chunk, or None if the file
+            doesn't contain such a chunk.
+
+    Raises:
+        InvalidRIFFFileError: If the file doesn't start with a RIFF/WAVE
+            header.
+    """
+    for chunk in iter_riff_chunks(fileobj):
+        if chunk.chunk_id in chunk_ids:
+            return chunk
+    return None
+
+
+def find_riff_chunk_in_buffer(
+    buffer: RIFFBuffer, chunk_ids: Tuple[bytes, ...]
+) -> Optional[RIFFChunk]:
+    """Finds the first top-level chunk of a RIFF/WAVE file held in a buffer
+    with one of the given identifiers.
+
+    Only the RIFF header and the chunk headers are accessed, so when the
+    buffer is a memory map of the file, only the pages holding them are
+    read from disk.
+
+    Args:
+        buffer (RIFFBuffer): The content of the WAV file, e.g., a memory map
+            of the file.
+        chunk_ids (Tuple[bytes, ...]): Accepted 4-byte chunk identifiers.
+
+    Returns:
+        Optional[RIFFChunk]: The location of the chunk, or None if the file
+            doesn't contain such a chunk.
+
+    Raises:
+        InvalidRIFFFileError: If the file doesn't start with a RIFF/WAVE
+            header.
+    """
+    _validate_riff_header(bytes(buffer[:RIFF_HEADER_SIZE]))
+
+    buffer_size = len(buffer)
+    offset = RIFF_HEADER_SIZE
+    while offset + CHUNK_HEADER_SIZE <= buffer_size:
+        chunk_id, data_size = struct.unpack_from("<4sI", buffer, offset)
+        chunk = RIFFChunk(chunk_id, offset, data_size)
+        if chunk_id in chunk_ids:
+            return chunk
+        offset = chunk.end_offset
+    return None
+
+
+def iter_riff_chunks(fileobj: BinaryIO) -> Iterator[RIFFChunk]:
+    """Iterates over the top-level chunks of a RIFF/WAVE file, in the order
+    they're stored.
+
+    The last chunk may extend past the end of the file, if the file is
+    truncated.
+
+    Args:
+        fileobj (BinaryIO): A seekable binary file object of the WAV file.
+
+    Returns:
+        Iterator[RIFFChunk]: A generator yielding the location of each
+            chunk.
+
+    Raises:
+        InvalidRIFFFileError: If the file doesn't start with a RIFF/WAVE
+            header.
+    """
+    file_size = fileobj.seek(0, os.SEEK_END)
+    fileobj.seek(0)
+    read_riff_header(fileobj)
+
+    offset = RIFF_HEADER_SIZE
+    while offset + CHUNK_HEADER_SIZE <= file_size:
+        fileobj.seek(offset)
+        chunk = _read_chunk_header(fileobj, offset)
+        yield chunk
+        offset = chunk.end_offset
+
+
+def write_riff_chunk(
+    fileobj: BinaryIO, chunk_ids: Tuple[bytes, ...], data: bytes
+) -> RIFFChunk:
+    """Writes the data of a top-level chunk of a RIFF/WAVE file, replacing
+    the first chunk with one of the given identifiers, if any.
+
+    The chunk is written without moving any other chunk:
+    - If the chunk is the last one, it's rewritten, and the file is
+      truncated or extended to its new end.
+    - If the chunk is followed by other chunks, and its size doesn't change,
+      its data is overwritten in place.
+    - Otherwise, the chunk is turned into a JUNK chunk, which readers skip,
+      and written again at the end of the file. Missing chunks are written
+      at the end of the file too.
+
+    The RIFF size in the header is updated to match the new end of the file.
+
+    Args:
+        fileobj (BinaryIO): A seekable, readable and writable binary file
+            object of the WAV file.
+        chunk_ids (Tuple[bytes, ...]): Accepted 4-byte chunk identifiers.
+            The first one is used for new chunks.
+        data (bytes): The data of the chunk.
+
+    Returns:
+        RIFFChunk: The location of the written chunk.
+
+    Raises:
+        InvalidRIFFFileError: If the file doesn't start with a RIFF/WAVE
+            header, if its last chunk declares more data than the file
+            holds, or if the chunk would make the file larger than the 4GB
+            limit of RIFF files.
+    """
+    chunks = list(iter_riff_chunks(fileobj))
+    existing_chunk = next(
+        (chunk for chunk in chunks if chunk.chunk_id in chunk_ids), None
+    )
+    end_offset = chunks[-1].end_offset if chunks else RIFF_HEADER_SIZE
+
+    if existing_chunk is None:
+        chunk = RIFFChunk(chunk_ids[0], end_offset, len(data))
+    elif existing_chunk is chunks[-1]:
+        chunk = RIFFChunk(
+            existing_chunk.chunk_id, existing_chunk.header_offset, len(data)
+        )
+    elif existing_chunk.data_size == len(data):
+        fileobj.seek(existing_chunk.data_offset)
+        fileobj.write(data)
+        return existing_chunk
+    else:
+        chunk = RIFFChunk(existing_chunk.chunk_id, end_offset, len(data))
+
+    if chunk.end_offset - CHUNK_HEADER_SIZE > MAX_RIFF_SIZE:
+        raise InvalidRIFFFileError(
+            "RIFF files can't be larger than 4GB: writing a chunk of "
+            f"{len(data)} bytes would make the file {chunk.end_offset} bytes"
+        )
+
+    file_size = fileobj.seek(0, os.SEEK_END)
+    # Chunks are written after the declared end of the last chunk, so the
+    # declared size of a truncated file would leave a gap of up to 4GB.
+    # A missing padding byte after the last chunk is common, and harmless.
+    if chunks and chunks[-1].data_offset + chunks[-1].data_size > file_size:
+        raise InvalidRIFFFileError(
+            f"RIFF file is truncated: its last chunk ends at "
+            f"{chunks[-1].end_offset}, past the end of the file at {file_size}"
+        )
+
+    if existing_chunk is not None and chunk.header_offset == end_offset:
+        fileobj.seek(existing_chunk.header_offset)
+        fileobj.write(JUNK_CHUNK_ID)
+    fileobj.seek(chunk.header_offset)
+    fileobj.write(chunk.chunk_id + struct.pack("<I", len(data)) + data)
+    if len(data) & 1:
+        fileobj.write(b"\x00")
+    fileobj.truncate(chunk.end_offset)
+    fileobj.seek(4)
+    fileobj.write(struct.pack("<I", chunk.end_offset - CHUNK_HEADER_SIZE))
+    return chunk
+
+
+def read_riff_header(fileobj: BinaryIO) -> int:
+    """Reads and validates the RIFF/WAVE header at the current position.
+
+    Args:
+        fileobj (BinaryIO): A binary file object positioned at the start of
+            the WAV file.
+
+    Returns:
+        int: The RIFF size declared in the header.
+
+    Raises:
+        InvalidRIFFFileError: If the header is not a RIFF/WAVE header.
+    """
+    header = fileobj.read(RIFF_HEADER_SIZE)
+    _validate_riff_header(header)
+    return struct.unpack("<I", header[4:8])[0]
+
+
+def _validate_riff_header(header: bytes) -> None:
+    if (
+        len(header) < RIFF_HEADER_SIZE
+        or header[:4] != b"RIFF"
+        or header[8:12] != b"WAVE"
+    ):
+        raise InvalidRIFFFileError()
+
+
+def _read_chunk_header(fileobj: BinaryIO, offset: int) -> RIFFChunk:
+    header = fileobj.read(CHUNK_HEADER_SIZE)
+    chunk_id = header[:4]
+    data_size = struct.unpack("<I", header[4:8])[0]
+    return RIFFChunk(chunk_id, offset, data_size)
@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Utility class for SQLite databases shared by the threads of a process.
+
+This module provides the `SQLiteDatabase` class, which wraps a single SQLite
+connection behind a lock, creates the schema of the database when it's
+opened, and commits every write.
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union
+
+Parameters = Sequence[Any]
+
+
+class SQLiteDatabase:
+    """Thread-safe connection to a SQLite database.
+
+    Attributes:
+        database_path (Union[str, Path]): Path to the SQLite database file,
+            created if it doesn't exist, or ":memory:" for an in-memory
+            database.
+    """
+
+    def __init__(
+        self, database_path: Union[str, Path], schema: Iterable[str]
+    ) -> None:
+        """Opens the database, creating its schema if needed.
+
+        Args:
+            database_path (Union[str, Path]): Path to the SQLite database
+                file, or ":memory:".
+            schema (Iterable[str]): The statements that create the tables
+                and indexes of the database. They must be idempotent, e.g.,
+                "CREATE TABLE IF NOT EXISTS".
+        """
+        self.database_path = database_path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            database_path, check_same_thread=False
+        )
+        with self._lock, self._connection:
+            for statement in schema:
+                self._connection.execute(statement)
+
+    def fetch_one(
+        self, query: str, parameters: Parameters = ()
+    ) -> Optional[Tuple]:
+        """Runs a query and fetches its first row.
+
+        Args:
+            query (str): The SQL query.
+            parameters (Sequence[Any]): The parameters of the query.
+
+        Returns:
+            Optional[Tuple]: The first row, or None if there's no row.
+        """
+        with self._lock:
+            return self._connection.execute(query, parameters).fetchone()
+
+    def fetch_all(
+        self, query: str, parameters: Parameters = ()
+    ) -> List[Tuple]:
+        """Runs a query and fetches all its rows.
+
+        Args:
+            query (str): The SQL query.
+            parameters (Sequence[Any]): The parameters of the query.
+
+        Returns:
+            List[Tuple]: The rows.
+        """
+        with self._lock:
+            return self._connection.execute(query, parameters).fetchall()
+
+    def execute(self, statement: str, parameters: Parameters = ()) -> int:
+        """Runs a statement and commits it.
+
+        Args:
+            statement (str): The SQL statement.
+            parameters (Sequence[Any]): The parameters of the statement.
+
+        Returns:
+            int: The number of rows modified by the statement.
+        """
+        with self._lock, self._connection:
+            return self._connection.execute(statement, parameters).rowcount
+
+    def execute_many(
+        self, statement: str, parameters: Iterable[Parameters]
+    ) -> int:
+        """Runs a statement once for each set of parameters, and commits
+        them all at once.
+
+        Args:
+            statement (str): The SQL statement.
+            parameters (Iterable[Sequence[Any]]): The parameters of each
+                run of the statement.
+
+        Returns:
+            int: The number of rows modified by all the runs.
+        """
+        with self._lock, self._connection:
+            return self._connection.executemany(statement, parameters).rowcount
+
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Exposes the drop folder watcher of transparentmeta, which tags the audio
+files dropped into folders as soon as they're complete, for direct import
+from the `transparentmeta.watch` package.
+
+The interfaces are imported lazily, on first access, so that importing the
+package, e.g., for its constants, doesn't pull in the watcher.
+"""
+
+from typing import TYPE_CHECKING
+
+from transparentmeta.utils.lazy_import_utils import build_lazy_exports
+
+if TYPE_CHECKING:
+    from transparentmeta.watch.drop_folder_watcher import (
+        DropFolderWatcher,
+        WatchConfig,
+        WatchStatistics,
+    )
+    from transparentmeta.watch.file_debouncer import FileDebouncer
+    from transparentmeta.watch.file_event_source import (
+        FileEventSource,
+        InotifyFileEventSource,
+        PollingFileEventSource,
+        build_file_event_source,
+    )
+    from transparentmeta.watch.metadata_resolver import (
+        MetadataResolver,
+        TemplateMetadataResolver,
+    )
+
+_EXPORT_MODULES = {
+    "DropFolderWatcher": "drop_folder_watcher",
+    "WatchConfig": "drop_folder_watcher",
+    "WatchStatistics": "drop_folder_watcher",
+    "FileDebouncer": "file_debouncer",
+    "FileEventSource": "file_event_source",
+    "InotifyFileEventSource": "file_event_source",
+    "PollingFileEventSource": "file_event_source",
+    "build_file_event_source": "file_event_source",
+    "MetadataResolver": "metadata_resolver",
+    "TemplateMetadataResolver": "metadata_resolver",
+}
+
+__all__ = list(_EXPORT_MODULES)
+
+__getattr__, __dir__ = build_lazy_exports(__name__, _EXPORT_MODULES, globals())
@@ -0,0 +1,12 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+Module featuring constants for the watch package.
+"""
+
+DEFAULT_MAX_IN_FLIGHT: int = 64
+DEFAULT_TICK: float = 0.5  # in seconds
+DEFAULT_SETTLE_TIME: float = 2.0  # in seconds
+DEFAULT_POLLING_INTERVAL: float = 5.0  # in seconds
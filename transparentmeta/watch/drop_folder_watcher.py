@@ -0,0 +1,307 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module provides the `DropFolderWatcher` class, which tags the audio
+files dropped into a set of folders as soon as they're complete.
+
+The watcher is a pipeline of three stages:
+1. A `FileEventSource` reports the files that may have changed, through
+   inotify or by polling.
+2. A `FileDebouncer` holds each file back until it has stopped changing, so
+   that files being copied aren't tagged halfway.
+3. A bounded pool of threads resolves the metadata of each file with a
+   `MetadataResolver`, and writes it with a `TransparentMetadataWriter`.
+
+The pool accepts a bounded number of files at once. When it's full, the
+watcher stops taking files out of the debouncer and events out of the event
+source until a slot frees up, so a burst of files never builds an unbounded
+queue in memory: inotify events wait in the kernel queue, and polling just
+walks the folders later.
+
+Tagging a file modifies it, which is reported as a change like any other.
+The watcher remembers the stat identity of the files it tagged, and ignores
+changes that leave a file as it tagged it.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from transparentmeta.sdk.transparent_metadata_writer import (
+    TransparentMetadataWriter,
+)
+from transparentmeta.utils.file_utils import FileIdentity, get_file_identity
+from transparentmeta.watch.constants import DEFAULT_MAX_IN_FLIGHT, DEFAULT_TICK
+from transparentmeta.watch.file_debouncer import FileDebouncer
+from transparentmeta.watch.file_event_source import FileEventSource
+from transparentmeta.watch.metadata_resolver import MetadataResolver
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class WatchStatistics:
+    """Snapshot of the activity of a drop folder watcher.
+
+    Attributes:
+        tagged (int): Number of files tagged successfully.
+        failed (int): Number of files whose tagging failed.
+        skipped (int): Number of files the metadata resolver chose not to
+            tag.
+        pending (int): Number of files held back until they stop changing.
+        in_flight (int): Number of files queued in the worker pool or being
+            tagged.
+        tagged_bytes (int): Total size in bytes of the files tagged.
+        elapsed_seconds (float): Time since the watcher started, in seconds.
+    """
+
+    tagged: int
+    failed: int
+    skipped: int
+    pending: int
+    in_flight: int
+    tagged_bytes: int
+    elapsed_seconds: float
+
+    @property
+    def files_per_second(self) -> float:
+        """Average number of files tagged per second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.tagged / self.elapsed_seconds
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Average number of bytes of audio tagged per second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.tagged_bytes / self.elapsed_seconds
+
+
+@dataclass(frozen=True)
+class WatchConfig:
+    """Settings of a drop folder watcher.
+
+    Attributes:
+        workers (Optional[int]): Number of threads tagging files in
+            parallel. Defaults to the thread pool default.
+        max_in_flight (int): Maximum number of files queued in the worker
+            pool or being tagged. Defaults to 64.
+        tick (float): Maximum time in seconds the watcher waits for events
+            between two checks of the debouncer and of whether it must stop.
+            Defaults to 0.5 seconds.
+    """
+
+    workers: Optional[int] = None
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    tick: float = DEFAULT_TICK
+
+    def __post_init__(self) -> None:
+        if self.max_in_flight < 1:
+            raise ValueError(
+                f"Max in flight must be positive: {self.max_in_flight}"
+            )
+
+
+@dataclass
+class _WatchState:
+    # Mutable state of a watcher, shared by its threads. The condition is
+    # notified each time a file is done, which frees up a slot in the pool.
+    condition: threading.Condition = field(default_factory=threading.Condition)
+    in_flight_filepaths: Set[Path] = field(default_factory=set)
+    # Identity of each file right after the watcher tagged it.
+    tagged_file_identities: Dict[Path, FileIdentity] = field(
+        default_factory=dict
+    )
+    # Counts of tagged, failed and skipped files, and of tagged bytes.
+    counts: Counter = field(default_factory=Counter)
+    start_time: Optional[float] = None
+
+
+class DropFolderWatcher:
+    """Tags the audio files dropped into folders as soon as they're
+    complete.
+
+    `run` blocks, watching and tagging files until `stop` is called from
+    another thread or a signal handler. Statistics can be read at any time
+    with `get_statistics`.
+
+    Files that are already in the folders when the watcher starts aren't
+    tagged, unless they change later.
+
+    Attributes:
+        transparent_metadata_writer (TransparentMetadataWriter): Writes the
+            metadata to the files.
+        metadata_resolver (MetadataResolver): Decides the metadata of each
+            file.
+        file_event_source (FileEventSource): Reports the files that may have
+            changed. It's closed when the watcher stops.
+        debouncer (FileDebouncer): Holds files back until they stop
+            changing.
+        config (WatchConfig): Settings of the watcher.
+    """
+
+    def __init__(
+        self,
+        transparent_metadata_writer: TransparentMetadataWriter,
+        metadata_resolver: MetadataResolver,
+        file_event_source: FileEventSource,
+        debouncer: Optional[FileDebouncer] = None,
+        config: Optional[WatchConfig] = None,
+    ) -> None:
+        """Initializes the DropFolderWatcher.
+
+        Args:
+            transparent_metadata_writer (TransparentMetadataWriter): The
+                writer of the metadata.
+            metadata_resolver (MetadataResolver): Decides the metadata of
+                each file.
+            file_event_source (FileEventSource): Reports the files that may
+                have changed.
+            debouncer (Optional[FileDebouncer]): Holds files back until they
+                stop changing. Defaults to a debouncer with a settle time of
+                2 seconds.
+            config (Optional[WatchConfig]): Settings of the watcher.
+                Defaults to the default settings.
+        """
+        self.transparent_metadata_writer = transparent_metadata_writer
+        self.metadata_resolver = metadata_resolver
+        self.file_event_source = file_event_source
+        self.debouncer = (
+            debouncer if debouncer is not None else FileDebouncer()
+        )
+        self.config = config if config is not None else WatchConfig()
+
+        self._stop_event = threading.Event()
+        self._state = _WatchState()
+
+    def run(self) -> None:
+        """Watches the folders and tags new files until `stop` is called.
+
+        Files being tagged when the watcher stops are tagged before this
+        method returns, but files held back by the debouncer are not.
+        """
+        self._state.start_time = time.monotonic()
+        logger.info("Started watching for new audio files")
+        try:
+            with ThreadPoolExecutor(
+                self.config.workers, thread_name_prefix="transparentmeta-watch"
+            ) as executor:
+                while not self._stop_event.is_set():
+                    for filepath in self.file_event_source.wait_for_changes(
+                        self.config.tick
+                    ):
+                        self.debouncer.add(filepath)
+                    for filepath in self.debouncer.pop_settled():
+                        if not self._submit(executor, filepath):
+                            break
+        finally:
+            self.file_event_source.close()
+
+        statistics = self.get_statistics()
+        logger.info(
+            "Stopped watching. Tagged: %d. Failed: %d. Skipped: %d",
+            statistics.tagged,
+            statistics.failed,
+            statistics.skipped,
+        )
+
+    def stop(self) -> None:
+        """Asks the watcher to stop. `run` returns once the files being
+        tagged are done."""
+        self._stop_event.set()
+
+    def get_statistics(self) -> WatchStatistics:
+        """Takes a snapshot of the activity of the watcher.
+
+        Returns:
+            WatchStatistics: The counts of files processed so far, and the
+                throughput since the watcher started.
+        """
+        state = self._state
+        elapsed_seconds = (
+            time.monotonic() - state.start_time
+            if state.start_time is not None
+            else 0.0
+        )
+        with state.condition:
+            return WatchStatistics(
+                tagged=state.counts["tagged"],
+                failed=state.counts["failed"],
+                skipped=state.counts["skipped"],
+                pending=len(self.debouncer),
+                in_flight=len(state.in_flight_filepaths),
+                tagged_bytes=state.counts["tagged_bytes"],
+                elapsed_seconds=elapsed_seconds,
+            )
+
+    def _submit(self, executor: ThreadPoolExecutor, filepath: Path) -> bool:
+        state = self._state
+        with state.condition:
+            if filepath in state.in_flight_filepaths:
+                # The change may come from the write in progress, so the
+                # file is checked again once the write is over.
+                self.debouncer.add(filepath)
+                return True
+            if self._is_own_write(filepath):
+                return True
+
+            # Waiting for a slot is the backpressure: no more events are
+            # taken from the event source until a file is done.
+            while not state.condition.wait_for(
+                self._has_free_slot, self.config.tick
+            ):
+                if self._stop_event.is_set():
+                    return False
+            state.in_flight_filepaths.add(filepath)
+        executor.submit(self._tag_file, filepath)
+        return True
+
+    def _has_free_slot(self) -> bool:
+        return len(self._state.in_flight_filepaths) < self.config.max_in_flight
+
+    def _is_own_write(self, filepath: Path) -> bool:
+        tagged_file_identity = self._state.tagged_file_identities.pop(
+            filepath, None
+        )
+        if tagged_file_identity is None:
+            return False
+        try:
+            return get_file_identity(filepath) == tagged_file_identity
+        except FileNotFoundError:
+            return True
+
+    def _tag_file(self, filepath: Path) -> None:
+        file_identity: Optional[FileIdentity] = None
+        failed = False
+        try:
+            metadata = self.metadata_resolver.resolve(filepath)
+            if metadata is None:
+                logger.info("Skipped file: %s", filepath)
+            else:
+                self.transparent_metadata_writer.write(filepath, metadata)
+                file_identity = get_file_identity(filepath)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            logger.info("Metadata write failed for file %s: %s", filepath, err)
+            failed = True
+
+        state = self._state
+        with state.condition:
+            state.in_flight_filepaths.discard(filepath)
+            if failed:
+                state.counts["failed"] += 1
+            elif file_identity is None:
+                state.counts["skipped"] += 1
+            else:
+                state.tagged_file_identities[filepath] = file_identity
+                state.counts["tagged"] += 1
+                # The third item of the identity is the size of the file.
+                state.counts["tagged_bytes"] += file_identity[2]
+            state.condition.notify()
@@ -0,0 +1,95 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module provides the `FileDebouncer` class, which holds back files
+until they stop changing.
+
+Files dropped into a folder are often reported before they're complete,
+e.g., while they're still being copied or uploaded, and sometimes several
+times. Tagging a partially written file would fail, or worse, be undone by
+the rest of the copy. The debouncer only releases a file once its stat
+identity, i.e., its size, modification time and inode, hasn't changed for a
+settle time.
+"""
+
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from transparentmeta.utils.file_utils import FileIdentity, get_file_identity
+from transparentmeta.watch.constants import DEFAULT_SETTLE_TIME
+
+
+class FileDebouncer:
+    """Releases files once they've stopped changing for a settle time.
+
+    Attributes:
+        settle_time (float): Time in seconds a file must stay unchanged
+            before it's released.
+        clock (Callable[[], float]): Returns the current time in seconds.
+    """
+
+    def __init__(
+        self,
+        settle_time: float = DEFAULT_SETTLE_TIME,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initializes the FileDebouncer.
+
+        Args:
+            settle_time (float): Time in seconds a file must stay unchanged
+                before it's released. Defaults to 2 seconds.
+            clock (Callable[[], float]): Returns the current time in
+                seconds. Defaults to `time.monotonic`.
+        """
+        self.settle_time = settle_time
+        self.clock = clock
+        # Identity of each pending file, and the time it was last seen
+        # changing.
+        self._pending_files: Dict[Path, Tuple[FileIdentity, float]] = {}
+
+    def __len__(self) -> int:
+        """Returns the number of files held back."""
+        return len(self._pending_files)
+
+    def add(self, filepath: Path) -> None:
+        """Holds back a file that may have changed, restarting its settle
+        time. Files that no longer exist are ignored.
+
+        Args:
+            filepath (Path): The path to the file.
+        """
+        try:
+            file_identity = get_file_identity(filepath)
+        except FileNotFoundError:
+            self._pending_files.pop(filepath, None)
+            return
+        self._pending_files[filepath] = (file_identity, self.clock())
+
+    def pop_settled(self) -> List[Path]:
+        """Releases the files that haven't changed for the settle time.
+
+        Files that changed since they were last checked have their settle
+        time restarted, and files that no longer exist are dropped.
+
+        Returns:
+            List[Path]: The paths of the released files.
+        """
+        now = self.clock()
+        settled_filepaths: List[Path] = []
+        for filepath, (file_identity, changed_at) in list(
+            self._pending_files.items()
+        ):
+            try:
+                current_file_identity = get_file_identity(filepath)
+            except FileNotFoundError:
+                del self._pending_files[filepath]
+                continue
+            if current_file_identity != file_identity:
+                self._pending_files[filepath] = (current_file_identity, now)
+            elif now - changed_at >= self.settle_time:
+                del self._pending_files[filepath]
+                settled_filepaths.append(filepath)
+        return settled_filepaths
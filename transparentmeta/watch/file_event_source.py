@@ -0,0 +1,329 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module defines the `FileEventSource` interface, which reports the audio
+files created or modified in a set of directory trees, and its two
+implementations:
+- `InotifyFileEventSource` is notified by the Linux kernel through inotify,
+  so changes are reported as soon as they happen, without walking the
+  directory trees.
+- `PollingFileEventSource` walks the directory trees at a fixed interval,
+  and compares the stat identity of the files with the previous walk. It
+  works on every platform and file system, including network file systems,
+  where inotify doesn't see changes made by other machines.
+
+`build_file_event_source` picks inotify where it's available, and falls back
+to polling otherwise.
+
+Files are reported when they may have changed, not when they're complete:
+a file being copied can be reported several times before its copy ends.
+"""
+
+import ctypes
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence
+
+from transparentmeta.use_case.constants import SUPPORTED_AUDIO_FORMATS
+from transparentmeta.utils.file_utils import (
+    FileIdentity,
+    find_files_with_extensions,
+    get_file_extension,
+    get_file_identity,
+)
+from transparentmeta.watch.constants import DEFAULT_POLLING_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+# inotify event masks, from <sys/inotify.h>.
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+_INOTIFY_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_ONLYDIR
+# Watch descriptor, mask, cookie and name length of an inotify event.
+_INOTIFY_EVENT = struct.Struct("iIII")
+_INOTIFY_READ_SIZE = 64 * 1024
+
+
+class FileEventSource(ABC):
+    """Reports the audio files created or modified in directory trees."""
+
+    @abstractmethod
+    def wait_for_changes(self, timeout: float) -> List[Path]:
+        """Waits for audio files to be created or modified.
+
+        Args:
+            timeout (float): Maximum time to wait, in seconds.
+
+        Returns:
+            List[Path]: The paths of the audio files that may have been
+                created or modified since the previous call, which is empty
+                if the timeout expired first.
+        """
+
+    def close(self) -> None:
+        """Releases the resources held by the source. Does nothing by
+        default."""
+
+
+class PollingFileEventSource(FileEventSource):
+    """Reports changed audio files by walking directory trees at a fixed
+    interval.
+
+    The first walk happens when the source is created: files that already
+    exist then are not reported, unless they're modified later.
+
+    Attributes:
+        directories (List[Path]): The roots of the directory trees.
+        interval (float): Time between two walks, in seconds.
+        extensions (frozenset[str]): Lowercase extensions of the files to
+            report.
+    """
+
+    def __init__(
+        self,
+        directories: Sequence[Path],
+        interval: float = DEFAULT_POLLING_INTERVAL,
+        extensions: Iterable[str] = SUPPORTED_AUDIO_FORMATS,
+    ) -> None:
+        """Initializes the PollingFileEventSource, and walks the directory
+        trees a first time.
+
+        Args:
+            directories (Sequence[Path]): The roots of the directory trees.
+            interval (float): Time between two walks, in seconds. Defaults
+                to 5 seconds.
+            extensions (Iterable[str]): Lowercase extensions of the files to
+                report. Defaults to the supported audio formats.
+        """
+        self.directories = [directory.resolve() for directory in directories]
+        self.interval = interval
+        self.extensions = frozenset(extensions)
+        self._file_identities = self._walk()
+        self._next_walk_time = time.monotonic() + interval
+
+    def wait_for_changes(self, timeout: float) -> List[Path]:
+        """Waits for the next walk, if it's due within the timeout, and
+        reports the files that are new or whose identity changed since the
+        previous walk.
+
+        Args:
+            timeout (float): Maximum time to wait, in seconds.
+
+        Returns:
+            List[Path]: The paths of the new and modified audio files.
+        """
+        delay = self._next_walk_time - time.monotonic()
+        if delay > timeout:
+            time.sleep(timeout)
+            return []
+        time.sleep(max(delay, 0.0))
+        self._next_walk_time = time.monotonic() + self.interval
+
+        file_identities = self._walk()
+        changed_filepaths = [
+            filepath
+            for filepath, file_identity in file_identities.items()
+            if self._file_identities.get(filepath) != file_identity
+        ]
+        self._file_identities = file_identities
+        return changed_filepaths
+
+    def _walk(self) -> Dict[Path, FileIdentity]:
+        file_identities: Dict[Path, FileIdentity] = {}
+        for directory in self.directories:
+            for filepath in find_files_with_extensions(
+                directory, self.extensions
+            ):
+                try:
+                    file_identities[filepath] = get_file_identity(filepath)
+                except FileNotFoundError:
+                    # The file was deleted during the walk.
+                    continue
+        return file_identities
+
+
+class InotifyFileEventSource(FileEventSource):
+    """Reports changed audio files as the Linux kernel notifies them through
+    inotify.
+
+    Every directory of the trees is watched, including the directories
+    created or moved into the trees later. Files are reported when they're
+    closed after being written, or moved into a watched directory. When a
+    directory is moved into a tree, the audio files it holds are reported.
+
+    Attributes:
+        directories (List[Path]): The roots of the directory trees.
+        extensions (frozenset[str]): Lowercase extensions of the files to
+            report.
+    """
+
+    def __init__(
+        self,
+        directories: Sequence[Path],
+        extensions: Iterable[str] = SUPPORTED_AUDIO_FORMATS,
+    ) -> None:
+        """Initializes the InotifyFileEventSource, and starts watching the
+        directory trees.
+
+        Args:
+            directories (Sequence[Path]): The roots of the directory trees.
+            extensions (Iterable[str]): Lowercase extensions of the files to
+                report. Defaults to the supported audio formats.
+
+        Raises:
+            OSError: If inotify is not available, e.g., outside Linux, or if
+                the directories can't be watched, e.g., because the limit of
+                inotify watches is reached.
+        """
+        if not sys.platform.startswith("linux"):  # pragma: no cover
+            raise OSError("inotify is only available on Linux")
+        self.directories = [directory.resolve() for directory in directories]
+        self.extensions = frozenset(extensions)
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            self._raise_last_error("inotify_init1")
+        self._watched_directories: Dict[int, Path] = {}
+        try:
+            for directory in self.directories:
+                self._watch_tree(directory)
+        except OSError:
+            self.close()
+            raise
+
+    def wait_for_changes(self, timeout: float) -> List[Path]:
+        """Waits for inotify events, and reports the audio files they
+        concern.
+
+        Args:
+            timeout (float): Maximum time to wait, in seconds.
+
+        Returns:
+            List[Path]: The paths of the audio files written or moved into
+                the directory trees.
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+        changed_filepaths: List[Path] = []
+        while True:
+            try:
+                data = os.read(self._fd, _INOTIFY_READ_SIZE)
+            except BlockingIOError:
+                return changed_filepaths
+            changed_filepaths.extend(self._parse_events(data))
+
+    def close(self) -> None:
+        """Stops watching the directory trees."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _watch_tree(self, directory: Path) -> None:
+        self._add_watch(directory)
+        for dirpath, dirnames, _ in os.walk(directory):
+            for dirname in dirnames:
+                self._add_watch(Path(dirpath) / dirname)
+
+    def _add_watch(self, directory: Path) -> None:
+        watch_descriptor = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(directory), _INOTIFY_WATCH_MASK
+        )
+        if watch_descriptor < 0:
+            self._raise_last_error("inotify_add_watch", str(directory))
+        self._watched_directories[watch_descriptor] = directory
+
+    def _parse_events(self, data: bytes) -> List[Path]:
+        changed_filepaths: List[Path] = []
+        offset = 0
+        while offset < len(data):
+            watch_descriptor, mask, _, name_size = _INOTIFY_EVENT.unpack_from(
+                data, offset
+            )
+            offset += _INOTIFY_EVENT.size
+            name = data[offset : offset + name_size].rstrip(b"\0")
+            offset += name_size
+
+            if mask & IN_Q_OVERFLOW:
+                logger.warning(
+                    "The inotify event queue overflowed: some new files "
+                    "may not be reported"
+                )
+                continue
+            directory = self._watched_directories.get(watch_descriptor)
+            if mask & IN_IGNORED:
+                # The directory was deleted or moved out of the tree.
+                self._watched_directories.pop(watch_descriptor, None)
+                continue
+            if directory is None:
+                continue
+            filepath = directory / os.fsdecode(name)
+            if mask & IN_ISDIR:
+                changed_filepaths.extend(self._watch_new_directory(filepath))
+            elif (
+                mask & (IN_CLOSE_WRITE | IN_MOVED_TO)
+                and get_file_extension(filepath) in self.extensions
+            ):
+                changed_filepaths.append(filepath)
+        return changed_filepaths
+
+    def _watch_new_directory(self, directory: Path) -> List[Path]:
+        try:
+            self._watch_tree(directory)
+        except OSError as err:
+            logger.warning("Can't watch directory %s: %s", directory, err)
+            return []
+        # Files may have been written, or moved in with the directory,
+        # before it was watched.
+        return list(find_files_with_extensions(directory, self.extensions))
+
+    def _raise_last_error(self, function_name: str, *args: str) -> None:
+        errno = ctypes.get_errno()
+        raise OSError(
+            errno, f"{function_name} failed: {os.strerror(errno)}", *args
+        )
+
+
+def build_file_event_source(
+    directories: Sequence[Path],
+    polling_interval: float = DEFAULT_POLLING_INTERVAL,
+    force_polling: bool = False,
+) -> FileEventSource:
+    """Builds a source of changed audio files for directory trees, using
+    inotify where it's available, and polling otherwise.
+
+    Args:
+        directories (Sequence[Path]): The roots of the directory trees.
+        polling_interval (float): Time between two walks of the trees, in
+            seconds, if polling is used. Defaults to 5 seconds.
+        force_polling (bool): If True, polling is used even where inotify is
+            available, e.g., for network file systems. Defaults to False.
+
+    Returns:
+        FileEventSource: An `InotifyFileEventSource`, or a
+            `PollingFileEventSource` if inotify is not available.
+    """
+    if not force_polling:
+        try:
+            return InotifyFileEventSource(directories)
+        except OSError as err:
+            logger.info(
+                "inotify is not available, falling back to polling: %s", err
+            )
+    return PollingFileEventSource(directories, polling_interval)
@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (c) 2025 Transparent Audio
+# Author: Valerio Velardo - valerio@transparentaudio.ai
+
+"""
+This module defines the `MetadataResolver` interface, which decides the
+metadata written to each audio file, and the `TemplateMetadataResolver`,
+which fills a fixed template with the name of each file.
+
+Resolvers let the metadata come from anywhere, e.g., a catalogue database
+or a sidecar file dropped next to the audio, while the code that finds and
+tags the files stays the same.
+"""
+
+import hashlib
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+CONTENT_ID_MIN_LENGTH = 2
+CONTENT_ID_MAX_LENGTH = 50
+CONTENT_ID_DIGEST_LENGTH = 8
+
+
+class MetadataResolver(ABC):
+    """Decides the metadata to write to audio files.
+
+    Resolvers may be called from several threads at once, so they must be
+    thread-safe.
+    """
+
+    @abstractmethod
+    def resolve(self, filepath: Path) -> Optional[Dict[str, Any]]:
+        """Resolves the metadata to write to an audio file.
+
+        Args:
+            filepath (Path): The path to the audio file.
+
+        Returns:
+            Optional[Dict[str, Any]]: The metadata fields, in the structure
+                expected by `Metadata`, or None if the file must not be
+                tagged.
+        """
+
+
+class TemplateMetadataResolver(MetadataResolver):
+    """Resolves the same metadata for every file, from a template.
+
+    Fields missing from the template are filled for each file: the content
+    ID with the name of the file without its extension, and the creation
+    time with the current time. Names too short for a content ID keep their
+    extension, and names too long are shortened and suffixed with a digest
+    of the full name, so that they stay distinct.
+
+    Attributes:
+        metadata_template (Mapping[str, Any]): The metadata fields shared by
+            all files.
+    """
+
+    def __init__(self, metadata_template: Mapping[str, Any]) -> None:
+        """Initializes the TemplateMetadataResolver.
+
+        Args:
+            metadata_template (Mapping[str, Any]): The metadata fields shared
+                by all files.
+        """
+        self.metadata_template = metadata_template
+
+    def resolve(self, filepath: Path) -> Dict[str, Any]:
+        """Fills the template with the name of the file and the current
+        time.
+
+        Args:
+            filepath (Path): The path to the audio file.
+
+        Returns:
+            Dict[str, Any]: A copy of the template, with `content_id` and
+                `created_at` filled in if they were missing.
+        """
+        metadata = dict(self.metadata_template)
+        metadata.setdefault("content_id", derive_content_id(filepath))
+        metadata.setdefault(
+            "created_at", datetime.now(timezone.utc).isoformat()
+        )
+        return metadata
+
+
+def derive_content_id(filepath: Path) -> str:
+    """Derives a valid content ID from the name of a file.
+
+    Args:
+        filepath (Path): The path to the file.
+
+    Returns:
+        str: The name of the file without its extension, or with it if the
+            name is too short, shortened and suffixed with a digest if it's
+            too long, and padded with underscores if it's still too short.
+    """
+    content_id = filepath.stem
+    if len(content_id) < CONTENT_ID_MIN_LENGTH:
+        content_id = filepath.name
+    if len(content_id) > CONTENT_ID_MAX_LENGTH:
+        digest = hashlib.sha256(content_id.encode("utf-8")).hexdigest()
+        prefix_length = CONTENT_ID_MAX_LENGTH - CONTENT_ID_DIGEST_LENGTH - 1
+        content_id = (
+            f"{content_id[:prefix_length]}-"
+            f"{digest[:CONTENT_ID_DIGEST_LENGTH]}"
+        )
+    return content_id.ljust(CONTENT_ID_MIN_LENGTH, "_")